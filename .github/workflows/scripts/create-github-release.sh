@@ -36,6 +36,8 @@ fi
 
 CURSOR_ZIP="$RELEASE_DIR/sckit-cursor-${VERSION#v}.zip"
 CLAUDE_ZIP="$RELEASE_DIR/sckit-claude-${VERSION#v}.zip"
+CURSOR_MANIFEST="${CURSOR_ZIP%.zip}.manifest.json"
+CLAUDE_MANIFEST="${CLAUDE_ZIP%.zip}.manifest.json"
 
 if [ ! -f "$CURSOR_ZIP" ] || [ ! -f "$CLAUDE_ZIP" ]; then
     echo "❌ 错误: Release 包不存在"
@@ -91,6 +93,8 @@ sckit init . --force
 本 Release 包含两种编辑器的模板包：
 - \`sckit-cursor-${VERSION#v}.zip\` - 适用于 Cursor 编辑器
 - \`sckit-claude-${VERSION#v}.zip\` - 适用于 Claude Code 编辑器
+- \`*.manifest.json\` - 模板包的文件清单（用于增量更新）
+- \`SHA256SUMS\` - 以上文件的 SHA-256 摘要（CLI 下载时自动校验）
 
 CLI 工具会自动下载对应的模板包并部署到项目中。
 
@@ -159,6 +163,29 @@ curl -s -X POST "$UPLOAD_URL?name=$CLAUDE_NAME" \
 
 echo "   ✅ $CLAUDE_NAME 上传完成"
 
+# 上传文件清单（旧版本打包时没有清单，客户端会改为完整下载）
+for MANIFEST in "$CURSOR_MANIFEST" "$CLAUDE_MANIFEST"; do
+    if [ -f "$MANIFEST" ]; then
+        echo "📤 上传文件清单..."
+        MANIFEST_NAME=$(basename "$MANIFEST")
+        curl -s -X POST "$UPLOAD_URL?name=$MANIFEST_NAME" \
+            -H "Authorization: token $GITHUB_TOKEN" \
+            -H "Content-Type: application/json" \
+            --data-binary "@$MANIFEST" > /dev/null
+        echo "   ✅ $MANIFEST_NAME 上传完成"
+    fi
+done
+
+# 上传 SHA-256 校验文件
+if [ -f "$RELEASE_DIR/SHA256SUMS" ]; then
+    echo "📤 上传 SHA256SUMS..."
+    curl -s -X POST "$UPLOAD_URL?name=SHA256SUMS" \
+        -H "Authorization: token $GITHUB_TOKEN" \
+        -H "Content-Type: text/plain" \
+        --data-binary "@$RELEASE_DIR/SHA256SUMS" > /dev/null
+    echo "   ✅ SHA256SUMS 上传完成"
+fi
+
 echo ""
 echo "✨ GitHub Release 创建完成！"
 echo ""
@@ -79,6 +79,32 @@ cd ../..
 CLAUDE_SIZE=$(du -h "$RELEASE_DIR/sckit-claude-${VERSION_NUM}.zip" | cut -f1)
 echo "   ✅ sckit-claude-${VERSION_NUM}.zip ($CLAUDE_SIZE)"
 
+# ============================================================================
+# 文件清单（客户端据此只下载变化的文件）
+# ============================================================================
+
+echo "🔨 生成文件清单..."
+
+python3 src/sckit_cli/utils/release_manifest.py \
+    "$RELEASE_DIR/sckit-cursor-${VERSION_NUM}.zip" \
+    "$RELEASE_DIR/sckit-claude-${VERSION_NUM}.zip"
+
+# ============================================================================
+# SHA-256 校验文件（客户端下载时校验）
+# ============================================================================
+
+echo "🔨 生成 SHA256SUMS..."
+
+(
+    cd "$RELEASE_DIR"
+    if command -v sha256sum > /dev/null; then
+        sha256sum *.zip *.manifest.json > SHA256SUMS
+    else
+        shasum -a 256 *.zip *.manifest.json > SHA256SUMS  # macOS
+    fi
+)
+echo "   ✅ SHA256SUMS"
+
 # ============================================================================
 # 汇总信息
 # ============================================================================
@@ -87,7 +113,7 @@ echo ""
 echo "✨ Release 包创建完成！"
 echo ""
 echo "📦 生成的文件:"
-ls -lh "$RELEASE_DIR"/*.zip | awk '{print "   - " $9 " (" $5 ")"}'
+ls -lh "$RELEASE_DIR"/*.zip "$RELEASE_DIR"/*.manifest.json "$RELEASE_DIR"/SHA256SUMS | awk '{print "   - " $9 " (" $5 ")"}'
 echo ""
 echo "🎯 下一步: 运行 create-github-release.sh 上传到 GitHub"
 
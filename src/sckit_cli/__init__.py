@@ -10,14 +10,36 @@ import os
 import sys
 import signal
 import atexit
+import contextvars
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Callable
+from typing import Any, Collection, Dict, Generator, Iterator, List, Optional, Tuple, Callable, Union, TYPE_CHECKING
+from contextlib import contextmanager
 from datetime import datetime
 
 __version__ = "0.3.0"
 
+if TYPE_CHECKING:
+    import hashlib
+    import httpx
+    import zipfile
+    from rich.console import Console
+    from rich.progress import Progress
+    import threading
+    from sckit_cli.utils.cache import CachedRelease, ReleaseCache
+    from sckit_cli.utils.events import EventSink
+    from sckit_cli.utils.filters import TemplateFilter
+    from sckit_cli.utils.http import HttpSession
+    from sckit_cli.utils.limits import ExtractionBudget
+    from sckit_cli.utils.manifest import InstallManifest, ManifestEntry
+    from sckit_cli.utils.projects import ProjectRegistry
+    from sckit_cli.utils.release_manifest import ReleaseManifest
+    from sckit_cli.utils.sources import TemplateSource
+    from sckit_cli.utils.store import Linker
+    from sckit_cli.utils.sync import ConflictCallback, PlannedFile, SyncPlan
+    from sckit_cli.utils.timings import PhaseRecorder, PhaseTiming
+
 
 # ============================================================================
 # T009: Editor 枚举
@@ -49,6 +71,14 @@ class Editor(str, Enum):
         return project_root / self.config_dir / "commands"
 
 
+class LinkMode(str, Enum):
+    """commands/ 中文件的生成方式（除 copy 外均经由全局模板存储）"""
+    HARD = "hard"        # 硬链接：共享同一 inode
+    REFLINK = "reflink"  # 写时复制克隆（btrfs、XFS、APFS 等）
+    SYMLINK = "symlink"  # 指向存储对象的符号链接
+    COPY = "copy"        # 普通复制
+
+
 # ============================================================================
 # T010: 异常层次结构
 # ============================================================================
@@ -75,6 +105,16 @@ class DownloadError(NetworkError):
     pass
 
 
+class IntegrityError(DownloadError):
+    """下载内容与发布的 SHA-256 摘要不符"""
+    def __init__(self, name: str, expected: str, actual: str):
+        self.expected = expected
+        self.actual = actual
+        super().__init__(
+            f"{name} 校验失败 (期望 SHA-256 {expected[:12]}…，实际 {actual[:12]}…)"
+        )
+
+
 class FileSystemError(SCKitError):
     """文件系统错误"""
     pass
@@ -85,6 +125,11 @@ class ValidationError(SCKitError):
     pass
 
 
+class TemplateLimitError(SCKitError):
+    """模板包超出下载大小或解压限制（可能已损坏或被篡改）"""
+    pass
+
+
 class TemplateNotFoundError(SCKitError):
     """模板未找到"""
     def __init__(self, editor: Editor, version: str):
@@ -108,21 +153,59 @@ class Config:
     # API配置
     GITHUB_API_BASE: str = "https://api.github.com"
     REQUEST_TIMEOUT: float = float(os.getenv("SCKIT_TIMEOUT", "10.0"))
-    DOWNLOAD_CHUNK_SIZE: int = 8192  # 8KB
+    DOWNLOAD_CHUNK_SIZE: int = 64 * 1024  # 自适应分块的下限（64KB）
+    DOWNLOAD_MAX_CHUNK_SIZE: int = 4 * 1024 * 1024  # 自适应分块的上限（4MB）
+    PROGRESS_INTERVAL: float = 0.1  # 进度回调的最小间隔（秒）
+    
+    # HTTP 连接池与重试
+    HTTP_MAX_CONNECTIONS: int = int(os.getenv("SCKIT_MAX_CONNECTIONS", "10"))
+    HTTP_RETRIES: int = int(os.getenv("SCKIT_RETRIES", "3"))
+    HTTP_RETRY_BACKOFF: float = float(os.getenv("SCKIT_RETRY_BACKOFF", "0.5"))  # 秒
+    HTTP2: bool = os.getenv("SCKIT_HTTP2", "").lower() in ("1", "true", "yes")
+    
+    # 模板包限制：下载大小（超过即中止下载），以及解压的成员数、总大小与单个成员的压缩比
+    MAX_TEMPLATE_SIZE: int = int(os.getenv("SCKIT_MAX_TEMPLATE_SIZE", str(10 * 1024 * 1024)))  # 10MB
+    MAX_TEMPLATE_FILES: int = int(os.getenv("SCKIT_MAX_TEMPLATE_FILES", "10000"))
+    MAX_EXTRACTED_SIZE: int = int(os.getenv("SCKIT_MAX_EXTRACTED_SIZE", str(100 * 1024 * 1024)))  # 100MB
+    MAX_COMPRESSION_RATIO: float = 100.0
+    
+    # 增量更新需读取的压缩数据超过模板包的该比例时，改为下载完整模板包
+    DELTA_MAX_RATIO: float = 0.5
+    
+    # 缓存配置
+    CACHE_TTL: float = float(os.getenv("SCKIT_CACHE_TTL", "300"))  # 秒
+    # 过期后仍先使用缓存、同时在后台重新验证的时长（秒），超过后同步验证
+    CACHE_STALE_TTL: float = float(os.getenv("SCKIT_CACHE_STALE_TTL", "86400"))
+    CACHE_MAX_SIZE: int = int(os.getenv("SCKIT_CACHE_MAX_SIZE", str(200 * 1024 * 1024)))  # 200MB
+    
+    # 默认模板源（本地 zip/目录或镜像 URL，留空表示 GitHub）
+    TEMPLATE_SOURCE: str = os.getenv("SCKIT_SOURCE", "")
+    
+    # 默认安装方式（hard/reflink/symlink/copy），存储目录由 SCKIT_STORE_DIR 指定
+    LINK_MODE: str = os.getenv("SCKIT_LINK", "copy")
     
-    # 文件大小限制
-    MAX_TEMPLATE_SIZE: int = 10 * 1024 * 1024  # 10MB
+    # Release 列表分页大小
+    RELEASES_PER_PAGE: int = 30
+    
+    # sckit sync --watch 的检查间隔（秒）与随机抖动比例（各机器错开请求）
+    SYNC_INTERVAL: float = float(os.getenv("SCKIT_SYNC_INTERVAL", "3600"))
+    SYNC_JITTER: float = 0.2
     
     # 版本
     CLI_VERSION: str = __version__
     
     @property
-    def release_api_url(self) -> str:
-        """最新Release的API URL"""
+    def releases_api_url(self) -> str:
+        """Release 列表（分页）的API URL"""
         return (
             f"{self.GITHUB_API_BASE}/repos/"
-            f"{self.GITHUB_OWNER}/{self.GITHUB_REPO}/releases/latest"
+            f"{self.GITHUB_OWNER}/{self.GITHUB_REPO}/releases"
         )
+    
+    @property
+    def release_api_url(self) -> str:
+        """最新Release的API URL"""
+        return f"{self.releases_api_url}/latest"
 
 
 # 全局配置实例
@@ -139,11 +222,50 @@ class ReleaseAsset:
     name: str
     download_url: str
     size: int  # 字节
+    sha256: Optional[str] = None  # 发布的内容摘要（API 的 digest 字段或 SHA256SUMS）
+    api_url: Optional[str] = None  # GitHub API 的资源地址（私有仓库需经此下载）
+    headers: Dict[str, str] = field(default_factory=dict)  # 下载时附加的请求头
     
     def is_template_for(self, editor: Editor) -> bool:
         """判断是否是指定编辑器的模板"""
-        # 期望格式: sckit-{editor}-{version}.zip
-        return self.name.startswith(f"sckit-{editor.value}-")
+        # 期望格式: sckit-{editor}-{version}.zip（同名的 .manifest.json 是文件清单）
+        return (
+            self.name.startswith(f"sckit-{editor.value}-")
+            and not self.name.endswith(".manifest.json")
+        )
+    
+    @property
+    def local_path(self) -> Optional[Path]:
+        """本地资源（文件路径或 file:// URL）的路径，远程资源返回 None"""
+        if self.download_url.startswith("file://"):
+            from urllib.parse import urlparse
+            from urllib.request import url2pathname
+            return Path(url2pathname(urlparse(self.download_url).path))
+        if "://" in self.download_url:
+            return None
+        return Path(self.download_url)
+
+
+def parse_asset_digest(digest: Optional[str]) -> Optional[str]:
+    """解析 GitHub API 资源的 digest 字段（"sha256:<hex>"）"""
+    if digest and digest.startswith("sha256:"):
+        return digest[len("sha256:"):].lower()
+    return None
+
+
+def parse_checksums(text: str) -> Dict[str, str]:
+    """
+    解析 sha256sum 格式的校验文件
+    
+    每行 `<hex>  <文件名>`（二进制模式为 `<hex> *<文件名>`），忽略空行与无效行。
+    """
+    checksums = {}
+    for line in text.splitlines():
+        digest, _, name = line.strip().partition(" ")
+        name = name.strip().lstrip("*")
+        if len(digest) == 64 and name and all(c in "0123456789abcdefABCDEF" for c in digest):
+            checksums[name] = digest.lower()
+    return checksums
 
 
 # ============================================================================
@@ -156,6 +278,8 @@ class Release:
     tag_name: str  # e.g., "v0.1.0"
     name: str
     assets: List[ReleaseAsset]
+    published_at: Optional[str] = None  # ISO 8601
+    prerelease: bool = False
     
     @property
     def version(self) -> str:
@@ -168,6 +292,38 @@ class Release:
             if asset.is_template_for(editor):
                 return asset
         return None
+    
+    def get_manifest_asset(self, editor: Editor) -> Optional[ReleaseAsset]:
+        """获取模板包对应的文件清单（sckit-{editor}-{version}.manifest.json）"""
+        template = self.get_template_asset(editor)
+        if template is None:
+            return None
+        stem = template.name[:-4] if template.name.endswith(".zip") else template.name
+        for asset in self.assets:
+            if asset.name == f"{stem}.manifest.json":
+                return asset
+        return None
+    
+    def get_checksums_asset(self) -> Optional[ReleaseAsset]:
+        """获取 SHA-256 校验文件（sha256sum 格式的 SHA256SUMS）"""
+        for asset in self.assets:
+            if asset.name == "SHA256SUMS":
+                return asset
+        return None
+    
+    def authorize(self, token: str) -> None:
+        """
+        改为携带令牌经 GitHub API 下载资源（私有仓库的 browser_download_url 不接受令牌）
+        
+        API 重定向到存储服务时，HTTP 客户端不会把 Authorization 头带到其它主机。
+        """
+        for asset in self.assets:
+            if asset.api_url:
+                asset.download_url = asset.api_url
+                asset.headers = {
+                    "Authorization": f"token {token}",
+                    "Accept": "application/octet-stream",
+                }
 
     @classmethod
     def from_api_response(cls, data: dict) -> "Release":
@@ -176,14 +332,18 @@ class Release:
             ReleaseAsset(
                 name=a["name"],
                 download_url=a["browser_download_url"],
-                size=a["size"]
+                size=a["size"],
+                sha256=parse_asset_digest(a.get("digest")),
+                api_url=a.get("url"),
             )
             for a in data.get("assets", [])
         ]
         return cls(
             tag_name=data["tag_name"],
-            name=data.get("name", data["tag_name"]),
-            assets=assets
+            name=data.get("name") or data["tag_name"],
+            assets=assets,
+            published_at=data.get("published_at"),
+            prerelease=bool(data.get("prerelease", False)),
         )
 
 
@@ -198,17 +358,41 @@ class InstallConfig:
     editor: Editor
     force: bool = False
     github_token: Optional[str] = None
+    use_cache: bool = True
+    # 模板源：github:OWNER/REPO、本地 zip/目录或镜像 URL，多个以逗号分隔（靠前的优先）；
+    # None 表示默认 GitHub 仓库。见 TemplateSource
+    source: Optional[str] = None
+    link: LinkMode = LinkMode.COPY  # 文件生成方式，非 copy 时经由全局模板存储
+    dry_run: bool = False           # 只生成并显示同步计划，不写入
+    version: Optional[str] = None   # 固定安装的版本（如 "0.3.0"），None 表示最新
+    # 模板筛选（glob 或 tag:<名称>）；两者均为 None 时沿用上次安装记录的筛选
+    only: Optional[List[str]] = None
+    exclude: Optional[List[str]] = None
+    interactive: bool = True        # False 时不询问冲突，保留本地修改（后台同步）
+    pick: bool = False              # 暂存后交互式选择模板，结果作为 only 记录（--pick）
     
     @property
     def is_current_dir(self) -> bool:
         """是否在当前目录初始化"""
         return self.target_path.resolve() == Path.cwd().resolve()
     
+    @property
+    def template_sources(self) -> List["TemplateSource"]:
+        """按优先级排列的模板源"""
+        from sckit_cli.utils.sources import parse_sources
+        return parse_sources(self.source)
+    
     @property
     def commands_dir(self) -> Path:
         """目标commands目录"""
         return self.editor.get_commands_path(self.target_path)
     
+    @property
+    def manifest_path(self) -> Path:
+        """安装清单路径（与 commands 目录同级）"""
+        from sckit_cli.utils.manifest import MANIFEST_NAME
+        return self.target_path / self.editor.config_dir / MANIFEST_NAME
+    
     def validate(self) -> None:
         """验证配置"""
         # 检查项目名是否合法
@@ -218,6 +402,10 @@ class InstallConfig:
                     f"项目名 '{self.target_path.name}' 包含非法字符"
                 )
         
+        if self.version and self.source:
+            raise ValidationError("--version 只能用于 GitHub 模板源，不能与 --source 同时使用")
+        self.template_sources  # 模板源写法错误时尽早报错
+        
         # 检查父目录是否可写
         parent = self.target_path.parent
         if not parent.exists() or not os.access(parent, os.W_OK):
@@ -238,6 +426,13 @@ class InstallResult:
     editor: Editor
     files_skipped: int = 0
     files_overwritten: int = 0
+    files_unchanged: int = 0
+    files_removed: int = 0
+    error: Optional[str] = None
+    timings: List["PhaseTiming"] = field(default_factory=list)  # 各阶段计时
+    link: LinkMode = LinkMode.COPY  # 请求的文件生成方式
+    files_linked: int = 0           # 以链接方式（而非复制）写入的文件数
+    plan: Optional[SyncPlan] = None  # 预演（--dry-run）时的同步计划，未写入任何文件
     
     @property
     def total_files(self) -> int:
@@ -246,6 +441,16 @@ class InstallResult:
     
     def format_summary(self) -> str:
         """格式化摘要信息"""
+        from sckit_cli.utils.sync import FileAction
+        if self.plan is not None:
+            return "\n".join([
+                "🔍 预演完成（未写入任何文件）",
+                f"版本: v{self.version}",
+                f"编辑器: {self.editor.display_name}",
+                f"位置: {self.target_path / self.editor.config_dir / 'commands'}",
+                f"计划: {self.plan.format_counts()}",
+            ])
+        
         lines = [
             f"✅ 安装完成",
             f"版本: v{self.version}",
@@ -258,8 +463,144 @@ class InstallResult:
             lines.append(f"      {self.files_skipped} 个已跳过")
         if self.files_overwritten > 0:
             lines.append(f"      {self.files_overwritten} 个已覆盖")
+        if self.files_unchanged > 0:
+            lines.append(f"      {self.files_unchanged} 个无变化")
+        if self.files_removed > 0:
+            lines.append(f"      {self.files_removed} 个已删除（新版本已移除）")
+        if self.link != LinkMode.COPY:
+            lines.append(f"      其中 {self.files_linked} 个以 {self.link.value} 方式链接自模板存储")
+            fallbacks = self.files_copied + self.files_overwritten - self.files_linked
+            if fallbacks > 0:
+                lines.append(f"      {fallbacks} 个因文件系统不支持 {self.link.value} 改为复制")
+        
+        return "\n".join(lines)
+    
+    def to_dict(self) -> dict:
+        """机器可读的结果（用于 --json）"""
+        return {
+            "success": self.success,
+            "version": self.version,
+            "editor": self.editor.value,
+            "target_path": str(self.target_path),
+            "files_copied": self.files_copied,
+            "files_skipped": self.files_skipped,
+            "files_overwritten": self.files_overwritten,
+            "files_unchanged": self.files_unchanged,
+            "files_removed": self.files_removed,
+            "link": self.link.value,
+            "files_linked": self.files_linked,
+            "error": self.error,
+            "timings": [t.to_dict() for t in self.timings],
+            "plan": self.plan.to_dict() if self.plan is not None else None,
+        }
+
+
+@dataclass
+class BatchInstallResult:
+    """批量安装结果（多个项目共用一次下载）"""
+    results: List[InstallResult]
+    timings: List["PhaseTiming"] = field(default_factory=list)  # 共享阶段（Release、下载）计时
+    
+    @property
+    def success(self) -> bool:
+        """是否全部成功"""
+        return all(r.success for r in self.results)
+    
+    @property
+    def failed(self) -> List[InstallResult]:
+        """失败的项目"""
+        return [r for r in self.results if not r.success]
+    
+    @property
+    def editors(self) -> List[Editor]:
+        """涉及的编辑器（保持首次出现的顺序）"""
+        return list(dict.fromkeys(r.editor for r in self.results))
+    
+    @property
+    def files_copied(self) -> int:
+        return sum(r.files_copied for r in self.results)
+    
+    @property
+    def files_skipped(self) -> int:
+        return sum(r.files_skipped for r in self.results)
+    
+    @property
+    def files_overwritten(self) -> int:
+        return sum(r.files_overwritten for r in self.results)
+    
+    @property
+    def files_unchanged(self) -> int:
+        return sum(r.files_unchanged for r in self.results)
+    
+    @property
+    def files_removed(self) -> int:
+        return sum(r.files_removed for r in self.results)
+    
+    def format_summary(self) -> str:
+        """格式化汇总信息"""
+        if not self.results:
+            return "未安装任何项目"
+        
+        first = self.results[0]
+        succeeded = len(self.results) - len(self.failed)
+        editors = self.editors
+        projects = {r.target_path for r in self.results}
+        
+        if any(r.plan is not None for r in self.results):
+            lines = [
+                "🔍 预演完成（未写入任何文件）",
+                f"版本: v{first.version}",
+                f"编辑器: {', '.join(e.display_name for e in editors)}",
+                f"项目: {len(projects)} 个",
+            ]
+            for action in FileAction:
+                total = sum(r.plan.count(action) for r in self.results if r.plan)
+                if total:
+                    lines.append(f"      {total} 个{action.label}")
+            for result in self.failed:
+                lines.append(f"❌ {result.target_path}: {result.error}")
+            return "\n".join(lines)
+        
+        lines = [
+            f"{'✅' if self.success else '⚠️'} 批量安装完成",
+            f"版本: v{first.version}",
+            f"编辑器: {', '.join(e.display_name for e in editors)}",
+            f"项目: {len(projects)} 个（{succeeded}/{len(self.results)} 项安装成功）",
+            f"文件: {self.files_copied} 个已复制",
+        ]
+        
+        if self.files_skipped > 0:
+            lines.append(f"      {self.files_skipped} 个已跳过")
+        if self.files_overwritten > 0:
+            lines.append(f"      {self.files_overwritten} 个已覆盖")
+        if self.files_unchanged > 0:
+            lines.append(f"      {self.files_unchanged} 个无变化")
+        if self.files_removed > 0:
+            lines.append(f"      {self.files_removed} 个已删除（新版本已移除）")
+        
+        # 多个编辑器时按编辑器分别列出
+        if len(editors) > 1:
+            for editor in editors:
+                results = [r for r in self.results if r.editor == editor]
+                copied = sum(r.files_copied for r in results)
+                overwritten = sum(r.files_overwritten for r in results)
+                lines.append(
+                    f"  {editor.display_name} ({editor.config_dir}/commands): "
+                    f"{copied} 个已复制, {overwritten} 个已覆盖"
+                )
+        
+        for result in self.failed:
+            lines.append(f"❌ {result.target_path}: {result.error}")
         
         return "\n".join(lines)
+    
+    def to_dict(self) -> dict:
+        """机器可读的结果（用于 --json）"""
+        return {
+            "success": self.success,
+            "timings": [t.to_dict() for t in self.timings],
+            "results": [r.to_dict() for r in self.results],
+        }
 
 
 # ============================================================================
@@ -287,7 +628,6 @@ class DownloadProgress:
 
 # 类型别名
 ProgressCallback = Callable[[DownloadProgress], None]
-FileConflictCallback = Callable[[Path], bool]
 
 
 # ============================================================================
@@ -324,6 +664,12 @@ def error_handler(e: Exception, verbose: bool = False) -> None:
     elif isinstance(e, TemplateNotFoundError):
         print(f"❌ 错误: {str(e)}", file=sys.stderr)
         print(f"💡 建议: 检查仓库Release是否包含正确的模板文件", file=sys.stderr)
+    elif isinstance(e, IntegrityError):
+        print(f"❌ 错误: {str(e)}", file=sys.stderr)
+        print(f"💡 建议: 重试；持续失败时检查代理或镜像是否篡改了文件", file=sys.stderr)
+    elif isinstance(e, TemplateLimitError):
+        print(f"❌ 错误: {str(e)}", file=sys.stderr)
+        print(f"💡 建议: 确认模板源可信；模板确实很大时调高 SCKIT_MAX_TEMPLATE_SIZE 等限制", file=sys.stderr)
     elif isinstance(e, NetworkError):
         print(f"❌ 错误: 网络连接失败", file=sys.stderr)
         print(f"💡 建议: 检查网络连接后重试", file=sys.stderr)
@@ -374,11 +720,38 @@ def register_cleanup_path(path: Path) -> None:
     _cleanup_paths.append(path)
 
 
-# 注册清理和信号处理
-atexit.register(cleanup)
-signal.signal(signal.SIGINT, signal_handler)
-if hasattr(signal, 'SIGTERM'):
-    signal.signal(signal.SIGTERM, signal_handler)
+_cleanup_registered = False
+
+
+@contextmanager
+def interrupt_handlers() -> Iterator[None]:
+    """
+    安装期间的清理与信号处理
+    
+    导入模块时不做任何注册：只在安装运行期间接管 SIGINT/SIGTERM，
+    退出时恢复原来的处理器。清理钩子在首次进入时注册到 atexit。
+    signal 只能在主线程设置，其它线程中只注册清理钩子。
+    """
+    import threading
+    
+    global _cleanup_registered
+    if not _cleanup_registered:
+        atexit.register(cleanup)
+        _cleanup_registered = True
+    
+    if threading.current_thread() is not threading.main_thread():
+        yield
+        return
+    
+    signums = [signal.SIGINT]
+    if hasattr(signal, 'SIGTERM'):
+        signums.append(signal.SIGTERM)
+    previous = {signum: signal.signal(signum, signal_handler) for signum in signums}
+    try:
+        yield
+    finally:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
 
 
 # ============================================================================
@@ -386,9 +759,100 @@ if hasattr(signal, 'SIGTERM'):
 # ============================================================================
 
 import typer
-from rich.console import Console
 
-console = Console()
+
+_console: Optional["Console"] = None
+
+
+def get_console() -> "Console":
+    """
+    获取进程共享的 rich Console（首次调用时创建）
+    
+    导入 rich.console 的开销与 typer 本身相当，`sckit --version`
+    这类不输出富文本的命令不需要付出这部分启动时间。
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+def use_stderr_console() -> None:
+    """此后所有 Rich 输出改写到 stderr（stdout 用于机器可读输出时）"""
+    global _console
+    from rich.console import Console
+    _console = Console(stderr=True)
+
+
+# 安装引擎的事件接收者，None 表示 CLI 默认的 RichSink（见 utils/events.py）。
+# 按上下文保存：并发的安装（不同线程或 asyncio 任务）各自使用自己的 sink
+_event_sink: "contextvars.ContextVar[Optional[EventSink]]" = contextvars.ContextVar(
+    "sckit_event_sink", default=None,
+)
+
+
+@contextmanager
+def use_event_sink(sink: "EventSink") -> Iterator["EventSink"]:
+    """with 块内引擎的输出与事件交给 sink（只影响当前上下文，线程池见 in_current_context()）"""
+    token = _event_sink.set(sink)
+    try:
+        yield sink
+    finally:
+        _event_sink.reset(token)
+
+
+def in_current_context(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    包装要提交到线程池的函数，使其在工作线程中沿用提交时的事件接收者
+    
+    工作线程不会继承调用方的 contextvars；每次调用在提交时上下文的独立副本中执行。
+    """
+    context = contextvars.copy_context()
+    
+    def run(*args: Any, **kwargs: Any) -> Any:
+        return context.copy().run(func, *args, **kwargs)
+    return run
+
+
+def renders_console() -> bool:
+    """引擎输出是否由 Rich 渲染到终端；否则不导入 Rich，也不询问用户"""
+    sink = _event_sink.get()
+    return sink is None or sink.renders_console
+
+
+def active_sink() -> Optional["EventSink"]:
+    """接收事件的 sink；不接收事件时返回 None，调用方据此跳过构造事件"""
+    sink = _event_sink.get()
+    return sink if sink is not None and sink.enabled else None
+
+
+def notify(text: str, level: str = "info") -> None:
+    """
+    引擎的提示信息：以 Message 事件发给当前的 sink
+    
+    默认的 RichSink 把它渲染到终端；其它接收者 enabled 时收到事件，否则不构造事件。
+    
+    Args:
+        text: 纯文本（不含 Rich 标记）
+        level: info / success / warning / error
+    """
+    sink = _event_sink.get()
+    if sink is not None and not (sink.enabled or sink.renders_console):
+        return
+    from sckit_cli.utils.events import Message, RichSink
+    
+    (sink or RichSink()).emit(Message(text, level))
+
+
+class _LazyConsole:
+    """把属性访问转发给 get_console()，供 CLI 命令中 `console.print(...)` 使用"""
+    
+    def __getattr__(self, name: str):
+        return getattr(get_console(), name)
+
+
+console = _LazyConsole()
 
 app = typer.Typer(
     name="sckit",
@@ -400,7 +864,7 @@ app = typer.Typer(
 def version_callback(value: bool) -> None:
     """显示版本信息并退出"""
     if value:
-        console.print(f"sckit version {__version__}")
+        typer.echo(f"sckit version {__version__}")
         raise typer.Exit()
 
 
@@ -427,36 +891,163 @@ def main(
 # T032-T036: 核心函数
 # ============================================================================
 
-import httpx
-import zipfile
-import tempfile
-import shutil
-from rich.progress import Progress, BarColumn, DownloadColumn, TransferSpeedColumn, TimeRemainingColumn
-from rich.prompt import Prompt, Confirm
-from rich.panel import Panel
+# httpx、zipfile 与 Rich 的进度条/提示/面板只在需要时于函数内导入，
+# 保持 `sckit --version` 等轻量命令的启动速度
+
+
+_http_session: Optional["HttpSession"] = None
 
 
-def get_latest_release(github_token: Optional[str] = None) -> Release:
+def get_http_session() -> "HttpSession":
+    """
+    获取进程共享的 HTTP 会话（首次调用时创建）
+    
+    所有网络请求复用同一连接池，进程退出时关闭。
+    """
+    global _http_session
+    if _http_session is None:
+        from sckit_cli.utils.http import HttpSession
+        _http_session = HttpSession(
+            timeout=config.REQUEST_TIMEOUT,
+            max_connections=config.HTTP_MAX_CONNECTIONS,
+            http2=config.HTTP2,
+            retries=config.HTTP_RETRIES,
+            backoff_factor=config.HTTP_RETRY_BACKOFF,
+        )
+        atexit.register(_http_session.close)
+    return _http_session
+
+
+def open_cache() -> "ReleaseCache":
+    """打开用户级 Release/模板包缓存"""
+    from sckit_cli.utils.cache import ReleaseCache
+    return ReleaseCache(
+        ttl=config.CACHE_TTL, max_size=config.CACHE_MAX_SIZE, stale_ttl=config.CACHE_STALE_TTL,
+    )
+
+
+def get_latest_release(
+    github_token: Optional[str] = None,
+    cache: Optional["ReleaseCache"] = None,
+    url: Optional[str] = None,
+    revalidate: bool = False,
+) -> Release:
     """
     T032: 获取最新 Release
     
-    从 GitHub API 获取仓库的最新 Release 信息
+    从 GitHub API 获取仓库的最新 Release 信息。
+    
+    提供 cache 时（stale-while-revalidate）：
+    - TTL 内直接使用缓存
+    - 过期不超过 cache.stale_ttl：立即返回缓存，同时在后台携带 If-None-Match /
+      If-Modified-Since 重新验证，结果供之后的运行使用
+    - 更久未确认：同步重新验证（304 不消耗下载）；网络失败或限流时退回过期缓存
+    
+    revalidate=True 时忽略 TTL，总是同步重新验证。
+    
+    url 指向与 GitHub 相同 Release JSON 格式的镜像时，不发送 GitHub token
+    （只向 GitHub API 发送）。
+    """
+    url = url or config.release_api_url
+    cached = cache.get_release(url) if cache else None
+    
+    if cached and not revalidate:
+        if cached.is_fresh(cache.ttl):
+            cache.record(hit=True)
+            return Release.from_api_response(cached.data)
+        if cached.is_fresh(cache.ttl + cache.stale_ttl):
+            cache.record(hit=True)
+            refresh_in_background(
+                latest_release_exchange(url, github_token, cache, cached, record=False)
+            )
+            return Release.from_api_response(cached.data)
+    
+    return run_exchange(latest_release_exchange(url, github_token, cache, cached))
+
+
+# 一次 HTTP 交换：产出要发送的 (URL, 请求头)，接收响应（请求失败时被抛入 httpx 异常），
+# 结束时返回结果。同一段缓存与分页逻辑由同步会话或 AsyncInstaller 的异步客户端驱动。
+HttpExchange = Generator[Tuple[str, Dict[str, str]], "httpx.Response", Any]
+
+
+def exchange_step(
+    exchange: HttpExchange,
+    response: Optional["httpx.Response"] = None,
+    error: Optional[Exception] = None,
+) -> Tuple[bool, Any]:
+    """
+    推进交换一步
+    
+    Returns:
+        (是否结束, 下一个请求或最终结果)；不向外抛出 StopIteration，可在线程池中执行
+    """
+    try:
+        if error is not None:
+            return False, exchange.throw(error)
+        return False, exchange.send(response)
+    except StopIteration as stop:
+        return True, stop.value
+
+
+def run_exchange(exchange: HttpExchange) -> Any:
+    """用共享 HTTP 会话执行交换"""
+    import httpx
+    
+    done, value = exchange_step(exchange)
+    while not done:
+        url, headers = value
+        try:
+            response = get_http_session().get(url, headers=headers, timeout=config.REQUEST_TIMEOUT)
+        except httpx.HTTPError as e:
+            done, value = exchange_step(exchange, error=e)
+        else:
+            done, value = exchange_step(exchange, response)
+    return value
+
+
+def latest_release_exchange(
+    url: str,
+    github_token: Optional[str] = None,
+    cache: Optional["ReleaseCache"] = None,
+    cached: Optional["CachedRelease"] = None,
+    record: bool = True,
+) -> HttpExchange:
     """
+    向服务器获取（或用 cached 的校验器重新验证）最新 Release，并写入缓存
+    
+    网络失败或限流时退回 cached。record=False 时不计入命中统计（后台刷新）。
+    """
+    import httpx
+    
     headers = {
         "Accept": "application/vnd.github.v3+json",
     }
     
     # T044: 支持 GITHUB_TOKEN
     token = github_token or os.getenv("GITHUB_TOKEN")
-    if token:
+    if token and url.startswith(config.GITHUB_API_BASE + "/"):
         headers["Authorization"] = f"token {token}"
     
+    if cached:
+        headers.update(cached.conditional_headers())
+    
+    def serve_stale(error: NetworkError) -> Release:
+        """无法访问服务器时退回过期缓存"""
+        if not cached:
+            raise error
+        if record:
+            cache.record(hit=True)
+        return Release.from_api_response(cached.data)
+    
     try:
-        response = httpx.get(
-            config.release_api_url,
-            headers=headers,
-            timeout=config.REQUEST_TIMEOUT,
-        )
+        response = yield url, headers
+        
+        # 缓存仍然有效
+        if response.status_code == 304 and cached:
+            cache.touch_release(url)
+            if record:
+                cache.record(hit=True)
+            return Release.from_api_response(cached.data)
         
         # 检查速率限制
         if response.status_code == 403:
@@ -464,121 +1055,894 @@ def get_latest_release(github_token: Optional[str] = None) -> Release:
             if reset_time != "unknown":
                 reset_dt = datetime.fromtimestamp(int(reset_time))
                 reset_time = reset_dt.strftime("%Y-%m-%d %H:%M:%S")
-            raise RateLimitError(reset_time)
+            return serve_stale(RateLimitError(reset_time))
         
         response.raise_for_status()
-        return Release.from_api_response(response.json())
-        
+        data = response.json()
     except httpx.TimeoutException:
-        raise NetworkError("请求超时，请检查网络连接")
+        return serve_stale(NetworkError("请求超时，请检查网络连接"))
     except httpx.HTTPError as e:
-        raise NetworkError(f"网络请求失败: {e}")
+        return serve_stale(NetworkError(f"网络请求失败: {e}"))
+    
+    if cache:
+        cache.put_release(
+            url,
+            data,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        if record:
+            cache.record(hit=False)
+    
+    return Release.from_api_response(data)
 
 
-def download_file(
-    url: str,
-    dest: Path,
-    progress_callback: Optional[ProgressCallback] = None
-) -> None:
+# 进行中的后台重新验证（进程退出前等待完成，见 refresh_in_background()）
+_background_refreshes: List["threading.Thread"] = []
+
+
+def refresh_in_background(exchange: HttpExchange) -> None:
     """
-    T033: 下载文件
+    在后台线程中执行交换，结果只写入缓存；失败时忽略
     
-    使用 httpx 流式下载文件，支持进度回调
+    线程不是守护线程：进程退出前等待其完成（最多一次请求的超时时间），
+    刷新结果不会丢失。
     """
+    import threading
+    
+    def run() -> None:
+        try:
+            run_exchange(exchange)
+        except (SCKitError, OSError):
+            pass
+    
+    thread = threading.Thread(target=run, name="sckit-revalidate")
+    _background_refreshes.append(thread)
+    thread.start()
+
+
+def wait_for_refreshes() -> None:
+    """等待所有后台重新验证完成"""
+    while _background_refreshes:
+        _background_refreshes.pop().join()
+
+
+def release_index_exchange(
+    github_token: Optional[str] = None,
+    cache: Optional["ReleaseCache"] = None,
+    refresh: bool = False,
+) -> HttpExchange:
+    """fetch_release_index() 的交换，返回全部 Release 的 API 数据"""
+    import httpx
+    
+    url = config.releases_api_url
+    cached = cache.get_release(url) if cache else None
+    known = cached.data.get("releases", []) if cached else []
+    
+    if cached and not refresh and cached.is_fresh(cache.ttl):
+        cache.record(hit=True)
+        return known
+    
+    headers = {
+        "Accept": "application/vnd.github.v3+json",
+    }
+    token = github_token or os.getenv("GITHUB_TOKEN")
+    if token:
+        headers["Authorization"] = f"token {token}"
+    
+    def serve_stale(error: NetworkError) -> List[dict]:
+        if not cached:
+            raise error
+        cache.record(hit=True)
+        return known
+    
+    known_tags = {item["tag_name"] for item in known}
+    fetched: List[dict] = []
+    validators: Dict[str, Optional[str]] = {}
+    page_url: Optional[str] = f"{url}?per_page={config.RELEASES_PER_PAGE}"
+    
     try:
-        with httpx.stream("GET", url, timeout=config.REQUEST_TIMEOUT * 3, follow_redirects=True) as response:
-            response.raise_for_status()
-            total = int(response.headers.get("content-length", 0))
+        while page_url:
+            first_page = not validators
+            page_headers = dict(headers)
+            if first_page and cached:
+                page_headers.update(cached.conditional_headers())
             
-            downloaded = 0
-            with open(dest, "wb") as f:
-                for chunk in response.iter_bytes(chunk_size=config.DOWNLOAD_CHUNK_SIZE):
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if progress_callback:
-                        progress_callback(DownloadProgress(downloaded, total))
+            response = yield page_url, page_headers
             
-            # 验证文件大小
-            if total > 0 and dest.stat().st_size != total:
-                raise DownloadError("文件下载不完整")
-                
+            # 第一页没有变化：没有新的 Release
+            if first_page and response.status_code == 304 and cached:
+                cache.touch_release(url)
+                cache.record(hit=True)
+                return known
+            
+            if response.status_code == 403:
+                reset_time = response.headers.get("X-RateLimit-Reset", "unknown")
+                if reset_time != "unknown":
+                    reset_dt = datetime.fromtimestamp(int(reset_time))
+                    reset_time = reset_dt.strftime("%Y-%m-%d %H:%M:%S")
+                return serve_stale(RateLimitError(reset_time))
+            
+            response.raise_for_status()
+            items = response.json()
+            if first_page:
+                validators = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+            fetched.extend(items)
+            
+            # 之后的页面都已在缓存中
+            if any(item["tag_name"] in known_tags for item in items):
+                break
+            page_url = response.links.get("next", {}).get("url")
+    
+    except httpx.TimeoutException:
+        return serve_stale(NetworkError("请求超时，请检查网络连接"))
     except httpx.HTTPError as e:
-        raise DownloadError(f"下载失败: {e}")
-
-
-def extract_zip(zip_path: Path, extract_to: Path) -> None:
-    """
-    T034: 解压 ZIP 文件
+        return serve_stale(NetworkError(f"网络请求失败: {e}"))
     
-    解压模板 zip 文件到指定目录
-    """
-    try:
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_to)
-    except zipfile.BadZipFile:
-        raise FileSystemError(f"ZIP 文件损坏: {zip_path}")
-    except Exception as e:
-        raise FileSystemError(f"解压失败: {e}")
+    # 新获取的条目优先（可能补充了资源），其余保持缓存中的顺序
+    merged: Dict[str, dict] = {}
+    for item in fetched + known:
+        if not item.get("draft"):
+            merged.setdefault(item["tag_name"], item)
+    releases = list(merged.values())
+    
+    if cache:
+        cache.put_release(url, {"releases": releases}, **validators)
+        cache.record(hit=False)
+    
+    return releases
 
 
-def copy_template_files(
-    source_dir: Path,
-    target_dir: Path,
-    force: bool = False,
-    conflict_callback: Optional[FileConflictCallback] = None
-) -> tuple[int, int, int]:
+def fetch_release_index(
+    github_token: Optional[str] = None,
+    cache: Optional["ReleaseCache"] = None,
+    refresh: bool = False,
+) -> List[dict]:
     """
-    T035: 复制模板文件
+    获取全部 Release 的 API 数据（新 → 旧），来自分页的 releases 接口
     
-    从源目录复制文件到目标目录，处理文件冲突
-    
-    Returns:
-        (files_copied, files_skipped, files_overwritten)
+    提供 cache 时：TTL 内（且未要求 refresh）直接使用缓存的索引；否则增量刷新——
+    第一页携带条件请求头（304 表示没有变化），逐页获取直到遇到缓存中已有的
+    tag，只下载比缓存更新的页面。网络失败或限流时退回缓存。
     """
-    files_copied = 0
-    files_skipped = 0
-    files_overwritten = 0
+    return run_exchange(release_index_exchange(github_token, cache, refresh))
+
+
+def list_releases(
+    github_token: Optional[str] = None,
+    cache: Optional["ReleaseCache"] = None,
+    refresh: bool = False,
+) -> List[Release]:
+    """全部 Release（新 → 旧），见 fetch_release_index()"""
+    return [
+        Release.from_api_response(item)
+        for item in fetch_release_index(github_token, cache, refresh)
+    ]
+
+
+def release_exchange(
+    version: str,
+    github_token: Optional[str] = None,
+    cache: Optional["ReleaseCache"] = None,
+) -> HttpExchange:
+    """get_release() 的交换，返回指定版本的 Release"""
+    wanted = version.lstrip("v")
     
-    # 确保目标目录存在
-    target_dir.mkdir(parents=True, exist_ok=True)
+    def find(items: List[dict]) -> Optional[Release]:
+        for item in items:
+            if item["tag_name"].lstrip("v") == wanted:
+                return Release.from_api_response(item)
+        return None
     
-    # 遍历源目录中的所有文件
-    for source_file in source_dir.rglob("*"):
-        if source_file.is_file():
-            # 计算相对路径
-            rel_path = source_file.relative_to(source_dir)
-            target_file = target_dir / rel_path
-            
-            # 检查文件是否已存在
-            if target_file.exists() and not force:
-                # 询问是否覆盖
-                if conflict_callback and conflict_callback(target_file):
-                    # 用户选择覆盖
-                    target_file.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(source_file, target_file)
-                    files_overwritten += 1
-                else:
-                    # 跳过
-                    files_skipped += 1
-            else:
-                # 复制文件
-                target_file.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(source_file, target_file)
-                if target_file.exists() and not force:
-                    files_overwritten += 1
-                else:
-                    files_copied += 1
+    cached = cache.get_release(config.releases_api_url) if cache else None
+    if cached:
+        release = find(cached.data.get("releases", []))
+        if release is not None:
+            cache.record(hit=True)
+            return release
     
-    return files_copied, files_skipped, files_overwritten
+    release = find((yield from release_index_exchange(github_token, cache, refresh=True)))
+    if release is None:
+        raise ValidationError(f"找不到版本 v{wanted}，可用 `sckit releases` 查看可用版本")
+    return release
 
 
-def prompt_editor_choice() -> Editor:
+def get_release(
+    version: str,
+    github_token: Optional[str] = None,
+    cache: Optional["ReleaseCache"] = None,
+) -> Release:
     """
-    T036 + T016: 交互式编辑器选择
+    获取指定版本的 Release（"0.3.0" 与 "v0.3.0" 等价）
     
-    使用箭头键选择界面让用户选择编辑器。
-    在非交互式环境（CI/CD）中自动降级到默认值。
+    缓存的索引中已有该版本时直接返回，不访问网络（无论是否过期：已发布的
+    版本不会改变）；否则增量刷新索引后再查找。
+    
+    Raises:
+        ValidationError: 版本不存在
+    """
+    return run_exchange(release_exchange(version, github_token, cache))
+
+
+TEMPLATE_ASSET_PATTERN = r"^sckit-(?P<editor>[a-z]+)-(?P<version>.+)\.zip$"
+
+
+def local_release(path: Path) -> Release:
+    """
+    由本地模板源构造 Release（不访问网络）
+    
+    支持：
+    - `sckit-<editor>-<version>.zip` 文件（名称不符合时视为适用于所有编辑器）
+    - 包含若干 `sckit-<editor>-<version>.zip` 的目录（Release 资源的本地镜像）
+    - 解压后的目录：含 `<config_dir>/commands/`、`commands/`，或本身就是 commands 目录
+    """
+    import re
+    
+    if not path.exists():
+        raise ValidationError(f"模板源不存在: {path}")
+    
+    def generic(target: Path, version: str) -> Release:
+        return Release(
+            tag_name=version,
+            name=f"本地模板 ({target})",
+            assets=[
+                ReleaseAsset(name=f"sckit-{e.value}-{version}", download_url=str(target), size=0)
+                for e in Editor
+            ],
+        )
+    
+    if path.is_file():
+        match = re.match(TEMPLATE_ASSET_PATTERN, path.name)
+        if not match:
+            return generic(path, "local")
+        return Release(
+            tag_name=match.group("version"),
+            name=f"本地模板 ({path})",
+            assets=[ReleaseAsset(name=path.name, download_url=str(path), size=path.stat().st_size)],
+        )
+    
+    assets = []
+    version = "local"
+    for zip_path in sorted(path.glob("sckit-*.zip")):
+        match = re.match(TEMPLATE_ASSET_PATTERN, zip_path.name)
+        if match:
+            version = match.group("version")
+            assets.append(ReleaseAsset(
+                name=zip_path.name, download_url=str(zip_path), size=zip_path.stat().st_size,
+            ))
+    if assets:
+        return Release(tag_name=version, name=f"本地模板 ({path})", assets=assets)
+    
+    return generic(path, version)
+
+
+def fetch_source_release(
+    source: TemplateSource,
+    cache: Optional["ReleaseCache"] = None,
+    github_token: Optional[str] = None,
+    version: Optional[str] = None,
+    revalidate: bool = False,
+) -> Release:
+    """
+    获取单个模板源的 Release
+    
+    GitHub 仓库查询最新 Release（默认仓库指定 version 时按版本查找）；本地路径完全离线；
+    `.zip` URL 直接作为模板包下载；其它 URL 视为与 GitHub 格式相同的 Release JSON 镜像。
+    
+    各源的 Release 元数据按各自的 URL 分别缓存。源指定了令牌环境变量时，
+    元数据与资源都携带该令牌获取（见 Release.authorize()）。
+    
+    Args:
+        github_token: 源未指定令牌时使用的令牌（默认 GITHUB_TOKEN）
+        revalidate: 忽略缓存 TTL，总是发送条件请求（见 get_latest_release()）
+    """
+    from sckit_cli.utils.sources import TemplateSource
+    if source.kind == "local":
+        notify(f"使用本地模板源: {source}")
+        return local_release(Path(source.location).expanduser().resolve())
+    
+    if source.kind == "url":
+        notify(f"正在从镜像获取模板信息: {source}")
+        release = zip_url_release(source.location) or get_latest_release(
+            cache=cache, url=source.location, revalidate=revalidate,
+        )
+    elif version:
+        notify(f"正在获取 v{version.lstrip('v')} 模板信息...")
+        release = get_release(version, github_token, cache=cache)
+    else:
+        is_default = source == TemplateSource.default()
+        if is_default:
+            notify("正在获取最新模板信息...")
+        else:
+            notify(f"正在获取 {source} 的最新模板信息...")
+        release = get_latest_release(
+            source.token or github_token, cache=cache,
+            url=None if is_default else source.release_api_url, revalidate=revalidate,
+        )
+        if source.token:
+            release.authorize(source.token)
+    
+    attach_checksums(release, cache)
+    return release
+
+
+def fetch_releases(
+    sources: List[TemplateSource],
+    cache: Optional["ReleaseCache"] = None,
+    github_token: Optional[str] = None,
+    version: Optional[str] = None,
+    revalidate: bool = False,
+) -> List[Release]:
+    """
+    获取所有模板源的 Release（与模板源顺序一致）
+    
+    多个模板源并发获取，总耗时接近最慢的单个源。参数见 fetch_source_release()。
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    def fetch(source: TemplateSource) -> Release:
+        return fetch_source_release(source, cache, github_token, version, revalidate)
+    
+    if len(sources) == 1:
+        return [fetch(sources[0])]
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        return list(executor.map(in_current_context(fetch), sources))
+
+
+def attach_checksums(release: Release, cache: Optional["ReleaseCache"] = None) -> None:
+    """
+    为缺少摘要的资源填入 SHA256SUMS 中的摘要
+    
+    GitHub API 已提供 digest 时不再获取校验文件。校验文件随 Release 发布后
+    不再变化，缓存后直接使用；获取失败时摘要保持未知（只检查大小）。
+    """
+    import httpx
+    
+    checksums_asset = release.get_checksums_asset()
+    if checksums_asset is None or all(
+        a.sha256 for a in release.assets if a is not checksums_asset
+    ):
+        return
+    
+    url = checksums_asset.download_url
+    cached = cache.get_release(url) if cache else None
+    if cached:
+        checksums = cached.data.get("checksums", {})
+    else:
+        try:
+            response = get_http_session().get(
+                url, headers=checksums_asset.headers, timeout=config.REQUEST_TIMEOUT,
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            notify(f"无法获取 SHA256SUMS（{e}），只检查文件大小", "warning")
+            return
+        checksums = parse_checksums(response.text)
+        if cache:
+            cache.put_release(url, {"checksums": checksums})
+    
+    for asset in release.assets:
+        if asset.sha256 is None:
+            asset.sha256 = checksums.get(asset.name)
+
+
+def verify_digest(name: str, expected: Optional[str], digest: "hashlib._Hash") -> str:
+    """
+    比较增量计算的摘要与发布的摘要
+    
+    Raises:
+        IntegrityError: 摘要不符（expected 为 None 时不检查）
+    
+    Returns:
+        str: 实际摘要（十六进制）
+    """
+    actual = digest.hexdigest()
+    if expected is not None and actual != expected:
+        raise IntegrityError(name, expected, actual)
+    return actual
+
+
+def http_bytes_received() -> int:
+    """共享 HTTP 会话迄今接收的（非流式）响应字节数"""
+    return _http_session.stats.bytes_received if _http_session is not None else 0
+
+
+def timed_fetch_releases(
+    config_obj: InstallConfig,
+    cache: Optional["ReleaseCache"],
+    recorder: "PhaseRecorder",
+) -> List[Release]:
+    """按安装配置获取所有模板源的 Release，并记录 release 阶段"""
+    with recorder.phase("release") as timing:
+        before = http_bytes_received()
+        releases = fetch_releases(
+            config_obj.template_sources, cache, config_obj.github_token, config_obj.version,
+        )
+        timing.bytes = http_bytes_received() - before
+    return releases
+
+
+def zip_url_release(url: str) -> Optional[Release]:
+    """
+    URL 直接指向 `.zip` 模板包时构造单资源 Release，否则返回 None
+    
+    文件名不符合 `sckit-<editor>-<version>.zip` 时视为适用于所有编辑器。
+    """
+    import re
+    
+    name = url.rsplit("/", 1)[-1].split("?", 1)[0]
+    if not name.endswith(".zip"):
+        return None
+    
+    match = re.match(TEMPLATE_ASSET_PATTERN, name)
+    if match:
+        return Release(
+            tag_name=match.group("version"),
+            name=name,
+            assets=[ReleaseAsset(name=name, download_url=url, size=0)],
+        )
+    return Release(
+        tag_name="mirror",
+        name=name,
+        assets=[
+            ReleaseAsset(name=f"sckit-{e.value}-mirror.zip", download_url=url, size=0)
+            for e in Editor
+        ],
+    )
+
+
+class RestartDownload(Exception):
+    """续传请求被拒绝，需要从头下载"""
+    pass
+
+
+def _content_range_total(value: Optional[str]) -> int:
+    """解析 Content-Range 头中的总长度（'bytes 100-199/200' → 200）"""
+    if not value or "/" not in value:
+        return 0
+    total = value.rsplit("/", 1)[1].strip()
+    return int(total) if total.isdigit() else 0
+
+
+class RangeResume:
+    """
+    可续传下载的状态（download_stream() 与 AsyncInstaller 共用）
+    
+    记录已接收的字节数与资源校验器（ETag / Last-Modified），据此生成
+    Range / If-Range 请求头，并检查响应能否接在已有数据之后。
+    """
+    
+    def __init__(
+        self,
+        url: str,
+        offset: int = 0,
+        validator: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        self.url = url
+        self.downloaded = offset
+        self.validator = validator
+        self.headers = dict(headers or {})
+        self.max_bytes = config.MAX_TEMPLATE_SIZE if max_bytes is None else max_bytes
+        self.total = 0
+    
+    def request_headers(self) -> Dict[str, str]:
+        """下一次请求的请求头（已有数据时从其后续传）"""
+        headers = dict(self.headers)
+        if self.downloaded > 0:
+            headers["Range"] = f"bytes={self.downloaded}-"
+            if self.validator:
+                headers["If-Range"] = self.validator
+        return headers
+    
+    def accept(self, response: "httpx.Response") -> bool:
+        """
+        检查响应头，记录资源总大小与校验器
+        
+        Returns:
+            校验器是否变化（调用方应持久化 self.validator）
+        
+        Raises:
+            RestartDownload: 服务器不支持 Range，或资源已变化（If-Range 不匹配）
+            TemplateLimitError: 服务器声明的大小超过上限
+            httpx.HTTPStatusError: 其它错误状态
+        """
+        if response.status_code == 416 and self.downloaded > 0:
+            # 已有数据超出资源长度：丢弃后从头下载
+            raise RestartDownload()
+        response.raise_for_status()
+        
+        if self.downloaded > 0 and response.status_code != 206:
+            raise RestartDownload()
+        
+        if response.status_code == 206:
+            self.total = _content_range_total(response.headers.get("content-range"))
+        else:
+            self.total = int(response.headers.get("content-length", 0))
+        
+        changed = False
+        validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+        if validator and validator != self.validator:
+            self.validator = validator
+            changed = True
+        
+        if self.total > self.max_bytes:
+            raise self.too_large(self.total)
+        return changed
+    
+    def too_large(self, size: int) -> TemplateLimitError:
+        return TemplateLimitError(f"下载大小 {size} 字节超过上限 {self.max_bytes} 字节: {self.url}")
+    
+    @property
+    def incomplete(self) -> bool:
+        """连接提前结束，还有数据未接收"""
+        return self.total > 0 and self.downloaded < self.total
+    
+    def restart(self) -> None:
+        """丢弃已有数据，从头下载"""
+        self.downloaded = 0
+        self.validator = None
+
+
+def download_stream(
+    url: str,
+    on_chunk: Callable[[bytes], None],
+    progress_callback: Optional[ProgressCallback] = None,
+    offset: int = 0,
+    validator: Optional[str] = None,
+    on_validator: Optional[Callable[[str], None]] = None,
+    on_restart: Optional[Callable[[], None]] = None,
+    on_total: Optional[Callable[[int], None]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    max_bytes: Optional[int] = None,
+) -> int:
+    """
+    流式下载，把每个数据块交给 on_chunk 处理
+    
+    块大小根据实测吞吐量自适应（config.DOWNLOAD_CHUNK_SIZE ~
+    config.DOWNLOAD_MAX_CHUNK_SIZE）；进度回调最多每
+    config.PROGRESS_INTERVAL 秒一次，下载结束时再回调一次。
+    
+    传输中断（包括连接提前关闭导致的不完整）时，使用 Range / If-Range
+    从已接收的位置续传，最多重试 config.HTTP_RETRIES 次。
+    
+    Args:
+        offset: 已有的字节数（从此处续传）
+        validator: 已有数据对应的 ETag / Last-Modified
+        on_validator: 收到响应校验器时回调（用于持久化续传状态）
+        on_restart: 服务器不接受续传、需要从头开始时回调（调用方应丢弃已有数据）
+        on_total: 得知资源总大小时回调（用于预分配目标文件）
+        headers: 附加的请求头（如私有仓库的令牌，见 ReleaseAsset.headers）
+        max_bytes: 大小上限，默认 config.MAX_TEMPLATE_SIZE；服务器声明的大小超限时
+            不读取响应体，实际接收的字节超限时立即中止（超限的数据块不交给 on_chunk）
+    
+    Raises:
+        TemplateLimitError: 超过大小上限
+    
+    Returns:
+        int: 已下载字节数（含 offset）
+    """
+    import time
+    import httpx
+    from sckit_cli.utils.http import AdaptiveChunker
+    
+    session = get_http_session()
+    resume = RangeResume(url, offset, validator, headers, max_bytes)
+    attempts = 0
+    last_report = float("-inf")  # 第一块总会报告
+    
+    while True:
+        try:
+            with session.stream(
+                "GET", url, headers=resume.request_headers(), timeout=config.REQUEST_TIMEOUT * 3
+            ) as response:
+                if resume.accept(response) and on_validator:
+                    on_validator(resume.validator)
+                total = resume.total
+                if total > 0 and on_total:
+                    on_total(total)
+                
+                def emit(chunk: bytes) -> None:
+                    nonlocal last_report
+                    on_chunk(chunk)
+                    resume.downloaded += len(chunk)
+                    if progress_callback:
+                        now = time.monotonic()
+                        if now - last_report >= config.PROGRESS_INTERVAL:
+                            last_report = now
+                            progress_callback(DownloadProgress(resume.downloaded, total))
+                
+                chunker = AdaptiveChunker(
+                    min_size=config.DOWNLOAD_CHUNK_SIZE,
+                    max_size=config.DOWNLOAD_MAX_CHUNK_SIZE,
+                )
+                # 按到达的字节计数（分块器会缓冲数据），超限时丢弃未交付的部分
+                received = resume.downloaded
+                try:
+                    for data in response.iter_bytes():
+                        received += len(data)
+                        if received > resume.max_bytes:
+                            raise resume.too_large(received)
+                        for chunk in chunker.feed(data):
+                            emit(chunk)
+                except httpx.TransportError:
+                    # 已收到的数据照常交给调用方，续传从其后开始
+                    for chunk in chunker.flush():
+                        emit(chunk)
+                    raise
+                for chunk in chunker.flush():
+                    emit(chunk)
+                
+                if progress_callback:
+                    progress_callback(DownloadProgress(resume.downloaded, total))
+                
+                # 连接提前结束：续传剩余部分
+                if resume.incomplete:
+                    raise httpx.RemoteProtocolError("文件下载不完整")
+                
+                return resume.downloaded
+        
+        except RestartDownload:
+            if on_restart is None:
+                raise DownloadError("服务器不支持续传，下载失败")
+            on_restart()
+            resume.restart()
+        except httpx.TransportError as e:
+            attempts += 1
+            if attempts > config.HTTP_RETRIES:
+                raise DownloadError(f"下载失败: {e}")
+        except httpx.HTTPError as e:
+            raise DownloadError(f"下载失败: {e}")
+
+
+def download_file(
+    url: str,
+    dest: Path,
+    progress_callback: Optional[ProgressCallback] = None,
+    sha256: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None,
+    max_bytes: Optional[int] = None,
+) -> str:
+    """
+    T033: 下载文件
+    
+    使用 httpx 流式下载文件，支持进度回调；传输中断时自动续传。
+    得知 content-length 后预分配目标文件，减少写入时的文件系统碎片与元数据更新。
+    
+    SHA-256 随数据块到达增量计算，不需要再读回文件。
+    
+    Args:
+        sha256: 发布的摘要；不符时删除文件并抛出 IntegrityError
+        headers: 附加的请求头
+        max_bytes: 大小上限（见 download_stream()）；超限时删除文件并抛出 TemplateLimitError
+    
+    Returns:
+        str: 文件的 SHA-256 摘要
     """
+    import hashlib
+    
+    digest = hashlib.sha256()
+    
+    with open(dest, "wb") as f:
+        def write(chunk: bytes) -> None:
+            f.write(chunk)
+            digest.update(chunk)
+        
+        def restart() -> None:
+            nonlocal digest
+            f.seek(0)
+            f.truncate()
+            digest = hashlib.sha256()
+        
+        def preallocate(total: int) -> None:
+            if f.tell() > 0:
+                return  # 续传时文件已有数据
+            try:
+                if hasattr(os, "posix_fallocate"):
+                    os.posix_fallocate(f.fileno(), 0, total)
+            except OSError:
+                pass  # 文件系统不支持时照常写入
+        
+        try:
+            download_stream(
+                url, write, progress_callback,
+                on_restart=restart, on_total=preallocate, headers=headers, max_bytes=max_bytes,
+            )
+        except TemplateLimitError:
+            f.close()
+            dest.unlink(missing_ok=True)
+            raise
+        # 去掉预分配后未写入的部分（例如服务器实际返回的数据更少）
+        f.truncate()
+    
+    try:
+        return verify_digest(dest.name, sha256, digest)
+    except IntegrityError:
+        dest.unlink(missing_ok=True)
+        raise
+
+
+def extraction_budget() -> "ExtractionBudget":
+    """按 config 的解压限制创建一次解压的用量计数"""
+    from sckit_cli.utils.limits import ExtractionBudget, ExtractionLimits
+    
+    return ExtractionBudget(ExtractionLimits(
+        max_entries=config.MAX_TEMPLATE_FILES,
+        max_total_size=config.MAX_EXTRACTED_SIZE,
+        max_ratio=config.MAX_COMPRESSION_RATIO,
+    ))
+
+
+def check_template_size(asset: ReleaseAsset) -> None:
+    """模板包的大小超过 config.MAX_TEMPLATE_SIZE 时在下载/解压前拒绝"""
+    if asset.size > config.MAX_TEMPLATE_SIZE:
+        raise TemplateLimitError(
+            f"模板包 {asset.name} 大小 {asset.size} 字节超过上限 {config.MAX_TEMPLATE_SIZE} 字节"
+        )
+
+
+def _extract_members(
+    zip_ref: "zipfile.ZipFile",
+    select: Callable[..., Optional[Path]],
+) -> None:
+    """
+    按 select 解压 zip 成员，解压出的字节计入解压限制
+    
+    先按中央目录声明的大小检查，再在复制时按实际解压出的字节检查。
+    """
+    from sckit_cli.utils.filters import FRONTMATTER_MAX_BYTES
+    from sckit_cli.utils.limits import ArchiveLimitError
+    
+    budget = extraction_budget()
+    try:
+        for info in zip_ref.infolist():
+            if info.is_dir():
+                continue
+            budget.entry(info.filename, info.compress_size, info.file_size)
+            
+            def read_head(info=info) -> bytes:
+                with zip_ref.open(info) as member:
+                    return member.read(FRONTMATTER_MAX_BYTES)
+            
+            dest = select(info.filename, read_head)
+            if dest is None:
+                continue
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            with zip_ref.open(info) as src, open(dest, "wb") as dst:
+                for block in iter(lambda: src.read(config.DOWNLOAD_CHUNK_SIZE), b""):
+                    budget.produce(len(block))
+                    dst.write(block)
+    except ArchiveLimitError as e:
+        raise TemplateLimitError(f"模板包超出解压限制: {e}")
+
+
+def extract_zip(zip_path: Path, extract_to: Path) -> None:
+    """
+    T034: 解压 ZIP 文件
+    
+    解压模板 zip 文件到指定目录；拒绝路径穿越，成员数、解压后大小与压缩比
+    超出限制时中止（见 extraction_budget()）
+    """
+    import zipfile
+    
+    root = extract_to.resolve()
+    
+    def select(name: str, read_head: Optional[Callable[[], bytes]] = None) -> Path:
+        dest = (root / name.replace("\\", "/")).resolve()
+        if root not in dest.parents:
+            raise FileSystemError(f"模板包包含非法路径: {name}")
+        return dest
+    
+    try:
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            _extract_members(zip_ref, select)
+    except zipfile.BadZipFile:
+        raise FileSystemError(f"ZIP 文件损坏: {zip_path}")
+    except SCKitError:
+        raise
+    except Exception as e:
+        raise FileSystemError(f"解压失败: {e}")
+
+
+def template_member_selector(
+    staging_dir: Path,
+    editor: Editor,
+    template_filter: Optional["TemplateFilter"] = None,
+) -> Callable[..., Optional[Path]]:
+    """
+    构造 zip 成员选择函数
+    
+    只选择 `<config_dir>/commands/` 与 `commands/` 下的成员，并保持其相对路径
+    写入 staging_dir；拒绝路径穿越。
+    
+    指定 template_filter 时只选择匹配的模板；选择函数的第二个参数
+    read_head 用于按标签匹配时读取成员开头（见 TemplateFilter.matches()）。
+    """
+    prefixes = (f"{editor.config_dir}/commands/", "commands/")
+    root = staging_dir.resolve()
+    
+    def select(name: str, read_head: Optional[Callable[[], bytes]] = None) -> Optional[Path]:
+        name = name.replace("\\", "/")
+        prefix = next((p for p in prefixes if name.startswith(p)), None)
+        if prefix is None:
+            return None
+        dest = (root / name).resolve()
+        if root not in dest.parents:
+            raise FileSystemError(f"模板包包含非法路径: {name}")
+        if template_filter and not template_filter.matches(name[len(prefix):], read_head):
+            return None
+        return dest
+    
+    return select
+
+
+def extract_template_members(
+    zip_path: Path,
+    staging_dir: Path,
+    editor: Editor,
+    template_filter: Optional["TemplateFilter"] = None,
+) -> None:
+    """
+    从本地 zip 中只解压 commands 成员到 staging_dir
+    
+    成员列表来自 zip 的中央目录；按标签筛选时只解压候选成员开头的
+    frontmatter，未选中的成员不会被完整解压或写入。超出解压限制时
+    抛出 TemplateLimitError。
+    """
+    import zipfile
+    
+    select = template_member_selector(staging_dir, editor, template_filter)
+    try:
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            _extract_members(zip_ref, select)
+    except zipfile.BadZipFile:
+        raise FileSystemError(f"ZIP 文件损坏: {zip_path}")
+    except SCKitError:
+        raise
+    except Exception as e:
+        raise FileSystemError(f"解压失败: {e}")
+
+
+def copy_template_files(
+    source_dir: Path,
+    target_dir: Path,
+    force: bool = False,
+    conflict_callback: Optional[ConflictCallback] = None,
+    move: bool = False,
+) -> tuple[int, int, int]:
+    """
+    T035: 复制模板文件
+    
+    从源目录复制文件到目标目录，处理文件冲突；内容相同的文件不会重写。
+    
+    Returns:
+        (files_copied, files_skipped, files_overwritten)
+        内容相同而未写入的文件计入 files_skipped
+    """
+    from sckit_cli.utils.sync import sync_template_files
+    result = sync_template_files(
+        source_dir, target_dir, force, conflict_callback, move
+    )
+    return (
+        result.files_copied,
+        result.files_skipped + result.files_unchanged,
+        result.files_overwritten,
+    )
+
+
+def prompt_editor_choice() -> Editor:
+    """
+    T036 + T016: 交互式编辑器选择
+    
+    使用箭头键选择界面让用户选择编辑器。
+    在非交互式环境（CI/CD）中自动降级到默认值。
+    """
+    from rich.prompt import Prompt
+    
     # 检测非交互式环境
     if not sys.stdin.isatty():
         console.print("[cyan]Non-interactive mode: using Cursor[/cyan]")
@@ -597,7 +1961,7 @@ def prompt_editor_choice() -> Editor:
             options=options,
             prompt="选择 AI 编辑器",
             default="Cursor",
-            console=console
+            console=get_console()
         )
         
         # 转换为 Editor 枚举
@@ -618,126 +1982,1267 @@ def prompt_editor_choice() -> Editor:
 # T037: install_template 编排函数
 # ============================================================================
 
-def install_template(config_obj: InstallConfig) -> InstallResult:
+def download_progress() -> Progress:
+    """下载进度条"""
+    from rich.progress import (
+        Progress, BarColumn, DownloadColumn, TextColumn,
+        TransferSpeedColumn, TimeRemainingColumn,
+    )
+    
+    return Progress(
+        TextColumn("{task.description}"),
+        BarColumn(),
+        DownloadColumn(),
+        TransferSpeedColumn(),
+        TimeRemainingColumn(),
+        console=get_console(),
+    )
+
+
+@contextmanager
+def progress_display() -> Iterator[Optional[Progress]]:
+    """
+    终端中显示下载进度条
+    
+    输出不是终端（CI、管道、重定向）或引擎输出交给其它 sink 时不创建进度条，
+    下载也不再产生进度回调。
+    """
+    if not renders_console() or not get_console().is_terminal:
+        yield None
+        return
+    with download_progress() as progress:
+        yield progress
+
+
+@contextmanager
+def _progress_context(progress: Optional[Progress]) -> Iterator[Optional[Progress]]:
+    """使用共享进度条，或创建一个仅在本次下载期间显示的进度条"""
+    if progress is not None:
+        yield progress
+    else:
+        with progress_display() as own:
+            yield own
+
+
+def stream_template_members(
+    asset: ReleaseAsset,
+    staging_dir: Path,
+    editor: Editor,
+    cache: Optional["ReleaseCache"] = None,
+    progress: Optional[Progress] = None,
+    template_filter: Optional["TemplateFilter"] = None,
+) -> int:
+    """
+    边下载边解压，只把 commands 成员写入 staging_dir
+    
+    启用缓存时，下载的字节同时写入缓存目录中的未完成文件（附带 ETag），
+    中断后下次运行会先回放已有数据，再用 Range / If-Range 续传剩余部分。
+    zip 结构无法流式解析时，改为下载完成后从缓存文件中解压。
+    
+    SHA-256 随数据块增量计算（含回放的数据）；与 asset.sha256 不符时
+    在暂存文件进入项目、模板包进入缓存之前抛出 IntegrityError。
+    下载超过 config.MAX_TEMPLATE_SIZE 或解压超出限制时立即中止，
+    抛出 TemplateLimitError（未完成的缓存文件一并丢弃）。
+    
+    template_filter: 只写入选中的模板。按路径筛选时流式解压直接跳过未选中的成员；
+        按标签筛选需要读取成员开头，改为下载完成后从中央目录解压
+    progress: 共享的进度条（并发下载多个模板包时使用），省略时单独显示
+    
+    Returns:
+        int: 本次通过网络接收的字节数
+    """
+    import hashlib
+    import shutil
+    import tempfile
+    from sckit_cli.utils.limits import ArchiveLimitError
+    from sckit_cli.utils.stream_unzip import (
+        StreamingZipExtractor,
+        StreamingUnsupportedError,
+        StreamingZipError,
+    )
+    
+    url = asset.download_url
+    select = template_member_selector(staging_dir, editor, template_filter)
+    extractor = StreamingZipExtractor(select, extraction_budget())
+    stream_members = not (template_filter and template_filter.needs_tags)
+    streaming = stream_members
+    received = 0
+    digest = hashlib.sha256()
+    
+    # 其它进程正在下载同一文件时，本次不写缓存
+    partial = None
+    cache_file = None
+    locked = False
+    if cache:
+        try:
+            locked = cache.lock_partial(url)
+            if locked:
+                register_cleanup_path(cache.partial_lock_path(url))
+                partial = cache.get_partial(url)
+                cache_file = open(partial.path, "ab")
+        except OSError:
+            partial = None  # 缓存不可写时仅流式解压
+    
+    def feed(chunk: bytes) -> None:
+        nonlocal streaming
+        digest.update(chunk)
+        if not streaming:
+            return
+        try:
+            extractor.feed(chunk)
+        except StreamingUnsupportedError:
+            if cache_file is None:
+                raise
+            # 继续下载到缓存文件，完成后再解压
+            streaming = False
+    
+    def on_chunk(chunk: bytes) -> None:
+        nonlocal received
+        received += len(chunk)
+        feed(chunk)
+        if cache_file:
+            cache_file.write(chunk)
+    
+    def on_validator(validator: str) -> None:
+        if cache_file:
+            cache_file.flush()
+            cache.set_partial_validator(url, validator)
+    
+    def on_restart() -> None:
+        nonlocal extractor, streaming, digest
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        staging_dir.mkdir(parents=True, exist_ok=True)
+        extractor = StreamingZipExtractor(select, extraction_budget())
+        streaming = stream_members
+        digest = hashlib.sha256()
+        if cache_file:
+            cache_file.seek(0)
+            cache_file.truncate()
+    
+    offset = partial.offset if partial else 0
+    
+    # 下载锁在成功（移入缓存后）或任何失败时都在这里释放
+    try:
+        try:
+            if not streaming and cache_file is None:
+                raise StreamingUnsupportedError("按标签筛选需要完整的模板包")
+            
+            # 回放上次未完成的数据
+            if offset:
+                with open(partial.path, "rb") as f:
+                    for block in iter(lambda: f.read(1024 * 1024), b""):
+                        feed(block)
+                notify(f"从 {offset // 1024} KB 处继续下载")
+            
+            # T033 + T042: 下载文件（带进度）
+            notify(f"正在下载并解压模板 {asset.name}...")
+            with _progress_context(progress) as bar:
+                update_progress = None
+                sink = active_sink()
+                if bar is not None:
+                    task_id = bar.add_task(
+                        f"[cyan]{editor.display_name}", total=asset.size, completed=offset,
+                    )
+                    
+                    def update_progress(prog: DownloadProgress):
+                        bar.update(task_id, completed=prog.downloaded)
+                elif sink is not None:
+                    from sckit_cli.utils.events import BytesReceived
+                    
+                    def update_progress(prog: DownloadProgress):
+                        sink.emit(BytesReceived(asset.name, prog.downloaded, prog.total))
+                
+                download_stream(
+                    url,
+                    on_chunk,
+                    update_progress,
+                    offset=offset,
+                    validator=partial.validator if partial else None,
+                    on_validator=on_validator,
+                    on_restart=on_restart,
+                    headers=asset.headers,
+                )
+            
+            if cache_file:
+                cache_file.close()
+            
+            # 先校验整个模板包，再完成解压或放入缓存
+            sha256 = verify_digest(asset.name, asset.sha256, digest)
+            if streaming:
+                extractor.close()
+            else:
+                extract_template_members(partial.path, staging_dir, editor, template_filter)
+            
+        except StreamingUnsupportedError:
+            # 未启用缓存：重新下载完整 zip 后只解压所需成员
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                zip_file = Path(tmp_dir) / asset.name
+                sha256 = download_file(url, zip_file, sha256=asset.sha256, headers=asset.headers)
+                received += zip_file.stat().st_size
+                extract_template_members(zip_file, staging_dir, editor, template_filter)
+        except StreamingZipError as e:
+            if cache:
+                cache.discard_partial(url)
+            raise FileSystemError(f"ZIP 文件损坏: {e}")
+        except (ArchiveLimitError, TemplateLimitError) as e:
+            if cache:
+                cache.discard_partial(url)
+            if isinstance(e, ArchiveLimitError):
+                raise TemplateLimitError(f"模板包超出解压限制: {e}")
+            raise
+        except IntegrityError:
+            if cache:
+                cache.discard_partial(url)
+            raise
+        finally:
+            if cache_file:
+                cache_file.close()
+        
+        notify(f"✓ {asset.name} 下载并解压完成", "success")
+        
+        if cache:
+            cache.record(hit=False)
+            if partial:
+                try:
+                    cache.complete_partial(url, sha256)
+                except OSError:
+                    pass
+    finally:
+        if locked:
+            cache.unlock_partial(url)
+        
+    return received
+
+
+def find_commands_source(extract_dir: Path, editor: Editor) -> Path:
+    """
+    在解压目录中查找 commands 目录（可能在 .cursor/commands 或 .claude/commands）
+    """
+    for candidate in [
+        extract_dir / editor.config_dir / "commands",
+        extract_dir / "commands",
+    ]:
+        if candidate.exists() and candidate.is_dir():
+            return candidate
+    
+    raise FileSystemError("模板包中未找到 commands 目录")
+
+
+def find_local_commands(directory: Path, editor: Editor) -> Path:
+    """
+    在本地目录模板源中查找 commands 目录
+    
+    目录中没有 commands 子目录时，目录本身即视为 commands 目录。
+    """
+    try:
+        return find_commands_source(directory, editor)
+    except FileSystemError:
+        if any(p.is_file() for p in directory.iterdir()):
+            return directory
+        raise FileSystemError(f"模板源中未找到模板文件: {directory}")
+
+
+def stage_template_source(
+    release: Release,
+    editor: Editor,
+    staging_dir: Path,
+    cache: Optional["ReleaseCache"] = None,
+    progress: Optional[Progress] = None,
+    recorder: Optional["PhaseRecorder"] = None,
+    template_filter: Optional["TemplateFilter"] = None,
+) -> Path:
+    """
+    把指定编辑器模板包中的 commands 成员放入暂存目录
+    
+    缓存命中时直接从缓存 zip 中读取所需成员；否则边下载边解压。
+    本地 zip 直接解压；本地目录不经过暂存，直接返回其中的 commands 目录
+    （调用方不能移动其中的文件，筛选在生成计划时进行）。
+    
+    recorder: 记录 download（边下载边解压）或 extract（缓存/本地 zip）阶段
+    template_filter: 只暂存选中的模板
+    
+    Returns:
+        Path: commands 源目录
+    """
+    from sckit_cli.utils.timings import optional_phase
+    
+    # 获取对应编辑器的模板资源
+    asset = release.get_template_asset(editor)
+    if not asset:
+        raise TemplateNotFoundError(editor, release.version)
+    
+    local_path = asset.local_path
+    if local_path is not None and local_path.is_dir():
+        return find_local_commands(local_path, editor)
+    check_template_size(asset)
+    
+    staging_dir.mkdir(parents=True, exist_ok=True)
+    
+    def staged_source() -> Path:
+        try:
+            return find_commands_source(staging_dir, editor)
+        except FileSystemError:
+            if template_filter:
+                raise ValidationError(f"没有模板匹配筛选条件（{template_filter.describe()}）")
+            raise
+    
+    if local_path is not None:
+        with optional_phase(recorder, "extract", editor.value) as timing:
+            extract_template_members(local_path, staging_dir, editor, template_filter)
+            timing.files = count_files(staging_dir)
+        return staged_source()
+    
+    notify(f"找到模板: {asset.name} ({asset.size // 1024} KB)", "success")
+    
+    # 优先使用缓存的模板包
+    cached_zip = cache.get_asset(asset.download_url, asset.size, asset.sha256) if cache else None
+    if cached_zip:
+        with optional_phase(recorder, "extract", editor.value) as timing:
+            cache.record(hit=True)
+            extract_template_members(cached_zip, staging_dir, editor, template_filter)
+            timing.files = count_files(staging_dir)
+        notify("✓ 使用缓存的模板包", "success")
+    else:
+        with optional_phase(recorder, "download", editor.value) as timing:
+            timing.bytes = stream_template_members(
+                asset, staging_dir, editor, cache, progress, template_filter,
+            )
+            timing.files = count_files(staging_dir)
+    
+    return staged_source()
+
+
+def stage_sources(
+    releases: List[Release],
+    editor: Editor,
+    staging_dir: Path,
+    cache: Optional["ReleaseCache"] = None,
+    progress: Optional[Progress] = None,
+    recorder: Optional["PhaseRecorder"] = None,
+    template_filter: Optional["TemplateFilter"] = None,
+) -> Path:
+    """
+    暂存所有模板源的 commands 成员并合并
+    
+    单个模板源时即 stage_template_source()。多个模板源并发下载、解压到
+    staging_dir/source-<序号>，再按模板源顺序合并到 staging_dir/merged，
+    总耗时接近最慢的单个源。没有该编辑器模板（或没有模板匹配筛选）的源
+    跳过，所有源都没有时抛出第一个源的错误。
+    
+    Returns:
+        Path: commands 源目录
+    """
+    from sckit_cli.utils.sources import merge_commands_sources
+    from concurrent.futures import ThreadPoolExecutor
+    from sckit_cli.utils.timings import optional_phase
+    
+    if len(releases) == 1:
+        return stage_template_source(
+            releases[0], editor, staging_dir, cache, progress, recorder, template_filter,
+        )
+    
+    def stage(index: int) -> Union[Path, SCKitError]:
+        try:
+            return stage_template_source(
+                releases[index], editor, staging_dir / f"source-{index}",
+                cache, progress, recorder, template_filter,
+            )
+        except (TemplateNotFoundError, ValidationError) as e:
+            return e
+    
+    # 各源的下载共用一个进度条
+    with _progress_context(progress) as progress, \
+            ThreadPoolExecutor(max_workers=len(releases)) as executor:
+        staged = list(executor.map(in_current_context(stage), range(len(releases))))
+    
+    sources = [source for source in staged if isinstance(source, Path)]
+    if not sources:
+        raise staged[0]
+    
+    merged_dir = staging_dir / "merged"
+    merged_dir.mkdir(parents=True, exist_ok=True)
+    with optional_phase(recorder, "merge", editor.value) as timing:
+        overridden = merge_commands_sources(sources, merged_dir, staging_dir)
+        timing.files = count_files(merged_dir)
+    if overridden:
+        notify(f"{overridden} 个同名模板使用靠前模板源的版本", "warning")
+    return merged_dir
+
+
+def fetch_release_manifest(
+    release: Release,
+    editor: Editor,
+    cache: Optional["ReleaseCache"] = None,
+) -> Optional["ReleaseManifest"]:
+    """
+    获取模板包的文件清单
+    
+    清单随 Release 发布后不再变化，缓存后直接使用。Release 没有清单、
+    模板源在本地、获取失败或清单与模板包不符时返回 None（调用方改为完整下载）。
+    """
+    import hashlib
+    import httpx
+    from sckit_cli.utils.release_manifest import ReleaseManifest, ReleaseManifestError
+    
+    asset = release.get_template_asset(editor)
+    manifest_asset = release.get_manifest_asset(editor)
+    if asset is None or manifest_asset is None or asset.local_path is not None:
+        return None
+    
+    url = manifest_asset.download_url
+    cached = cache.get_release(url) if cache else None
+    try:
+        if cached:
+            data = cached.data
+        else:
+            response = get_http_session().get(
+                url, headers=manifest_asset.headers, timeout=config.REQUEST_TIMEOUT,
+            )
+            response.raise_for_status()
+            if manifest_asset.sha256:
+                verify_digest(manifest_asset.name, manifest_asset.sha256, hashlib.sha256(response.content))
+            data = response.json()
+        manifest = ReleaseManifest.from_dict(data)
+    except (httpx.HTTPError, ValueError, ReleaseManifestError, IntegrityError):
+        return None
+    
+    if manifest.asset != asset.name or manifest.asset_size != asset.size:
+        return None
+    if cache and not cached:
+        cache.put_release(url, data)
+    return manifest
+
+
+def manifest_commands(
+    manifest: "ReleaseManifest",
+    editor: Editor,
+    staging_dir: Path,
+) -> tuple[Path, Dict[str, "ManifestEntry"]]:
+    """
+    从清单中取出 commands 成员（与 find_commands_source 的查找顺序一致）
+    
+    Returns:
+        (commands 源目录（尚未创建）, {相对路径: ManifestEntry})
+    """
+    from sckit_cli.utils.manifest import ManifestEntry
+    
+    select = template_member_selector(staging_dir, editor)
+    for prefix in (f"{editor.config_dir}/commands/", "commands/"):
+        entries = {}
+        for name, item in manifest.files.items():
+            if name.startswith(prefix) and len(name) > len(prefix):
+                select(name)  # 拒绝路径穿越
+                entries[name[len(prefix):]] = ManifestEntry(size=item.size, sha256=item.sha256)
+        if entries:
+            return staging_dir / prefix.rstrip("/"), entries
+    
+    raise FileSystemError("模板包中未找到 commands 目录")
+
+
+def fetch_manifest_members(
+    asset: ReleaseAsset,
+    manifest: "ReleaseManifest",
+    names: List[str],
+    staging_dir: Path,
+    editor: Editor,
+) -> int:
+    """
+    用 Range 请求只读取指定成员的压缩数据，校验后写入 staging_dir
+    
+    相邻成员合并为一次请求。清单声明的成员数、大小与压缩比同样受解压限制。
+    
+    Raises:
+        DownloadError: 服务器不支持 Range 请求
+        TemplateLimitError: 超出解压限制
+        NetworkError: 网络请求失败
+        ReleaseManifestError: 读到的数据与清单不符
+    
+    Returns:
+        int: 接收的字节数
+    """
+    import httpx
+    from sckit_cli.utils.limits import ArchiveLimitError
+    from sckit_cli.utils.release_manifest import coalesce_ranges, decode_members
+    
+    select = template_member_selector(staging_dir, editor)
+    session = get_http_session()
+    received = 0
+    
+    budget = extraction_budget()
+    try:
+        for name in names:
+            item = manifest.files[name]
+            budget.entry(name, item.compressed_size, item.size)
+            budget.produce(item.size)
+    except ArchiveLimitError as e:
+        raise TemplateLimitError(f"模板包超出解压限制: {e}")
+    
+    for start, end, members in coalesce_ranges([manifest.files[name] for name in names]):
+        try:
+            response = session.get(
+                asset.download_url,
+                headers={**asset.headers, "Range": f"bytes={start}-{end - 1}"},
+                timeout=config.REQUEST_TIMEOUT,
+            )
+        except httpx.TimeoutException:
+            raise NetworkError("请求超时，请检查网络连接")
+        except httpx.HTTPError as e:
+            raise NetworkError(f"网络请求失败: {e}")
+        
+        content_range = response.headers.get("Content-Range", "")
+        if response.status_code != 206 or not content_range.startswith(f"bytes {start}-"):
+            raise DownloadError(f"服务器不支持分段下载 (HTTP {response.status_code})")
+        received += len(response.content)
+        
+        for item, content in decode_members(response.content, start, members):
+            dest = select(item.name)
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            dest.write_bytes(content)
+    
+    return received
+
+
+def plan_delta(
+    release: Release,
+    config_obj: InstallConfig,
+    staging_dir: Path,
+    cache: Optional["ReleaseCache"] = None,
+    recorder: Optional["PhaseRecorder"] = None,
+) -> Optional[tuple[SyncPlan, "ReleaseManifest"]]:
+    """
+    根据发布清单生成同步计划，不下载模板包
+    
+    只用于远程模板包且缓存中没有该模板包时（缓存命中时本地解压更快）。
+    计划的源目录此时还是空的，由 stage_plan_sources() 只下载需要写入的文件。
+    清单中没有 frontmatter，按标签筛选时不使用清单。
+    
+    Returns:
+        (计划, 清单)；无法增量更新时返回 None
+    """
+    from sckit_cli.utils.timings import optional_phase
+    
+    editor = config_obj.editor
+    asset = release.get_template_asset(editor)
+    if asset is None or asset.local_path is not None:
+        return None
+    if asset.size > config.MAX_TEMPLATE_SIZE:
+        return None  # 由完整下载流程报告超限
+    if cache and cache.get_asset(asset.download_url, asset.size, asset.sha256):
+        return None
+    template_filter = resolve_template_filter(config_obj, previous_install(config_obj))
+    if template_filter and template_filter.needs_tags:
+        return None
+    
+    manifest = fetch_release_manifest(release, editor, cache)
+    if manifest is None:
+        return None
+    
+    commands_source, entries = manifest_commands(manifest, editor, staging_dir)
+    with optional_phase(recorder, "plan") as timing:
+        plan = plan_project(config_obj, commands_source, entries=entries)
+        timing.files = len(plan.files)
+    
+    notify(f"找到模板: {asset.name}（按文件清单增量更新）", "success")
+    return plan, manifest
+
+
+def stage_plan_sources(
+    release: Release,
+    editor: Editor,
+    manifest: "ReleaseManifest",
+    plan: SyncPlan,
+    overwrite: Collection[str],
+    staging_dir: Path,
+    cache: Optional["ReleaseCache"] = None,
+    recorder: Optional["PhaseRecorder"] = None,
+) -> Path:
+    """
+    只下载计划中需要写入的文件（新增、更新、确认覆盖的冲突）
+    
+    需读取的压缩数据超过模板包的 DELTA_MAX_RATIO，或服务器不支持
+    Range 请求、数据与清单不符时，改为完整下载模板包。
+    
+    Returns:
+        Path: commands 源目录（同时更新 plan.source_dir）
+    """
+    from sckit_cli.utils.sync import FileAction
+    import shutil
+    from sckit_cli.utils.release_manifest import ReleaseManifestError
+    from sckit_cli.utils.timings import optional_phase
+    
+    asset = release.get_template_asset(editor)
+    prefix = plan.source_dir.relative_to(staging_dir).as_posix() + "/"
+    names = [
+        prefix + item.path
+        for item in plan.files
+        if item.action in (FileAction.NEW, FileAction.MODIFIED)
+        or (item.action == FileAction.EDITED and item.path in overwrite)
+    ]
+    needed = sum(manifest.files[name].compressed_size for name in names)
+    
+    if needed <= manifest.asset_size * config.DELTA_MAX_RATIO:
+        staging_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            with optional_phase(recorder, "delta", editor.value) as timing:
+                timing.bytes = fetch_manifest_members(asset, manifest, names, staging_dir, editor)
+                timing.files = len(names)
+            notify(
+                f"✓ 增量更新: 读取 {len(names)} 个文件 "
+                f"({timing.bytes // 1024} KB / 模板包 {asset.size // 1024} KB)",
+                "success",
+            )
+            return plan.source_dir
+        except (NetworkError, ReleaseManifestError) as e:
+            notify(f"增量下载失败（{e}），改为下载完整模板包", "warning")
+            shutil.rmtree(staging_dir, ignore_errors=True)
+    
+    plan.source_dir = stage_template_source(
+        release, editor, staging_dir, cache,
+        recorder=recorder, template_filter=plan.template_filter,
+    )
+    return plan.source_dir
+
+
+def count_files(directory: Path) -> int:
+    """目录下（递归）的文件数"""
+    return sum(len(files) for _, _, files in os.walk(directory))
+
+
+def project_linker(config_obj: InstallConfig) -> Optional["Linker"]:
+    """按安装方式返回模板存储的链接器，copy 方式返回 None"""
+    if config_obj.link == LinkMode.COPY:
+        return None
+    from sckit_cli.utils.store import Linker, TemplateStore
+    return Linker(TemplateStore(), config_obj.link)
+
+
+def previous_install(config_obj: InstallConfig) -> Optional["InstallManifest"]:
+    """项目中同一编辑器的上次安装清单"""
+    from sckit_cli.utils.manifest import InstallManifest
+    
+    previous = InstallManifest.load(config_obj.manifest_path)
+    if previous and previous.editor != config_obj.editor.value:
+        return None
+    return previous
+
+
+def resolve_template_filter(
+    config_obj: InstallConfig,
+    previous: Optional["InstallManifest"] = None,
+) -> Optional["TemplateFilter"]:
+    """
+    本次安装生效的模板筛选
+    
+    命令行指定了 --only/--exclude 时以其为准（`--only '*'` 取消筛选），
+    否则沿用上次安装记录的筛选。没有筛选时返回 None。
+    """
+    from sckit_cli.utils.filters import TemplateFilter
+    
+    if config_obj.only is None and config_obj.exclude is None:
+        if previous is None:
+            return None
+        template_filter = TemplateFilter.from_patterns(previous.only, previous.exclude)
+    else:
+        template_filter = TemplateFilter.from_patterns(config_obj.only, config_obj.exclude)
+    return template_filter or None
+
+
+def pick_templates(
+    configs: List[InstallConfig],
+    commands_source: Path,
+) -> List[InstallConfig]:
+    """
+    交互式选择要安装的模板（--pick），结果作为 only 写入各配置
+    
+    候选为 commands_source 中的全部模板，按 frontmatter 的 name 与 description
+    模糊筛选；当前生效的筛选（上次安装记录或 --only/--exclude）选中的模板预先勾选。
+    非交互环境中沿用原有筛选。
+    """
+    import glob
+    from dataclasses import replace
+    from sckit_cli.utils.filters import FRONTMATTER_MAX_BYTES
+    from sckit_cli.utils.search import parse_template
+    
+    if not renders_console() or not sys.stdin.isatty():
+        notify("非交互模式：忽略 --pick，沿用模板筛选", "warning")
+        return configs
+    
+    from sckit_cli.utils.interactive import PickerItem, select_templates
+    
+    first = configs[0]
+    template_filter = resolve_template_filter(first, previous_install(first))
+    items = []
+    preselected = []
+    for path in sorted(p for p in commands_source.rglob("*") if p.is_file()):
+        rel = path.relative_to(commands_source).as_posix()
+        with open(path, "rb") as f:
+            head = f.read(FRONTMATTER_MAX_BYTES)
+        meta = parse_template(head.decode("utf-8", errors="ignore"))
+        items.append(PickerItem(rel, meta["name"] or path.stem, meta["description"]))
+        if not template_filter or template_filter.matches(rel, lambda: head):
+            preselected.append(rel)
+    
+    if not items:
+        return configs
+    
+    chosen = select_templates(
+        items,
+        prompt=f"选择要安装的模板（共 {len(items)} 个）",
+        console=get_console(),
+        selected=preselected,
+    )
+    if not chosen:
+        raise ValidationError("未选择任何模板")
+    
+    # 全部选中时取消筛选，之后的更新也安装新增的模板
+    only = ["*"] if len(chosen) == len(items) else [glob.escape(rel) for rel in chosen]
+    notify(f"已选择 {len(chosen)}/{len(items)} 个模板")
+    return [replace(c, only=only, exclude=None, pick=False) for c in configs]
+
+
+def plan_project(
+    config_obj: InstallConfig,
+    commands_source: Path,
+    max_workers: Optional[int] = None,
+    entries: Optional[Dict[str, "ManifestEntry"]] = None,
+) -> SyncPlan:
+    """根据安装清单生成项目的同步计划（不写入）；entries 见 plan_template_sync()"""
+    from sckit_cli.utils.sync import plan_template_sync
+    previous = previous_install(config_obj)
+    
+    return plan_template_sync(
+        commands_source,
+        config_obj.commands_dir,
+        previous,
+        project_linker(config_obj),
+        max_workers,
+        entries,
+        resolve_template_filter(config_obj, previous),
+    )
+
+
+def apply_project(
+    config_obj: InstallConfig,
+    plan: SyncPlan,
+    version: str,
+    overwrite: Collection[str] = (),
+    move: bool = False,
+) -> InstallResult:
+    """按计划同步项目并更新安装清单，每个有变化的文件发出 FileApplied 事件"""
+    from sckit_cli.utils.sync import FileAction, apply_template_sync
+    from sckit_cli.utils.manifest import InstallManifest
+    
+    sync = apply_template_sync(plan, overwrite, move, project_linker(config_obj))
+    
+    sink = active_sink()
+    if sink is not None:
+        from sckit_cli.utils.events import FileApplied
+        
+        project = str(config_obj.target_path)
+        for item in plan.files:
+            if item.action != FileAction.IDENTICAL:
+                sink.emit(FileApplied(
+                    project, item.path, item.action.value,
+                    applied=item.action != FileAction.EDITED or item.path in overwrite,
+                ))
+    
+    template_filter = plan.template_filter
+    InstallManifest(
+        source_version=version,
+        editor=config_obj.editor.value,
+        files=sync.files,
+        only=list(template_filter.only) if template_filter else [],
+        exclude=list(template_filter.exclude) if template_filter else [],
+    ).save(config_obj.manifest_path)
+    
+    return InstallResult(
+        success=True,
+        version=version,
+        files_copied=sync.files_copied,
+        target_path=config_obj.target_path,
+        editor=config_obj.editor,
+        files_skipped=sync.files_skipped,
+        files_overwritten=sync.files_overwritten,
+        files_unchanged=sync.files_unchanged,
+        files_removed=sync.files_removed,
+        link=config_obj.link,
+        files_linked=sync.files_linked,
+    )
+
+
+def sync_project(
+    config_obj: InstallConfig,
+    commands_source: Path,
+    version: str,
+    conflict_callback: Optional[ConflictCallback] = None,
+    move: bool = False,
+) -> InstallResult:
+    """
+    根据安装清单把 commands 源目录增量同步到项目，并更新清单
+    
+    冲突文件在写入之前一次性交给 conflict_callback 决定（force 时全部覆盖）。
+    """
+    plan = plan_project(config_obj, commands_source)
+    overwrite = plan.resolve(config_obj.force, conflict_callback)
+    return apply_project(config_obj, plan, version, overwrite, move)
+
+
+def update_search_index(
+    cache: "ReleaseCache",
+    version: str,
+    plan: SyncPlan,
+    overwrite: Collection[str] = (),
+) -> None:
+    """
+    安装完成后按同步计划增量更新搜索索引
+    
+    以文件的 SHA-256 作为 fingerprint，只解析内容变化的模板。模板内容
+    优先从暂存目录读取，已移动到项目中的文件从项目读取；保留了本地修改
+    的文件只能从暂存目录读取（增量更新时没有下载则沿用旧条目）。
+    筛选安装只含部分模板，不更新索引。索引写入失败不影响安装。
+    """
+    from sckit_cli.utils.sync import FileAction
+    from sckit_cli.utils.search import SearchIndex
+    
+    if plan.template_filter:
+        return
+    
+    def reader(item: PlannedFile) -> Callable[[], Optional[str]]:
+        candidates = [plan.source_dir / item.path]
+        if item.action != FileAction.EDITED or item.path in overwrite:
+            candidates.append(plan.target_dir / item.path)
+        
+        def read() -> Optional[str]:
+            for candidate in candidates:
+                try:
+                    return candidate.read_text(encoding="utf-8", errors="replace")
+                except OSError:
+                    continue
+            return None
+        
+        return read
+    
+    try:
+        index = SearchIndex.load(cache.search_dir)
+        index.update(
+            (
+                (item.path, item.entry.sha256, reader(item))
+                for item in plan.files
+                if item.entry is not None and item.path.endswith(".md")
+            ),
+            source=f"v{version}",
+        )
+        index.save()
+    except OSError:
+        pass
+
+
+def install_template(
+    config_obj: InstallConfig,
+    sink: Optional["EventSink"] = None,
+) -> InstallResult:
     """
     T037: 安装模板
     
-    编排完整的模板安装流程：下载 → 解压 → 复制
-    """
-    # 验证配置
-    config_obj.validate()
+    编排完整的模板安装流程：边下载边解压到目标旁的暂存目录 → 生成同步计划
+    → 一次性决定冲突 → 移动到位。dry_run 时显示计划后返回，不写入。
+    
+    Release 带有文件清单时先按清单生成计划，决定冲突后只下载需要写入的文件。
+    
+    Args:
+        sink: 事件接收者（见 utils/events.py），默认使用 Rich 输出到终端；
+            NdjsonSink / NullSink 不渲染终端，也不询问用户
+    """
+    from sckit_cli.utils.conflicts import choose_overwrites, print_sync_plan
+    from sckit_cli.utils.sources import combined_version
+    if sink is not None:
+        with use_event_sink(sink):
+            return install_template(config_obj)
+    
+    import shutil
+    import tempfile
+    from sckit_cli.utils.timings import PhaseRecorder
+    
+    # 验证配置
+    config_obj.validate()
+    
+    cache = open_cache() if config_obj.use_cache else None
+    recorder = PhaseRecorder(active_sink())
+    
+    # T042: 获取最新 Release（或本地/镜像模板源，多个模板源并发获取）
+    releases = timed_fetch_releases(config_obj, cache, recorder)
+    version = combined_version(releases)
+    
+    # 交互式选择时暂存全部模板，选择后再筛选
+    template_filter = None if config_obj.pick else resolve_template_filter(
+        config_obj, previous_install(config_obj),
+    )
+    if template_filter:
+        notify(f"模板筛选: {template_filter.describe()}")
+    
+    # 暂存目录与目标位于同一文件系统，解压结果可直接重命名到位
+    commands_dir = config_obj.commands_dir
+    config_dir_existed = commands_dir.parent.exists()
+    commands_dir.parent.mkdir(parents=True, exist_ok=True)
+    staging_dir = Path(tempfile.mkdtemp(prefix=".sckit-staging-", dir=commands_dir.parent))
+    
+    # 注册清理路径
+    register_cleanup_path(staging_dir)
+    
+    try:
+        # 增量更新只用于单个模板源；交互式选择需要各模板的 frontmatter
+        delta = plan_delta(
+            releases[0], config_obj, staging_dir, cache, recorder,
+        ) if len(releases) == 1 and not config_obj.pick else None
+        if delta:
+            plan, release_manifest = delta
+        else:
+            commands_source = stage_sources(
+                releases, config_obj.editor, staging_dir, cache,
+                recorder=recorder, template_filter=template_filter,
+            )
+            if config_obj.pick:
+                config_obj = pick_templates([config_obj], commands_source)[0]
+            with recorder.phase("plan") as timing:
+                plan = plan_project(config_obj, commands_source)
+                timing.files = len(plan.files)
+        
+        if config_obj.dry_run or plan.conflicts:
+            print_sync_plan([(config_obj, plan)])
+        
+        if config_obj.dry_run:
+            result = InstallResult(
+                success=True,
+                version=version,
+                files_copied=0,
+                target_path=config_obj.target_path,
+                editor=config_obj.editor,
+                link=config_obj.link,
+                plan=plan,
+            )
+        else:
+            # 所有冲突在写入前一次性决定
+            overwrite = choose_overwrites([(config_obj, plan)])[0]
+            
+            if delta:
+                commands_source = stage_plan_sources(
+                    releases[0], config_obj.editor, release_manifest, plan, overwrite,
+                    staging_dir, cache, recorder,
+                )
+            
+            # T035: 复制文件
+            notify("正在复制文件...")
+            with recorder.phase("sync") as timing:
+                result = apply_project(
+                    config_obj,
+                    plan,
+                    version,
+                    overwrite,
+                    # 本地目录模板源不在暂存目录内，只能复制
+                    move=staging_dir in commands_source.parents,
+                )
+                timing.files = result.files_copied + result.files_overwritten + result.files_removed
+            
+            if cache:
+                update_search_index(cache, version, plan, overwrite)
+            
+            notify("✓ 文件复制完成", "success")
+        result.timings = recorder.phases
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        if not config_dir_existed:
+            try:
+                commands_dir.parent.rmdir()  # 安装失败时不留下空目录
+            except OSError:
+                pass
+    
+    # T043: 显示成功消息
+    finish_install(
+        result.to_dict(),
+        result.format_summary(),
+        "[bold cyan]预演[/bold cyan]" if config_obj.dry_run
+        else "[bold green]安装成功[/bold green]",
+        "cyan" if config_obj.dry_run else "green",
+    )
+    
+    return result
+
+
+def finish_install(data: dict, summary: str, title: str, border_style: str) -> None:
+    """显示结果面板，或向 sink 发出 InstallFinished 事件"""
+    if renders_console():
+        from rich.panel import Panel
+        console.print(Panel(summary, title=title, border_style=border_style))
+    sink = active_sink()
+    if sink is not None:
+        from sckit_cli.utils.events import InstallFinished
+        sink.emit(InstallFinished(data))
+
+
+def install_templates(
+    configs: List[InstallConfig],
+    max_workers: Optional[int] = None,
+    sink: Optional["EventSink"] = None,
+) -> BatchInstallResult:
+    """
+    批量安装模板
+    
+    每个模板源只获取一次 Release；每个编辑器的模板包只下载并解压一次（多个编辑器
+    并发下载），然后用线程池并行生成各项目的同步计划，所有冲突一次性
+    决定后再并行写入。单个项目失败不会中断其它项目。
+    
+    Args:
+        configs: 各项目/编辑器的安装配置
+        max_workers: 复制线程数，默认由 ThreadPoolExecutor 决定
+        sink: 事件接收者，见 install_template()
+    """
+    from sckit_cli.utils.conflicts import choose_overwrites, print_sync_plan
+    from sckit_cli.utils.sources import combined_version
+    from sckit_cli.utils.sync import SyncPlan
+    if sink is not None:
+        with use_event_sink(sink):
+            return install_templates(configs, max_workers)
+    
+    import tempfile
+    from concurrent.futures import ThreadPoolExecutor
+    from sckit_cli.utils.timings import PhaseRecorder
+    
+    if not configs:
+        raise ValidationError("未指定任何项目")
     
-    # T042: 获取最新 Release
-    console.print("\n[cyan]正在获取最新模板信息...[/cyan]")
-    release = get_latest_release(config_obj.github_token)
+    for config_obj in configs:
+        config_obj.validate()
     
-    # 获取对应编辑器的模板资源
-    asset = release.get_template_asset(config_obj.editor)
-    if not asset:
-        raise TemplateNotFoundError(config_obj.editor, release.version)
+    # 保持首次出现的顺序
+    editors = list(dict.fromkeys(c.editor for c in configs))
+    
+    first = configs[0]
+    cache = open_cache() if first.use_cache else None
+    recorder = PhaseRecorder(active_sink())
     
-    console.print(f"[green]找到模板: {asset.name} ({asset.size // 1024} KB)[/green]")
+    releases = timed_fetch_releases(first, cache, recorder)
+    version = combined_version(releases)
     
-    # 创建临时目录用于下载和解压
     with tempfile.TemporaryDirectory() as tmp_dir:
         tmp_path = Path(tmp_dir)
-        zip_file = tmp_path / asset.name
-        extract_dir = tmp_path / "extracted"
-        
-        # 注册清理路径
         register_cleanup_path(tmp_path)
         
-        # T033 + T042: 下载文件（带进度）
-        console.print("\n[cyan]正在下载模板...[/cyan]")
-        with Progress(
-            BarColumn(),
-            DownloadColumn(),
-            TransferSpeedColumn(),
-            TimeRemainingColumn(),
-            console=console,
-        ) as progress:
-            task_id = progress.add_task("[cyan]下载中", total=asset.size)
-            
-            def update_progress(prog: DownloadProgress):
-                progress.update(task_id, completed=prog.downloaded)
-            
-            download_file(asset.download_url, zip_file, update_progress)
-        
-        console.print("[green]✓ 下载完成[/green]")
-        
-        # T034: 解压
-        console.print("\n[cyan]正在解压模板...[/cyan]")
-        extract_zip(zip_file, extract_dir)
-        console.print("[green]✓ 解压完成[/green]")
-        
-        # T035: 复制文件
-        console.print("\n[cyan]正在复制文件...[/cyan]")
-        
-        # 查找 commands 目录（可能在 .cursor/commands 或 .claude/commands）
-        commands_source = None
-        for candidate in [
-            extract_dir / config_obj.editor.config_dir / "commands",
-            extract_dir / "commands",
-        ]:
-            if candidate.exists() and candidate.is_dir():
-                commands_source = candidate
-                break
+        # 各编辑器的模板包并发下载，共用一个进度条
+        with progress_display() as progress, \
+                ThreadPoolExecutor(max_workers=len(editors)) as executor:
+            futures = {
+                editor: executor.submit(
+                    in_current_context(stage_sources),
+                    releases, editor, tmp_path / editor.value, cache, progress, recorder,
+                )
+                for editor in editors
+            }
+            sources = {editor: future.result() for editor, future in futures.items()}
         
-        if not commands_source:
-            raise FileSystemError("模板包中未找到 commands 目录")
-        
-        # 定义冲突处理回调
-        def handle_conflict(file_path: Path) -> bool:
-            """询问用户是否覆盖文件"""
-            if config_obj.force:
-                return True
-            return Confirm.ask(f"文件 '{file_path.name}' 已存在，是否覆盖？", default=False)
-        
-        # 复制文件
-        files_copied, files_skipped, files_overwritten = copy_template_files(
-            commands_source,
-            config_obj.commands_dir,
-            config_obj.force,
-            handle_conflict
-        )
+        if first.pick:
+            configs = pick_templates(configs, sources[first.editor])
         
-        console.print("[green]✓ 文件复制完成[/green]")
-        
-        # T043: 显示成功消息
-        result = InstallResult(
-            success=True,
-            version=release.version,
-            files_copied=files_copied,
-            target_path=config_obj.target_path,
-            editor=config_obj.editor,
-            files_skipped=files_skipped,
-            files_overwritten=files_overwritten,
-        )
+        recorders = [PhaseRecorder(active_sink()) for _ in configs]
         
-        console.print(Panel(
-            result.format_summary(),
-            title="[bold green]安装成功[/bold green]",
-            border_style="green",
-        ))
+        def detail(config_obj: InstallConfig) -> str:
+            return f"{config_obj.target_path.name}, {config_obj.editor.value}"
+        
+        def failure(index: int, error: OSError) -> InstallResult:
+            config_obj = configs[index]
+            return InstallResult(
+                success=False,
+                version=version,
+                files_copied=0,
+                target_path=config_obj.target_path,
+                editor=config_obj.editor,
+                error=str(error),
+                timings=recorders[index].phases,
+            )
         
-        return result
+        # 先并行生成所有项目的计划，冲突一次性决定后再统一写入
+        def plan_one(index: int):
+            config_obj = configs[index]
+            try:
+                with recorders[index].phase("plan", detail(config_obj)) as timing:
+                    plan = plan_project(config_obj, sources[config_obj.editor])
+                    timing.files = len(plan.files)
+                return plan
+            except OSError as e:
+                return e
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            plans = list(executor.map(in_current_context(plan_one), range(len(configs))))
+        
+        planned = [i for i, plan in enumerate(plans) if isinstance(plan, SyncPlan)]
+        pairs = [(configs[i], plans[i]) for i in planned]
+        if first.dry_run or any(plan.conflicts for _, plan in pairs):
+            print_sync_plan(pairs)
+        overwrite = {} if first.dry_run else dict(zip(planned, choose_overwrites(pairs)))
+        
+        if not first.dry_run:
+            notify(f"正在复制文件到 {len(configs)} 个项目...")
+        
+        def apply_one(index: int) -> InstallResult:
+            config_obj, plan = configs[index], plans[index]
+            if isinstance(plan, OSError):
+                return failure(index, plan)
+            if config_obj.dry_run:
+                return InstallResult(
+                    success=True,
+                    version=version,
+                    files_copied=0,
+                    target_path=config_obj.target_path,
+                    editor=config_obj.editor,
+                    link=config_obj.link,
+                    timings=recorders[index].phases,
+                    plan=plan,
+                )
+            try:
+                with recorders[index].phase("sync", detail(config_obj)) as timing:
+                    result = apply_project(
+                        config_obj, plan, version, overwrite.get(index, ()),
+                    )
+                    timing.files = (
+                        result.files_copied + result.files_overwritten + result.files_removed
+                    )
+                result.timings = recorders[index].phases
+                return result
+            except OSError as e:
+                return failure(index, e)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(in_current_context(apply_one), range(len(configs))))
+        
+        # 各项目的模板相同，用第一个写入成功的项目更新搜索索引
+        if cache and not first.dry_run:
+            for index, result in enumerate(results):
+                if result.success:
+                    update_search_index(
+                        cache, version, plans[index], overwrite.get(index, ()),
+                    )
+                    break
+    
+    batch = BatchInstallResult(results=results, timings=recorder.phases)
+    
+    finish_install(
+        batch.to_dict(),
+        batch.format_summary(),
+        "[bold cyan]批量预演[/bold cyan]" if first.dry_run and batch.success
+        else "[bold green]批量安装完成[/bold green]" if batch.success
+        else "[bold yellow]批量安装部分失败[/bold yellow]",
+        "green" if batch.success else "yellow",
+    )
+    
+    return batch
 
 
 # ============================================================================
 # T038-T041: init 命令
 # ============================================================================
 
+def parse_editors(value: str) -> List[Editor]:
+    """
+    解析 --editor 参数
+    
+    支持单个编辑器、逗号分隔的多个编辑器（cursor,claude）或 all。
+    包含无法识别的名称时返回空列表。
+    """
+    names = [name.strip().lower() for name in value.split(",") if name.strip()]
+    if "all" in names:
+        return list(Editor)
+    
+    editors = []
+    for name in names:
+        try:
+            selected = Editor(name)
+        except ValueError:
+            return []
+        if selected not in editors:
+            editors.append(selected)
+    return editors
+
+
+def default_link_mode() -> LinkMode:
+    """SCKIT_LINK 指定的默认安装方式"""
+    try:
+        return LinkMode(config.LINK_MODE.lower())
+    except ValueError:
+        raise ValidationError(
+            f"SCKIT_LINK 必须是 hard、reflink、symlink 或 copy: {config.LINK_MODE}"
+        )
+
+
+def print_http_stats() -> None:
+    """显示共享 HTTP 会话的请求、重试与连接复用统计"""
+    if _http_session is None:
+        return
+    session = _http_session
+    protocol = "HTTP/2" if session.http2 else "HTTP/1.1"
+    console.print(
+        f"[dim]{session.stats.format_summary()} "
+        f"({protocol}, 连接池上限 {session.max_connections})[/dim]"
+    )
+
+
+def print_timings(result: BatchInstallResult) -> None:
+    """以表格显示各阶段耗时与资源统计"""
+    from rich.table import Table
+    
+    phases = list(result.timings)
+    for item in result.results:
+        phases.extend(item.timings)
+    
+    table = Table(title="阶段计时", title_style="bold cyan")
+    table.add_column("阶段")
+    table.add_column("耗时", justify="right")
+    table.add_column("传输", justify="right")
+    table.add_column("文件", justify="right")
+    table.add_column("峰值内存", justify="right")
+    for phase in phases:
+        table.add_row(
+            phase.label,
+            f"{phase.seconds * 1000:.1f} ms",
+            format_size(phase.bytes) if phase.bytes else "-",
+            str(phase.files) if phase.files else "-",
+            format_size(phase.peak_rss) if phase.peak_rss is not None else "-",
+        )
+    console.print(table)
+
+
+def emit_json(document: dict) -> None:
+    """把 JSON 文档写到 stdout"""
+    import json
+    typer.echo(json.dumps(document, ensure_ascii=False, indent=2))
+
+
+def read_batch_file(batch_file: Path) -> List[str]:
+    """
+    读取批量项目列表文件
+    
+    每行一个项目路径，忽略空行和以 # 开头的注释行。
+    """
+    try:
+        lines = batch_file.read_text(encoding="utf-8").splitlines()
+    except OSError as e:
+        raise FileSystemError(f"无法读取项目列表: {batch_file} ({e})")
+    
+    return [
+        line.strip() for line in lines
+        if line.strip() and not line.strip().startswith("#")
+    ]
+
+
 @app.command()
 def init(
-    path: str = typer.Argument(
-        ".",
-        help="项目路径。使用 '.' 表示当前目录，或指定目录名创建新项目"
+    paths: Optional[List[str]] = typer.Argument(
+        None,
+        help="项目路径（可指定多个）。使用 '.' 表示当前目录，或指定目录名创建新项目"
     ),
     editor: Optional[str] = typer.Option(
         None,
         "--editor",
         "-e",
-        help="指定编辑器（cursor 或 claude），跳过交互式选择"
+        help="指定编辑器（cursor、claude，逗号分隔多个，或 all），跳过交互式选择"
     ),
     force: bool = typer.Option(
         False,
@@ -745,6 +3250,77 @@ def init(
         "-f",
         help="强制覆盖已存在的文件，跳过确认"
     ),
+    version: Optional[str] = typer.Option(
+        None,
+        "--version",
+        help="安装指定版本（如 0.3.0），用于固定版本或回滚；默认安装最新版本",
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="只显示同步计划（新增、更新、本地已修改、删除），不写入任何文件",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="不读取也不写入本地缓存",
+    ),
+    source: Optional[List[str]] = typer.Option(
+        None,
+        "--source",
+        help="模板源：github:OWNER/REPO[@令牌环境变量]、本地 zip、解压后的目录或镜像 URL；"
+             "可重复或逗号分隔，同名模板以靠前的源为准",
+    ),
+    only: Optional[List[str]] = typer.Option(
+        None,
+        "--only",
+        help="只安装匹配的模板：glob（如 sckit.code-reviewer、sckit.git-*）或 tag:<标签>，可重复或逗号分隔；'*' 取消筛选",
+    ),
+    exclude: Optional[List[str]] = typer.Option(
+        None,
+        "--exclude",
+        help="排除匹配的模板（写法同 --only）；筛选条件记录在项目中，之后的更新沿用",
+    ),
+    pick: bool = typer.Option(
+        False,
+        "--pick",
+        "-p",
+        help="下载后在终端中多选要安装的模板（输入即模糊筛选名称与描述），选择结果同 --only 记录",
+    ),
+    link: Optional[LinkMode] = typer.Option(
+        None,
+        "--link",
+        case_sensitive=False,
+        help="文件生成方式：hard/reflink/symlink 从全局模板存储链接（不支持时退回复制），copy 为普通复制",
+    ),
+    batch: Optional[Path] = typer.Option(
+        None,
+        "--batch",
+        "-b",
+        help="从文件读取项目路径列表（每行一个），一次下载安装到所有项目",
+    ),
+    jobs: Optional[int] = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="批量安装时的并行复制线程数",
+    ),
+    timings: bool = typer.Option(
+        False,
+        "--timings",
+        help="安装完成后显示各阶段耗时、传输字节数、文件数与峰值内存",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="以 JSON 输出安装结果与各阶段计时（其它信息输出到 stderr）",
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        help="显示详细信息（HTTP 重试与连接池统计、错误堆栈）",
+    ),
 ) -> None:
     """
     在项目中初始化或更新提示词模板
@@ -753,50 +3329,669 @@ def init(
         sckit init my-project          # 创建新项目
         sckit init .                   # 在当前目录初始化
         sckit init . --force           # 强制更新
+        sckit init . --dry-run         # 只查看将要发生的变更
+        sckit init . --version 0.2.0   # 固定版本 / 回滚
+        sckit init . --only sckit.code-reviewer,sckit.git-committer  # 只安装部分模板
+        sckit init . --exclude 'tag:experimental'  # 按 frontmatter 标签排除
+        sckit init . --pick              # 交互式多选模板
         sckit init my-project -e cursor  # 指定编辑器
+        sckit init pkg-a pkg-b -e cursor # 一次安装到多个项目
+        sckit init --batch projects.txt  # 从文件读取项目列表
+        sckit init . -e cursor,claude    # 同时安装两种编辑器的模板
+        sckit init . --source ./sckit-cursor-0.3.0.zip  # 离线安装
+        sckit init . --source github:acme/commands@ACME_TOKEN --source github:daviwang1224/slash-command-kit  # 合并多个模板源
+        sckit init . -e cursor --link hard  # 从全局模板存储硬链接
+        sckit init . -e cursor --json    # 机器可读的结果与阶段计时
     """
+    if json_output:
+        # stdout 只留给 JSON 文档
+        use_stderr_console()
+    
     try:
         # T041: 处理路径
-        target_path = Path(path).resolve()
+        path_list = list(paths or [])
+        if batch:
+            path_list.extend(read_batch_file(batch))
+        if not path_list:
+            path_list = ["."]
         
-        # 如果不是当前目录，创建新目录
-        if path != "." and not target_path.exists():
-            console.print(f"\n[cyan]创建项目目录: {target_path}[/cyan]")
-            target_path.mkdir(parents=True, exist_ok=True)
+        target_paths = []
+        for path in path_list:
+            target_path = Path(path).resolve()
+            
+            # 如果不是当前目录，创建新目录
+            if path != "." and not target_path.exists():
+                console.print(f"\n[cyan]创建项目目录: {target_path}[/cyan]")
+                target_path.mkdir(parents=True, exist_ok=True)
+            
+            if target_path not in target_paths:
+                target_paths.append(target_path)
         
         # T039: 选择编辑器
         if editor:
             # 从命令行参数获取
-            if editor.lower() in ["cursor", "claude"]:
-                selected_editor = Editor.CURSOR if editor.lower() == "cursor" else Editor.CLAUDE
-            else:
-                console.print("[red]错误: 编辑器必须是 'cursor' 或 'claude'[/red]")
+            selected_editors = parse_editors(editor)
+            if not selected_editors:
+                console.print("[red]错误: 编辑器必须是 'cursor'、'claude' 或 'all'[/red]")
                 raise typer.Exit(1)
         else:
             # T036: 交互式选择
-            selected_editor = prompt_editor_choice()
+            selected_editors = [prompt_editor_choice()]
+        
+        if link is None:
+            link = default_link_mode()
         
         # 创建安装配置
-        install_config = InstallConfig(
-            target_path=target_path,
-            editor=selected_editor,
-            force=force,
-        )
+        install_configs = [
+            InstallConfig(
+                target_path=target_path,
+                editor=selected_editor,
+                force=force,
+                use_cache=not no_cache,
+                source=",".join(source) if source else config.TEMPLATE_SOURCE or None,
+                link=link,
+                dry_run=dry_run,
+                version=version,
+                # 未指定时为 None：沿用项目记录的筛选
+                only=only or None,
+                exclude=exclude or None,
+                pick=pick,
+            )
+            for target_path in target_paths
+            for selected_editor in selected_editors
+        ]
         
         # 执行安装
-        install_template(install_config)
+        with interrupt_handlers():
+            if len(install_configs) == 1:
+                result = BatchInstallResult(results=[install_template(install_configs[0])])
+            else:
+                result = install_templates(install_configs, max_workers=jobs)
+        
+        if timings:
+            print_timings(result)
+        if json_output:
+            emit_json({"sckit_version": __version__, **result.to_dict()})
+        if verbose:
+            print_http_stats()
+        if not result.success:
+            raise typer.Exit(1)
         
     except SCKitError as e:
-        error_handler(e)
+        error_handler(e, verbose)
+        if json_output:
+            emit_json({"sckit_version": __version__, "success": False, "error": str(e)})
+        if verbose:
+            print_http_stats()
         raise typer.Exit(1)
     except KeyboardInterrupt:
         console.print("\n[yellow]操作已取消[/yellow]")
         raise typer.Exit(2)
+    except typer.Exit:
+        raise
     except Exception as e:
         console.print(f"\n[red]未预期的错误: {e}[/red]")
         raise typer.Exit(1)
 
 
+# ============================================================================
+# releases 命令
+# ============================================================================
+
+@app.command()
+def releases(
+    limit: int = typer.Option(
+        20,
+        "--limit",
+        "-n",
+        min=1,
+        help="最多显示的版本数",
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="忽略缓存有效期，立即增量刷新版本列表",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="不读取也不写入本地缓存",
+    ),
+) -> None:
+    """
+    列出可安装的版本（新 → 旧）
+    
+    版本列表缓存在本地，过期后只获取比缓存更新的页面。
+    
+    示例:
+        sckit releases               # 最近 20 个版本
+        sckit releases -n 5 --refresh
+    """
+    from rich.table import Table
+    
+    try:
+        items = list_releases(
+            cache=None if no_cache else open_cache(),
+            refresh=refresh,
+        )
+    except SCKitError as e:
+        error_handler(e)
+        raise typer.Exit(1)
+    
+    if not items:
+        console.print("[yellow]还没有发布任何版本[/yellow]")
+        return
+    
+    table = Table(title="可用版本", title_style="bold cyan")
+    table.add_column("版本")
+    table.add_column("发布时间")
+    table.add_column("编辑器")
+    table.add_column("说明")
+    for index, release in enumerate(items[:limit]):
+        editors = [e.value for e in Editor if release.get_template_asset(e)]
+        notes = []
+        if index == 0:
+            notes.append("[green]最新[/green]")
+        if release.prerelease:
+            notes.append("[yellow]预发布[/yellow]")
+        table.add_row(
+            f"v{release.version}",
+            (release.published_at or "")[:10],
+            ", ".join(editors) or "-",
+            " ".join(notes),
+        )
+    if len(items) > limit:
+        table.caption = f"另有 {len(items) - limit} 个更早的版本（使用 --limit 显示更多）"
+    console.print(table)
+
+
+# ============================================================================
+# search 命令
+# ============================================================================
+
+def local_search_files(path: Path) -> List[tuple]:
+    """
+    本地模板目录或模板包中的 markdown 模板，供 SearchIndex.update() 使用
+    
+    fingerprint 取自文件大小与修改时间（目录）或中央目录中的 CRC 与大小（zip），
+    不读取未变化的文件。
+    """
+    if path.is_dir():
+        commands = path
+        for editor in Editor:
+            try:
+                commands = find_commands_source(path, editor)
+                break
+            except FileSystemError:
+                continue
+        files = []
+        for file in sorted(commands.rglob("*.md")):
+            stat = file.stat()
+            files.append((
+                file.relative_to(commands).as_posix(),
+                f"{stat.st_size}:{stat.st_mtime_ns}",
+                lambda file=file: file.read_text(encoding="utf-8", errors="replace"),
+            ))
+        return files
+    
+    import zipfile
+    
+    try:
+        zf = zipfile.ZipFile(path)
+    except (OSError, zipfile.BadZipFile):
+        raise FileSystemError(f"无法读取模板源: {path}")
+    files = []
+    for info in zf.infolist():
+        name = info.filename.replace("\\", "/")
+        if info.is_dir() or not name.endswith(".md") or "commands/" not in name:
+            continue
+        files.append((
+            name.rsplit("commands/", 1)[1],
+            f"{info.CRC:08x}:{info.file_size}",
+            lambda info=info: zf.read(info).decode("utf-8", errors="replace"),
+        ))
+    return files
+
+
+@app.command()
+def search(
+    query: List[str] = typer.Argument(
+        ...,
+        help="搜索词（中英文均可）",
+    ),
+    limit: int = typer.Option(
+        10,
+        "--limit",
+        "-n",
+        min=1,
+        help="最多显示的结果数",
+    ),
+    source: Optional[Path] = typer.Option(
+        None,
+        "--source",
+        help="先把本地模板目录或模板包（如内部 fork）增量加入索引",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="以 JSON 输出结果",
+    ),
+) -> None:
+    """
+    搜索模板的名称、描述与正文
+    
+    索引在每次安装时按文件摘要增量更新，搜索只读取本地索引，不访问网络。
+    
+    示例:
+        sckit search 接口设计
+        sckit search sql 优化 -n 5
+        sckit search review --source ../my-fork/commands
+    """
+    import time
+    from sckit_cli.utils.search import SearchIndex
+    
+    index_dir = open_cache().search_dir
+    
+    if source is not None:
+        try:
+            index = SearchIndex.load(index_dir)
+            parsed, removed = index.update(
+                local_search_files(source.expanduser().resolve()), source=str(source),
+            )
+            index.save()
+        except (SCKitError, OSError) as e:
+            console.print(f"[red]错误: {e}[/red]")
+            raise typer.Exit(1)
+        if not json_output:
+            console.print(f"[dim]索引已更新: 解析 {parsed} 个模板，移除 {removed} 个[/dim]")
+    
+    text = " ".join(query)
+    start = time.perf_counter()
+    index = SearchIndex.load(index_dir)
+    hits = index.search(text, limit)
+    elapsed = (time.perf_counter() - start) * 1000
+    
+    if json_output:
+        emit_json({
+            "query": text,
+            "source": index.source,
+            "templates": len(index),
+            "results": [hit.to_dict() for hit in hits],
+        })
+        return
+    
+    if not len(index):
+        console.print("[yellow]搜索索引为空：先运行 sckit init 安装模板，或使用 --source 指定模板目录[/yellow]")
+        raise typer.Exit(1)
+    if not hits:
+        console.print(f"[yellow]没有找到与“{text}”相关的模板[/yellow]")
+        return
+    
+    from rich.table import Table
+    
+    table = Table(title=f"搜索: {text}", title_style="bold cyan")
+    table.add_column("命令", style="cyan", no_wrap=True)
+    table.add_column("说明")
+    for hit in hits:
+        table.add_row(hit.command, hit.description or hit.name)
+    table.caption = f"索引 {index.source}，共 {len(index)} 个模板，用时 {elapsed:.1f} ms"
+    console.print(table)
+
+
+# ============================================================================
+# sync 命令
+# ============================================================================
+
+def sync_config(path: Path, editor: Editor, interactive: bool = True) -> InstallConfig:
+    """后台同步使用的安装配置（SCKIT_SOURCE 指定的模板源）"""
+    return InstallConfig(
+        target_path=path,
+        editor=editor,
+        source=config.TEMPLATE_SOURCE or None,
+        link=default_link_mode(),
+        interactive=interactive,
+    )
+
+
+def poll_latest_releases(cache: "ReleaseCache") -> List[Release]:
+    """
+    检查所有模板源的最新 Release（后台同步使用）
+    
+    忽略缓存的 TTL，每次都携带 If-None-Match / If-Modified-Since 重新验证：
+    版本没有变化时服务器返回 304，GitHub 不计入 API 速率限制。
+    SCKIT_SOURCE 指定了多个模板源时并发检查；全部是本地模板源时不支持后台同步。
+    """
+    from sckit_cli.utils.sources import parse_sources
+    sources = parse_sources(config.TEMPLATE_SOURCE)
+    if all(source.kind == "local" for source in sources):
+        raise ValidationError("sckit sync 需要 GitHub 或镜像 URL 模板源，本地模板源请使用 sckit init --source")
+    return fetch_releases(sources, cache, revalidate=True)
+
+
+def outdated_installs(
+    registry: "ProjectRegistry",
+    version: str,
+    interactive: bool = True,
+) -> List[InstallConfig]:
+    """
+    登记项目中版本与 version 不同的安装（每个项目的每个已安装编辑器）
+    
+    多个模板源时 version 为合并后的版本（见 combined_version()）。
+    沿用各项目安装清单中记录的模板筛选；不存在的项目跳过（不自动移除登记）。
+    """
+    configs = []
+    for project in registry.projects:
+        path = Path(project)
+        if not path.is_dir():
+            console.print(f"[yellow]跳过不存在的项目: {path}[/yellow]")
+            continue
+        for editor in Editor:
+            config_obj = sync_config(path, editor, interactive)
+            previous = previous_install(config_obj)
+            if previous is not None and previous.source_version != version:
+                configs.append(config_obj)
+    return configs
+
+
+def sync_registered(
+    registry: "ProjectRegistry",
+    cache: "ReleaseCache",
+    interactive: bool = True,
+) -> tuple[str, Optional[BatchInstallResult]]:
+    """
+    检查一次最新版本，并增量更新版本落后的登记项目
+    
+    多个项目共用一次下载（见 install_templates()）。interactive=False 时
+    不询问冲突，保留本地修改。
+    
+    Returns:
+        (最新版本, 安装结果)；所有项目均为最新时安装结果为 None
+    """
+    from sckit_cli.utils.sources import combined_version
+    import time
+    
+    releases = poll_latest_releases(cache)
+    version = combined_version(releases)
+    registry.last_tag = "+".join(release.tag_name for release in releases)
+    registry.last_checked = time.time()
+    registry.save()
+    
+    configs = outdated_installs(registry, version, interactive)
+    if not configs:
+        return version, None
+    if len(configs) == 1:
+        return version, BatchInstallResult(results=[install_template(configs[0])])
+    return version, install_templates(configs)
+
+
+def next_poll_delay(interval: float, jitter: float = config.SYNC_JITTER) -> float:
+    """在 interval 上下 jitter 比例内随机取下次检查的间隔，使各机器的请求错开"""
+    import random
+    
+    return interval * random.uniform(1 - jitter, 1 + jitter)
+
+
+def watch_registered(
+    interval: float,
+    registry_path: Optional[Path] = None,
+    sleep: Optional[Callable[[float], None]] = None,
+    max_polls: Optional[int] = None,
+) -> None:
+    """
+    后台同步循环：检查 → 更新落后的项目 → 休眠到下次检查
+    
+    休眠期间不占用 CPU，也不保留任何线程；每次检查前重新读取登记文件。
+    单次检查失败（网络、文件系统）只记录，不退出循环。
+    
+    Args:
+        interval: 平均检查间隔（秒），实际间隔带有随机抖动
+        sleep: 休眠函数（测试时替换），默认 time.sleep
+        max_polls: 检查次数上限，None 表示一直运行
+    """
+    import time
+    from sckit_cli.utils.projects import ProjectRegistry
+    
+    sleep = sleep or time.sleep
+    cache = open_cache()
+    polls = 0
+    while True:
+        registry = ProjectRegistry.load(registry_path)
+        stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        try:
+            version, result = sync_registered(registry, cache, interactive=False)
+        except (SCKitError, OSError) as e:
+            console.print(f"[yellow]{stamp} 检查失败: {e}[/yellow]")
+        else:
+            if result is None:
+                console.print(
+                    f"[dim]{stamp} 已是最新 (v{version})，"
+                    f"{len(registry.projects)} 个项目[/dim]"
+                )
+            else:
+                status = "green" if result.success else "yellow"
+                console.print(
+                    f"[{status}]{stamp} 已更新 {len(result.results)} 个安装到 "
+                    f"v{version}[/{status}]"
+                )
+        
+        polls += 1
+        if max_polls is not None and polls >= max_polls:
+            return
+        sleep(next_poll_delay(interval))
+
+
+sync_app = typer.Typer(
+    help="登记项目，并让其中已安装的模板自动跟随最新版本",
+    invoke_without_command=True,
+)
+app.add_typer(sync_app, name="sync")
+
+
+@sync_app.callback()
+def sync_main(
+    ctx: typer.Context,
+    watch: bool = typer.Option(
+        False,
+        "--watch",
+        help="持续运行：定期检查新版本并更新所有登记项目（不询问冲突，保留本地修改）",
+    ),
+    interval: Optional[float] = typer.Option(
+        None,
+        "--interval",
+        min=60,
+        help="--watch 的平均检查间隔（秒），默认 SCKIT_SYNC_INTERVAL（3600）",
+    ),
+) -> None:
+    """
+    把登记项目中已安装的模板更新到最新版本（不带子命令时执行一次）
+    
+    示例:
+        sckit sync add . ../other-project  # 登记项目
+        sckit sync                         # 立即检查并更新
+        sckit sync --watch                 # 后台持续同步
+    """
+    from sckit_cli.utils.projects import ProjectRegistry
+    
+    if ctx.invoked_subcommand is not None:
+        return
+    
+    registry = ProjectRegistry.load()
+    if not registry.projects and not watch:
+        console.print("[yellow]没有登记的项目：先运行 sckit sync add <项目路径>[/yellow]")
+        raise typer.Exit(1)
+    
+    try:
+        with interrupt_handlers():
+            if watch:
+                interval = interval or config.SYNC_INTERVAL
+                console.print(
+                    f"[cyan]后台同步已启动：{len(registry.projects)} 个项目，"
+                    f"约每 {interval / 60:.0f} 分钟检查一次（Ctrl+C 停止）[/cyan]"
+                )
+                watch_registered(interval)
+                return
+            
+            version, result = sync_registered(registry, open_cache())
+            if result is None:
+                console.print(f"[green]✓ 所有项目已是最新 (v{version})[/green]")
+            elif not result.success:
+                raise typer.Exit(1)
+    except SCKitError as e:
+        error_handler(e)
+        raise typer.Exit(1)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]已停止[/yellow]")
+        raise typer.Exit(2)
+
+
+@sync_app.command("add")
+def sync_add(
+    paths: List[Path] = typer.Argument(..., help="项目路径（可指定多个）"),
+) -> None:
+    """登记项目"""
+    from sckit_cli.utils.projects import ProjectRegistry
+    
+    registry = ProjectRegistry.load()
+    for path in paths:
+        path = path.expanduser().resolve()
+        if not path.is_dir():
+            console.print(f"[red]错误: 目录不存在: {path}[/red]")
+            raise typer.Exit(1)
+        if registry.add(path):
+            console.print(f"[green]✓ 已登记 {path}[/green]")
+        else:
+            console.print(f"[dim]{path} 已登记[/dim]")
+        if not any(previous_install(InstallConfig(path, editor)) for editor in Editor):
+            console.print("[yellow]  该项目尚未安装模板，先运行 sckit init[/yellow]")
+    registry.save()
+
+
+@sync_app.command("remove")
+def sync_remove(
+    paths: List[Path] = typer.Argument(..., help="项目路径（可指定多个）"),
+) -> None:
+    """取消登记项目（不删除已安装的模板）"""
+    from sckit_cli.utils.projects import ProjectRegistry
+    
+    registry = ProjectRegistry.load()
+    for path in paths:
+        if registry.remove(path.expanduser()):
+            console.print(f"[green]✓ 已移除 {path}[/green]")
+        else:
+            console.print(f"[yellow]{path} 未登记[/yellow]")
+    registry.save()
+
+
+@sync_app.command("list")
+def sync_list() -> None:
+    """列出登记的项目及其已安装的版本"""
+    from rich.table import Table
+    from sckit_cli.utils.projects import ProjectRegistry
+    
+    registry = ProjectRegistry.load()
+    if not registry.projects:
+        console.print("[yellow]没有登记的项目：先运行 sckit sync add <项目路径>[/yellow]")
+        return
+    
+    table = Table(title="登记的项目", title_style="bold cyan")
+    table.add_column("项目")
+    table.add_column("已安装")
+    for project in registry.projects:
+        path = Path(project)
+        installs = [
+            f"{editor.value} v{previous.source_version}"
+            for editor in Editor
+            for previous in [previous_install(InstallConfig(path, editor))]
+            if previous is not None
+        ]
+        table.add_row(project, ", ".join(installs) or "[yellow]未安装[/yellow]")
+    if registry.last_checked:
+        checked = datetime.fromtimestamp(registry.last_checked).strftime("%Y-%m-%d %H:%M")
+        table.caption = f"最近检查: {checked}，最新版本 {registry.last_tag}"
+    console.print(table)
+
+
+# ============================================================================
+# cache 命令
+# ============================================================================
+
+cache_app = typer.Typer(
+    help="查看和清理本地 Release/模板包缓存",
+    invoke_without_command=True,
+)
+app.add_typer(cache_app, name="cache")
+
+
+def format_size(num_bytes: int) -> str:
+    """格式化字节数"""
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+@cache_app.callback()
+def cache_main(ctx: typer.Context) -> None:
+    """
+    查看和清理本地缓存（不带子命令时显示统计信息）
+    """
+    if ctx.invoked_subcommand is None:
+        cache_stats()
+
+
+@cache_app.command("stats")
+def cache_stats() -> None:
+    """显示缓存统计信息"""
+    from rich.panel import Panel
+    from sckit_cli.utils.store import TemplateStore
+    
+    stats = open_cache().stats()
+    store = TemplateStore()
+    objects, store_size = store.stats()
+    
+    lines = [
+        f"位置: {stats.path}",
+        f"Release 元数据: {stats.releases} 个",
+        f"模板包: {stats.assets} 个",
+        f"占用: {format_size(stats.total_size)} / {format_size(stats.max_size)}",
+        f"命中: {stats.hits} 次，未命中: {stats.misses} 次",
+        f"命中率: {stats.hit_rate:.1f}%",
+    ]
+    if objects:
+        # 模板存储被项目链接引用，不随缓存清理
+        lines.append(f"模板存储: {objects} 个文件，{format_size(store_size)}（{store.root}）")
+    console.print(Panel(
+        "\n".join(lines),
+        title="[bold cyan]缓存统计[/bold cyan]",
+        border_style="cyan",
+    ))
+
+
+@cache_app.command("prune")
+def cache_prune(
+    max_size: Optional[float] = typer.Option(
+        None,
+        "--max-size",
+        help="缓存大小上限（MB），默认使用 SCKIT_CACHE_MAX_SIZE",
+    ),
+    all_entries: bool = typer.Option(
+        False,
+        "--all",
+        help="清空全部缓存",
+    ),
+) -> None:
+    """按最近最少使用（LRU）清理缓存"""
+    cache = open_cache()
+    if all_entries:
+        freed = cache.clear()
+    else:
+        limit = int(max_size * 1024 * 1024) if max_size is not None else None
+        freed = cache.prune(max_size=limit)
+    console.print(f"[green]✓ 已释放 {format_size(freed)}[/green]")
+
+
 # 主入口点
 def cli() -> None:
     """CLI 入口点"""
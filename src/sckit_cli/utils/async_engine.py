@@ -0,0 +1,593 @@
+"""
+异步安装引擎
+
+供基于 asyncio 的服务在一个事件循环里并发安装大量项目：
+
+- 网络请求共用一个 httpx.AsyncClient（一个连接池）
+- 解压、哈希、复制等阻塞文件操作交给有界线程池
+- 同时进行的安装数受 max_concurrency 限制
+- 同一模板源只获取一次 Release，每个编辑器的模板包只下载、解压一次
+- 固定版本经由同一连接池查找；模板包下载与同步安装共用缓存中的未完成文件，
+  中断后用 Range / If-Range 续传
+- 进度与结果通过回调报告，不使用 Rich、不向终端输出、不等待用户输入
+
+用法:
+    async with AsyncInstaller(max_concurrency=64) as installer:
+        batch = await installer.install_many(configs)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import random
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Awaitable, BinaryIO, Callable, Collection, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+import httpx
+
+from sckit_cli import (
+    BatchInstallResult,
+    DownloadError,
+    DownloadProgress,
+    Editor,
+    HttpExchange,
+    InstallConfig,
+    InstallResult,
+    IntegrityError,
+    RangeResume,
+    Release,
+    ReleaseAsset,
+    RestartDownload,
+    SCKitError,
+    TemplateNotFoundError,
+    TemplateLimitError,
+    ValidationError,
+    check_template_size,
+    config,
+    extract_template_members,
+    find_commands_source,
+    exchange_step,
+    find_local_commands,
+    latest_release_exchange,
+    local_release,
+    parse_checksums,
+    plan_project,
+    release_exchange,
+    sync_project,
+    verify_digest,
+    zip_url_release,
+)
+from sckit_cli.utils.cache import HASH_CHUNK_SIZE, PartialDownload, ReleaseCache
+from sckit_cli.utils.http import MAX_RETRY_AFTER, RETRY_STATUS_CODES, http2_available
+from sckit_cli.utils.sources import TemplateSource
+
+
+def _hash_file(digest: "hashlib._Hash", path: Path) -> None:
+    """把文件内容加入摘要（回放未完成下载的已有数据）"""
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(block)
+
+
+# 下载进度：(编辑器, 进度)
+AsyncProgressCallback = Callable[[Editor, DownloadProgress], None]
+# 单个项目安装完成（成功或失败）
+ResultCallback = Callable[[InstallResult], None]
+# 收到一个项目的全部冲突文件，返回其中要覆盖的文件；可以是普通函数或协程函数
+AsyncConflictCallback = Callable[
+    [List[Path]], Union[Collection[Path], Awaitable[Collection[Path]]]
+]
+
+
+class AsyncInstaller:
+    """
+    异步安装引擎
+
+    Args:
+        max_concurrency: 同时进行的项目安装数上限
+        max_workers: 文件操作线程池大小
+        cache: Release/模板包缓存，None 表示不使用缓存
+        progress_callback: 下载进度回调（在事件循环线程中调用）
+        result_callback: 每个项目安装完成后的回调
+        conflict_callback: 每个项目调用一次，决定覆盖哪些本地修改过的文件，省略时全部保留
+        transport: 自定义 httpx 异步传输（测试用）
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        max_workers: Optional[int] = None,
+        cache: Optional[ReleaseCache] = None,
+        progress_callback: Optional[AsyncProgressCallback] = None,
+        result_callback: Optional[ResultCallback] = None,
+        conflict_callback: Optional[AsyncConflictCallback] = None,
+        retries: int = config.HTTP_RETRIES,
+        backoff_factor: float = config.HTTP_RETRY_BACKOFF,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency 必须大于 0")
+        self.max_concurrency = max_concurrency
+        self.max_workers = max_workers
+        self.cache = cache
+        self.progress_callback = progress_callback
+        self.result_callback = result_callback
+        self.conflict_callback = conflict_callback
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self._transport = transport
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._work_dir: Optional[Path] = None
+        # 进行中或已完成的 Release 获取 / 模板暂存，按 (模板源, 版本, 是否用缓存)
+        # （以及编辑器）去重
+        self._releases: Dict[Tuple[Optional[str], Optional[str], bool], asyncio.Future] = {}
+        self._staged: Dict[
+            Tuple[Optional[str], Optional[str], bool, Editor], asyncio.Future
+        ] = {}
+        # 进行中的后台重新验证（关闭前等待完成）
+        self._refreshes: Set[asyncio.Future] = set()
+
+    # ------------------------------------------------------------------
+    # 生命周期
+    # ------------------------------------------------------------------
+
+    async def __aenter__(self) -> "AsyncInstaller":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """创建连接池、线程池与工作目录"""
+        if self._client is not None:
+            return
+        self._client = httpx.AsyncClient(
+            timeout=config.REQUEST_TIMEOUT,
+            http2=config.HTTP2 and http2_available(),
+            follow_redirects=True,
+            transport=self._transport,
+            limits=httpx.Limits(
+                max_connections=config.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=config.HTTP_MAX_CONNECTIONS,
+            ),
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="sckit-io",
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._work_dir = Path(tempfile.mkdtemp(prefix="sckit-async-"))
+
+    async def close(self) -> None:
+        """关闭连接池与线程池，删除工作目录"""
+        if self._client is None:
+            return
+        await asyncio.gather(*self._refreshes, return_exceptions=True)
+        await self._client.aclose()
+        await self._run(shutil.rmtree, self._work_dir, True)
+        self._executor.shutdown(wait=True)
+        self._client = None
+        self._executor = None
+        self._releases.clear()
+        self._staged.clear()
+
+    # ------------------------------------------------------------------
+    # 工具
+    # ------------------------------------------------------------------
+
+    async def _run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """在有界线程池中执行阻塞函数"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def _once(self, registry: Dict[Any, asyncio.Future], key: Any, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """同一 key 的工作只执行一次，其余调用者等待同一结果；失败的结果不保留，之后的调用重新执行"""
+        future = registry.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            registry[key] = future
+
+            def forget_failure(done: asyncio.Future) -> None:
+                if (done.cancelled() or done.exception() is not None) and registry.get(key) is done:
+                    del registry[key]
+
+            future.add_done_callback(forget_failure)
+        return await asyncio.shield(future)
+
+    def _backoff(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """与同步会话相同的退避策略：遵守 Retry-After，否则带抖动的指数退避"""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return min(float(retry_after), MAX_RETRY_AFTER)
+                except ValueError:
+                    pass
+        delay = self.backoff_factor * (2 ** attempt)
+        return delay + random.uniform(0, delay / 2)
+
+    async def _get(self, url: str, headers: Dict[str, str]) -> httpx.Response:
+        """带重试的 GET（传输错误与 429/5xx）"""
+        attempt = 0
+        while True:
+            try:
+                response = await self._client.get(url, headers=headers)
+            except httpx.TransportError:
+                if attempt >= self.retries:
+                    raise
+                delay = self._backoff(attempt)
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= self.retries:
+                    return response
+                delay = self._backoff(attempt, response)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _exchange(self, exchange: HttpExchange) -> Any:
+        """用异步客户端执行交换（见 run_exchange()）；交换中的缓存读写在线程池中进行"""
+        done, value = await self._run(exchange_step, exchange)
+        while not done:
+            url, headers = value
+            try:
+                response = await self._get(url, headers)
+            except httpx.HTTPError as e:
+                done, value = await self._run(exchange_step, exchange, error=e)
+            else:
+                done, value = await self._run(exchange_step, exchange, response)
+        return value
+
+    # ------------------------------------------------------------------
+    # Release
+    # ------------------------------------------------------------------
+
+    async def fetch_release(self, config_obj: InstallConfig) -> Release:
+        """按安装配置的模板源获取 Release（同一模板源只获取一次）"""
+        key = (config_obj.source, config_obj.version, config_obj.use_cache)
+        return await self._once(self._releases, key, lambda: self._fetch_release(config_obj))
+
+    async def _fetch_release(self, config_obj: InstallConfig) -> Release:
+        sources = config_obj.template_sources
+        if len(sources) > 1:
+            raise ValidationError("异步安装只支持单个模板源")
+        source = sources[0]
+        if config_obj.version:
+            cache = self.cache if config_obj.use_cache else None
+            return await self._exchange(
+                release_exchange(config_obj.version, config_obj.github_token, cache)
+            )
+        if source.kind == "local":
+            return await self._run(local_release, Path(source.location).expanduser().resolve())
+        if source.kind == "url":
+            release = zip_url_release(source.location)
+            if release is not None:
+                return release
+            url = source.location
+        elif source == TemplateSource.default():
+            url = config.release_api_url
+        else:
+            url = source.release_api_url
+
+        cache = self.cache if config_obj.use_cache else None
+        cached = await self._run(cache.get_release, url) if cache else None
+        token = source.token or config_obj.github_token
+        if cached and cached.is_fresh(cache.ttl):
+            await self._run(cache.record, True)
+            release = Release.from_api_response(cached.data)
+        elif cached and cached.is_fresh(cache.ttl + cache.stale_ttl):
+            # 与 get_latest_release() 相同：先使用缓存，后台重新验证
+            await self._run(cache.record, True)
+            refresh = asyncio.ensure_future(self._refresh(
+                latest_release_exchange(url, token, cache, cached, record=False)
+            ))
+            self._refreshes.add(refresh)
+            refresh.add_done_callback(self._refreshes.discard)
+            release = Release.from_api_response(cached.data)
+        else:
+            release = await self._exchange(latest_release_exchange(url, token, cache, cached))
+        if source.token:
+            release.authorize(source.token)
+        return release
+
+    async def _refresh(self, exchange: HttpExchange) -> None:
+        """后台重新验证，结果只写入缓存；失败时忽略"""
+        try:
+            await self._exchange(exchange)
+        except (SCKitError, OSError, httpx.HTTPError):
+            pass
+
+    # ------------------------------------------------------------------
+    # 下载与暂存
+    # ------------------------------------------------------------------
+
+    async def _download(
+        self,
+        asset: ReleaseAsset,
+        dest: Path,
+        editor: Editor,
+        cache: Optional[ReleaseCache] = None,
+        partial: Optional[PartialDownload] = None,
+    ) -> "hashlib._Hash":
+        """
+        流式下载到文件；传输中断时用 Range / If-Range 续传
+
+        partial 为缓存中未完成的下载（dest 即其数据文件）时，先回放已有数据，
+        再从其后续传，并把校验器记入缓存，供之后的运行（包括同步安装）续传。
+
+        Returns:
+            边下载边计算的 SHA-256（含已有数据）
+        """
+        digest = hashlib.sha256()
+        resume = RangeResume(asset.download_url, headers=asset.headers)
+        if partial is not None and partial.offset:
+            await self._run(_hash_file, digest, dest)
+            resume = RangeResume(
+                asset.download_url, partial.offset, partial.validator, asset.headers,
+            )
+
+        f = await self._run(open, dest, "ab" if partial is not None else "wb")
+        try:
+            attempt = 0
+            while True:
+                try:
+                    await self._download_once(resume, f, digest, editor, cache)
+                    return digest
+                except RestartDownload:
+                    await self._run(f.truncate, 0)
+                    await self._run(f.seek, 0)
+                    digest = hashlib.sha256()
+                    resume.restart()
+                except httpx.TransportError as e:
+                    if attempt >= self.retries:
+                        raise DownloadError(f"下载失败: {e}")
+                    await asyncio.sleep(self._backoff(attempt))
+                    attempt += 1
+                except httpx.HTTPError as e:
+                    raise DownloadError(f"下载失败: {e}")
+        finally:
+            await self._run(f.close)
+
+    async def _download_once(
+        self,
+        resume: RangeResume,
+        f: BinaryIO,
+        digest: "hashlib._Hash",
+        editor: Editor,
+        cache: Optional[ReleaseCache],
+    ) -> None:
+        url = resume.url
+        async with self._client.stream(
+            "GET", url, headers=resume.request_headers(), timeout=config.REQUEST_TIMEOUT * 3,
+        ) as response:
+            if resume.accept(response) and cache is not None:
+                await self._run(f.flush)
+                await self._run(cache.set_partial_validator, url, resume.validator)
+            async for chunk in response.aiter_bytes():
+                if resume.downloaded + len(chunk) > resume.max_bytes:
+                    raise resume.too_large(resume.downloaded + len(chunk))
+                await self._run(f.write, chunk)
+                digest.update(chunk)
+                resume.downloaded += len(chunk)
+                if self.progress_callback:
+                    self.progress_callback(editor, DownloadProgress(resume.downloaded, resume.total))
+            if resume.incomplete:
+                raise httpx.RemoteProtocolError("文件下载不完整")
+
+    async def _fetch_asset(
+        self, asset: ReleaseAsset, editor: Editor, cache: Optional[ReleaseCache], dest: Path,
+    ) -> Path:
+        """
+        下载模板包并校验摘要，返回 zip 路径
+
+        启用缓存时与 stream_template_members() 一样写入缓存中的未完成文件（持有其锁），
+        完成后移入缓存；其它进程正在下载同一文件时下载到 dest。
+        """
+        url = asset.download_url
+        locked = False
+        if cache:
+            try:
+                locked = await self._run(cache.lock_partial, url)
+            except OSError:
+                locked = False  # 缓存不可写
+        try:
+            partial = await self._run(cache.get_partial, url) if locked else None
+            path = partial.path if partial else dest
+            try:
+                digest = await self._download(
+                    asset, path, editor, cache if locked else None, partial,
+                )
+                sha256 = verify_digest(asset.name, asset.sha256, digest)
+            except (IntegrityError, TemplateLimitError):
+                if locked:
+                    await self._run(cache.discard_partial, url)
+                else:
+                    await self._run(path.unlink, True)
+                raise
+            if locked:
+                return await self._run(cache.complete_partial, url, sha256)
+            if cache:
+                return await self._run(cache.put_asset, url, path, sha256)
+            return path
+        finally:
+            if locked:
+                await self._run(cache.unlock_partial, url)
+
+    async def stage(self, config_obj: InstallConfig) -> Tuple[Release, Path]:
+        """
+        准备安装配置对应的 commands 源目录（同一模板源、版本与编辑器只准备一次）
+
+        Returns:
+            (Release, commands 源目录)；源目录可能是本地模板源本身，不能移动其中的文件
+        """
+        release = await self.fetch_release(config_obj)
+        key = (config_obj.source, config_obj.version, config_obj.use_cache, config_obj.editor)
+        source = await self._once(
+            self._staged, key, lambda: self._stage(release, config_obj)
+        )
+        return release, source
+
+    async def _stage(self, release: Release, config_obj: InstallConfig) -> Path:
+        editor = config_obj.editor
+        asset = release.get_template_asset(editor)
+        if not asset:
+            raise TemplateNotFoundError(editor, release.version)
+
+        local_path = asset.local_path
+        if local_path is not None and local_path.is_dir():
+            return await self._run(find_local_commands, local_path, editor)
+        check_template_size(asset)
+
+        staging_dir = Path(await self._run(
+            tempfile.mkdtemp, prefix=f"{editor.value}-", dir=self._work_dir,
+        ))
+
+        zip_path = local_path
+        if zip_path is None:
+            cache = self.cache if config_obj.use_cache else None
+            await self._attach_checksums(release, cache)
+            zip_path = await self._run(
+                cache.get_asset, asset.download_url, asset.size, asset.sha256,
+            ) if cache else None
+            if zip_path is not None:
+                await self._run(cache.record, True)
+            else:
+                zip_path = await self._fetch_asset(
+                    asset, editor, cache, staging_dir.with_suffix(".zip"),
+                )
+                if cache:
+                    await self._run(cache.record, False)
+
+        await self._run(extract_template_members, zip_path, staging_dir, editor)
+        return await self._run(find_commands_source, staging_dir, editor)
+
+    async def _attach_checksums(self, release: Release, cache: Optional[ReleaseCache]) -> None:
+        """attach_checksums() 的异步版本；获取失败时摘要保持未知（只检查大小），不输出到终端"""
+        checksums_asset = release.get_checksums_asset()
+        if checksums_asset is None or all(
+            a.sha256 for a in release.assets if a is not checksums_asset
+        ):
+            return
+
+        url = checksums_asset.download_url
+        cached = await self._run(cache.get_release, url) if cache else None
+        if cached:
+            checksums = cached.data.get("checksums", {})
+        else:
+            try:
+                response = await self._get(url, checksums_asset.headers)
+                response.raise_for_status()
+            except httpx.HTTPError:
+                return
+            checksums = parse_checksums(response.text)
+            if cache:
+                await self._run(cache.put_release, url, {"checksums": checksums})
+
+        for asset in release.assets:
+            if asset.sha256 is None:
+                asset.sha256 = checksums.get(asset.name)
+
+    # ------------------------------------------------------------------
+    # 安装
+    # ------------------------------------------------------------------
+
+    def _conflict_handler(
+        self, loop: asyncio.AbstractEventLoop
+    ) -> Optional[Callable[[List[Path]], Collection[Path]]]:
+        """把（可能是异步的）冲突回调包装成可在线程池中调用的同步函数"""
+        callback = self.conflict_callback
+        if callback is None:
+            return None
+
+        def handle(paths: List[Path]) -> Collection[Path]:
+            answer = callback(paths)
+            if inspect.isawaitable(answer):
+                async def wait() -> Collection[Path]:
+                    return await answer
+                answer = asyncio.run_coroutine_threadsafe(wait(), loop).result()
+            return answer
+
+        return handle
+
+    async def install(self, config_obj: InstallConfig) -> InstallResult:
+        """
+        安装单个项目（受并发上限约束）；dry_run 时只返回同步计划，不写入
+
+        Raises:
+            SCKitError: 验证、网络或文件系统错误
+        """
+        if self._client is None:
+            await self.start()
+
+        async with self._semaphore:
+            await self._run(config_obj.validate)
+            release, source = await self.stage(config_obj)
+            if config_obj.dry_run:
+                # 与 install_template() 相同：只生成计划，不写入文件与清单
+                plan = await self._run(plan_project, config_obj, source)
+                result = InstallResult(
+                    success=True,
+                    version=release.version,
+                    files_copied=0,
+                    target_path=config_obj.target_path,
+                    editor=config_obj.editor,
+                    link=config_obj.link,
+                    plan=plan,
+                )
+            else:
+                result = await self._run(
+                    sync_project,
+                    config_obj,
+                    source,
+                    release.version,
+                    self._conflict_handler(asyncio.get_running_loop()),
+                )
+
+        if self.result_callback:
+            self.result_callback(result)
+        return result
+
+    async def _install_or_fail(self, config_obj: InstallConfig) -> InstallResult:
+        try:
+            return await self.install(config_obj)
+        except (SCKitError, OSError, httpx.HTTPError) as e:
+            result = InstallResult(
+                success=False,
+                version="",
+                files_copied=0,
+                target_path=config_obj.target_path,
+                editor=config_obj.editor,
+                error=str(e),
+            )
+            if self.result_callback:
+                self.result_callback(result)
+            return result
+
+    async def install_many(self, configs: Iterable[InstallConfig]) -> BatchInstallResult:
+        """并发安装多个项目；单个项目失败不影响其它项目"""
+        results = await asyncio.gather(*(self._install_or_fail(c) for c in configs))
+        return BatchInstallResult(results=list(results))
+
+
+async def install_templates_async(
+    configs: Iterable[InstallConfig],
+    **kwargs: Any,
+) -> BatchInstallResult:
+    """
+    在当前事件循环中批量安装（AsyncInstaller 的便捷封装）
+
+    Args:
+        configs: 各项目/编辑器的安装配置
+        **kwargs: 传给 AsyncInstaller 的参数
+    """
+    async with AsyncInstaller(**kwargs) as installer:
+        return await installer.install_many(configs)
@@ -0,0 +1,540 @@
+"""
+本地缓存
+
+在用户级缓存目录中保存 GitHub Release 元数据（连同 ETag/Last-Modified）
+和按内容摘要（SHA-256）存储的模板 zip，避免重复的 API 调用与下载。
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from sckit_cli.utils.fs import atomic_write_json, user_dir
+
+
+# 索引文件格式版本，结构不兼容时递增
+INDEX_VERSION = 1
+
+HASH_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# 未完成下载的锁超过此时间（秒）视为持有进程已退出
+PARTIAL_LOCK_TIMEOUT = 600
+
+
+def default_cache_dir() -> Path:
+    """
+    返回默认缓存目录
+
+    优先使用 SCKIT_CACHE_DIR，其次遵循各平台的缓存目录约定。
+    """
+    env_dir = os.getenv("SCKIT_CACHE_DIR")
+    if env_dir:
+        return Path(env_dir).expanduser()
+    return user_dir("cache")
+
+
+def file_sha256(path: Path) -> str:
+    """计算文件的 SHA-256 摘要"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _read_json(path: Path) -> Optional[Any]:
+    """读取 JSON 文件，文件缺失或损坏时返回 None"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+# ============================================================================
+# 缓存条目与统计
+# ============================================================================
+
+@dataclass
+class CachedRelease:
+    """缓存的 Release 元数据"""
+    data: dict
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float  # 最近一次从服务器确认的时间戳
+
+    def age(self, now: Optional[float] = None) -> float:
+        """距离最近一次确认经过的秒数"""
+        return (now if now is not None else time.time()) - self.fetched_at
+
+    def is_fresh(self, ttl: float) -> bool:
+        """是否仍在 TTL 内（可直接使用，无需请求服务器）"""
+        return self.age() < ttl
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """用于重新验证的条件请求头"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class PartialDownload:
+    """未完成的下载"""
+    path: Path
+    offset: int                # 已下载字节数
+    validator: Optional[str]   # ETag / Last-Modified，用于 If-Range
+
+
+@dataclass
+class CacheStats:
+    """缓存统计信息"""
+    path: Path
+    hits: int
+    misses: int
+    releases: int
+    assets: int
+    total_size: int  # 字节
+    max_size: int    # 字节
+
+    @property
+    def hit_rate(self) -> float:
+        """命中率 (0-100)"""
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return (self.hits / total) * 100
+
+
+# ============================================================================
+# ReleaseCache
+# ============================================================================
+
+class ReleaseCache:
+    """
+    Release 元数据与模板包缓存
+
+    目录结构:
+        <root>/index.json          资源索引与 LRU 时间戳
+        <root>/stats.log           命中统计（每个进程退出时追加一行 "<命中> <未命中>"）
+        <root>/releases/<key>.json Release JSON 及其校验器
+        <root>/assets/<sha256>.zip 按内容摘要存储的模板包
+        <root>/partial/<key>.part  未完成的下载（<key>.json 记录地址与 ETag）
+        <root>/search/             模板搜索索引
+    """
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        ttl: float = 300.0,
+        max_size: int = 200 * 1024 * 1024,
+        stale_ttl: float = 0.0,
+    ):
+        self.root = Path(root) if root is not None else default_cache_dir()
+        self.ttl = ttl
+        self.max_size = max_size
+        # 过期后仍可先使用、同时在后台重新验证的时长（stale-while-revalidate）
+        self.stale_ttl = stale_ttl
+        # 同一进程内多个线程并发读写索引时保持一致
+        self._index_lock = threading.RLock()
+        # 本进程尚未写入 stats.log 的命中统计
+        self._pending_stats = {"hits": 0, "misses": 0}
+        self._stats_lock = threading.Lock()
+        self._flush_registered = False
+
+    # ------------------------------------------------------------------
+    # 路径与索引
+    # ------------------------------------------------------------------
+
+    @property
+    def releases_dir(self) -> Path:
+        return self.root / "releases"
+
+    @property
+    def assets_dir(self) -> Path:
+        return self.root / "assets"
+
+    @property
+    def partial_dir(self) -> Path:
+        return self.root / "partial"
+
+    @property
+    def search_dir(self) -> Path:
+        """模板搜索索引（sckit_cli.utils.search）"""
+        return self.root / "search"
+
+    @property
+    def index_path(self) -> Path:
+        return self.root / "index.json"
+
+    @property
+    def stats_path(self) -> Path:
+        return self.root / "stats.log"
+
+    @staticmethod
+    def _key(url: str) -> str:
+        """URL 对应的缓存文件名"""
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+
+    def _load_index(self) -> Dict[str, Any]:
+        index = _read_json(self.index_path)
+        if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+            index = {"version": INDEX_VERSION, "assets": {}, "urls": {}, "stats": {}}
+        index.setdefault("assets", {})
+        index.setdefault("urls", {})
+        index.setdefault("stats", {})
+        return index
+
+    def _save_index(self, index: Dict[str, Any]) -> None:
+        try:
+            atomic_write_json(self.index_path, index)
+        except OSError:
+            pass  # 缓存写入失败不影响主流程
+
+    def record(self, hit: bool) -> None:
+        """记录一次缓存命中或未命中（先计入内存，进程退出时由 flush_stats() 写入）"""
+        with self._stats_lock:
+            self._pending_stats["hits" if hit else "misses"] += 1
+            if not self._flush_registered:
+                atexit.register(self.flush_stats)
+                self._flush_registered = True
+
+    def flush_stats(self) -> None:
+        """
+        把本进程累计的命中统计追加到 stats.log
+
+        只追加一行、不重写文件：并发的 sckit 进程各自追加，互不丢失更新。
+        """
+        with self._stats_lock:
+            hits, misses = self._pending_stats["hits"], self._pending_stats["misses"]
+            if not hits and not misses:
+                return
+            self._pending_stats = {"hits": 0, "misses": 0}
+        try:
+            # 缓存目录不存在（已被清除）时不再创建
+            fd = os.open(self.stats_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, f"{hits} {misses}\n".encode("ascii"))
+            finally:
+                os.close(fd)
+        except OSError:
+            pass  # 缓存写入失败不影响主流程
+
+    def _hit_counts(self, index: Dict[str, Any]) -> tuple[int, int]:
+        """(命中, 未命中)：stats.log、旧版索引中的统计与本进程尚未写入的部分"""
+        hits = index["stats"].get("hits", 0)
+        misses = index["stats"].get("misses", 0)
+        try:
+            with open(self.stats_path, "r", encoding="ascii") as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():
+                        hits += int(parts[0])
+                        misses += int(parts[1])
+        except (OSError, ValueError):
+            pass
+        with self._stats_lock:
+            hits += self._pending_stats["hits"]
+            misses += self._pending_stats["misses"]
+        return hits, misses
+
+    # ------------------------------------------------------------------
+    # Release 元数据
+    # ------------------------------------------------------------------
+
+    def _release_path(self, url: str) -> Path:
+        return self.releases_dir / f"{self._key(url)}.json"
+
+    def get_release(self, url: str) -> Optional[CachedRelease]:
+        """读取缓存的 Release 元数据"""
+        entry = _read_json(self._release_path(url))
+        if not isinstance(entry, dict) or "data" not in entry:
+            return None
+        return CachedRelease(
+            data=entry["data"],
+            etag=entry.get("etag"),
+            last_modified=entry.get("last_modified"),
+            fetched_at=float(entry.get("fetched_at", 0)),
+        )
+
+    def put_release(
+        self,
+        url: str,
+        data: dict,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """保存 Release 元数据及其校验器"""
+        try:
+            atomic_write_json(self._release_path(url), {
+                "url": url,
+                "data": data,
+                "etag": etag,
+                "last_modified": last_modified,
+                "fetched_at": time.time(),
+            })
+        except OSError:
+            pass
+
+    def touch_release(self, url: str) -> None:
+        """服务器返回 304 时刷新确认时间"""
+        cached = self.get_release(url)
+        if cached:
+            self.put_release(url, cached.data, cached.etag, cached.last_modified)
+
+    # ------------------------------------------------------------------
+    # 模板包
+    # ------------------------------------------------------------------
+
+    def get_asset(
+        self,
+        url: str,
+        expected_size: Optional[int] = None,
+        sha256: Optional[str] = None,
+    ) -> Optional[Path]:
+        """
+        查找缓存的模板包
+
+        已知发布的摘要时直接按摘要查找（镜像或其它地址下载的同一模板包
+        同样命中，地址下内容已变化时不会误用旧文件）；否则按下载地址查找。
+        命中时更新 LRU 时间戳；文件缺失或大小不符时视为未命中。
+        """
+        with self._index_lock:
+            index = self._load_index()
+            digest = sha256 or index["urls"].get(url)
+            if not digest:
+                return None
+
+            path = self.assets_dir / f"{digest}.zip"
+            entry = index["assets"].get(digest)
+            if entry is None or not path.exists():
+                return None
+            if expected_size and entry.get("size") != expected_size:
+                return None
+
+            entry["last_used"] = time.time()
+            index["urls"][url] = digest
+            self._save_index(index)
+            return path
+
+    def put_asset(self, url: str, source: Path, digest: Optional[str] = None) -> Path:
+        """
+        将下载好的模板包移入缓存
+
+        Args:
+            url: 下载地址
+            source: 已下载的文件（会被移动）
+            digest: 已知的 SHA-256 摘要，省略时重新计算
+
+        Returns:
+            Path: 缓存中的文件路径
+        """
+        digest = digest or file_sha256(source)
+        self.assets_dir.mkdir(parents=True, exist_ok=True)
+        path = self.assets_dir / f"{digest}.zip"
+        if not path.exists():
+            shutil.move(str(source), str(path))
+
+        with self._index_lock:
+            index = self._load_index()
+            index["urls"][url] = digest
+            index["assets"][digest] = {
+                "size": path.stat().st_size,
+                "last_used": time.time(),
+            }
+            self._save_index(index)
+
+        self.prune(keep=digest)
+        return path
+
+    # ------------------------------------------------------------------
+    # 未完成的下载
+    # ------------------------------------------------------------------
+
+    def partial_path(self, url: str) -> Path:
+        """未完成下载的数据文件"""
+        return self.partial_dir / f"{self._key(url)}.part"
+
+    def _partial_meta_path(self, url: str) -> Path:
+        return self.partial_dir / f"{self._key(url)}.json"
+
+    def partial_lock_path(self, url: str) -> Path:
+        """未完成下载的锁文件"""
+        return self.partial_dir / f"{self._key(url)}.lock"
+
+    def lock_partial(self, url: str) -> bool:
+        """
+        获取未完成下载的独占锁（防止并发进程写入同一文件）
+
+        Returns:
+            bool: 是否获得锁
+        """
+        lock = self.partial_lock_path(url)
+        lock.parent.mkdir(parents=True, exist_ok=True)
+        for _ in range(2):
+            try:
+                fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                try:
+                    if time.time() - lock.stat().st_mtime < PARTIAL_LOCK_TIMEOUT:
+                        return False
+                    lock.unlink()  # 过期锁
+                except OSError:
+                    return False
+                continue
+            os.write(fd, str(os.getpid()).encode())
+            os.close(fd)
+            return True
+        return False
+
+    def unlock_partial(self, url: str) -> None:
+        """释放未完成下载的锁"""
+        try:
+            self.partial_lock_path(url).unlink()
+        except OSError:
+            pass
+
+    def get_partial(self, url: str) -> PartialDownload:
+        """
+        读取未完成的下载
+
+        已下载字节数以数据文件大小为准；缺少校验器（ETag）时无法安全续传，
+        丢弃已有数据。
+        """
+        path = self.partial_path(url)
+        meta = _read_json(self._partial_meta_path(url))
+        if (
+            path.exists()
+            and isinstance(meta, dict)
+            and meta.get("url") == url
+            and meta.get("validator")
+        ):
+            return PartialDownload(path, path.stat().st_size, meta["validator"])
+
+        self.discard_partial(url)
+        return PartialDownload(path, 0, None)
+
+    def set_partial_validator(self, url: str, validator: str) -> None:
+        """记录续传所需的校验器"""
+        try:
+            atomic_write_json(self._partial_meta_path(url), {
+                "url": url,
+                "validator": validator,
+            })
+        except OSError:
+            pass
+
+    def discard_partial(self, url: str) -> None:
+        """删除未完成的下载"""
+        for path in (self.partial_path(url), self._partial_meta_path(url)):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def complete_partial(self, url: str, digest: Optional[str] = None) -> Path:
+        """下载完成：把数据文件移入模板包存储（digest 为下载时已算出的摘要）"""
+        path = self.put_asset(url, self.partial_path(url), digest)
+        self.discard_partial(url)
+        return path
+
+    # ------------------------------------------------------------------
+    # 统计与清理
+    # ------------------------------------------------------------------
+
+    def _release_files(self):
+        if not self.releases_dir.exists():
+            return []
+        return [p for p in self.releases_dir.glob("*.json") if p.is_file()]
+
+    def stats(self) -> CacheStats:
+        """汇总缓存统计信息"""
+        index = self._load_index()
+        hits, misses = self._hit_counts(index)
+        release_files = self._release_files()
+        total_size = sum(p.stat().st_size for p in release_files)
+        assets = 0
+        for digest in index["assets"]:
+            path = self.assets_dir / f"{digest}.zip"
+            if path.exists():
+                assets += 1
+                total_size += path.stat().st_size
+
+        return CacheStats(
+            path=self.root,
+            hits=hits,
+            misses=misses,
+            releases=len(release_files),
+            assets=assets,
+            total_size=total_size,
+            max_size=self.max_size,
+        )
+
+    def prune(self, max_size: Optional[int] = None, keep: Optional[str] = None) -> int:
+        """
+        按 LRU 淘汰模板包，直到总大小不超过上限
+
+        Args:
+            max_size: 大小上限（字节），默认使用实例配置
+            keep: 不淘汰的摘要（刚写入的条目）
+
+        Returns:
+            int: 释放的字节数
+        """
+        with self._index_lock:
+            return self._prune(self.max_size if max_size is None else max_size, keep)
+
+    def _prune(self, limit: int, keep: Optional[str]) -> int:
+        index = self._load_index()
+
+        # 清理索引中已不存在的文件
+        assets = {
+            digest: entry for digest, entry in index["assets"].items()
+            if (self.assets_dir / f"{digest}.zip").exists()
+        }
+        total = sum(entry.get("size", 0) for entry in assets.values())
+
+        freed = 0
+        for digest, entry in sorted(assets.items(), key=lambda kv: kv[1].get("last_used", 0)):
+            if total <= limit:
+                break
+            if digest == keep:
+                continue
+            try:
+                (self.assets_dir / f"{digest}.zip").unlink()
+            except OSError:
+                continue
+            size = entry.get("size", 0)
+            total -= size
+            freed += size
+            del assets[digest]
+
+        index["assets"] = assets
+        index["urls"] = {url: d for url, d in index["urls"].items() if d in assets}
+        self._save_index(index)
+        return freed
+
+    def clear(self) -> int:
+        """删除全部缓存内容，返回释放的字节数"""
+        freed = self.stats().total_size
+        for path in (self.releases_dir, self.assets_dir, self.partial_dir, self.search_dir):
+            if path.exists():
+                shutil.rmtree(path, ignore_errors=True)
+        for path in (self.index_path, self.stats_path):
+            if path.exists():
+                path.unlink()
+        with self._stats_lock:
+            self._pending_stats = {"hits": 0, "misses": 0}
+        return freed
@@ -0,0 +1,155 @@
+"""
+冲突确认
+
+以一张表显示所有项目的同步计划，并对本地修改过的文件一次性做出选择
+（全部覆盖、全部保留或按编号覆盖）。引擎输出交给其它 sink 或不在终端中
+运行时不显示、不询问，保留本地修改。
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING, List, Optional, Set
+
+from sckit_cli.utils.sync import FileAction, SyncPlan
+
+if TYPE_CHECKING:
+    from sckit_cli import InstallConfig
+
+
+ACTION_STYLES = {
+    FileAction.NEW: "green",
+    FileAction.MODIFIED: "cyan",
+    FileAction.EDITED: "yellow",
+    FileAction.REMOVED: "red",
+}
+
+
+def print_sync_plan(plans: List[tuple[InstallConfig, SyncPlan]]) -> None:
+    """
+    以一张表显示所有项目的同步计划
+    
+    内容相同的文件只计数；本地修改过的文件按出现顺序编号，供批量选择时引用。
+    引擎输出交给其它 sink 时不显示（文件分类见 FileApplied 事件与结果）。
+    """
+    from sckit_cli import console, renders_console
+    
+    if not renders_console():
+        return
+    from rich.table import Table
+    
+    multiple = len(plans) > 1
+    table = Table(title="同步计划", title_style="bold cyan")
+    table.add_column("#", justify="right", style="yellow")
+    if multiple:
+        table.add_column("项目")
+    table.add_column("文件")
+    table.add_column("状态")
+    
+    number = 0
+    identical = 0
+    for config_obj, plan in plans:
+        identical += plan.count(FileAction.IDENTICAL)
+        for item in plan.changes:
+            label = ""
+            if item.action == FileAction.EDITED:
+                number += 1
+                label = str(number)
+            style = ACTION_STYLES[item.action]
+            row = [label]
+            if multiple:
+                row.append(f"{config_obj.target_path.name} ({config_obj.editor.value})")
+            row.extend([
+                f"{config_obj.editor.config_dir}/commands/{item.path}",
+                f"[{style}]{item.action.label}[/{style}]",
+            ])
+            table.add_row(*row)
+    
+    if identical:
+        table.caption = f"另有 {identical} 个文件无变化"
+    if table.row_count:
+        console.print(table)
+    else:
+        console.print(f"[green]所有文件均无变化（{identical} 个）[/green]")
+
+
+def parse_selection(text: str, count: int) -> Optional[Set[int]]:
+    """
+    解析编号选择（如 "1,3,5-8"），编号从 1 开始
+    
+    Returns:
+        选中的编号；格式错误或超出范围时返回 None
+    """
+    selected: Set[int] = set()
+    for part in text.replace(" ", "").split(","):
+        if not part:
+            continue
+        start, _, end = part.partition("-")
+        if not start.isdigit() or (end and not end.isdigit()):
+            return None
+        first, last = int(start), int(end or start)
+        if not 1 <= first <= last <= count:
+            return None
+        selected.update(range(first, last + 1))
+    return selected
+
+
+def choose_overwrites(plans: List[tuple[InstallConfig, SyncPlan]]) -> List[Set[str]]:
+    """
+    对所有项目的冲突文件一次性做出选择：全部覆盖、全部保留或按编号覆盖
+    
+    force 的项目直接覆盖；非交互环境（interactive=False 的配置，或引擎输出
+    交给其它 sink 时）保留本地修改。编号与 print_sync_plan() 一致。
+    
+    Returns:
+        与 plans 对应的、各项目要覆盖的文件路径
+    """
+    from sckit_cli import console, get_console, notify, renders_console
+    
+    overwrite: List[Set[str]] = [
+        {f.path for f in plan.conflicts} if config_obj.force else set()
+        for config_obj, plan in plans
+    ]
+    # 与 print_sync_plan() 相同的编号顺序
+    numbered = [
+        (index, item.path)
+        for index, (_, plan) in enumerate(plans)
+        for item in plan.conflicts
+    ]
+    pending = sum(1 for index, _ in numbered if not plans[index][0].force)
+    if not pending:
+        return overwrite
+    
+    if (
+        not renders_console()
+        or not sys.stdin.isatty()
+        or not all(c.interactive for c, _ in plans)
+    ):
+        notify(f"非交互模式：保留 {pending} 个本地修改过的文件（使用 --force 覆盖）", "warning")
+        return overwrite
+    
+    from rich.prompt import Prompt
+    
+    choice = Prompt.ask(
+        f"{pending} 个文件有本地修改：全部覆盖 (a) / 全部保留 (k) / 按编号覆盖 (s)",
+        choices=["a", "k", "s"],
+        default="k",
+        console=get_console(),
+    )
+    if choice == "k":
+        return overwrite
+    
+    if choice == "a":
+        selected = set(range(1, len(numbered) + 1))
+    else:
+        while True:
+            text = Prompt.ask("要覆盖的编号（如 1,3,5-8）", console=get_console())
+            selected = parse_selection(text, len(numbered))
+            if selected is not None:
+                break
+            console.print(f"[red]请输入 1-{len(numbered)} 之间的编号[/red]")
+    
+    for number in selected:
+        index, path = numbered[number - 1]
+        overwrite[index].add(path)
+    return overwrite
@@ -0,0 +1,158 @@
+"""
+安装事件
+
+安装引擎（install_template / install_templates）在各阶段发出类型化事件，
+由可替换的接收者（sink）处理：
+
+- RichSink：CLI 默认，把提示信息（Message）渲染到终端；进度条、同步计划与
+  结果面板直接由 Rich 渲染，不构造其它事件
+- NdjsonSink：每个事件一行 JSON，供 CI、编辑器插件等其它进程读取
+- NullSink：丢弃一切输出，嵌入时零开销（不导入 Rich、不构造事件、不询问）
+- ListSink：收集到列表（测试或在进程内检查事件）
+
+非 Rich 的接收者都不会等待用户输入：冲突文件保留本地修改（force 时覆盖）。
+
+用法:
+    from sckit_cli import install_template
+    from sckit_cli.utils.events import NdjsonSink
+
+    result = install_template(config, sink=NdjsonSink())
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from dataclasses import asdict, dataclass
+from typing import ClassVar, List, Optional, TextIO
+
+
+@dataclass(frozen=True)
+class Event:
+    """事件基类；kind 为 NDJSON 中的 event 字段"""
+    kind: ClassVar[str] = "event"
+
+    def to_dict(self) -> dict:
+        return {"event": self.kind, **asdict(self)}
+
+
+@dataclass(frozen=True)
+class PhaseStarted(Event):
+    """阶段开始（release、download、extract、merge、plan、sync）"""
+    kind: ClassVar[str] = "phase_start"
+    phase: str
+    detail: str = ""
+
+
+@dataclass(frozen=True)
+class PhaseFinished(Event):
+    """阶段结束（阶段抛出异常时同样发出）"""
+    kind: ClassVar[str] = "phase_end"
+    phase: str
+    detail: str = ""
+    seconds: float = 0.0
+    bytes: int = 0
+    files: int = 0
+
+
+@dataclass(frozen=True)
+class BytesReceived(Event):
+    """下载进度（按 config.PROGRESS_INTERVAL 节流）"""
+    kind: ClassVar[str] = "bytes"
+    name: str           # 模板包文件名
+    downloaded: int
+    total: int          # 未知时为 0
+
+
+@dataclass(frozen=True)
+class FileApplied(Event):
+    """同步计划中的一个文件处理完毕（内容相同的文件不发出）"""
+    kind: ClassVar[str] = "file"
+    project: str
+    path: str           # 相对 commands 目录
+    action: str         # new / modified / edited / removed
+    applied: bool       # 是否写入或删除（edited 且保留本地修改时为 False）
+
+
+@dataclass(frozen=True)
+class Message(Event):
+    """引擎的提示信息（纯文本，不含 Rich 标记）"""
+    kind: ClassVar[str] = "message"
+    text: str
+    level: str = "info"  # info / success / warning / error
+
+
+@dataclass(frozen=True)
+class InstallFinished(Event):
+    """安装结束；result 与 `sckit init --json` 的输出相同"""
+    kind: ClassVar[str] = "result"
+    result: dict
+
+
+class EventSink:
+    """
+    事件接收者
+
+    enabled 为 False 时引擎不构造事件。renders_console 为 True 时引擎的进度条、
+    同步计划与结果面板交给 Rich 渲染，并可询问用户；这类接收者无论 enabled
+    都会收到 Message 事件，由其渲染到终端。
+    """
+    enabled: bool = True
+    renders_console: bool = False
+
+    def emit(self, event: Event) -> None:
+        raise NotImplementedError
+
+
+# Message.level 在终端中的颜色
+MESSAGE_STYLES = {"info": "cyan", "success": "green", "warning": "yellow", "error": "red"}
+
+
+class RichSink(EventSink):
+    """CLI 默认：把 Message 渲染到终端，不接收其它事件"""
+    enabled = False
+    renders_console = True
+
+    def emit(self, event: Event) -> None:
+        if isinstance(event, Message):
+            from sckit_cli import get_console
+            get_console().print(event.text, style=MESSAGE_STYLES.get(event.level), markup=False)
+
+
+class NullSink(EventSink):
+    """丢弃一切输出"""
+    enabled = False
+
+    def emit(self, event: Event) -> None:
+        pass
+
+
+class NdjsonSink(EventSink):
+    """每个事件写一行 JSON（可在多个线程中使用）"""
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream if stream is not None else sys.stdout
+        self._lock = threading.Lock()
+
+    def emit(self, event: Event) -> None:
+        line = json.dumps(event.to_dict(), ensure_ascii=False, default=str)
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+
+class ListSink(EventSink):
+    """把事件收集到 events 列表（可在多个线程中使用）"""
+
+    def __init__(self) -> None:
+        self.events: List[Event] = []
+        self._lock = threading.Lock()
+
+    def emit(self, event: Event) -> None:
+        with self._lock:
+            self.events.append(event)
+
+    def of(self, kind: type) -> List[Event]:
+        """指定类型的事件"""
+        return [e for e in self.events if isinstance(e, kind)]
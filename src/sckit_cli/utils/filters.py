@@ -0,0 +1,145 @@
+"""
+模板筛选
+
+`sckit init --only/--exclude` 的匹配规则：
+
+- 普通模式是 glob，依次与相对路径、文件名、去掉 .md 的文件名比较
+  （`sckit.code-reviewer`、`sckit.git-*`、`*.md` 均可）
+- `tag:<名称>` 与模板 frontmatter 中的 `tags` 比较（名称同样可以是 glob）
+
+匹配不区分大小写。只有路径模式无法决定结果时才读取 frontmatter，且只读取文件开头
+FRONTMATTER_MAX_BYTES 字节；未被选中的模板不需要完整解压。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Callable, FrozenSet, Iterable, List, Optional, Tuple
+
+
+TAG_PREFIX = "tag:"
+
+# 读取 frontmatter 的字节上限
+FRONTMATTER_MAX_BYTES = 4096
+
+HeadReader = Callable[[], bytes]
+
+
+def split_patterns(values: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    """展开逗号分隔的模式，去掉空白与重复项（保持顺序）"""
+    patterns = []
+    for value in values or ():
+        for part in value.split(","):
+            part = part.strip().lower()
+            if part and part not in patterns:
+                patterns.append(part)
+    return tuple(patterns)
+
+
+def parse_tags(head: bytes) -> FrozenSet[str]:
+    """
+    从文件开头的字节中解析 frontmatter 的 tags
+
+    支持 `tags: [a, b]`、`tags: a, b` 与 YAML 列表（`- a`）三种写法。
+    head 可能在 frontmatter 结束前被截断，只解析已读到的部分。
+    """
+    text = head.decode("utf-8", errors="ignore")
+    if not text.startswith("---"):
+        return frozenset()
+
+    tags: List[str] = []
+    in_list = False
+    for line in text.splitlines()[1:]:
+        if line.strip() == "---":
+            break
+        if in_list:
+            item = line.strip()
+            if item.startswith("- "):
+                tags.append(item[2:])
+                continue
+            if not item:
+                continue
+            in_list = False
+        key, sep, value = line.partition(":")
+        if not sep or key.strip() != "tags":
+            continue
+        value = value.strip()
+        if value:
+            tags.extend(value.strip("[]").split(","))
+        else:
+            in_list = True
+
+    return frozenset(
+        tag.strip().strip("'\"").lower() for tag in tags if tag.strip().strip("'\"")
+    )
+
+
+@dataclass(frozen=True)
+class TemplateFilter:
+    """
+    模板筛选条件
+
+    only 非空时只选择匹配其中任一模式的模板；再排除匹配 exclude 中任一模式的模板。
+    """
+    only: Tuple[str, ...] = ()
+    exclude: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_patterns(
+        cls,
+        only: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> "TemplateFilter":
+        """由命令行参数构造；`--only '*'` 表示全部模板"""
+        return cls(
+            only=tuple(p for p in split_patterns(only) if p != "*"),
+            exclude=split_patterns(exclude),
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.only or self.exclude)
+
+    @property
+    def needs_tags(self) -> bool:
+        """是否有按标签匹配的模式（需要读取 frontmatter）"""
+        return any(p.startswith(TAG_PREFIX) for p in self.only + self.exclude)
+
+    def describe(self) -> str:
+        parts = []
+        if self.only:
+            parts.append("只安装 " + ", ".join(self.only))
+        if self.exclude:
+            parts.append("排除 " + ", ".join(self.exclude))
+        return "；".join(parts)
+
+    def matches(self, path: str, read_head: Optional[HeadReader] = None) -> bool:
+        """
+        模板是否被选中
+
+        Args:
+            path: 相对 commands 目录的路径
+            read_head: 读取文件开头（至多 FRONTMATTER_MAX_BYTES 字节）的函数，
+                只在需要按标签匹配时调用一次；省略时视为没有标签
+        """
+        path = path.lower()
+        name = path.rsplit("/", 1)[-1]
+        names = (path, name, name[:-3] if name.endswith(".md") else name)
+        tags: Optional[FrozenSet[str]] = None
+
+        def hit(patterns: Tuple[str, ...]) -> bool:
+            nonlocal tags
+            # 先比较路径，只有路径模式都不匹配时才读取标签
+            globs = [p for p in patterns if not p.startswith(TAG_PREFIX)]
+            if any(fnmatchcase(n, p) for p in globs for n in names):
+                return True
+            wanted = [p[len(TAG_PREFIX):] for p in patterns if p.startswith(TAG_PREFIX)]
+            if not wanted:
+                return False
+            if tags is None:
+                tags = parse_tags(read_head()) if read_head else frozenset()
+            return any(fnmatchcase(tag, p) for p in wanted for tag in tags)
+
+        if self.only and not hit(self.only):
+            return False
+        return not (self.exclude and hit(self.exclude))
@@ -0,0 +1,73 @@
+"""
+文件系统工具
+
+缓存、全局模板存储、搜索索引、安装清单与项目登记共用的用户目录定位与原子写入。
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+
+def user_dir(kind: str) -> Path:
+    """
+    返回 sckit 的用户级目录（遵循各平台约定）
+
+    Args:
+        kind: "cache"（可随时清理的缓存）或 "data"（需要长期保留的数据）
+    """
+    if sys.platform == "win32":
+        base = Path(os.getenv("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / ("Caches" if kind == "cache" else "Application Support")
+    elif kind == "cache":
+        base = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache")
+    else:
+        base = Path(os.getenv("XDG_DATA_HOME") or Path.home() / ".local" / "share")
+    return base / "sckit"
+
+
+@contextmanager
+def atomic_path(
+    path: Path,
+    prefix: str = ".tmp-",
+    suffix: str = "",
+    on_error: Optional[Callable[[Path], None]] = None,
+) -> Iterator[Path]:
+    """
+    原子替换文件：在同一目录中创建临时文件交给调用方写入，成功后重命名为 path
+
+    并发进程不会读到写了一半的文件。失败时把临时文件交给 on_error 处理
+    （例如移回原处），未提供时删除。
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=prefix, suffix=suffix)
+    os.close(fd)
+    tmp = Path(tmp_name)
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            (on_error or os.unlink)(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_text(path: Path, content: str, prefix: str = ".tmp-", suffix: str = "") -> None:
+    """原子写入文本文件（UTF-8）"""
+    with atomic_path(path, prefix, suffix) as tmp:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(content)
+
+
+def atomic_write_json(path: Path, data: Any, **dump_kwargs: Any) -> None:
+    """原子写入 JSON 文件，其余参数传给 json.dumps"""
+    atomic_write_text(path, json.dumps(data, ensure_ascii=False, **dump_kwargs), suffix=".json")
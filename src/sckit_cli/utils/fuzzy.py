@@ -0,0 +1,105 @@
+"""
+模糊匹配
+
+交互式模板选择（`sckit init --pick`）的输入即筛选：查询按空白拆成若干词，
+每个词的字符须按顺序（不必相邻）出现在条目的名称或描述中，所有词都匹配才保留。
+
+结果分档排序，档内保持原顺序：
+    1. 每个词都是名称的子串
+    2. 每个词都按顺序出现在名称中
+    3. 每个词都是名称或描述的子串
+    4. 其它（字符分散在名称与描述中）
+
+每次按键都在上一次的结果上继续筛选：查询在末尾追加字符时，新结果一定是
+旧结果的子集，只需检查旧结果；删除字符时直接复用之前的结果。
+匹配与分档都由 `compress(..., map(pattern.search, ...))` 完成，
+逐条目的循环在 C 中执行，一万个条目的一次筛选在几毫秒内完成。
+"""
+
+from __future__ import annotations
+
+import re
+from itertools import compress, filterfalse
+from typing import Dict, List, Pattern, Sequence, Tuple
+
+
+# 保留结果的查询数上限（超过后清空，只保留空查询）
+CACHE_SIZE = 256
+
+
+def term_pattern(term: str) -> Pattern[str]:
+    """
+    词的各字符按顺序出现
+
+    相邻字符之间用排除下一个字符的字符类连接（如 `g[^i]*i[^t]*t`），
+    匹配失败时不回溯：每个起点只向后扫描一次。
+    """
+    parts = [re.escape(term[0])]
+    for c in term[1:]:
+        c = re.escape(c)
+        parts.append(f"[^{c}]*{c}")
+    return re.compile("".join(parts))
+
+
+def _select(indices: List[int], texts: List[str], patterns: List[Pattern[str]]) -> List[int]:
+    """indices 中对应文本匹配全部 patterns 的下标（保持顺序）"""
+    for pattern in patterns:
+        indices = list(compress(indices, map(pattern.search, map(texts.__getitem__, indices))))
+    return indices
+
+
+class FuzzyIndex:
+    """
+    对一组 (名称, 描述) 做模糊筛选
+
+    用法:
+        index = FuzzyIndex([(name, description), ...])
+        index.filter("git cm")  # 匹配条目的下标，按相关度排序
+    """
+
+    def __init__(self, entries: Sequence[Tuple[str, str]]):
+        self._names = [name.lower() for name, _ in entries]
+        self._texts = [f"{name}\n{description}".lower() for name, description in entries]
+        everything = list(range(len(entries)))
+        # 查询 -> (按原顺序的匹配下标, 排序后的结果)
+        self._cache: Dict[str, Tuple[List[int], List[int]]] = {"": (everything, everything)}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def filter(self, query: str) -> List[int]:
+        """匹配 query 的条目下标（按相关度排序）；空查询返回全部"""
+        query = " ".join(query.lower().split())
+        cached = self._cache.get(query)
+        if cached is not None:
+            return cached[1]
+
+        terms = query.split()
+        fuzzy = [term_pattern(term) for term in terms]
+        exact = [re.compile(re.escape(term)) for term in terms]
+
+        matched = _select(self._candidates(query), self._texts, fuzzy)
+        tiers = [(self._names, exact), (self._names, fuzzy), (self._texts, exact)]
+        if all(len(term) == 1 for term in terms):
+            del tiers[1:]  # 单字符的词：子串与按顺序出现相同，匹配即出现在名称或描述中
+        ranked: List[int] = []
+        rest = matched
+        for texts, patterns in tiers:
+            tier = _select(rest, texts, patterns)
+            if tier:
+                ranked.extend(tier)
+                rest = list(filterfalse(set(tier).__contains__, rest))
+        ranked.extend(rest)
+
+        if len(self._cache) >= CACHE_SIZE:
+            self._cache = {"": self._cache[""]}
+        self._cache[query] = (matched, ranked)
+        return ranked
+
+    def _candidates(self, query: str) -> List[int]:
+        """最长的、已有结果的前缀查询的匹配（新结果是其子集）"""
+        for end in range(len(query) - 1, 0, -1):
+            cached = self._cache.get(query[:end].rstrip())
+            if cached is not None:
+                return cached[0]
+        return self._cache[""][0]
@@ -0,0 +1,247 @@
+"""
+共享 HTTP 会话
+
+整个进程复用一个 httpx.Client：连接保持（keep-alive）、可配置的连接池、
+可选 HTTP/2，以及对幂等请求的指数退避重试。
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import httpx
+
+
+# 可以安全重试的请求方法与响应状态码
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Retry-After 的最长等待时间（秒）
+MAX_RETRY_AFTER = 30.0
+
+
+def http2_available() -> bool:
+    """是否安装了 HTTP/2 支持（h2 包）"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+@dataclass
+class HttpStats:
+    """请求与连接池统计"""
+    requests: int = 0           # 发出的请求数（含重试）
+    retries: int = 0            # 重试次数
+    connections_opened: int = 0 # 新建 TCP 连接数
+    bytes_received: int = 0     # 非流式响应体字节数（流式下载由调用方统计）
+
+    @property
+    def connections_reused(self) -> int:
+        """复用已有连接的请求数"""
+        return max(0, self.requests - self.connections_opened)
+
+    def format_summary(self) -> str:
+        return (
+            f"HTTP: {self.requests} 个请求, {self.retries} 次重试, "
+            f"新建连接 {self.connections_opened} 个, "
+            f"复用连接 {self.connections_reused} 次"
+        )
+
+
+class AdaptiveChunker:
+    """
+    把网络读到的数据合并成自适应大小的块
+
+    目标块大小 = 最近测得的吞吐量 × target_interval，并限制在
+    [min_size, max_size] 之间：快速链路上块更大，每块的 Python 层开销
+    （回调、解压器调用、写文件）随之摊薄；慢速链路上块保持较小，
+    数据能及时交给下游。
+
+    读到的数据只保存引用：一次读取已达到目标大小时原样交出，不复制；
+    多次小读取合并时只拼接一次。
+    """
+
+    def __init__(
+        self,
+        min_size: int = 64 * 1024,
+        max_size: int = 4 * 1024 * 1024,
+        target_interval: float = 0.05,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_interval = target_interval
+        self.size = min_size
+        self._clock = clock
+        self._pieces: List[bytes] = []
+        self._buffered = 0
+        self._last = clock()
+
+    def _take(self) -> bytes:
+        chunk = self._pieces[0] if len(self._pieces) == 1 else b"".join(self._pieces)
+        self._pieces = []
+        self._buffered = 0
+        return chunk
+
+    def feed(self, data: bytes) -> Iterator[bytes]:
+        """加入数据，返回已凑满的块"""
+        self._pieces.append(data)
+        self._buffered += len(data)
+        if self._buffered < self.size:
+            return
+        chunk = self._take()
+
+        now = self._clock()
+        elapsed = now - self._last
+        self._last = now
+        if elapsed > 0:
+            target = int(len(chunk) / elapsed * self.target_interval)
+            self.size = max(self.min_size, min(self.max_size, target))
+        yield chunk
+
+    def flush(self) -> Iterator[bytes]:
+        """取出缓冲中剩余的数据"""
+        if self._buffered:
+            yield self._take()
+
+
+class HttpSession:
+    """
+    带重试的共享 HTTP 会话
+
+    只有幂等请求（GET/HEAD/OPTIONS）会重试：连接/超时等传输错误，
+    以及 429/5xx 响应。429/503 的 Retry-After 头会被遵守。
+    """
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        max_connections: int = 10,
+        http2: bool = False,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        sleep: Callable[[float], None] = time.sleep,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.http2 = http2 and http2_available()
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.stats = HttpStats()
+        self._sleep = sleep
+        self._transport = transport
+        self._client: Optional[httpx.Client] = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        """延迟创建底层 httpx.Client"""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        timeout=self.timeout,
+                        http2=self.http2,
+                        follow_redirects=True,
+                        transport=self._transport,
+                        limits=httpx.Limits(
+                            max_connections=self.max_connections,
+                            max_keepalive_connections=self.max_connections,
+                        ),
+                    )
+        return self._client
+
+    def close(self) -> None:
+        """关闭连接池"""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    # ------------------------------------------------------------------
+    # 重试
+    # ------------------------------------------------------------------
+
+    def _trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        """httpcore trace 回调：统计新建连接"""
+        if event_name == "connection.connect_tcp.complete":
+            with self._lock:
+                self.stats.connections_opened += 1
+
+    def _backoff(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """计算第 attempt 次重试前的等待时间（带抖动的指数退避）"""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return min(float(retry_after), MAX_RETRY_AFTER)
+                except ValueError:
+                    pass
+        delay = self.backoff_factor * (2 ** attempt)
+        return delay + random.uniform(0, delay / 2)
+
+    def _should_retry(self, method: str, attempt: int) -> bool:
+        return method.upper() in IDEMPOTENT_METHODS and attempt < self.retries
+
+    def _send(self, method: str, url: str, stream: bool, **kwargs: Any) -> httpx.Response:
+        extensions = dict(kwargs.pop("extensions", None) or {})
+        extensions.setdefault("trace", self._trace)
+
+        attempt = 0
+        while True:
+            with self._lock:
+                self.stats.requests += 1
+            try:
+                request = self.client.build_request(method, url, extensions=extensions, **kwargs)
+                response = self.client.send(request, stream=stream)
+            except httpx.TransportError:
+                if not self._should_retry(method, attempt):
+                    raise
+                delay = self._backoff(attempt)
+            else:
+                if (
+                    response.status_code not in RETRY_STATUS_CODES
+                    or not self._should_retry(method, attempt)
+                ):
+                    return response
+                delay = self._backoff(attempt, response)
+                response.close()
+
+            with self._lock:
+                self.stats.retries += 1
+            self._sleep(delay)
+            attempt += 1
+
+    # ------------------------------------------------------------------
+    # 公共接口
+    # ------------------------------------------------------------------
+
+    def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """发送请求并读取完整响应"""
+        response = self._send(method, url, stream=False, **kwargs)
+        with self._lock:
+            self.stats.bytes_received += len(response.content)
+        return response
+
+    def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self.request("GET", url, **kwargs)
+
+    @contextmanager
+    def stream(self, method: str, url: str, **kwargs: Any) -> Iterator[httpx.Response]:
+        """
+        流式请求
+
+        在拿到响应头之前的失败会重试；响应体读取过程中的错误直接抛出。
+        """
+        response = self._send(method, url, stream=True, **kwargs)
+        try:
+            yield response
+        finally:
+            response.close()
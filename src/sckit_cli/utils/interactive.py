@@ -1,16 +1,25 @@
 """
 交互式选择界面
 
-提供跨平台的箭头键选择功能，用于 CLI 交互
+提供跨平台的箭头键选择功能，用于 CLI 交互：
+
+- select_with_arrows：从少量选项中单选（编辑器）
+- select_templates：从大量模板中多选，输入即模糊筛选（`sckit init --pick`）
+
+界面只在状态变化时重绘（Live 不自动刷新），模板选择器只渲染可见的一屏。
 """
 
-from typing import Dict
+from dataclasses import dataclass
+from typing import Collection, Dict, List, Optional, Sequence
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 from rich.live import Live
 
+from sckit_cli.utils.fuzzy import FuzzyIndex
+
 try:
     import readchar
     READCHAR_AVAILABLE = True
@@ -24,7 +33,8 @@ def get_key() -> str:
     跨平台读取单个按键输入
     
     Returns:
-        str: 标准化的键名 ('up', 'down', 'enter', 'escape')
+        str: 标准化的键名 ('up', 'down', 'pageup', 'pagedown', 'home', 'end',
+            'tab', 'backspace', 'select-all', 'enter', 'escape')，其它按键原样返回
     
     Raises:
         KeyboardInterrupt: 用户按 Ctrl+C
@@ -47,6 +57,20 @@ def get_key() -> str:
         return 'enter'
     if key == readchar.key.ESC:
         return 'escape'
+    if key == readchar.key.PAGE_UP:
+        return 'pageup'
+    if key == readchar.key.PAGE_DOWN:
+        return 'pagedown'
+    if key == readchar.key.HOME:
+        return 'home'
+    if key == readchar.key.END:
+        return 'end'
+    if key == readchar.key.TAB:
+        return 'tab'
+    if key in (readchar.key.BACKSPACE, readchar.key.CTRL_H):
+        return 'backspace'
+    if key == readchar.key.CTRL_A:
+        return 'select-all'
     if key == readchar.key.CTRL_C:
         raise KeyboardInterrupt
     
@@ -148,11 +172,11 @@ def select_with_arrows(
     selected_index = keys.index(default) if default in keys else 0
     
     try:
-        # 使用 Live 实时更新界面
+        # 使用 Live 更新界面：只在按键改变选择时重绘
         with Live(
             render_selection(options, selected_index, prompt),
             console=console,
-            refresh_per_second=10
+            auto_refresh=False
         ) as live:
             while True:
                 # 读取按键
@@ -162,12 +186,12 @@ def select_with_arrows(
                 if key == 'up':
                     # 向上循环
                     selected_index = (selected_index - 1) % len(keys)
-                    live.update(render_selection(options, selected_index, prompt))
+                    live.update(render_selection(options, selected_index, prompt), refresh=True)
                 
                 elif key == 'down':
                     # 向下循环
                     selected_index = (selected_index + 1) % len(keys)
-                    live.update(render_selection(options, selected_index, prompt))
+                    live.update(render_selection(options, selected_index, prompt), refresh=True)
                 
                 elif key == 'enter':
                     # 确认选择
@@ -182,3 +206,229 @@ def select_with_arrows(
         # Ctrl+C 中断
         raise
 
+
+# ============================================================================
+# 模板多选
+# ============================================================================
+
+# 模板选择器最多显示的行数（终端较矮时减少）
+PICKER_HEIGHT = 15
+
+# 面板中除列表外占用的行数（边框、查询、提示）
+PICKER_CHROME = 7
+
+
+@dataclass(frozen=True)
+class PickerItem:
+    """模板选择器的条目"""
+    key: str                # 返回值（模板相对路径）
+    name: str               # 显示并参与筛选的名称
+    description: str = ""   # 显示并参与筛选的描述
+
+
+class TemplatePicker:
+    """
+    模板选择器的状态（与终端无关）
+
+    matches 为当前查询的匹配（条目下标，按相关度排序），cursor 为高亮行在
+    matches 中的位置，top 为可见窗口的第一行；只有窗口内的 height 行需要渲染。
+    """
+
+    def __init__(
+        self,
+        items: Sequence[PickerItem],
+        selected: Collection[str] = (),
+        height: int = PICKER_HEIGHT,
+    ):
+        self.items = list(items)
+        self.height = max(height, 1)
+        self.selected = set(selected)
+        self.query = ""
+        self.cursor = 0
+        self.top = 0
+        self._index = FuzzyIndex([(item.name, item.description) for item in self.items])
+        self.matches = self._index.filter("")
+
+    def set_query(self, query: str) -> None:
+        """修改查询并回到第一行"""
+        self.query = query
+        self.matches = self._index.filter(query)
+        self.cursor = 0
+        self.top = 0
+
+    def move(self, delta: int) -> None:
+        """移动高亮行（不循环），窗口随之滚动"""
+        if not self.matches:
+            return
+        self.cursor = min(max(self.cursor + delta, 0), len(self.matches) - 1)
+        if self.cursor < self.top:
+            self.top = self.cursor
+        elif self.cursor >= self.top + self.height:
+            self.top = self.cursor - self.height + 1
+
+    def toggle(self) -> None:
+        """切换高亮行的选中状态"""
+        if not self.matches:
+            return
+        key = self.items[self.matches[self.cursor]].key
+        if key in self.selected:
+            self.selected.remove(key)
+        else:
+            self.selected.add(key)
+
+    def toggle_all(self) -> None:
+        """当前匹配全部已选中时全部取消，否则全部选中"""
+        keys = {self.items[i].key for i in self.matches}
+        if keys <= self.selected:
+            self.selected -= keys
+        else:
+            self.selected |= keys
+
+    def handle(self, key: str) -> bool:
+        """
+        处理一个按键（get_key() 的返回值）
+
+        Returns:
+            bool: 状态是否改变（需要重绘）
+        """
+        before = (self.query, self.cursor, self.top, len(self.selected))
+        if key == 'up':
+            self.move(-1)
+        elif key == 'down':
+            self.move(1)
+        elif key == 'pageup':
+            self.move(-self.height)
+        elif key == 'pagedown':
+            self.move(self.height)
+        elif key == 'home':
+            self.move(-len(self.matches))
+        elif key == 'end':
+            self.move(len(self.matches))
+        elif key == 'tab':
+            self.toggle()
+            self.move(1)
+            return True
+        elif key == 'select-all':
+            self.toggle_all()
+            return True
+        elif key == 'backspace':
+            if self.query:
+                self.set_query(self.query[:-1])
+        elif len(key) == 1 and key.isprintable():
+            self.set_query(self.query + key)
+        return (self.query, self.cursor, self.top, len(self.selected)) != before
+
+    def visible(self) -> List[int]:
+        """可见窗口内的条目下标"""
+        return self.matches[self.top:self.top + self.height]
+
+    def result(self) -> List[str]:
+        """选中的条目（按原顺序）；未选中任何条目时为高亮的条目"""
+        if self.selected:
+            return [item.key for item in self.items if item.key in self.selected]
+        if self.matches:
+            return [self.items[self.matches[self.cursor]].key]
+        return []
+
+
+def render_picker(picker: TemplatePicker, prompt: str) -> Panel:
+    """
+    渲染模板选择器（只渲染可见窗口）
+
+    条目文本不解析 Rich 标记，描述过长时截断。
+    """
+    grid = Table.grid(padding=(0, 1))
+    grid.add_column(no_wrap=True)
+    grid.add_column(no_wrap=True, overflow="ellipsis")
+    
+    grid.add_row(
+        Text("> ", style="bold cyan"),
+        Text.assemble(
+            (picker.query, "bold"),
+            ("▏", "cyan"),
+            (f"  {len(picker.matches)}/{len(picker.items)}  已选 {len(picker.selected)}", "dim"),
+        ),
+    )
+    
+    for position, index in enumerate(picker.visible(), start=picker.top):
+        item = picker.items[index]
+        current = position == picker.cursor
+        mark = "◉" if item.key in picker.selected else "○"
+        line = Text(item.name, style="bold green" if current else "cyan")
+        if item.description:
+            line.append(f"  {item.description}", style="dim")
+        grid.add_row(Text(f"{'▶' if current else ' '} {mark}"), line)
+    
+    if not picker.matches:
+        grid.add_row("", Text("没有匹配的模板", style="yellow"))
+    
+    grid.add_row("", "")
+    grid.add_row("", Text(
+        "输入筛选  ↑/↓ PgUp/PgDn 移动  Tab 选择  Ctrl+A 全选  Enter 确认  Esc 清空/取消",
+        style="dim",
+    ))
+    
+    return Panel(
+        grid,
+        title=f"[bold]{prompt}[/bold]",
+        border_style="cyan",
+        padding=(0, 1),
+    )
+
+
+def select_templates(
+    items: Sequence[PickerItem],
+    prompt: str,
+    console: Console,
+    selected: Collection[str] = (),
+    height: Optional[int] = None,
+) -> List[str]:
+    """
+    从大量模板中多选：输入即模糊筛选名称与描述
+    
+    Args:
+        items: 候选条目
+        prompt: 提示文本
+        console: Rich Console 实例
+        selected: 预先选中的条目 key（如上次安装的模板）
+        height: 列表行数，默认按终端高度，不超过 PICKER_HEIGHT
+    
+    Returns:
+        List[str]: 选中的条目 key（按 items 的顺序）
+    
+    Raises:
+        KeyboardInterrupt: 用户按 Ctrl+C
+        typer.Exit: 查询为空时按 ESC 取消 (退出码 1)
+        ImportError: readchar 未安装
+    """
+    if not READCHAR_AVAILABLE:
+        raise ImportError(
+            "readchar is not installed. "
+            "Please install it: pip install readchar>=4.0.0"
+        )
+    
+    if height is None:
+        height = min(PICKER_HEIGHT, max(console.size.height - PICKER_CHROME, 3))
+    picker = TemplatePicker(items, selected, height)
+    
+    with Live(
+        render_picker(picker, prompt),
+        console=console,
+        auto_refresh=False,
+        transient=True,
+    ) as live:
+        while True:
+            key = get_key()
+            
+            if key == 'enter':
+                return picker.result()
+            
+            if key == 'escape':
+                if not picker.query:
+                    console.print("[yellow]Selection cancelled[/yellow]")
+                    raise typer.Exit(1)
+                picker.set_query("")
+            elif not picker.handle(key):
+                continue
+            
+            live.update(render_picker(picker, prompt), refresh=True)
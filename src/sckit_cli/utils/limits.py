@@ -0,0 +1,110 @@
+"""
+模板包解压限制
+
+损坏或恶意的模板包（zip 炸弹）不能耗尽共享构建机的磁盘与内存：解压时限制
+成员数、解压出的总字节数，以及单个成员的压缩比。计数基于实际解压出的字节，
+不信任 zip 头中声明的大小；声明的大小已经超限时不必解压即可拒绝。
+
+本模块只依赖标准库，流式解压（stream_unzip）与中央目录解压共用。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+# 解压出的字节未超过该值的成员不检查压缩比（小文件的压缩比没有意义）
+RATIO_MIN_SIZE = 1024 * 1024
+
+# 流式解压时每次解压输出的上限，避免一小段压缩数据一次展开到内存
+INFLATE_CHUNK_SIZE = 256 * 1024
+
+
+class ArchiveLimitError(Exception):
+    """模板包超出解压限制"""
+    pass
+
+
+@dataclass(frozen=True)
+class ExtractionLimits:
+    """解压限制"""
+    max_entries: int       # 成员数（不含目录条目）
+    max_total_size: int    # 解压出的总字节数
+    max_ratio: float       # 单个成员解压后与压缩后大小之比
+
+
+class ExtractionBudget:
+    """
+    一次解压的用量
+
+    用法:
+        budget = ExtractionBudget(limits)
+        budget.entry(name, compressed_size, size)  # 每个成员开始时
+        budget.consume(n)                           # 读取了 n 字节压缩数据（流式解压）
+        budget.produce(n)                           # 解压出 n 字节
+
+    limits 为 None 时不限制（仍然计数）。
+    """
+
+    def __init__(self, limits: Optional[ExtractionLimits] = None):
+        self.limits = limits
+        self.entries = 0
+        self.total_size = 0
+        self._name = ""
+        self._compressed = 0
+        self._produced = 0
+
+    def entry(
+        self,
+        name: str,
+        compressed_size: Optional[int] = None,
+        size: Optional[int] = None,
+    ) -> None:
+        """
+        开始一个成员
+
+        Args:
+            compressed_size: 已知的压缩后大小（中央目录）；流式解压时省略，改由 consume() 累计
+            size: 声明的解压后大小，已知时提前检查
+        """
+        self.entries += 1
+        self._name = name
+        self._compressed = compressed_size or 0
+        self._produced = 0
+        limits = self.limits
+        if limits is None:
+            return
+        if self.entries > limits.max_entries:
+            raise ArchiveLimitError(f"成员数超过上限 {limits.max_entries}")
+        if size is not None:
+            if self.total_size + size > limits.max_total_size:
+                raise ArchiveLimitError(
+                    f"解压后的总大小超过上限 {limits.max_total_size} 字节: {name}"
+                )
+            self._check_ratio(size)
+
+    def consume(self, compressed: int) -> None:
+        """累计当前成员已读取的压缩数据"""
+        self._compressed += compressed
+
+    def produce(self, size: int) -> None:
+        """累计解压出的字节，超限时立即抛出 ArchiveLimitError"""
+        self.total_size += size
+        self._produced += size
+        limits = self.limits
+        if limits is None:
+            return
+        if self.total_size > limits.max_total_size:
+            raise ArchiveLimitError(
+                f"解压后的总大小超过上限 {limits.max_total_size} 字节: {self._name}"
+            )
+        self._check_ratio(self._produced)
+
+    def _check_ratio(self, produced: int) -> None:
+        if produced <= RATIO_MIN_SIZE:
+            return
+        if produced > self.limits.max_ratio * max(self._compressed, 1):
+            raise ArchiveLimitError(
+                f"压缩比超过上限 {self.limits.max_ratio:g}: {self._name}"
+            )
@@ -0,0 +1,113 @@
+"""
+安装清单
+
+记录已安装到项目中的每个模板文件（路径、大小、SHA-256）及来源版本，
+用于增量同步：只写入新增或变化的文件，并清理旧版本拥有而新版本已删除的文件。
+安装时指定的模板筛选（--only/--exclude）同样记录在清单中，之后的更新沿用。
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from sckit_cli.utils.cache import file_sha256
+from sckit_cli.utils.fs import atomic_write_text
+
+
+MANIFEST_NAME = ".sckit-manifest.json"
+MANIFEST_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """清单中的单个文件"""
+    size: int
+    sha256: str
+
+    @classmethod
+    def from_file(cls, path: Path) -> "ManifestEntry":
+        """根据文件内容构造"""
+        return cls(size=path.stat().st_size, sha256=file_sha256(path))
+
+    def matches(self, path: Path) -> bool:
+        """文件内容是否与记录一致（先比较大小，避免不必要的哈希）"""
+        try:
+            if path.stat().st_size != self.size:
+                return False
+        except OSError:
+            return False
+        return file_sha256(path) == self.sha256
+
+
+@dataclass
+class InstallManifest:
+    """项目中已安装模板的清单"""
+    source_version: str
+    editor: str
+    files: Dict[str, ManifestEntry] = field(default_factory=dict)
+    only: List[str] = field(default_factory=list)     # 模板筛选：只安装匹配的模板
+    exclude: List[str] = field(default_factory=list)  # 模板筛选：排除匹配的模板
+
+    def to_dict(self) -> dict:
+        data = {
+            "format": MANIFEST_FORMAT,
+            "source_version": self.source_version,
+            "editor": self.editor,
+            "files": {
+                path: {"size": entry.size, "sha256": entry.sha256}
+                for path, entry in sorted(self.files.items())
+            },
+        }
+        if self.only:
+            data["only"] = list(self.only)
+        if self.exclude:
+            data["exclude"] = list(self.exclude)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "InstallManifest":
+        return cls(
+            source_version=data.get("source_version", ""),
+            editor=data.get("editor", ""),
+            files={
+                path: ManifestEntry(size=int(item["size"]), sha256=item["sha256"])
+                for path, item in data.get("files", {}).items()
+            },
+            only=[str(p) for p in data.get("only", [])],
+            exclude=[str(p) for p in data.get("exclude", [])],
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["InstallManifest"]:
+        """读取清单，不存在或格式不兼容时返回 None"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("format") != MANIFEST_FORMAT:
+            return None
+        try:
+            return cls.from_dict(data)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def save(self, path: Path) -> bool:
+        """
+        写入清单（内容未变化时不写）
+
+        Returns:
+            bool: 是否发生了写入
+        """
+        content = json.dumps(self.to_dict(), ensure_ascii=False, indent=2) + "\n"
+        try:
+            if path.read_text(encoding="utf-8") == content:
+                return False
+        except OSError:
+            pass
+
+        atomic_write_text(path, content, prefix=".tmp-manifest-")
+        return True
@@ -0,0 +1,82 @@
+"""
+已登记项目
+
+`sckit sync` 自动更新的项目列表保存在用户数据目录的 projects.json 中，
+同时记录最近一次检查的时间与版本。后台运行的 `sckit sync --watch`
+每次检查前重新读取该文件，登记或移除项目无需重启。
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+from sckit_cli.utils.fs import atomic_write_text, user_dir
+
+
+REGISTRY_FORMAT = 1
+
+
+def default_registry_path() -> Path:
+    """
+    返回默认登记文件路径
+
+    优先使用 SCKIT_PROJECTS_FILE；与全局模板存储一样放在数据目录，不随缓存清理。
+    """
+    env_path = os.getenv("SCKIT_PROJECTS_FILE")
+    if env_path:
+        return Path(env_path).expanduser()
+    return user_dir("data") / "projects.json"
+
+
+@dataclass
+class ProjectRegistry:
+    """登记的项目（绝对路径）与最近一次检查的结果"""
+    path: Path
+    projects: List[str] = field(default_factory=list)
+    last_tag: str = ""          # 最近一次检查到的最新版本
+    last_checked: float = 0.0   # 最近一次检查的时间（Unix 时间戳）
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None) -> "ProjectRegistry":
+        """读取登记文件；不存在或损坏时返回空列表"""
+        registry = cls(path or default_registry_path())
+        try:
+            with open(registry.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return registry
+        if isinstance(data, dict) and data.get("format") == REGISTRY_FORMAT:
+            registry.projects = [str(p) for p in data.get("projects", [])]
+            registry.last_tag = data.get("last_tag", "")
+            registry.last_checked = float(data.get("last_checked", 0.0))
+        return registry
+
+    def save(self) -> None:
+        """先写临时文件再重命名"""
+        content = json.dumps({
+            "format": REGISTRY_FORMAT,
+            "projects": self.projects,
+            "last_tag": self.last_tag,
+            "last_checked": self.last_checked,
+        }, ensure_ascii=False, indent=2) + "\n"
+        atomic_write_text(self.path, content, prefix=".tmp-projects-")
+
+    def add(self, project: Path) -> bool:
+        """登记项目，返回是否新增"""
+        key = str(Path(project).resolve())
+        if key in self.projects:
+            return False
+        self.projects.append(key)
+        return True
+
+    def remove(self, project: Path) -> bool:
+        """移除项目，返回是否存在"""
+        key = str(Path(project).resolve())
+        if key not in self.projects:
+            return False
+        self.projects.remove(key)
+        return True
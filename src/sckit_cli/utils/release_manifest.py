@@ -0,0 +1,219 @@
+"""
+Release 文件清单
+
+发布时为每个模板包生成 `sckit-<editor>-<version>.manifest.json`，记录包内每个
+文件的路径、大小、SHA-256，以及压缩数据在 zip 中的位置。客户端据此与已安装的
+文件比较，只用 Range 请求读取变化的成员，而不必下载整个模板包。
+
+本模块只依赖标准库，发布流程中直接作为脚本运行:
+
+    python3 src/sckit_cli/utils/release_manifest.py .genreleases/sckit-*.zip
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import struct
+import sys
+import zipfile
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+MANIFEST_FORMAT = 1
+MANIFEST_SUFFIX = ".manifest.json"
+
+LOCAL_HEADER_FORMAT = "<4sHHHHHIIIHH"
+LOCAL_HEADER_SIZE = struct.calcsize(LOCAL_HEADER_FORMAT)  # 30
+
+METHOD_STORED = 0
+METHOD_DEFLATED = 8
+
+# 两个待读取成员之间的间隔不超过此值时合并为一次 Range 请求
+RANGE_MERGE_GAP = 64 * 1024
+
+
+class ReleaseManifestError(Exception):
+    """清单格式错误，或读取到的成员与清单不符"""
+    pass
+
+
+@dataclass(frozen=True)
+class PackedFile:
+    """模板包中的单个文件"""
+    name: str             # zip 成员名
+    size: int             # 解压后大小
+    sha256: str           # 解压后内容的摘要
+    data_offset: int      # 压缩数据在 zip 中的起始位置
+    compressed_size: int
+    method: int           # 0 = stored, 8 = deflate
+
+    @property
+    def data_end(self) -> int:
+        """压缩数据的结束位置（不含）"""
+        return self.data_offset + self.compressed_size
+
+    def to_dict(self) -> dict:
+        return {
+            "size": self.size,
+            "sha256": self.sha256,
+            "data_offset": self.data_offset,
+            "compressed_size": self.compressed_size,
+            "method": self.method,
+        }
+
+
+@dataclass
+class ReleaseManifest:
+    """一个模板包的文件清单"""
+    asset: str       # 模板包文件名
+    asset_size: int
+    files: Dict[str, PackedFile]
+
+    def to_dict(self) -> dict:
+        return {
+            "format": MANIFEST_FORMAT,
+            "asset": self.asset,
+            "asset_size": self.asset_size,
+            "files": {name: f.to_dict() for name, f in sorted(self.files.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ReleaseManifest":
+        """
+        Raises:
+            ReleaseManifestError: 格式不兼容或字段缺失
+        """
+        if not isinstance(data, dict) or data.get("format") != MANIFEST_FORMAT:
+            raise ReleaseManifestError("不支持的清单格式")
+        try:
+            return cls(
+                asset=data["asset"],
+                asset_size=int(data["asset_size"]),
+                files={
+                    name: PackedFile(
+                        name=name,
+                        size=int(item["size"]),
+                        sha256=item["sha256"],
+                        data_offset=int(item["data_offset"]),
+                        compressed_size=int(item["compressed_size"]),
+                        method=int(item["method"]),
+                    )
+                    for name, item in data["files"].items()
+                },
+            )
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            raise ReleaseManifestError(f"清单字段无效: {e}")
+
+
+def manifest_name(asset_name: str) -> str:
+    """模板包对应的清单文件名: sckit-cursor-0.3.0.zip → sckit-cursor-0.3.0.manifest.json"""
+    stem = asset_name[:-4] if asset_name.endswith(".zip") else asset_name
+    return stem + MANIFEST_SUFFIX
+
+
+def build_manifest(zip_path: Path) -> ReleaseManifest:
+    """读取模板包，生成文件清单"""
+    files = {}
+    with open(zip_path, "rb") as raw, zipfile.ZipFile(raw) as zf:
+        for info in zf.infolist():
+            if info.is_dir():
+                continue
+            if info.compress_type not in (METHOD_STORED, METHOD_DEFLATED):
+                raise ReleaseManifestError(f"不支持的压缩方式: {info.filename}")
+
+            # 本地文件头的扩展字段长度可能与中央目录不同，需要读取本地头
+            raw.seek(info.header_offset)
+            header = struct.unpack(LOCAL_HEADER_FORMAT, raw.read(LOCAL_HEADER_SIZE))
+            name_length, extra_length = header[9], header[10]
+            data_offset = info.header_offset + LOCAL_HEADER_SIZE + name_length + extra_length
+
+            digest = hashlib.sha256()
+            with zf.open(info) as member:
+                for block in iter(lambda: member.read(1024 * 1024), b""):
+                    digest.update(block)
+
+            files[info.filename] = PackedFile(
+                name=info.filename,
+                size=info.file_size,
+                sha256=digest.hexdigest(),
+                data_offset=data_offset,
+                compressed_size=info.compress_size,
+                method=info.compress_type,
+            )
+
+    return ReleaseManifest(
+        asset=zip_path.name,
+        asset_size=zip_path.stat().st_size,
+        files=files,
+    )
+
+
+def coalesce_ranges(
+    files: List[PackedFile], max_gap: int = RANGE_MERGE_GAP
+) -> List[Tuple[int, int, List[PackedFile]]]:
+    """
+    把待读取的成员合并为尽量少的字节区间
+
+    Returns:
+        [(起始位置, 结束位置（不含）, 区间内的成员), ...]
+    """
+    ranges: List[Tuple[int, int, List[PackedFile]]] = []
+    for item in sorted(files, key=lambda f: f.data_offset):
+        if ranges and item.data_offset - ranges[-1][1] <= max_gap:
+            start, end, members = ranges[-1]
+            ranges[-1] = (start, max(end, item.data_end), members + [item])
+        else:
+            ranges.append((item.data_offset, item.data_end, [item]))
+    return ranges
+
+
+def decode_members(
+    data: bytes, start: int, members: List[PackedFile]
+) -> Iterator[Tuple[PackedFile, bytes]]:
+    """
+    从一段 zip 字节中解出成员内容并校验
+
+    Args:
+        data: 从 start 开始读取的字节
+        members: 完全位于该区间内的成员
+
+    Raises:
+        ReleaseManifestError: 数据不完整、解压失败或摘要不符
+    """
+    for item in members:
+        begin = item.data_offset - start
+        packed = data[begin:begin + item.compressed_size]
+        if len(packed) != item.compressed_size:
+            raise ReleaseManifestError(f"数据不完整: {item.name}")
+        try:
+            # 解压输出不超过清单声明的大小（多出的字节说明内容与清单不符）
+            content = packed if item.method == METHOD_STORED else zlib.decompressobj(-15).decompress(
+                packed, item.size + 1,
+            )
+        except zlib.error as e:
+            raise ReleaseManifestError(f"解压失败: {item.name}: {e}")
+        if len(content) != item.size or hashlib.sha256(content).hexdigest() != item.sha256:
+            raise ReleaseManifestError(f"内容与清单不符: {item.name}")
+        yield item, content
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """为每个给定的模板包在同一目录下生成清单"""
+    paths = [Path(p) for p in (sys.argv[1:] if argv is None else argv)]
+    if not paths:
+        print("用法: release_manifest.py sckit-<editor>-<version>.zip ...", file=sys.stderr)
+        return 1
+    for zip_path in paths:
+        manifest = build_manifest(zip_path)
+        target = zip_path.with_name(manifest_name(zip_path.name))
+        target.write_text(json.dumps(manifest.to_dict(), indent=2) + "\n", encoding="utf-8")
+        print(f"   ✅ {target.name} ({len(manifest.files)} 个文件)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,303 @@
+"""
+模板全文搜索
+
+对每个模板的 frontmatter `name`、`description` 与正文建立倒排索引，
+以 JSON 分片保存在缓存目录中。安装时按文件摘要增量更新：只解析内容变化的模板；
+查询只读取索引，不访问网络，也不重新解析 markdown。
+
+分词：ASCII 字母数字按单词（小写），中日韩文字按相邻两字（bigram），
+无需词典即可匹配中文子串。排序使用 BM25，名称与描述的词频加权。
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sckit_cli.utils.fs import atomic_write_json
+
+
+INDEX_FORMAT = 1
+
+# 倒排表分片数
+SHARD_COUNT = 16
+
+# 字段权重：名称与描述中的词比正文中的词更能说明模板用途
+FIELD_WEIGHTS = (("name", 3), ("description", 2), ("body", 1))
+
+# BM25 参数
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_CJK_RE = re.compile(r"[぀-ヿ㐀-䶿一-鿿가-힯豈-﫿]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """把文本切分为检索词：ASCII 单词与中日韩文字的 bigram"""
+    text = text.lower()
+    tokens = _WORD_RE.findall(text)
+    for run in _CJK_RE.findall(text):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def parse_template(text: str) -> Dict[str, str]:
+    """
+    拆分模板的 frontmatter 与正文
+
+    只解析 `key: value` 形式的单行字段；没有 frontmatter 时整个文件视为正文。
+    """
+    meta = {"name": "", "description": "", "body": text}
+    if text.startswith("---"):
+        end = text.find("\n---", 3)
+        if end != -1:
+            for line in text[3:end].splitlines():
+                key, sep, value = line.partition(":")
+                if sep and key.strip() in ("name", "description"):
+                    meta[key.strip()] = value.strip().strip("'\"")
+            meta["body"] = text[end + 4:].lstrip("-\n")
+    return meta
+
+
+def _read_json(path: Path) -> Optional[dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path: Path, data: dict) -> None:
+    """原子写入紧凑格式的 JSON"""
+    atomic_write_json(path, data, separators=(",", ":"))
+
+
+@dataclass
+class SearchHit:
+    """一条搜索结果"""
+    path: str         # 模板相对路径，如 sckit.api-designer.md
+    name: str
+    description: str
+    score: float
+
+    @property
+    def command(self) -> str:
+        """模板对应的斜杠命令"""
+        return "/" + Path(self.path).stem
+
+    def to_dict(self) -> dict:
+        return {
+            "path": self.path,
+            "command": self.command,
+            "name": self.name,
+            "description": self.description,
+            "score": round(self.score, 4),
+        }
+
+
+class SearchIndex:
+    """
+    持久化的倒排索引
+
+    目录结构:
+        <root>/docs.json         版本、各模板的 fingerprint、名称、描述与长度
+        <root>/postings-XX.json  按词的哈希分片的倒排表 {词: "文档号:词频 ..."}
+
+    查询只读取 docs.json 与查询词所在的分片；倒排表编码为字符串，
+    只有命中的词才会被展开，模板数量增长时查询耗时基本不变。
+
+    fingerprint 由调用方决定（内容摘要、zip CRC 或文件大小与修改时间），
+    相同时不重新解析该模板。
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.source = ""
+        self.docs: Dict[str, dict] = {}
+        self._next_id = 0
+        self._shards: Dict[int, Dict[str, str]] = {}
+        self._dirty: set = set()
+
+    @property
+    def docs_path(self) -> Path:
+        return self.root / "docs.json"
+
+    def shard_path(self, shard: int) -> Path:
+        return self.root / f"postings-{shard:02x}.json"
+
+    @staticmethod
+    def shard_of(term: str) -> int:
+        return zlib.crc32(term.encode("utf-8")) % SHARD_COUNT
+
+    @classmethod
+    def load(cls, root: Path) -> "SearchIndex":
+        """读取索引；不存在、损坏或格式不兼容时返回空索引"""
+        index = cls(root)
+        data = _read_json(index.docs_path)
+        if isinstance(data, dict) and data.get("format") == INDEX_FORMAT:
+            index.source = data.get("source", "")
+            index.docs = data.get("docs", {})
+            index._next_id = data.get("next_id", 0)
+        else:
+            # 新建（或无法读取）的索引：保存时重写全部分片，不沿用残留的倒排项
+            index._dirty = set(range(SHARD_COUNT))
+        return index
+
+    def _shard(self, shard: int) -> Dict[str, str]:
+        if shard not in self._shards:
+            data = None if shard in self._dirty else _read_json(self.shard_path(shard))
+            self._shards[shard] = data if isinstance(data, dict) else {}
+        return self._shards[shard]
+
+    def save(self) -> None:
+        """写入 docs.json 与修改过的分片（各自原子替换）"""
+        self.root.mkdir(parents=True, exist_ok=True)
+        for shard in sorted(self._dirty):
+            _write_json(self.shard_path(shard), self._shard(shard))
+        self._dirty.clear()
+        # docs.json 最后写入：中途失败时旧的文档表不会引用尚未写入的分片数据
+        _write_json(self.docs_path, {
+            "format": INDEX_FORMAT,
+            "source": self.source,
+            "next_id": self._next_id,
+            "docs": self.docs,
+        })
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    # ------------------------------------------------------------------
+    # 更新
+    # ------------------------------------------------------------------
+
+    def _remove_ids(self, doc_ids: set) -> None:
+        """从所有分片中删除这些文档的倒排项"""
+        if not doc_ids:
+            return
+        for shard in range(SHARD_COUNT):
+            postings = self._shard(shard)
+            for term, encoded in list(postings.items()):
+                kept = [
+                    item for item in encoded.split(" ")
+                    if int(item.partition(":")[0]) not in doc_ids
+                ]
+                if len(kept) == encoded.count(" ") + 1:
+                    continue
+                if kept:
+                    postings[term] = " ".join(kept)
+                else:
+                    del postings[term]
+                self._dirty.add(shard)
+
+    def _add(self, path: str, fingerprint: str, text: str) -> None:
+        meta = parse_template(text)
+        counts: Dict[str, int] = {}
+        length = 0
+        for field, weight in FIELD_WEIGHTS:
+            for token in tokenize(meta[field]):
+                counts[token] = counts.get(token, 0) + weight
+                length += weight
+
+        doc_id = self._next_id
+        self._next_id += 1
+        for term, count in counts.items():
+            shard = self.shard_of(term)
+            postings = self._shard(shard)
+            item = f"{doc_id}:{count}"
+            postings[term] = f"{postings[term]} {item}" if term in postings else item
+            self._dirty.add(shard)
+
+        self.docs[path] = {
+            "id": doc_id,
+            "fingerprint": fingerprint,
+            "name": meta["name"] or Path(path).stem,
+            "description": meta["description"],
+            "length": length,
+        }
+
+    def update(
+        self,
+        files: Iterable[Tuple[str, str, Callable[[], Optional[str]]]],
+        source: str = "",
+    ) -> Tuple[int, int]:
+        """
+        按新的文件列表增量更新索引（调用方随后 save()）
+
+        Args:
+            files: (相对路径, fingerprint, 读取内容的函数)；fingerprint 未变的文件
+                不读取；读取函数返回 None 时保留该文件已有的条目
+            source: 本次更新来自的版本或路径
+
+        Returns:
+            (重新解析的模板数, 删除的模板数)
+        """
+        seen = set()
+        changed: Dict[str, Tuple[str, str]] = {}
+        for path, fingerprint, read in files:
+            seen.add(path)
+            doc = self.docs.get(path)
+            if doc is not None and doc["fingerprint"] == fingerprint:
+                continue
+            text = read()
+            if text is not None:
+                changed[path] = (fingerprint, text)
+
+        removed = [path for path in self.docs if path not in seen]
+        stale = {self.docs[path]["id"] for path in list(changed) + removed if path in self.docs}
+        self._remove_ids(stale)
+        for path in removed:
+            del self.docs[path]
+        for path, (fingerprint, text) in changed.items():
+            self._add(path, fingerprint, text)
+
+        self.source = source
+        return len(changed), len(removed)
+
+    # ------------------------------------------------------------------
+    # 查询
+    # ------------------------------------------------------------------
+
+    def search(self, query: str, limit: int = 10) -> List[SearchHit]:
+        """按 BM25 得分返回最相关的模板"""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self.docs:
+            return []
+
+        by_id = {doc["id"]: path for path, doc in self.docs.items()}
+        total = len(self.docs)
+        avg_length = sum(doc["length"] for doc in self.docs.values()) / total or 1.0
+        scores: Dict[str, float] = {}
+        for term in terms:
+            encoded = self._shard(self.shard_of(term)).get(term)
+            if not encoded:
+                continue
+            items = encoded.split(" ")
+            idf = math.log(1 + (total - len(items) + 0.5) / (len(items) + 0.5))
+            for item in items:
+                doc_id, _, tf = item.partition(":")
+                path = by_id.get(int(doc_id))
+                if path is None:
+                    continue
+                tf = int(tf)
+                norm = 1 - BM25_B + BM25_B * self.docs[path]["length"] / avg_length
+                scores[path] = scores.get(path, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [
+            SearchHit(
+                path=path,
+                name=self.docs[path]["name"],
+                description=self.docs[path]["description"],
+                score=score,
+            )
+            for path, score in ranked
+        ]
@@ -0,0 +1,118 @@
+"""
+模板源
+
+解析 --source / SCKIT_SOURCE 中的模板源（GitHub 仓库、URL 或本地路径），
+并把多个模板源的 commands 目录按优先级合并：同名模板以靠前的源为准。
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
+
+if TYPE_CHECKING:
+    from sckit_cli import Release
+
+
+GITHUB_SOURCE_PREFIX = "github:"
+
+
+@dataclass(frozen=True)
+class TemplateSource:
+    """
+    一个模板源
+    
+    写法（--source / SCKIT_SOURCE，多个源以逗号分隔，靠前的优先）:
+        github:OWNER/REPO[@ENV]  GitHub 仓库的最新 Release；ENV 为存放该仓库
+                                 访问令牌的环境变量名（私有仓库），省略时使用 GITHUB_TOKEN
+        https://...              Release JSON 镜像或 .zip 地址
+        其它                     本地 zip、包含 zip 的目录或解压后的目录
+    """
+    location: str                   # OWNER/REPO、URL 或本地路径
+    kind: str = "github"            # github / url / local
+    token_env: Optional[str] = None  # 访问令牌所在的环境变量（仅 github）
+    
+    @classmethod
+    def parse(cls, spec: str) -> "TemplateSource":
+        from sckit_cli import ValidationError
+        
+        spec = spec.strip()
+        if spec.startswith(GITHUB_SOURCE_PREFIX):
+            repo, _, token_env = spec[len(GITHUB_SOURCE_PREFIX):].partition("@")
+            owner, _, name = repo.partition("/")
+            if not owner or not name or "/" in name:
+                raise ValidationError(f"GitHub 模板源应为 github:OWNER/REPO: {spec}")
+            return cls(repo, "github", token_env or None)
+        if is_remote_source(spec):
+            return cls(spec, "url")
+        return cls(spec, "local")
+    
+    @classmethod
+    def default(cls) -> "TemplateSource":
+        """SCKIT_REPO_OWNER / SCKIT_REPO 指定的默认 GitHub 仓库"""
+        from sckit_cli import config
+        return cls(f"{config.GITHUB_OWNER}/{config.GITHUB_REPO}")
+    
+    @property
+    def token(self) -> Optional[str]:
+        """该源的访问令牌（仅来自 token_env）"""
+        return os.getenv(self.token_env) if self.token_env else None
+    
+    @property
+    def release_api_url(self) -> str:
+        """最新 Release 的 API URL（仅 github）"""
+        from sckit_cli import config
+        return f"{config.GITHUB_API_BASE}/repos/{self.location}/releases/latest"
+    
+    def __str__(self) -> str:
+        return self.location
+
+
+def parse_sources(value: Optional[str]) -> List[TemplateSource]:
+    """解析逗号分隔的模板源；为空时只有默认 GitHub 仓库"""
+    specs = [part for part in (value or "").split(",") if part.strip()]
+    if not specs:
+        return [TemplateSource.default()]
+    return list(dict.fromkeys(TemplateSource.parse(spec) for spec in specs))
+
+
+def is_remote_source(source: str) -> bool:
+    """模板源是否为 HTTP(S) URL"""
+    return source.startswith(("http://", "https://"))
+
+
+def combined_version(releases: List[Release]) -> str:
+    """多个模板源合并安装时记录的版本（按模板源顺序以 + 连接）"""
+    return "+".join(release.version for release in releases)
+
+
+def merge_commands_sources(sources: List[Path], merged_dir: Path, staging_dir: Path) -> int:
+    """
+    按优先级合并多个 commands 源目录：同名模板以靠前的源为准
+    
+    暂存目录内的文件直接移动，本地目录模板源中的文件复制。
+    
+    Returns:
+        int: 被靠前的源覆盖的同名模板数
+    """
+    import shutil
+    
+    seen = set()
+    overridden = 0
+    for source in sources:
+        movable = staging_dir in source.parents
+        for path in sorted(p for p in source.rglob("*") if p.is_file()):
+            relative = path.relative_to(source).as_posix()
+            if relative in seen:
+                overridden += 1
+                continue
+            seen.add(relative)
+            dest = merged_dir / relative
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            if movable:
+                os.replace(path, dest)
+            else:
+                shutil.copy2(path, dest)
+    return overridden
@@ -0,0 +1,229 @@
+"""
+内容寻址的模板存储
+
+把模板文件按 SHA-256 存放在用户级全局目录中，项目里的 commands/ 通过
+硬链接、reflink（写时复制）或符号链接从存储中生成，而不是逐字节复制：
+无论有多少个项目，同一内容在磁盘上只保存一份。
+
+文件系统不支持所选链接方式时（跨设备、FAT、权限不足等）自动退回复制。
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+import shutil
+import stat
+import sys
+from pathlib import Path
+from typing import Dict, Optional
+
+from sckit_cli import LinkMode
+from sckit_cli.utils.fs import atomic_path, user_dir
+
+
+# Linux FICLONE ioctl（_IOW(0x94, 9, int)）
+FICLONE = 0x40049409
+
+
+def default_store_dir() -> Path:
+    """
+    返回默认存储目录
+
+    优先使用 SCKIT_STORE_DIR。存储不放在缓存目录中：清理缓存不能让
+    项目中的符号链接失效。
+    """
+    env_dir = os.getenv("SCKIT_STORE_DIR")
+    if env_dir:
+        return Path(env_dir).expanduser()
+    return user_dir("data") / "store"
+
+
+def reflink(source: Path, target: Path) -> None:
+    """
+    以写时复制方式克隆文件
+
+    Raises:
+        OSError: 平台或文件系统不支持
+    """
+    if sys.platform == "darwin":
+        import ctypes
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.clonefile(os.fsencode(source), os.fsencode(target), 0) != 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), str(target))
+        return
+
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError(errno.EOPNOTSUPP, "reflink 不受支持", str(target))
+
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            dst.close()
+            os.unlink(target)
+            raise
+
+
+class TemplateStore:
+    """
+    全局模板存储
+
+    目录结构:
+        <root>/objects/<前 2 位>/<sha256>  只读的文件内容
+
+    对象写入后设为只读：硬链接与符号链接共享存储中的内容，
+    只读可以防止在某个项目中原地编辑时波及其它项目。
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root) if root is not None else default_store_dir()
+
+    @property
+    def objects_dir(self) -> Path:
+        return self.root / "objects"
+
+    def object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+
+    def add(self, source: Path, digest: str, move: bool = False) -> Path:
+        """
+        把文件放入存储（同一内容已存在时不重复写入）
+
+        Args:
+            source: 源文件
+            digest: 源文件的 SHA-256 摘要
+            move: 是否移动源文件（暂存文件）；与存储不在同一文件系统时改为复制。
+                放入存储失败时源文件移回原处，调用方可以改为直接复制
+
+        Returns:
+            Path: 存储中的对象路径
+        """
+        path = self.object_path(digest)
+        if path.exists():
+            return path
+
+        moved_mode: Optional[int] = None  # 已移入临时文件的源文件的原权限
+
+        def put_back(tmp: Path) -> None:
+            if moved_mode is None:
+                os.unlink(tmp)
+            else:
+                os.replace(tmp, source)
+                os.chmod(source, moved_mode)
+
+        # 先写临时文件再重命名，并发写入同一对象时保持完整
+        with atomic_path(path, on_error=put_back) as tmp:
+            if move:
+                try:
+                    os.replace(source, tmp)
+                    moved_mode = stat.S_IMODE(os.stat(tmp).st_mode)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+            if moved_mode is None:
+                shutil.copyfile(source, tmp)
+            os.chmod(tmp, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+        return path
+
+    def stats(self) -> tuple[int, int]:
+        """(对象数, 总字节数)"""
+        count = size = 0
+        if self.objects_dir.exists():
+            for path in self.objects_dir.glob("*/*"):
+                if path.is_file() and not path.name.startswith(".tmp-"):
+                    count += 1
+                    size += path.stat().st_size
+        return count, size
+
+
+class Linker:
+    """
+    从存储中生成项目文件
+
+    所选方式在某个目标文件系统上失败一次后，该文件系统上的后续文件
+    直接复制，不再重复尝试。
+    """
+
+    def __init__(self, store: TemplateStore, mode: LinkMode):
+        self.store = store
+        self.mode = mode
+        self.fallbacks = 0  # 退回复制的文件数
+        self._unsupported: Dict[int, bool] = {}  # 目标 st_dev -> 不支持所选方式
+
+    @property
+    def detects_links(self) -> bool:
+        """能否判断目标是否已链接到存储（reflink 克隆与普通文件无法区分）"""
+        return self.mode in (LinkMode.HARD, LinkMode.SYMLINK)
+
+    def is_linked(self, digest: str, target: Path) -> bool:
+        """目标是否已是指向该存储对象的硬链接或符号链接"""
+        if not self.detects_links:
+            return False
+        try:
+            return os.path.samefile(self.store.object_path(digest), target)
+        except OSError:
+            return False
+
+    def place(
+        self,
+        source: Path,
+        digest: str,
+        target: Path,
+        move: bool = False,
+        fallback: bool = True,
+    ) -> Optional[LinkMode]:
+        """
+        把 source 的内容放到 target（覆盖已有文件）
+
+        存储不可写（权限不足、磁盘已满等）时同样退回复制，直接复制 source。
+
+        Args:
+            fallback: 无法链接时是否改为复制；为 False 时保持 target 不变
+
+        Returns:
+            Optional[LinkMode]: 实际使用的方式，未写入时为 None
+        """
+        try:
+            obj: Optional[Path] = self.store.add(source, digest, move=move)
+        except OSError:
+            obj = None
+        target.parent.mkdir(parents=True, exist_ok=True)
+        device = target.parent.stat().st_dev
+
+        # 在目标旁生成临时文件再替换，已有文件不会出现中间状态
+        tmp = target.parent / f".sckit-link-{os.getpid()}-{target.name}"
+        if tmp.is_symlink() or tmp.exists():
+            tmp.unlink()
+
+        if obj is not None and not self._unsupported.get(device):
+            try:
+                self._link(obj, tmp)
+                os.replace(tmp, target)
+                return self.mode
+            except OSError:
+                self._unsupported[device] = True
+                if tmp.is_symlink() or tmp.exists():
+                    tmp.unlink()
+
+        if not fallback:
+            return None
+        self.fallbacks += 1
+        shutil.copyfile(obj if obj is not None else source, tmp)
+        os.replace(tmp, target)
+        return LinkMode.COPY
+
+    def _link(self, obj: Path, tmp: Path) -> None:
+        if self.mode == LinkMode.HARD:
+            os.link(obj, tmp)
+        elif self.mode == LinkMode.SYMLINK:
+            os.symlink(obj.resolve(), tmp)
+        elif self.mode == LinkMode.REFLINK:
+            reflink(obj, tmp)
+            os.chmod(tmp, 0o644)  # clonefile 会带上存储对象的只读权限
+        else:
+            raise OSError(errno.EINVAL, f"不是链接方式: {self.mode.value}")
@@ -0,0 +1,318 @@
+"""
+流式 ZIP 解压
+
+按本地文件头（local file header）顺序增量解析 zip 数据，
+在下载字节到达的同时解压所需成员并直接写入目标目录，无需先落盘整个 zip。
+解压输出分块进行，并计入 ExtractionBudget（见 limits 模块），zip 炸弹在展开前即被中止。
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Callable, List, Optional
+
+from sckit_cli.utils.limits import INFLATE_CHUNK_SIZE, ArchiveLimitError, ExtractionBudget
+
+
+LOCAL_HEADER_SIG = b"PK\x03\x04"
+CENTRAL_DIR_SIG = b"PK\x01\x02"
+END_OF_CENTRAL_DIR_SIG = b"PK\x05\x06"
+ZIP64_END_SIG = b"PK\x06\x06"
+DATA_DESCRIPTOR_SIG = b"PK\x07\x08"
+
+LOCAL_HEADER_FORMAT = "<4sHHHHHIIIHH"
+LOCAL_HEADER_SIZE = struct.calcsize(LOCAL_HEADER_FORMAT)  # 30
+
+METHOD_STORED = 0
+METHOD_DEFLATED = 8
+
+FLAG_ENCRYPTED = 0x01
+FLAG_DATA_DESCRIPTOR = 0x08
+FLAG_UTF8 = 0x800
+
+ZIP64_EXTRA_ID = 0x0001
+
+
+class StreamingUnsupportedError(Exception):
+    """zip 结构无法流式解析（需要回退到完整下载后解压）"""
+    pass
+
+
+class StreamingZipError(Exception):
+    """zip 数据损坏"""
+    pass
+
+
+# 成员选择函数：返回写入路径，返回 None 表示跳过该成员
+MemberSelector = Callable[[str], Optional[Path]]
+
+
+class StreamingZipExtractor:
+    """
+    增量 zip 解压器
+
+    用法:
+        extractor = StreamingZipExtractor(select)
+        for chunk in chunks:
+            extractor.feed(chunk)
+        extractor.close()
+
+    仅支持 stored 与 deflate 两种压缩方式；stored 成员使用数据描述符
+    （大小未写入本地文件头）时无法确定边界，会抛出 StreamingUnsupportedError。
+
+    所有成员（包括未选中的）解压出的字节都计入 budget，超限时抛出 ArchiveLimitError。
+    """
+
+    def __init__(self, select: MemberSelector, budget: Optional[ExtractionBudget] = None):
+        self._select = select
+        self._budget = budget or ExtractionBudget()
+        self._buffer = bytearray()
+        self._state = "header"
+        self._done = False
+
+        # 当前成员状态
+        self._name = ""
+        self._method = METHOD_STORED
+        self._flags = 0
+        self._crc = 0
+        self._remaining = 0
+        self._usize = 0
+        self._zip64 = False
+        self._running_crc = 0
+        self._decompressor = None
+        self._out: Optional[BinaryIO] = None
+        self._out_path: Optional[Path] = None
+
+        self.files_written: List[Path] = []
+        self.bytes_written = 0
+
+    # ------------------------------------------------------------------
+    # 公共接口
+    # ------------------------------------------------------------------
+
+    def feed(self, data: bytes) -> None:
+        """输入一段 zip 字节"""
+        if self._done:
+            return
+        self._buffer += data
+        try:
+            self._process()
+        except ArchiveLimitError:
+            self._abort()
+            raise
+
+    def close(self) -> None:
+        """结束输入并校验所有成员已完整解析"""
+        if not self._done and (self._state != "header" or self._buffer):
+            self._abort()
+            raise StreamingZipError("ZIP 数据不完整")
+        self._done = True
+
+    # ------------------------------------------------------------------
+    # 状态机
+    # ------------------------------------------------------------------
+
+    def _process(self) -> None:
+        while not self._done:
+            if self._state == "header":
+                if not self._read_header():
+                    return
+            elif self._state == "data":
+                if not self._read_data():
+                    return
+            elif self._state == "descriptor":
+                if not self._read_descriptor():
+                    return
+
+    def _read_header(self) -> bool:
+        if len(self._buffer) < 4:
+            return False
+
+        signature = bytes(self._buffer[:4])
+        if signature in (CENTRAL_DIR_SIG, END_OF_CENTRAL_DIR_SIG, ZIP64_END_SIG):
+            # 所有本地成员已处理完，后续的中央目录无需解析
+            self._done = True
+            self._buffer.clear()
+            return False
+        if signature != LOCAL_HEADER_SIG:
+            raise StreamingZipError("无效的 ZIP 本地文件头")
+
+        if len(self._buffer) < LOCAL_HEADER_SIZE:
+            return False
+        (_, _, flags, method, _, _, crc, csize, usize,
+         name_len, extra_len) = struct.unpack_from(LOCAL_HEADER_FORMAT, self._buffer)
+
+        header_len = LOCAL_HEADER_SIZE + name_len + extra_len
+        if len(self._buffer) < header_len:
+            return False
+
+        raw_name = bytes(self._buffer[LOCAL_HEADER_SIZE:LOCAL_HEADER_SIZE + name_len])
+        extra = bytes(self._buffer[LOCAL_HEADER_SIZE + name_len:header_len])
+        del self._buffer[:header_len]
+
+        if flags & FLAG_ENCRYPTED:
+            raise StreamingUnsupportedError("不支持加密的 ZIP 成员")
+        if method not in (METHOD_STORED, METHOD_DEFLATED):
+            raise StreamingUnsupportedError(f"不支持的压缩方式: {method}")
+
+        self._zip64 = self._has_zip64_extra(extra)
+        if csize == 0xFFFFFFFF or usize == 0xFFFFFFFF:
+            usize, csize = self._parse_zip64_extra(extra, usize, csize)
+            self._zip64 = True
+
+        has_descriptor = bool(flags & FLAG_DATA_DESCRIPTOR)
+        if has_descriptor and method == METHOD_STORED:
+            raise StreamingUnsupportedError("stored 成员使用了数据描述符，无法流式解析")
+
+        self._name = raw_name.decode("utf-8" if flags & FLAG_UTF8 else "cp437")
+        if not self._name.endswith("/"):
+            if has_descriptor:
+                self._budget.entry(self._name)  # 大小未知，压缩数据边读边计
+            else:
+                self._budget.entry(self._name, csize, usize)
+        self._method = method
+        self._flags = flags
+        self._crc = crc
+        self._remaining = csize
+        self._usize = usize
+        self._running_crc = 0
+        self._decompressor = zlib.decompressobj(-15) if method == METHOD_DEFLATED else None
+        self._open_output()
+        self._state = "data"
+        return True
+
+    @staticmethod
+    def _has_zip64_extra(extra: bytes) -> bool:
+        offset = 0
+        while offset + 4 <= len(extra):
+            header_id, size = struct.unpack_from("<HH", extra, offset)
+            if header_id == ZIP64_EXTRA_ID:
+                return True
+            offset += 4 + size
+        return False
+
+    @staticmethod
+    def _parse_zip64_extra(extra: bytes, usize: int, csize: int):
+        offset = 0
+        while offset + 4 <= len(extra):
+            header_id, size = struct.unpack_from("<HH", extra, offset)
+            if header_id == ZIP64_EXTRA_ID:
+                body = extra[offset + 4:offset + 4 + size]
+                pos = 0
+                if usize == 0xFFFFFFFF:
+                    usize = struct.unpack_from("<Q", body, pos)[0]
+                    pos += 8
+                if csize == 0xFFFFFFFF:
+                    csize = struct.unpack_from("<Q", body, pos)[0]
+                return usize, csize
+            offset += 4 + size
+        raise StreamingZipError("缺少 ZIP64 扩展字段")
+
+    def _read_data(self) -> bool:
+        has_descriptor = bool(self._flags & FLAG_DATA_DESCRIPTOR)
+
+        if has_descriptor:
+            # 大小未知：依赖 deflate 流自身的结束标记
+            if not self._buffer:
+                return False
+            chunk = bytes(self._buffer)
+            self._buffer.clear()
+            # 先计入压缩数据（可能含后续成员的字节，压缩比只会偏宽松）
+            self._budget.consume(len(chunk))
+            self._inflate(chunk)
+            if not self._decompressor.eof:
+                return False
+            # 未消费的字节属于数据描述符及后续成员
+            self._buffer[:0] = self._decompressor.unused_data
+            self._state = "descriptor"
+            return True
+
+        if self._remaining > 0:
+            if not self._buffer:
+                return False
+            take = min(self._remaining, len(self._buffer))
+            chunk = bytes(self._buffer[:take])
+            del self._buffer[:take]
+            self._remaining -= take
+            if self._decompressor is not None:
+                self._inflate(chunk)
+            else:
+                self._write(chunk)
+            if self._remaining > 0:
+                return False
+
+        if self._decompressor is not None:
+            self._write(self._decompressor.flush())
+        self._finish_member(self._crc)
+        self._state = "header"
+        return True
+
+    def _read_descriptor(self) -> bool:
+        size_len = 8 if self._zip64 else 4
+        has_sig = bytes(self._buffer[:4]) == DATA_DESCRIPTOR_SIG
+        needed = (4 if has_sig else 0) + 4 + size_len * 2
+        if len(self._buffer) < needed:
+            return False
+
+        offset = 4 if has_sig else 0
+        crc = struct.unpack_from("<I", self._buffer, offset)[0]
+        del self._buffer[:needed]
+        self._finish_member(crc)
+        self._state = "header"
+        return True
+
+    # ------------------------------------------------------------------
+    # 输出
+    # ------------------------------------------------------------------
+
+    def _open_output(self) -> None:
+        self._out = None
+        self._out_path = None
+        if self._name.endswith("/"):
+            return  # 目录条目
+        dest = self._select(self._name)
+        if dest is None:
+            return
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        self._out_path = dest
+        self._out = open(dest, "wb")
+
+    def _inflate(self, data: bytes) -> None:
+        """分块解压，每次输出不超过 INFLATE_CHUNK_SIZE"""
+        while True:
+            out = self._decompressor.decompress(data, INFLATE_CHUNK_SIZE)
+            self._write(out)
+            data = self._decompressor.unconsumed_tail
+            if not data and len(out) < INFLATE_CHUNK_SIZE:
+                return
+
+    def _write(self, data: bytes) -> None:
+        if not data:
+            return
+        self._budget.produce(len(data))
+        self._running_crc = zlib.crc32(data, self._running_crc)
+        if self._out is not None:
+            self._out.write(data)
+            self.bytes_written += len(data)
+
+    def _finish_member(self, expected_crc: int) -> None:
+        if self._out is not None:
+            self._out.close()
+            self._out = None
+        if (self._running_crc & 0xFFFFFFFF) != expected_crc:
+            if self._out_path is not None and self._out_path.exists():
+                self._out_path.unlink()
+            raise StreamingZipError(f"ZIP 成员校验失败: {self._name}")
+        if self._out_path is not None:
+            self.files_written.append(self._out_path)
+        self._out_path = None
+        self._decompressor = None
+
+    def _abort(self) -> None:
+        if self._out is not None:
+            self._out.close()
+            self._out = None
+        if self._out_path is not None and self._out_path.exists():
+            self._out_path.unlink()
@@ -0,0 +1,343 @@
+"""
+增量同步
+
+按内容把模板目录同步到项目的 commands/：先并行哈希、完整分类所有文件生成
+同步计划（SyncPlan），在任何写入之前一次性决定所有冲突文件，再按计划执行。
+内容相同的文件不重写，上次安装拥有而新版本删除的文件被清理。
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Collection, Dict, List, Optional, Set
+
+if TYPE_CHECKING:
+    from sckit_cli.utils.filters import TemplateFilter
+    from sckit_cli.utils.manifest import InstallManifest, ManifestEntry
+    from sckit_cli.utils.store import Linker
+
+
+# 收到全部冲突文件（目标路径），返回其中要覆盖的文件
+ConflictCallback = Callable[[List[Path]], Collection[Path]]
+
+
+@dataclass
+class SyncResult:
+    """增量同步结果"""
+    files_copied: int = 0
+    files_skipped: int = 0
+    files_overwritten: int = 0
+    files_unchanged: int = 0
+    files_removed: int = 0
+    files_linked: int = 0
+    # 同步后归本工具所有的文件（写入清单）
+    files: Dict[str, "ManifestEntry"] = field(default_factory=dict)
+    
+    @property
+    def files_written(self) -> int:
+        """实际写入的文件数"""
+        return self.files_copied + self.files_overwritten
+
+
+class FileAction(str, Enum):
+    """同步计划中单个文件的分类"""
+    NEW = "new"              # 目标不存在
+    IDENTICAL = "identical"  # 内容相同
+    MODIFIED = "modified"    # 新版本有改动，目标未被本地修改：直接更新
+    EDITED = "edited"        # 目标被本地修改过：冲突，需决定是否覆盖
+    REMOVED = "removed"      # 新版本已删除，目标未被本地修改：清理
+    
+    @property
+    def label(self) -> str:
+        return {
+            FileAction.NEW: "新增",
+            FileAction.IDENTICAL: "无变化",
+            FileAction.MODIFIED: "更新",
+            FileAction.EDITED: "本地已修改",
+            FileAction.REMOVED: "删除",
+        }[self]
+
+
+@dataclass
+class PlannedFile:
+    """同步计划中的单个文件"""
+    path: str                                # 相对 commands 目录的路径
+    action: FileAction
+    entry: Optional["ManifestEntry"] = None  # 源文件（REMOVED 时为 None）
+    linked: bool = False                     # 目标已链接到模板存储
+
+
+@dataclass
+class SyncPlan:
+    """同步计划：先完整分类所有文件，再统一决定冲突、执行写入"""
+    source_dir: Path
+    target_dir: Path
+    files: List[PlannedFile] = field(default_factory=list)
+    template_filter: Optional["TemplateFilter"] = None  # 生效的模板筛选
+    filtered: int = 0                                   # 模板源中未被选中的文件数
+    
+    @property
+    def conflicts(self) -> List[PlannedFile]:
+        """本地修改过、需要决定是否覆盖的文件"""
+        return [f for f in self.files if f.action == FileAction.EDITED]
+    
+    @property
+    def changes(self) -> List[PlannedFile]:
+        """内容相同以外的文件"""
+        return [f for f in self.files if f.action != FileAction.IDENTICAL]
+    
+    def count(self, action: FileAction) -> int:
+        return sum(1 for f in self.files if f.action == action)
+    
+    def resolve(
+        self,
+        force: bool = False,
+        conflict_callback: Optional[ConflictCallback] = None,
+    ) -> Set[str]:
+        """
+        决定要覆盖的冲突文件，返回其相对路径（在任何写入之前完成）
+        
+        conflict_callback 只调用一次，收到全部冲突文件的目标路径，
+        返回其中要覆盖的文件；没有冲突时不调用。
+        """
+        conflicts = self.conflicts
+        if force:
+            return {f.path for f in conflicts}
+        if conflict_callback is None or not conflicts:
+            return set()
+        chosen = {Path(p) for p in conflict_callback([self.target_dir / f.path for f in conflicts])}
+        return {f.path for f in conflicts if self.target_dir / f.path in chosen}
+    
+    def format_counts(self) -> str:
+        parts = [
+            f"{self.count(action)} 个{action.label}"
+            for action in FileAction if self.count(action)
+        ]
+        if self.filtered:
+            parts.append(f"{self.filtered} 个未选择")
+        return "，".join(parts) or "没有文件"
+    
+    def to_dict(self) -> dict:
+        """机器可读的计划（用于 --dry-run --json）"""
+        return {
+            "target": str(self.target_dir),
+            "filtered": self.filtered,
+            "files": [
+                {"path": f.path, "action": f.action.value}
+                for f in self.files
+            ],
+        }
+
+
+def plan_template_sync(
+    source_dir: Path,
+    target_dir: Path,
+    previous: Optional["InstallManifest"] = None,
+    linker: Optional["Linker"] = None,
+    max_workers: Optional[int] = None,
+    entries: Optional[Dict[str, "ManifestEntry"]] = None,
+    template_filter: Optional["TemplateFilter"] = None,
+) -> SyncPlan:
+    """
+    生成同步计划：并行哈希源文件与目标文件，对每个文件分类，不做任何写入
+    
+    entries 给出源文件的大小与摘要（来自发布清单）时不读取 source_dir，
+    源文件可以稍后只下载需要写入的部分（此时只能按路径筛选）。
+    
+    template_filter 未选中的源文件不进入计划；上次安装拥有而本次未选中的
+    文件与新版本删除的文件一样处理。
+    
+    - 目标不存在：NEW
+    - 内容相同（或已链接到同一存储对象）：IDENTICAL
+    - 内容不同，文件归上次安装所有且未被本地修改：MODIFIED
+    - 内容不同，且被本地修改过（或不归本工具所有）：EDITED（冲突）
+    - 上次安装拥有、新版本已删除且未被本地修改：REMOVED
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from sckit_cli import ValidationError
+    from sckit_cli.utils.cache import file_sha256
+    from sckit_cli.utils.filters import FRONTMATTER_MAX_BYTES
+    from sckit_cli.utils.manifest import ManifestEntry
+    
+    owned = previous.files if previous else {}
+    if entries is None:
+        source_paths = sorted(
+            p.relative_to(source_dir).as_posix() for p in source_dir.rglob("*") if p.is_file()
+        )
+    else:
+        source_paths = sorted(entries)
+    
+    filtered = 0
+    if template_filter:
+        def head_reader(rel: str) -> Optional[Callable[[], bytes]]:
+            if entries is not None:
+                return None  # 源文件尚未下载
+            
+            def read() -> bytes:
+                with open(source_dir / rel, "rb") as f:
+                    return f.read(FRONTMATTER_MAX_BYTES)
+            return read
+        
+        selected = [rel for rel in source_paths if template_filter.matches(rel, head_reader(rel))]
+        if not selected:
+            raise ValidationError(f"没有模板匹配筛选条件（{template_filter.describe()}）")
+        filtered = len(source_paths) - len(selected)
+        source_paths = selected
+    
+    def classify(rel: str) -> PlannedFile:
+        target_file = target_dir / rel
+        if entries is None:
+            entry = ManifestEntry.from_file(source_dir / rel)
+        else:
+            entry = entries[rel]
+        try:
+            size = target_file.stat().st_size
+        except FileNotFoundError:
+            return PlannedFile(rel, FileAction.NEW, entry)
+        
+        if linker is not None and linker.is_linked(entry.sha256, target_file):
+            return PlannedFile(rel, FileAction.IDENTICAL, entry, linked=True)
+        
+        # 目标只哈希一次，且仅在大小与新旧版本之一相同时才需要
+        old = owned.get(rel)
+        digest = None
+        if size == entry.size or (old is not None and size == old.size):
+            digest = file_sha256(target_file)
+        if digest == entry.sha256 and size == entry.size:
+            return PlannedFile(rel, FileAction.IDENTICAL, entry)
+        if old is not None and digest == old.sha256 and size == old.size:
+            return PlannedFile(rel, FileAction.MODIFIED, entry)
+        return PlannedFile(rel, FileAction.EDITED, entry)
+    
+    def classify_dropped(item) -> Optional[PlannedFile]:
+        rel, old_entry = item
+        if old_entry.matches(target_dir / rel):
+            return PlannedFile(rel, FileAction.REMOVED)
+        return None  # 本地修改过的文件保留，不再记为本工具所有
+    
+    known = set(source_paths)
+    dropped = sorted((rel, e) for rel, e in owned.items() if rel not in known)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        files = list(executor.map(classify, source_paths))
+        files.extend(p for p in executor.map(classify_dropped, dropped) if p is not None)
+    
+    return SyncPlan(
+        source_dir=source_dir,
+        target_dir=target_dir,
+        files=files,
+        template_filter=template_filter or None,
+        filtered=filtered,
+    )
+
+
+def apply_template_sync(
+    plan: SyncPlan,
+    overwrite: Collection[str] = (),
+    move: bool = False,
+    linker: Optional["Linker"] = None,
+) -> SyncResult:
+    """
+    按计划执行同步（不交互）
+    
+    Args:
+        plan: plan_template_sync() 生成的计划
+        overwrite: 要覆盖的冲突文件路径，其余冲突文件保留本地修改
+        move: 直接移动（重命名）源文件，适用于与目标同一文件系统的暂存目录
+        linker: 指定时文件先放入全局模板存储，再以链接方式生成到目标
+    """
+    import shutil
+    from sckit_cli import LinkMode
+    
+    result = SyncResult()
+    source_dir, target_dir = plan.source_dir, plan.target_dir
+    
+    # 确保目标目录存在
+    target_dir.mkdir(parents=True, exist_ok=True)
+    
+    def transfer(source_file: Path, target_file: Path, digest: str) -> None:
+        if linker is not None:
+            if linker.place(source_file, digest, target_file, move=move) != LinkMode.COPY:
+                result.files_linked += 1
+            return
+        target_file.parent.mkdir(parents=True, exist_ok=True)
+        if move:
+            os.replace(source_file, target_file)
+        else:
+            shutil.copy2(source_file, target_file)
+    
+    for item in plan.files:
+        source_file = source_dir / item.path
+        target_file = target_dir / item.path
+        
+        if item.action == FileAction.NEW:
+            transfer(source_file, target_file, item.entry.sha256)
+            result.files_copied += 1
+        elif item.action == FileAction.IDENTICAL:
+            # 内容相同的普通文件改为链接到存储，已有项目切换安装方式后同样节省空间
+            if not item.linked and linker is not None and linker.detects_links:
+                # 增量更新时未下载内容相同的源文件，目标本身即可放入存储
+                staged = source_file.exists()
+                if linker.place(
+                    source_file if staged else target_file,
+                    item.entry.sha256,
+                    target_file,
+                    move=move and staged,
+                    fallback=False,
+                ):
+                    result.files_linked += 1
+            result.files_unchanged += 1
+        elif item.action == FileAction.MODIFIED or (
+            item.action == FileAction.EDITED and item.path in overwrite
+        ):
+            transfer(source_file, target_file, item.entry.sha256)
+            result.files_overwritten += 1
+        elif item.action == FileAction.EDITED:
+            # 保留本地修改，不再记为本工具所有
+            result.files_skipped += 1
+            continue
+        else:
+            # 清理新版本已删除的文件（计划阶段已确认未被本地修改）
+            target_file.unlink(missing_ok=True)
+            result.files_removed += 1
+            # 删除因此变空的子目录
+            parent = target_file.parent
+            while parent != target_dir and target_dir in parent.parents:
+                try:
+                    parent.rmdir()
+                except OSError:
+                    break
+                parent = parent.parent
+            continue
+        
+        result.files[item.path] = item.entry
+    
+    return result
+
+
+def sync_template_files(
+    source_dir: Path,
+    target_dir: Path,
+    force: bool = False,
+    conflict_callback: Optional[ConflictCallback] = None,
+    move: bool = False,
+    previous: Optional["InstallManifest"] = None,
+    linker: Optional["Linker"] = None,
+) -> SyncResult:
+    """
+    按内容增量同步模板文件：生成计划 → 决定冲突 → 执行
+    
+    - 目标不存在：写入
+    - 内容相同：不写入（不改动 mtime，避免编辑器重新索引）
+    - 内容不同：若文件归上次安装所有且未被本地修改，直接更新；
+      否则视为冲突，force 或 conflict_callback 同意时覆盖
+    - 上次安装拥有、新版本已删除且未被本地修改的文件：清理
+    
+    conflict_callback 在任何写入之前一次性决定所有冲突文件。
+    move=True 时直接移动（重命名）文件，适用于与目标同一文件系统的暂存目录。
+    指定 linker 时文件先放入全局模板存储，再以链接方式生成到目标。
+    """
+    plan = plan_template_sync(source_dir, target_dir, previous, linker)
+    return apply_template_sync(plan, plan.resolve(force, conflict_callback), move, linker)
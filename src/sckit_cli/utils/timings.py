@@ -0,0 +1,104 @@
+"""
+安装阶段计时
+
+记录安装各阶段（获取 Release、下载、解压、同步）的耗时、传输字节数、
+涉及文件数，以及阶段结束时的进程峰值内存（RSS）。
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    from sckit_cli.utils.events import EventSink
+
+
+@dataclass
+class PhaseTiming:
+    """单个阶段的计时与资源统计"""
+    name: str
+    detail: str = ""                # 附加说明（如编辑器名）
+    seconds: float = 0.0
+    bytes: int = 0                  # 网络传输字节数
+    files: int = 0                  # 写入/删除/解压的文件数
+    peak_rss: Optional[int] = None  # 阶段结束时的进程峰值 RSS（字节），平台不支持时为 None
+
+    @property
+    def label(self) -> str:
+        return f"{self.name} ({self.detail})" if self.detail else self.name
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "detail": self.detail,
+            "seconds": round(self.seconds, 6),
+            "bytes": self.bytes,
+            "files": self.files,
+            "peak_rss": self.peak_rss,
+        }
+
+
+def peak_rss() -> Optional[int]:
+    """进程峰值常驻内存（字节）；Windows 等没有 resource 模块的平台返回 None"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 以 KB 为单位，macOS 以字节为单位
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+class PhaseRecorder:
+    """
+    按完成顺序收集各阶段的 PhaseTiming（可在多个线程中使用）
+
+    提供 sink 时在阶段开始、结束时发出 PhaseStarted / PhaseFinished 事件。
+    """
+
+    def __init__(self, sink: Optional["EventSink"] = None) -> None:
+        self.phases: List[PhaseTiming] = []
+        self._lock = threading.Lock()
+        self._sink = sink if sink is not None and sink.enabled else None
+
+    @contextmanager
+    def phase(self, name: str, detail: str = "") -> Iterator[PhaseTiming]:
+        """
+        计时一个阶段；调用方可在 with 块内填写 bytes 与 files
+
+        阶段抛出异常时同样记录（便于定位失败前耗时）。
+        """
+        timing = PhaseTiming(name=name, detail=detail)
+        if self._sink:
+            from sckit_cli.utils.events import PhaseStarted
+            self._sink.emit(PhaseStarted(name, detail))
+        start = time.perf_counter()
+        try:
+            yield timing
+        finally:
+            timing.seconds = time.perf_counter() - start
+            timing.peak_rss = peak_rss()
+            with self._lock:
+                self.phases.append(timing)
+            if self._sink:
+                from sckit_cli.utils.events import PhaseFinished
+                self._sink.emit(PhaseFinished(
+                    name, detail, timing.seconds, timing.bytes, timing.files,
+                ))
+
+
+@contextmanager
+def optional_phase(
+    recorder: Optional[PhaseRecorder], name: str, detail: str = ""
+) -> Iterator[PhaseTiming]:
+    """recorder 为 None 时仍提供一个（不被收集的）PhaseTiming，省去调用方判断"""
+    if recorder is None:
+        yield PhaseTiming(name=name, detail=detail)
+        return
+    with recorder.phase(name, detail) as timing:
+        yield timing
@@ -0,0 +1,433 @@
+"""
+性能基准测试
+
+启动一个本地的 GitHub Release API / 模板包下载替身，生成 10 ~ 50,000 个文件的
+合成模板包，分别计时：
+
+- get_latest_release
+- download_file
+- extract_zip
+- copy_template_files（可配置冲突比例）
+- install_template（端到端）
+
+结果写成 JSON，可与保存的基线比较，发现性能回退时以非零状态退出。
+
+用法:
+    python tests/benchmarks/bench.py --files 10,1000,50000 --output results.json
+    python tests/benchmarks/bench.py --baseline baseline.json --tolerance 0.25
+    python tests/benchmarks/bench.py --size-dist lognormal:2048:1.0 --conflict-ratio 0.3 --latency 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import io
+import json
+import math
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+from unittest.mock import patch
+
+
+PHASES = [
+    "get_latest_release",
+    "download_file",
+    "extract_zip",
+    "copy_template_files",
+    "install_template",
+]
+
+# 低于该差值（秒）的变化视为噪声，不算回退
+NOISE_FLOOR = 0.005
+
+
+# ============================================================================
+# 合成模板包
+# ============================================================================
+
+def parse_size_dist(spec: str) -> Callable[[random.Random], int]:
+    """
+    解析文件大小分布
+
+    - fixed:N              每个文件 N 字节
+    - uniform:MIN:MAX      [MIN, MAX] 均匀分布
+    - lognormal:MEDIAN:SIGMA  对数正态分布（中位数 MEDIAN 字节）
+    """
+    kind, _, args = spec.partition(":")
+    values = [float(v) for v in args.split(":")] if args else []
+    if kind == "fixed" and len(values) == 1:
+        size = int(values[0])
+        return lambda rng: size
+    if kind == "uniform" and len(values) == 2:
+        low, high = int(values[0]), int(values[1])
+        return lambda rng: rng.randint(low, high)
+    if kind == "lognormal" and len(values) == 2:
+        mu, sigma = math.log(values[0]), values[1]
+        return lambda rng: max(1, int(rng.lognormvariate(mu, sigma)))
+    raise ValueError(f"无法识别的大小分布: {spec}")
+
+
+def synthetic_content(rng: random.Random, size: int) -> bytes:
+    """生成类似 Markdown 的可压缩文本"""
+    words = ["prompt", "template", "command", "review", "## Step", "- item", "`code`", "\n"]
+    parts: List[str] = []
+    length = 0
+    while length <= size:
+        word = rng.choice(words)
+        parts.append(word)
+        length += len(word) + 1
+    return " ".join(parts).encode()[:size]
+
+
+@dataclasses.dataclass
+class Pack:
+    """合成模板包"""
+    files: Dict[str, bytes]   # commands 下的相对路径 -> 内容
+    zip_bytes: bytes
+
+    @property
+    def total_size(self) -> int:
+        return sum(len(v) for v in self.files.values())
+
+
+def generate_pack(count: int, size_dist: str, config_dir: str = ".cursor", seed: int = 0) -> Pack:
+    """生成包含 count 个文件的模板包（每 500 个文件一个子目录）"""
+    rng = random.Random(seed)
+    sizer = parse_size_dist(size_dist)
+    files = {}
+    for i in range(count):
+        rel = f"group{i // 500:03d}/sckit.bench-{i:05d}.md"
+        files[rel] = synthetic_content(rng, sizer(rng))
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        for rel, data in files.items():
+            zf.writestr(f"{config_dir}/commands/{rel}", data)
+    return Pack(files=files, zip_bytes=buffer.getvalue())
+
+
+def prepare_target(commands_dir: Path, pack: Pack, conflict_ratio: float, seed: int = 0) -> None:
+    """在目标目录中预置 conflict_ratio 比例的本地修改文件"""
+    rng = random.Random(seed)
+    for rel in pack.files:
+        if rng.random() < conflict_ratio:
+            path = commands_dir / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"local edit\n")
+
+
+# ============================================================================
+# 本地 GitHub 替身
+# ============================================================================
+
+class FakeGitHubServer:
+    """
+    本地 HTTP 服务器，模拟 releases/latest API 与资源下载
+
+    latency 为每个请求在响应前的额外延迟（秒）。
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.assets: Dict[str, bytes] = {}
+        self.tag_name = "v9.9.9"
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # 响应头与响应体分两次写出，避免 Nagle + 延迟 ACK 带来的 40ms 假延迟
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                if self.path.endswith("/releases/latest"):
+                    body = json.dumps(server.release_json()).encode()
+                    self._send(200, body, "application/json")
+                elif self.path.startswith("/download/") and self.path[10:] in server.assets:
+                    self._send(200, server.assets[self.path[10:]], "application/zip")
+                else:
+                    self._send(404, b"not found", "text/plain")
+
+            def _send(self, status: int, body: bytes, content_type: str) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def asset_url(self, name: str) -> str:
+        return f"{self.url}/download/{name}"
+
+    def release_json(self) -> dict:
+        return {
+            "tag_name": self.tag_name,
+            "name": f"Release {self.tag_name}",
+            "assets": [
+                {"name": name, "browser_download_url": self.asset_url(name), "size": len(data)}
+                for name, data in self.assets.items()
+            ],
+        }
+
+    def __enter__(self) -> "FakeGitHubServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@contextmanager
+def pointed_at(server: FakeGitHubServer) -> Iterator[None]:
+    """让 sckit_cli 使用本地服务器，并屏蔽终端输出"""
+    import sckit_cli
+    from rich.console import Console
+
+    quiet = Console(quiet=True)
+    # 合成模板包最多 50,000 个文件，超出默认的模板包限制
+    bench_config = dataclasses.replace(
+        sckit_cli.config,
+        GITHUB_API_BASE=server.url,
+        MAX_TEMPLATE_SIZE=1 << 40,
+        MAX_TEMPLATE_FILES=1 << 20,
+        MAX_EXTRACTED_SIZE=1 << 40,
+    )
+    with patch.object(sckit_cli, "config", bench_config), \
+            patch.object(sckit_cli, "_console", quiet), \
+            patch.object(sckit_cli, "_http_session", None):
+        try:
+            yield
+        finally:
+            if sckit_cli._http_session is not None:
+                sckit_cli._http_session.close()
+
+
+# ============================================================================
+# 计时
+# ============================================================================
+
+@dataclasses.dataclass
+class Measurement:
+    scenario: str
+    phase: str
+    runs: List[float]
+
+    @property
+    def best(self) -> float:
+        return min(self.runs)
+
+    def to_dict(self) -> dict:
+        return {
+            "scenario": self.scenario,
+            "phase": self.phase,
+            "best": round(self.best, 6),
+            "mean": round(statistics.fmean(self.runs), 6),
+            "runs": [round(r, 6) for r in self.runs],
+        }
+
+
+def timed(repeat: int, setup: Callable[[], object], func: Callable[[object], None]) -> List[float]:
+    """重复执行 func(setup())，只计 func 的耗时"""
+    runs = []
+    for _ in range(repeat):
+        state = setup()
+        start = time.perf_counter()
+        func(state)
+        runs.append(time.perf_counter() - start)
+    return runs
+
+
+def run_scenario(
+    count: int,
+    size_dist: str,
+    conflict_ratio: float,
+    latency: float,
+    repeat: int,
+    work_dir: Path,
+) -> List[Measurement]:
+    """对一个模板包规模执行全部阶段"""
+    import sckit_cli
+    from sckit_cli import Editor, InstallConfig
+
+    scenario = f"files={count},size={size_dist},conflicts={conflict_ratio},latency={latency}"
+    pack = generate_pack(count, size_dist)
+    asset_name = "sckit-cursor-9.9.9.zip"
+    measurements = []
+
+    def fresh_dir(name: str) -> Path:
+        path = work_dir / name
+        shutil.rmtree(path, ignore_errors=True)
+        path.mkdir(parents=True)
+        return path
+
+    with FakeGitHubServer(latency=latency) as server, pointed_at(server):
+        server.assets[asset_name] = pack.zip_bytes
+        zip_path = work_dir / asset_name
+
+        measurements.append(Measurement(scenario, "get_latest_release", timed(
+            repeat, lambda: None, lambda _: sckit_cli.get_latest_release(),
+        )))
+        measurements.append(Measurement(scenario, "download_file", timed(
+            repeat, lambda: None,
+            lambda _: sckit_cli.download_file(server.asset_url(asset_name), zip_path),
+        )))
+        measurements.append(Measurement(scenario, "extract_zip", timed(
+            repeat, lambda: fresh_dir("extract"),
+            lambda dest: sckit_cli.extract_zip(zip_path, dest),
+        )))
+
+        source = work_dir / "extract" / ".cursor" / "commands"
+
+        def copy_setup() -> Path:
+            target = fresh_dir("copy")
+            prepare_target(target, pack, conflict_ratio)
+            return target
+
+        measurements.append(Measurement(scenario, "copy_template_files", timed(
+            repeat, copy_setup,
+            lambda target: sckit_cli.copy_template_files(
+                source, target, conflict_callback=lambda paths: paths,
+            ),
+        )))
+
+        def install_setup() -> Path:
+            project = fresh_dir("project")
+            prepare_target(Editor.CURSOR.get_commands_path(project), pack, conflict_ratio)
+            return project
+
+        measurements.append(Measurement(scenario, "install_template", timed(
+            repeat, install_setup,
+            lambda project: sckit_cli.install_template(InstallConfig(
+                target_path=project, editor=Editor.CURSOR, force=True, use_cache=False,
+            )),
+        )))
+
+    return measurements
+
+
+# ============================================================================
+# 结果与基线
+# ============================================================================
+
+def build_report(measurements: List[Measurement], args: argparse.Namespace) -> dict:
+    from sckit_cli import __version__
+    return {
+        "meta": {
+            "sckit_version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "size_dist": args.size_dist,
+            "conflict_ratio": args.conflict_ratio,
+            "latency": args.latency,
+            "repeat": args.repeat,
+        },
+        "results": [m.to_dict() for m in measurements],
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> List[str]:
+    """
+    与基线比较最佳耗时
+
+    Returns:
+        回退说明列表（耗时超过基线 × (1 + tolerance) 且超出噪声下限）
+    """
+    previous = {(r["scenario"], r["phase"]): r["best"] for r in baseline.get("results", [])}
+    regressions = []
+    for result in report["results"]:
+        key = (result["scenario"], result["phase"])
+        if key not in previous:
+            continue
+        old, new = previous[key], result["best"]
+        if new > old * (1 + tolerance) and new - old > NOISE_FLOOR:
+            regressions.append(
+                f"{result['phase']} [{result['scenario']}]: "
+                f"{old * 1000:.1f} ms -> {new * 1000:.1f} ms (+{(new / old - 1) * 100:.0f}%)"
+            )
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="sckit 性能基准测试")
+    parser.add_argument("--files", default="10,1000,10000",
+                        help="模板包文件数，逗号分隔（默认 10,1000,10000；最大 50000）")
+    parser.add_argument("--size-dist", default="lognormal:2048:1.0",
+                        help="文件大小分布：fixed:N | uniform:MIN:MAX | lognormal:MEDIAN:SIGMA")
+    parser.add_argument("--conflict-ratio", type=float, default=0.1,
+                        help="目标目录中已有本地修改的文件比例（0~1）")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="本地服务器每个请求的额外延迟（秒）")
+    parser.add_argument("--repeat", type=int, default=3, help="每个阶段的重复次数")
+    parser.add_argument("--output", type=Path, help="结果 JSON 输出路径")
+    parser.add_argument("--baseline", type=Path, help="用于比较的基线 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="允许的相对变慢比例（默认 0.25）")
+    args = parser.parse_args(argv)
+
+    args.file_counts = [int(n) for n in args.files.split(",") if n.strip()]
+    if any(n < 1 or n > 50000 for n in args.file_counts):
+        parser.error("--files 取值范围为 1 ~ 50000")
+    parse_size_dist(args.size_dist)
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    measurements: List[Measurement] = []
+    with tempfile.TemporaryDirectory(prefix="sckit-bench-") as tmp:
+        for count in args.file_counts:
+            scenario_dir = Path(tmp) / str(count)
+            scenario_dir.mkdir()
+            results = run_scenario(
+                count, args.size_dist, args.conflict_ratio, args.latency, args.repeat, scenario_dir,
+            )
+            for m in results:
+                print(f"{count:>6} files  {m.phase:<20} {m.best * 1000:>10.1f} ms")
+            measurements.extend(results)
+
+    report = build_report(measurements, args)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n")
+
+    if args.baseline:
+        regressions = compare(report, json.loads(args.baseline.read_text()), args.tolerance)
+        if regressions:
+            print("\n性能回退:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\n未发现性能回退")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
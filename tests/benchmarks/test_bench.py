@@ -0,0 +1,55 @@
+"""
+基准测试工具自身的冒烟测试
+
+以最小规模跑通全部阶段，确保基准脚本随代码演进保持可用
+"""
+
+import json
+
+import pytest
+
+from bench import PHASES, compare, generate_pack, main, parse_size_dist
+
+
+class TestBenchHarness:
+    """测试基准脚本"""
+
+    def test_generate_pack(self):
+        """生成的模板包包含指定数量、指定大小的文件"""
+        pack = generate_pack(25, "fixed:100")
+
+        assert len(pack.files) == 25
+        assert pack.total_size == 2500
+
+    def test_invalid_size_dist(self):
+        with pytest.raises(ValueError):
+            parse_size_dist("normal:1")
+
+    def test_end_to_end(self, tmp_path, capsys):
+        """以最小规模跑通全部阶段并写出 JSON"""
+        output = tmp_path / "results.json"
+
+        assert main(["--files", "10", "--repeat", "1", "--output", str(output)]) == 0
+
+        report = json.loads(output.read_text())
+        assert [r["phase"] for r in report["results"]] == PHASES
+        assert report["meta"]["repeat"] == 1
+
+    def test_compare_with_baseline(self):
+        """超过容差且超过噪声下限的变慢才算回退"""
+        baseline = {"results": [
+            {"scenario": "s", "phase": "extract_zip", "best": 0.100},
+            {"scenario": "s", "phase": "download_file", "best": 0.001},
+            {"scenario": "s", "phase": "install_template", "best": 0.200},
+        ]}
+        report = {"results": [
+            {"scenario": "s", "phase": "extract_zip", "best": 0.200},      # 回退
+            {"scenario": "s", "phase": "download_file", "best": 0.003},    # 低于噪声下限
+            {"scenario": "s", "phase": "install_template", "best": 0.210}, # 容差内
+            {"scenario": "t", "phase": "extract_zip", "best": 9.0},        # 基线中没有
+        ]}
+
+        regressions = compare(report, baseline, tolerance=0.25)
+
+        assert len(regressions) == 1
+        assert regressions[0].startswith("extract_zip")
@@ -0,0 +1,71 @@
+"""
+测试共用的模板包构造工具
+
+测试模块通过 `from conftest import ...` 使用（pytest 会把本目录加入 sys.path）。
+"""
+
+import io
+import zipfile
+from typing import Mapping, Optional, Union
+
+from sckit_cli import Editor, Release, ReleaseAsset
+
+
+# 默认模板包中的两个模板
+TEMPLATE_FILES = {"sckit.a.md": "# A", "sckit.b.md": "# B"}
+
+
+class Unseekable(io.RawIOBase):
+    """不可 seek 的输出流，迫使 zipfile 写入数据描述符"""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.data += b
+        return len(b)
+
+
+def build_zip(
+    files: Mapping[str, Union[str, bytes]],
+    compression: int = zipfile.ZIP_DEFLATED,
+    seekable: bool = True,
+) -> bytes:
+    """按 {成员名: 内容} 打包 zip；seekable=False 时写入数据描述符"""
+    out = io.BytesIO() if seekable else Unseekable()
+    with zipfile.ZipFile(out, "w", compression) as zf:
+        for name, content in files.items():
+            zf.writestr(name, content)
+    return bytes(out.getvalue() if seekable else out.data)
+
+
+def template_zip(
+    files: Optional[Mapping[str, Union[str, bytes]]] = None,
+    config_dir: str = ".cursor",
+    compression: int = zipfile.ZIP_DEFLATED,
+) -> bytes:
+    """模板包：files 中的模板放在 <config_dir>/commands/ 下，默认 TEMPLATE_FILES"""
+    files = TEMPLATE_FILES if files is None else files
+    return build_zip(
+        {f"{config_dir}/commands/{name}": content for name, content in files.items()},
+        compression,
+    )
+
+
+def make_release(version: str = "0.3.0", editors=(Editor.CURSOR,), size: int = 0) -> Release:
+    """各编辑器的模板包位于 https://example.com/ 下的 Release"""
+    return Release(
+        tag_name=f"v{version}",
+        name=f"Release {version}",
+        assets=[
+            ReleaseAsset(
+                name=f"sckit-{editor.value}-{version}.zip",
+                download_url=f"https://example.com/sckit-{editor.value}-{version}.zip",
+                size=size,
+            )
+            for editor in editors
+        ],
+    )
@@ -0,0 +1,134 @@
+"""
+集成测试：批量安装
+
+测试一次下载安装到多个项目（sckit init --batch / 多个路径）
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from sckit_cli import (
+    app, Editor, InstallConfig,
+    BatchInstallResult, install_templates,
+)
+
+from conftest import make_release, template_zip
+
+
+runner = CliRunner()
+
+
+def fake_download(url, on_chunk, progress_callback=None, **kwargs):
+    """分块返回一个包含两个模板的 zip（按 URL 区分编辑器）"""
+    config_dir = ".claude" if "claude" in url else ".cursor"
+    data = template_zip(config_dir=config_dir)
+    for i in range(0, len(data), 16):
+        on_chunk(data[i:i + 16])
+    return len(data)
+
+
+class TestInstallTemplates:
+    """测试 install_templates()"""
+
+    @patch("sckit_cli.download_stream", side_effect=fake_download)
+    @patch("sckit_cli.get_latest_release")
+    def test_single_download_for_many_projects(self, mock_release, mock_download, tmp_path):
+        """多个项目只获取一次 Release、只下载一次"""
+        mock_release.return_value = make_release(editors=list(Editor))
+        projects = [tmp_path / f"pkg{i}" for i in range(5)]
+        for project in projects:
+            project.mkdir()
+
+        configs = [
+            InstallConfig(target_path=p, editor=Editor.CURSOR, use_cache=False)
+            for p in projects
+        ]
+        result = install_templates(configs, max_workers=3)
+
+        assert result.success
+        assert len(result.results) == 5
+        assert result.files_copied == 10
+        assert mock_release.call_count == 1
+        assert mock_download.call_count == 1
+        for project in projects:
+            assert (project / ".cursor" / "commands" / "sckit.a.md").read_text() == "# A"
+
+    @patch("sckit_cli.download_stream", side_effect=fake_download)
+    @patch("sckit_cli.get_latest_release")
+    def test_multiple_editors(self, mock_release, mock_download, tmp_path):
+        """多个编辑器各下载一次模板包，安装到各自的配置目录"""
+        mock_release.return_value = make_release(editors=list(Editor))
+        configs = [
+            InstallConfig(target_path=tmp_path, editor=editor, use_cache=False)
+            for editor in (Editor.CURSOR, Editor.CLAUDE)
+        ]
+
+        result = install_templates(configs)
+
+        assert result.success
+        assert result.editors == [Editor.CURSOR, Editor.CLAUDE]
+        assert mock_release.call_count == 1
+        assert mock_download.call_count == 2
+        assert (tmp_path / ".cursor" / "commands" / "sckit.a.md").exists()
+        assert (tmp_path / ".claude" / "commands" / "sckit.b.md").exists()
+
+
+class TestInitBatchCommand:
+    """测试 init 命令的批量参数"""
+
+    @patch("sckit_cli.install_templates")
+    def test_multiple_paths(self, mock_install, tmp_path):
+        """多个位置参数走批量安装"""
+        mock_install.return_value = BatchInstallResult(results=[])
+        a, b = tmp_path / "a", tmp_path / "b"
+
+        result = runner.invoke(app, ["init", str(a), str(b), "-e", "cursor"])
+
+        assert result.exit_code == 0, result.stdout
+        configs = mock_install.call_args[0][0]
+        assert [c.target_path for c in configs] == [a.resolve(), b.resolve()]
+
+    @patch("sckit_cli.install_templates")
+    def test_batch_file(self, mock_install, tmp_path):
+        """--batch 读取项目列表，忽略空行和注释"""
+        mock_install.return_value = BatchInstallResult(results=[])
+        batch = tmp_path / "projects.txt"
+        batch.write_text(f"# monorepo\n{tmp_path / 'a'}\n\n{tmp_path / 'b'}\n")
+
+        result = runner.invoke(app, ["init", "--batch", str(batch), "-e", "cursor", "-j", "4"])
+
+        assert result.exit_code == 0, result.stdout
+        configs = mock_install.call_args[0][0]
+        assert len(configs) == 2
+        assert mock_install.call_args[1]["max_workers"] == 4
+
+    @patch("sckit_cli.install_templates")
+    def test_multiple_editors(self, mock_install, tmp_path):
+        """--editor 接受逗号分隔的编辑器列表"""
+        mock_install.return_value = BatchInstallResult(results=[])
+
+        result = runner.invoke(app, ["init", str(tmp_path), "-e", "cursor,claude"])
+
+        assert result.exit_code == 0, result.stdout
+        configs = mock_install.call_args[0][0]
+        assert [c.editor for c in configs] == [Editor.CURSOR, Editor.CLAUDE]
+
+    @patch("sckit_cli.install_templates")
+    def test_all_editors(self, mock_install, tmp_path):
+        """--editor all 安装全部支持的编辑器"""
+        mock_install.return_value = BatchInstallResult(results=[])
+
+        result = runner.invoke(app, ["init", str(tmp_path), "-e", "all"])
+
+        assert result.exit_code == 0, result.stdout
+        configs = mock_install.call_args[0][0]
+        assert [c.editor for c in configs] == list(Editor)
+
+    def test_invalid_editor(self, tmp_path):
+        """列表中有不支持的编辑器时报错退出"""
+        result = runner.invoke(app, ["init", str(tmp_path), "-e", "cursor,vim"])
+
+        assert result.exit_code == 1
@@ -0,0 +1,202 @@
+"""
+集成测试：按文件清单增量更新
+
+Release 带有文件清单时，install_template 先按清单生成同步计划，
+只用 Range 请求下载变化的文件
+"""
+
+import random
+import zipfile
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from sckit_cli import Editor, InstallConfig, Release, ReleaseAsset, install_template
+from sckit_cli.utils.http import HttpSession
+from sckit_cli.utils.release_manifest import build_manifest
+from sckit_cli.utils.sync import FileAction
+
+ZIP_URL = "https://example.com/sckit-cursor-{}.zip"
+MANIFEST_URL = "https://example.com/sckit-cursor-{}.manifest.json"
+
+
+def random_text(seed, size=4096):
+    rng = random.Random(seed)
+    return "".join(rng.choice("abcdefghijklmnopqrstuvwxyz \n") for _ in range(size))
+
+
+class FakeAssetServer:
+    """提供模板包（支持 Range）与文件清单"""
+
+    def __init__(self, tmp_path, supports_range=True):
+        self.tmp_path = tmp_path
+        self.supports_range = supports_range
+        self.zips = {}
+        self.manifests = {}
+        self.requests = []
+
+    def publish(self, version, files):
+        path = self.tmp_path / f"sckit-cursor-{version}.zip"
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+            for name, content in files.items():
+                zf.writestr(f".cursor/commands/{name}", content)
+        self.zips[ZIP_URL.format(version)] = path.read_bytes()
+        self.manifests[MANIFEST_URL.format(version)] = build_manifest(path).to_dict()
+        return Release(tag_name=f"v{version}", name=version, assets=[
+            ReleaseAsset(path.name, ZIP_URL.format(version), path.stat().st_size),
+            ReleaseAsset(
+                f"sckit-cursor-{version}.manifest.json", MANIFEST_URL.format(version), 100,
+            ),
+        ])
+
+    def __call__(self, request):
+        self.requests.append(request)
+        url = str(request.url)
+        if url in self.manifests:
+            return httpx.Response(200, json=self.manifests[url])
+
+        data = self.zips[url]
+        ranged = request.headers.get("Range", "")
+        if not (self.supports_range and ranged.startswith("bytes=")):
+            return httpx.Response(200, content=data)
+        start, _, end = ranged[len("bytes="):].partition("-")
+        start = int(start)
+        end = int(end) if end else len(data) - 1
+        return httpx.Response(206, content=data[start:end + 1], headers={
+            "Content-Range": f"bytes {start}-{end}/{len(data)}",
+        })
+
+    def zip_requests(self):
+        return [r for r in self.requests if str(r.url) in self.zips]
+
+
+FILES = {f"sckit.{i}.md": random_text(i) for i in range(10)}
+
+
+def serve(server):
+    session = HttpSession(sleep=lambda _: None, transport=httpx.MockTransport(server))
+    return patch("sckit_cli.get_http_session", return_value=session)
+
+
+def install(project, release, **kwargs):
+    with patch("sckit_cli.get_latest_release", return_value=release):
+        return install_template(InstallConfig(
+            target_path=project, editor=Editor.CURSOR, use_cache=False, **kwargs,
+        ))
+
+
+@pytest.fixture
+def project(tmp_path):
+    path = tmp_path / "project"
+    path.mkdir()
+    return path
+
+
+class TestDeltaUpdate:
+    """测试 install_template() 的增量更新"""
+
+    def test_fetches_only_changed_files(self, tmp_path, project):
+        server = FakeAssetServer(tmp_path)
+        v1 = server.publish("0.1.0", FILES)
+        v2 = server.publish("0.2.0", {**FILES, "sckit.3.md": random_text("new")})
+
+        with serve(server):
+            install(project, v1)
+            server.requests.clear()
+            result = install(project, v2)
+
+        commands = project / ".cursor" / "commands"
+        assert (commands / "sckit.3.md").read_text() == random_text("new")
+        assert result.files_overwritten == 1
+        assert result.files_unchanged == 9
+
+        [ranged] = server.zip_requests()
+        assert ranged.headers["Range"].startswith("bytes=")
+        phases = {t.name: t for t in result.timings}
+        assert "download" not in phases
+        assert phases["delta"].files == 1
+        assert phases["delta"].bytes < len(server.zips[ZIP_URL.format("0.2.0")]) // 4
+
+    def test_first_install_downloads_whole_package(self, tmp_path, project):
+        """全部文件都需要写入时直接下载完整模板包"""
+        server = FakeAssetServer(tmp_path)
+        v1 = server.publish("0.1.0", FILES)
+
+        with serve(server):
+            result = install(project, v1)
+
+        assert result.files_copied == 10
+        assert [t.name for t in result.timings] == ["release", "plan", "download", "sync"]
+
+    def test_falls_back_without_range_support(self, tmp_path, project):
+        """服务器忽略 Range 时改为完整下载"""
+        server = FakeAssetServer(tmp_path, supports_range=False)
+        v1 = server.publish("0.1.0", FILES)
+        v2 = server.publish("0.2.0", {**FILES, "sckit.3.md": "changed"})
+
+        with serve(server):
+            install(project, v1)
+            result = install(project, v2)
+
+        assert (project / ".cursor" / "commands" / "sckit.3.md").read_text() == "changed"
+        assert result.files_overwritten == 1
+        assert "download" in [t.name for t in result.timings]
+
+    def test_dry_run_downloads_nothing(self, tmp_path, project):
+        """预演只需要文件清单"""
+        server = FakeAssetServer(tmp_path)
+        v1 = server.publish("0.1.0", FILES)
+        v2 = server.publish("0.2.0", {**FILES, "sckit.3.md": "changed"})
+
+        with serve(server):
+            install(project, v1)
+            server.requests.clear()
+            result = install(project, v2, dry_run=True)
+
+        assert server.zip_requests() == []
+        assert result.plan.count(FileAction.MODIFIED) == 1
+        assert (project / ".cursor" / "commands" / "sckit.3.md").read_text() == FILES["sckit.3.md"]
+
+    def test_only_fetches_selected_files(self, tmp_path, project):
+        """按路径筛选时只读取选中的文件"""
+        server = FakeAssetServer(tmp_path)
+        v1 = server.publish("0.1.0", FILES)
+
+        with serve(server):
+            result = install(project, v1, only=["sckit.3", "sckit.7"])
+
+        assert sorted(p.name for p in (project / ".cursor" / "commands").iterdir()) == [
+            "sckit.3.md", "sckit.7.md",
+        ]
+        assert result.files_copied == 2
+        phases = {t.name: t for t in result.timings}
+        assert "download" not in phases
+        assert phases["delta"].files == 2
+
+    def test_mismatched_manifest_ignored(self, tmp_path, project):
+        """清单与模板包大小不符时不使用清单"""
+        server = FakeAssetServer(tmp_path)
+        v1 = server.publish("0.1.0", FILES)
+        server.manifests[MANIFEST_URL.format("0.1.0")]["asset_size"] += 1
+
+        with serve(server):
+            result = install(project, v1)
+
+        assert result.files_copied == 10
+        assert [t.name for t in result.timings] == ["release", "download", "plan", "sync"]
+
+
+def test_manifest_is_cached(tmp_path, project, monkeypatch):
+    """清单不可变，缓存后不再请求"""
+    monkeypatch.setenv("SCKIT_CACHE_DIR", str(tmp_path / "cache"))
+    server = FakeAssetServer(tmp_path)
+    release = server.publish("0.1.0", FILES)
+
+    with serve(server), patch("sckit_cli.get_latest_release", return_value=release):
+        config_obj = InstallConfig(target_path=project, editor=Editor.CURSOR, dry_run=True)
+        install_template(config_obj)
+        install_template(config_obj)
+
+    manifest_requests = [r for r in server.requests if "manifest" in str(r.url)]
+    assert len(manifest_requests) == 1
@@ -0,0 +1,163 @@
+"""
+集成测试：安装事件
+
+测试安装引擎向 ListSink / NdjsonSink / NullSink 发出的事件，
+以及非 Rich 的接收者不渲染终端、不询问用户
+"""
+
+import io
+import json
+import subprocess
+import sys
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from sckit_cli import (
+    Editor, InstallConfig, active_sink, install_template, install_templates, use_event_sink,
+)
+from sckit_cli.utils.events import (
+    FileApplied, InstallFinished, ListSink, Message, NdjsonSink, PhaseFinished, PhaseStarted,
+)
+
+from conftest import template_zip
+
+
+@pytest.fixture
+def template(tmp_path, monkeypatch):
+    monkeypatch.setenv("SCKIT_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "sckit-cursor-0.4.0.zip"
+    path.write_bytes(template_zip())
+    return path
+
+
+def make_config(project, template, **kwargs):
+    project.mkdir(exist_ok=True)
+    return InstallConfig(target_path=project, editor=Editor.CURSOR, source=str(template), **kwargs)
+
+
+def test_list_sink_receives_typed_events(tmp_path, template):
+    sink = ListSink()
+    result = install_template(make_config(tmp_path / "project", template), sink=sink)
+
+    started = [e.phase for e in sink.of(PhaseStarted)]
+    finished = [e.phase for e in sink.of(PhaseFinished)]
+    assert started[0] == "release"
+    assert sorted(started) == sorted(finished) == sorted(t.name for t in result.timings)
+
+    files = sink.of(FileApplied)
+    assert {(e.path, e.action, e.applied) for e in files} == {
+        ("sckit.a.md", "new", True), ("sckit.b.md", "new", True),
+    }
+    assert sink.events[-1] == InstallFinished(result.to_dict())
+    # 终端提示转换为纯文本
+    assert all("[" not in e.text for e in sink.of(Message))
+
+
+def test_messages_keep_literal_brackets(tmp_path):
+    """提示信息是纯文本事件：路径中的 [word] 原样保留"""
+    template = tmp_path / "[team]" / "sckit-cursor-0.4.0.zip"
+    template.parent.mkdir()
+    template.write_bytes(template_zip({"sckit.a.md": "# A"}))
+    sink = ListSink()
+
+    install_template(make_config(tmp_path / "project", template), sink=sink)
+
+    messages = sink.of(Message)
+    assert Message(f"使用本地模板源: {template}") in messages
+    assert {m.level for m in messages} >= {"info", "success"}
+
+
+def test_edited_files_kept_without_prompt(tmp_path, template):
+    """非 Rich 的接收者即使在终端中也不询问，保留本地修改"""
+    project = tmp_path / "project"
+    install_template(make_config(project, template))
+    edited = project / ".cursor" / "commands" / "sckit.a.md"
+    edited.write_text("# mine")
+    template.write_bytes(template_zip({"sckit.a.md": "# A2", "sckit.b.md": "# B2"}))
+
+    sink = ListSink()
+    with patch("sys.stdin.isatty", return_value=True), \
+            patch("rich.prompt.Prompt.ask", side_effect=AssertionError("prompted")):
+        install_template(make_config(project, template), sink=sink)
+
+    assert edited.read_text() == "# mine"
+    assert {(e.path, e.action, e.applied) for e in sink.of(FileApplied)} == {
+        ("sckit.a.md", "edited", False), ("sckit.b.md", "modified", True),
+    }
+
+
+def test_ndjson_sink_batch(tmp_path, template):
+    stream = io.StringIO()
+    configs = [make_config(tmp_path / name, template) for name in ("one", "two")]
+
+    batch = install_templates(configs, sink=NdjsonSink(stream))
+
+    events = [json.loads(line) for line in stream.getvalue().splitlines()]
+    projects = {e["project"] for e in events if e["event"] == "file"}
+    assert projects == {str(tmp_path / "one"), str(tmp_path / "two")}
+    assert events[-1] == {"event": "result", "result": batch.to_dict()}
+
+
+def test_sinks_isolated_between_threads():
+    """并发的安装各自使用自己的 sink，互不覆盖"""
+    sinks = [ListSink(), ListSink()]
+    barrier = threading.Barrier(2)
+    seen = [None, None]
+
+    def run(index):
+        with use_event_sink(sinks[index]):
+            barrier.wait()  # 两个线程都已设置 sink
+            seen[index] = active_sink()
+            barrier.wait()
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert seen == sinks
+    assert active_sink() is None
+
+
+def test_concurrent_installs_keep_their_events(tmp_path, template):
+    """同时进行的 install_template 调用的文件事件只发给各自的 sink"""
+    sinks = {name: ListSink() for name in ("one", "two")}
+
+    def run(name):
+        install_template(make_config(tmp_path / name, template), sink=sinks[name])
+
+    threads = [threading.Thread(target=run, args=(name,)) for name in sinks]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for name, sink in sinks.items():
+        results = sink.of(InstallFinished)
+        assert len(results) == 1
+        assert results[0].result["target_path"] == str(tmp_path / name)
+        assert len(sink.of(FileApplied)) == 2
+
+
+def test_null_sink_does_not_load_rich(tmp_path, template):
+    project = tmp_path / "project"
+    project.mkdir()
+    code = (
+        "import sys\n"
+        "from pathlib import Path\n"
+        "from sckit_cli import Editor, InstallConfig, install_template\n"
+        "from sckit_cli.utils.events import NullSink\n"
+        "install_template(InstallConfig(target_path=Path(sys.argv[1]), editor=Editor.CURSOR,"
+        " source=sys.argv[2]), sink=NullSink())\n"
+        "print(','.join(m for m in sys.modules if m == 'rich' or m.startswith('rich.')))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code, str(project), str(template)],
+        capture_output=True, text=True, check=True,
+    )
+
+    assert result.stdout.strip() == ""
+    assert (project / ".cursor" / "commands" / "sckit.a.md").read_text() == "# A"
@@ -0,0 +1,299 @@
+"""
+集成测试：install_template
+
+测试单项目安装流程：流式解压到暂存目录、移动到位、缓存复用、
+同步计划与冲突的一次性选择
+"""
+
+import hashlib
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from sckit_cli import (
+    Editor, InstallConfig, IntegrityError, Release, ReleaseAsset,
+    install_template, install_templates,
+)
+from sckit_cli.utils.http import HttpSession
+from sckit_cli.utils.search import SearchIndex
+from sckit_cli.utils.sync import FileAction
+
+from conftest import build_zip, make_release, template_zip
+
+
+TEMPLATE_ZIP = build_zip({
+    ".cursor/commands/sckit.a.md": "# A",
+    ".cursor/commands/sckit.b.md": "# B",
+    "README.md": "not installed",
+})
+
+
+def fake_download(url, on_chunk, progress_callback=None, **kwargs):
+    for i in range(0, len(TEMPLATE_ZIP), 64):
+        on_chunk(TEMPLATE_ZIP[i:i + 64])
+    return len(TEMPLATE_ZIP)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setenv("SCKIT_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "project"
+    path.mkdir()
+    return path
+
+
+class TestInstallTemplate:
+    """测试 install_template()"""
+
+    @patch("sckit_cli.download_stream", side_effect=fake_download)
+    @patch("sckit_cli.get_latest_release", return_value=make_release(size=len(TEMPLATE_ZIP)))
+    def test_streams_commands_into_place(self, mock_release, mock_download, project):
+        """只安装 commands 成员，不留下暂存目录"""
+        result = install_template(InstallConfig(
+            target_path=project, editor=Editor.CURSOR, use_cache=False,
+        ))
+
+        commands = project / ".cursor" / "commands"
+        assert result.files_copied == 2
+        assert sorted(p.name for p in commands.iterdir()) == ["sckit.a.md", "sckit.b.md"]
+        assert sorted(p.name for p in (project / ".cursor").iterdir()) == [
+            ".sckit-manifest.json", "commands",
+        ]
+        assert not (project / "README.md").exists()
+
+    @patch("sckit_cli.download_stream", side_effect=fake_download)
+    @patch("sckit_cli.get_latest_release", return_value=make_release(size=len(TEMPLATE_ZIP)))
+    def test_second_install_uses_cached_asset(self, mock_release, mock_download, project):
+        """第二次安装直接使用缓存的模板包"""
+        config_obj = InstallConfig(target_path=project, editor=Editor.CURSOR, force=True)
+
+        install_template(config_obj)
+        result = install_template(config_obj)
+
+        assert mock_download.call_count == 1
+        assert result.files_unchanged == 2
+
+    @patch("sckit_cli.download_stream", side_effect=fake_download)
+    @patch("sckit_cli.get_latest_release", return_value=make_release(size=len(TEMPLATE_ZIP)))
+    def test_updates_search_index(self, mock_release, mock_download, project, tmp_path):
+        """安装后模板进入搜索索引"""
+        install_template(InstallConfig(target_path=project, editor=Editor.CURSOR))
+
+        index = SearchIndex.load(tmp_path / "cache" / "search")
+        assert len(index) == 2
+        assert index.source == "v0.3.0"
+
+    @patch("sckit_cli.download_stream", side_effect=ConnectionError("boom"))
+    @patch("sckit_cli.get_latest_release", return_value=make_release(size=len(TEMPLATE_ZIP)))
+    def test_failure_leaves_no_config_dir(self, mock_release, mock_download, project):
+        """下载失败时不留下空的编辑器目录"""
+        with pytest.raises(ConnectionError):
+            install_template(InstallConfig(
+                target_path=project, editor=Editor.CURSOR, use_cache=False,
+            ))
+
+        assert not (project / ".cursor").exists()
+
+    @patch("sckit_cli.download_stream", side_effect=fake_download)
+    @patch("sckit_cli.get_latest_release", return_value=make_release(size=len(TEMPLATE_ZIP)))
+    def test_records_phase_timings(self, mock_release, mock_download, project):
+        """结果中包含各阶段的耗时、字节数与文件数"""
+        result = install_template(InstallConfig(
+            target_path=project, editor=Editor.CURSOR, use_cache=False,
+        ))
+
+        phases = {t.name: t for t in result.timings}
+        assert list(phases) == ["release", "download", "plan", "sync"]
+        assert phases["download"].bytes == len(TEMPLATE_ZIP)
+        assert phases["download"].files == 2
+        assert phases["sync"].files == 2
+        assert all(t.seconds >= 0 for t in result.timings)
+
+
+def release_with_checksums(digest):
+    release = make_release(size=len(TEMPLATE_ZIP))
+    release.assets.append(ReleaseAsset(
+        name="SHA256SUMS", download_url="https://example.com/SHA256SUMS", size=100,
+    ))
+    session = HttpSession(sleep=lambda _: None, transport=httpx.MockTransport(
+        lambda request: httpx.Response(200, text=f"{digest}  sckit-cursor-0.3.0.zip\n")
+    ))
+    return release, session
+
+
+class TestChecksums:
+    """测试按 SHA256SUMS 校验模板包"""
+
+    @patch("sckit_cli.download_stream", side_effect=fake_download)
+    def test_verified_install(self, mock_download, project):
+        release, session = release_with_checksums(hashlib.sha256(TEMPLATE_ZIP).hexdigest())
+
+        with patch("sckit_cli.get_latest_release", return_value=release), \
+                patch("sckit_cli.get_http_session", return_value=session):
+            result = install_template(InstallConfig(target_path=project, editor=Editor.CURSOR))
+
+        assert result.files_copied == 2
+
+    @patch("sckit_cli.download_stream", side_effect=fake_download)
+    def test_mismatch_writes_nothing(self, mock_download, project):
+        """摘要不符时不写入项目"""
+        release, session = release_with_checksums("0" * 64)
+
+        with patch("sckit_cli.get_latest_release", return_value=release), \
+                patch("sckit_cli.get_http_session", return_value=session), \
+                pytest.raises(IntegrityError):
+            install_template(InstallConfig(target_path=project, editor=Editor.CURSOR))
+
+        assert not (project / ".cursor").exists()
+
+
+def edit_locally(project, name, content="mine"):
+    path = project / ".cursor" / "commands" / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+@patch("sckit_cli.download_stream", side_effect=fake_download)
+@patch("sckit_cli.get_latest_release", return_value=make_release(size=len(TEMPLATE_ZIP)))
+class TestSyncPlanFlow:
+    """测试先计划、一次性决定冲突、再执行的安装流程"""
+
+    def test_dry_run_writes_nothing(self, mock_release, mock_download, project):
+        """--dry-run 只返回计划，不写入文件与清单"""
+        edited = edit_locally(project, "sckit.a.md")
+
+        result = install_template(InstallConfig(
+            target_path=project, editor=Editor.CURSOR, use_cache=False, dry_run=True,
+        ))
+
+        actions = {f.path: f.action for f in result.plan.files}
+        assert actions == {"sckit.a.md": FileAction.EDITED, "sckit.b.md": FileAction.NEW}
+        assert result.to_dict()["plan"]["files"][0] == {"path": "sckit.a.md", "action": "edited"}
+        assert "预演" in result.format_summary()
+        assert edited.read_text() == "mine"
+        assert sorted(p.name for p in edited.parent.iterdir()) == ["sckit.a.md"]
+        assert not (project / ".cursor" / ".sckit-manifest.json").exists()
+
+    @patch("sckit_cli.sys.stdin.isatty", return_value=True)
+    @patch("rich.prompt.Prompt.ask", side_effect=["s", "2"])
+    def test_one_prompt_for_all_projects(
+        self, mock_ask, mock_isatty, mock_release, mock_download, project, tmp_path,
+    ):
+        """多个项目的冲突在一张表中列出，只询问一次，按编号覆盖"""
+        other = tmp_path / "other"
+        other.mkdir()
+        first = edit_locally(project, "sckit.a.md")
+        second = edit_locally(other, "sckit.b.md")
+
+        batch = install_templates([
+            InstallConfig(target_path=path, editor=Editor.CURSOR, use_cache=False)
+            for path in (project, other)
+        ])
+
+        assert batch.success
+        assert mock_ask.call_count == 2  # 批量选择 + 编号
+        assert first.read_text() == "mine"
+        assert second.read_text() == "# B"
+        assert batch.files_skipped == 1
+        assert batch.files_overwritten == 1
+
+    @patch("sckit_cli.sys.stdin.isatty", return_value=False)
+    def test_non_interactive_keeps_local_edits(
+        self, mock_isatty, mock_release, mock_download, project,
+    ):
+        """非交互环境不询问，保留本地修改"""
+        edited = edit_locally(project, "sckit.a.md")
+
+        result = install_template(InstallConfig(
+            target_path=project, editor=Editor.CURSOR, use_cache=False,
+        ))
+
+        assert result.files_skipped == 1
+        assert edited.read_text() == "mine"
+
+
+TAGGED_ZIP = template_zip({
+    "sckit.a.md": "---\nname: a\ntags: [review]\n---\n# A",
+    "sckit.b.md": "---\nname: b\ntags: [draft]\n---\n# B",
+})
+
+
+def fake_tagged_download(url, on_chunk, progress_callback=None, **kwargs):
+    on_chunk(TAGGED_ZIP)
+    return len(TAGGED_ZIP)
+
+
+def installed(project):
+    return sorted(p.name for p in (project / ".cursor" / "commands").iterdir())
+
+
+@patch("sckit_cli.download_stream", side_effect=fake_download)
+@patch("sckit_cli.get_latest_release", return_value=make_release(size=len(TEMPLATE_ZIP)))
+class TestSelectiveInstall:
+    """测试 --only/--exclude 筛选安装"""
+
+    def test_only_is_remembered(self, mock_release, mock_download, project):
+        """筛选记录在安装清单中，之后的更新沿用，--only '*' 取消"""
+        def install(**kwargs):
+            return install_template(InstallConfig(
+                target_path=project, editor=Editor.CURSOR, use_cache=False, **kwargs,
+            ))
+
+        install(only=["sckit.a"])
+        assert installed(project) == ["sckit.a.md"]
+
+        result = install()
+        assert installed(project) == ["sckit.a.md"]
+        assert result.files_unchanged == 1
+
+        install(only=["*"])
+        assert installed(project) == ["sckit.a.md", "sckit.b.md"]
+
+    def test_exclude_removes_installed_template(self, mock_release, mock_download, project):
+        config = dict(target_path=project, editor=Editor.CURSOR, use_cache=False)
+        install_template(InstallConfig(**config))
+
+        result = install_template(InstallConfig(**config, exclude=["sckit.b.md"]))
+
+        assert installed(project) == ["sckit.a.md"]
+        assert result.files_removed == 1
+
+    @pytest.mark.parametrize("use_cache", [True, False])
+    def test_tag_filter_while_downloading(self, mock_release, mock_download, project, use_cache):
+        """按标签筛选时下载完成后从中央目录解压"""
+        mock_download.side_effect = fake_tagged_download
+        mock_release.return_value = Release(tag_name="v0.3.0", name="0.3.0", assets=[
+            ReleaseAsset("sckit-cursor-0.3.0.zip", "https://example.com/t.zip", len(TAGGED_ZIP)),
+        ])
+
+        result = install_template(InstallConfig(
+            target_path=project, editor=Editor.CURSOR, use_cache=use_cache,
+            exclude=["tag:draft"],
+        ))
+
+        assert result.files_copied == 1
+        assert installed(project) == ["sckit.a.md"]
+
+    def test_pick_is_remembered(self, mock_release, mock_download, project):
+        """--pick 按 frontmatter 显示全部模板，选择结果作为 only 记录"""
+        mock_download.side_effect = fake_tagged_download
+        mock_release.return_value = Release(tag_name="v0.3.0", name="0.3.0", assets=[
+            ReleaseAsset("sckit-cursor-0.3.0.zip", "https://example.com/t.zip", len(TAGGED_ZIP)),
+        ])
+        config = dict(target_path=project, editor=Editor.CURSOR, use_cache=False)
+        install_template(InstallConfig(**config, exclude=["sckit.a"]))
+
+        with patch("sys.stdin.isatty", return_value=True), \
+                patch("sckit_cli.utils.interactive.select_templates",
+                      return_value=["sckit.a.md"]) as picker:
+            install_template(InstallConfig(**config, pick=True))
+
+        items = picker.call_args.args[0]
+        assert [(i.key, i.name) for i in items] == [("sckit.a.md", "a"), ("sckit.b.md", "b")]
+        assert list(picker.call_args.kwargs["selected"]) == ["sckit.b.md"]
+        assert installed(project) == ["sckit.a.md"]
+
+        install_template(InstallConfig(**config))
+        assert installed(project) == ["sckit.a.md"]
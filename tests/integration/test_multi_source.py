@@ -0,0 +1,144 @@
+"""
+集成测试：多个模板源
+
+测试模板源的写法、并发获取各源的 Release 与模板包、私有仓库令牌，
+以及同名模板按模板源顺序合并
+"""
+
+import threading
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from sckit_cli import Editor, InstallConfig, ValidationError, install_template
+from sckit_cli.utils.http import HttpSession
+from sckit_cli.utils.manifest import InstallManifest
+from sckit_cli.utils.sources import TemplateSource, parse_sources
+
+from conftest import template_zip
+
+
+class FakeGitHub:
+    """
+    多个仓库的 latest 接口与模板包
+
+    token 非空的仓库是私有仓库：请求必须携带该令牌，模板包只能通过 API 资源地址下载。
+    barrier 要求各仓库的 Release 请求同时进行，串行获取会超时失败。
+    """
+
+    def __init__(self, repos, barrier=None):
+        self.repos = repos  # repo -> (version, files, token)
+        self.barrier = barrier
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        path = request.url.path
+        for repo, (version, files, token) in self.repos.items():
+            if token and request.headers.get("Authorization") != f"token {token}":
+                if path.startswith(f"/repos/{repo}/"):
+                    return httpx.Response(404)
+                continue
+            if path == f"/repos/{repo}/releases/latest":
+                if self.barrier:
+                    self.barrier.wait()
+                data = template_zip(files)
+                return httpx.Response(200, json={
+                    "tag_name": f"v{version}",
+                    "name": version,
+                    "assets": [{
+                        "name": f"sckit-cursor-{version}.zip",
+                        "url": f"https://api.github.com/repos/{repo}/releases/assets/1",
+                        "browser_download_url": f"https://github.com/{repo}/sckit-cursor-{version}.zip",
+                        "size": len(data),
+                    }],
+                })
+            if path == f"/repos/{repo}/releases/assets/1":
+                assert request.headers["Accept"] == "application/octet-stream"
+                return httpx.Response(200, content=template_zip(files))
+            if path == f"/{repo}/sckit-cursor-{version}.zip" and not token:
+                return httpx.Response(200, content=template_zip(files))
+        return httpx.Response(404)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setenv("SCKIT_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("ACME_TOKEN", "secret")
+    path = tmp_path / "project"
+    path.mkdir()
+    return path
+
+
+def serve(server):
+    session = HttpSession(sleep=lambda _: None, transport=httpx.MockTransport(server))
+    return patch("sckit_cli.get_http_session", return_value=session)
+
+
+def installed(project):
+    commands = project / ".cursor" / "commands"
+    return {p.name: p.read_text() for p in commands.iterdir()}
+
+
+SOURCES = "github:acme/private@ACME_TOKEN,github:team/public"
+
+
+def test_merges_sources_by_priority(project):
+    """并发获取两个仓库，同名模板以靠前的私有仓库为准"""
+    server = FakeGitHub({
+        "acme/private": ("1.0.0", {"sckit.a.md": "# private A", "sckit.c.md": "# C"}, "secret"),
+        "team/public": ("0.3.0", {"sckit.a.md": "# A", "sckit.b.md": "# B"}, None),
+    }, barrier=threading.Barrier(2, timeout=5))
+
+    config_obj = InstallConfig(target_path=project, editor=Editor.CURSOR, source=SOURCES)
+    with serve(server):
+        result = install_template(config_obj)
+
+    assert installed(project) == {"sckit.a.md": "# private A", "sckit.b.md": "# B", "sckit.c.md": "# C"}
+    assert result.version == "1.0.0+0.3.0"
+    assert InstallManifest.load(config_obj.manifest_path).source_version == "1.0.0+0.3.0"
+    assert "merge" in [t.name for t in result.timings]
+    # 私有仓库的模板包经 API 资源地址下载，浏览器地址需要登录
+    assert not any("github.com/acme" in str(r.url) for r in server.requests)
+    assert all(
+        r.headers.get("Authorization") != "token secret"
+        for r in server.requests if "team/public" in str(r.url)
+    )
+
+
+def test_source_without_editor_skipped(project, tmp_path):
+    """某个源没有该编辑器的模板时只使用其它源"""
+    local = tmp_path / "sckit-claude-0.1.0.zip"
+    local.write_bytes(template_zip({"sckit.x.md": "# X"}))
+    server = FakeGitHub({"team/public": ("0.3.0", {"sckit.a.md": "# A"}, None)})
+
+    with serve(server):
+        install_template(InstallConfig(
+            target_path=project, editor=Editor.CURSOR, source=f"{local},github:team/public",
+        ))
+
+    assert installed(project) == {"sckit.a.md": "# A"}
+
+
+class TestTemplateSource:
+    """测试模板源的写法"""
+
+    @pytest.mark.parametrize("spec, expected", [
+        ("github:acme/commands", TemplateSource("acme/commands")),
+        ("github:acme/commands@ACME_TOKEN", TemplateSource("acme/commands", "github", "ACME_TOKEN")),
+        ("https://mirror.example.com/latest.json", TemplateSource("https://mirror.example.com/latest.json", "url")),
+        ("./templates", TemplateSource("./templates", "local")),
+    ])
+    def test_parse(self, spec, expected):
+        assert TemplateSource.parse(spec) == expected
+
+    def test_order_kept_and_duplicates_dropped(self):
+        assert [str(s) for s in parse_sources("./b, ./a, ./b")] == ["./b", "./a"]
+
+    def test_default_repository(self):
+        assert parse_sources(None) == [TemplateSource.default()]
+
+    def test_invalid_github_source(self, tmp_path):
+        with pytest.raises(ValidationError):
+            InstallConfig(target_path=tmp_path, editor=Editor.CURSOR, source="github:acme").validate()
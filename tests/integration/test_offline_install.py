@@ -0,0 +1,193 @@
+"""
+集成测试：离线模板源
+
+测试 --source 指定本地 zip、本地目录与镜像 URL 时的安装流程
+"""
+
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from sckit_cli import (
+    app, Editor, InstallConfig, LinkMode, Release, ReleaseAsset, ValidationError,
+    install_template, install_templates,
+)
+
+from conftest import template_zip
+
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setenv("SCKIT_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "project"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture(autouse=True)
+def no_network():
+    """本地模板源不应发起任何网络请求"""
+    with patch("sckit_cli.get_http_session", side_effect=AssertionError("network used")):
+        yield
+
+
+class TestLocalSource:
+    """测试本地模板源"""
+
+    def test_local_zip(self, project, tmp_path):
+        """本地 zip：版本取自文件名"""
+        zip_path = tmp_path / "sckit-cursor-0.4.0.zip"
+        zip_path.write_bytes(template_zip())
+
+        result = install_template(InstallConfig(
+            target_path=project, editor=Editor.CURSOR, source=str(zip_path),
+        ))
+
+        assert result.version == "0.4.0"
+        assert result.files_copied == 2
+        assert (project / ".cursor" / "commands" / "sckit.a.md").read_text() == "# A"
+
+    def test_local_zip_wrong_editor(self, project, tmp_path):
+        """文件名表明是其它编辑器的模板包时报错"""
+        from sckit_cli import TemplateNotFoundError
+        zip_path = tmp_path / "sckit-cursor-0.4.0.zip"
+        zip_path.write_bytes(template_zip())
+
+        with pytest.raises(TemplateNotFoundError):
+            install_template(InstallConfig(
+                target_path=project, editor=Editor.CLAUDE, source=str(zip_path),
+            ))
+
+    def test_commands_directory_is_copied_not_moved(self, project, tmp_path):
+        """commands 形状的目录：复制到项目，源目录保持不变"""
+        source = tmp_path / "commands"
+        source.mkdir()
+        (source / "sckit.a.md").write_text("# A")
+
+        result = install_template(InstallConfig(
+            target_path=project, editor=Editor.CLAUDE, source=str(source),
+        ))
+
+        assert result.files_copied == 1
+        assert (project / ".claude" / "commands" / "sckit.a.md").read_text() == "# A"
+        assert (source / "sckit.a.md").exists()
+
+    def test_directory_of_release_assets(self, project, tmp_path):
+        """包含多个模板包的目录：每个编辑器使用各自的 zip"""
+        mirror = tmp_path / "mirror"
+        mirror.mkdir()
+        (mirror / "sckit-cursor-0.4.0.zip").write_bytes(template_zip(config_dir=".cursor"))
+        (mirror / "sckit-claude-0.4.0.zip").write_bytes(template_zip(config_dir=".claude"))
+
+        result = install_templates([
+            InstallConfig(target_path=project, editor=editor, source=str(mirror))
+            for editor in (Editor.CURSOR, Editor.CLAUDE)
+        ])
+
+        assert result.success
+        assert (project / ".cursor" / "commands" / "sckit.a.md").exists()
+        assert (project / ".claude" / "commands" / "sckit.b.md").exists()
+
+    def test_missing_source(self, project, tmp_path):
+        """模板源不存在时报验证错误"""
+        with pytest.raises(ValidationError):
+            install_template(InstallConfig(
+                target_path=project, editor=Editor.CURSOR, source=str(tmp_path / "nope"),
+            ))
+
+
+class TestMirrorSource:
+    """测试镜像 URL 模板源"""
+
+    @patch("sckit_cli.download_stream")
+    @patch("sckit_cli.get_latest_release")
+    def test_release_json_mirror(self, mock_release, mock_download, project):
+        """镜像 URL 按 Release JSON 读取，不访问 GitHub API"""
+        data = template_zip()
+        mock_release.return_value = Release(
+            tag_name="v0.4.0",
+            name="mirror",
+            assets=[ReleaseAsset(
+                name="sckit-cursor-0.4.0.zip",
+                download_url="https://mirror.local/sckit-cursor-0.4.0.zip",
+                size=len(data),
+            )],
+        )
+        mock_download.side_effect = lambda url, on_chunk, *args, **kwargs: on_chunk(data)
+
+        install_template(InstallConfig(
+            target_path=project, editor=Editor.CURSOR, use_cache=False,
+            source="https://mirror.local/releases/latest",
+        ))
+
+        assert mock_release.call_args[1]["url"] == "https://mirror.local/releases/latest"
+        assert (project / ".cursor" / "commands" / "sckit.b.md").exists()
+
+
+class TestInitSourceOption:
+    """测试 init --source"""
+
+    @patch("sckit_cli.install_template")
+    def test_source_passed_to_config(self, mock_install, tmp_path):
+        zip_path = tmp_path / "sckit-cursor-0.4.0.zip"
+
+        result = runner.invoke(app, [
+            "init", str(tmp_path), "-e", "cursor", "--source", str(zip_path),
+        ])
+
+        assert result.exit_code == 0, result.stdout
+        assert mock_install.call_args[0][0].source == str(zip_path)
+
+    def test_dry_run(self, project, tmp_path):
+        """--dry-run 显示计划后退出，不写入项目"""
+        zip_path = tmp_path / "sckit-cursor-0.4.0.zip"
+        zip_path.write_bytes(template_zip())
+
+        result = runner.invoke(app, [
+            "init", str(project), "-e", "cursor", "--source", str(zip_path), "--dry-run",
+        ])
+
+        assert result.exit_code == 0, result.stdout
+        assert "同步计划" in result.stdout
+        assert not (project / ".cursor").exists()
+
+
+class TestLinkedInstall:
+    """测试 --link 从全局模板存储安装"""
+
+    def test_projects_share_store_objects(self, project, tmp_path, monkeypatch):
+        """两个项目的模板文件是同一存储对象的硬链接"""
+        monkeypatch.setenv("SCKIT_STORE_DIR", str(tmp_path / "store"))
+        zip_path = tmp_path / "sckit-cursor-0.4.0.zip"
+        zip_path.write_bytes(template_zip())
+        other = tmp_path / "other"
+        other.mkdir()
+
+        results = [
+            install_template(InstallConfig(
+                target_path=path, editor=Editor.CURSOR, source=str(zip_path),
+                link=LinkMode.HARD,
+            ))
+            for path in (project, other)
+        ]
+
+        assert [r.files_linked for r in results] == [2, 2]
+        assert "hard" in results[0].format_summary()
+        a = project / ".cursor" / "commands" / "sckit.a.md"
+        assert a.samefile(other / ".cursor" / "commands" / "sckit.a.md")
+        assert a.stat().st_nlink == 3
+
+    @patch("sckit_cli.install_template")
+    def test_link_option(self, mock_install, tmp_path):
+        """--link 传入安装配置，未指定时使用 SCKIT_LINK 的默认值"""
+        result = runner.invoke(app, ["init", str(tmp_path), "-e", "cursor", "--link", "symlink"])
+
+        assert result.exit_code == 0, result.stdout
+        assert mock_install.call_args[0][0].link == LinkMode.SYMLINK
+
+        result = runner.invoke(app, ["init", str(tmp_path), "-e", "cursor"])
+        assert mock_install.call_args[0][0].link == LinkMode.COPY
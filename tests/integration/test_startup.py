@@ -0,0 +1,72 @@
+"""
+集成测试：启动性能
+
+导入 sckit_cli 与执行 `sckit --version` 不应加载网络/解压/进度条等重依赖，
+也不应注册信号处理器。检查 sys.modules 而不是计时，结果不受机器负载影响。
+"""
+
+import subprocess
+import sys
+
+
+HEAVY_MODULES = [
+    "httpx",
+    "zipfile",
+    "tempfile",
+    "rich.console",
+    "rich.progress",
+    "rich.prompt",
+    "rich.panel",
+]
+
+
+def run_python(code, *args):
+    return subprocess.run(
+        [sys.executable, "-c", code, *args], capture_output=True, text=True, check=True,
+    )
+
+
+def loaded_heavy_modules(code, *args):
+    """在新解释器中执行 code，返回其间新加载的重依赖"""
+    # 部分标准库模块可能已被解释器启动过程（site）加载，只检查新增的
+    result = run_python(
+        "import sys; before = set(sys.modules)\n"
+        f"try:\n    exec({code!r})\nexcept SystemExit:\n    pass\n"
+        f"print('|' + ','.join(m for m in {HEAVY_MODULES!r} "
+        "if m in sys.modules and m not in before))",
+        *args,
+    )
+    return result.stdout.rpartition("|")[2].strip()
+
+
+class TestStartup:
+    """测试启动时的副作用"""
+
+    def test_import_is_light(self):
+        """导入时不加载重依赖"""
+        assert loaded_heavy_modules("import sckit_cli") == ""
+
+    def test_import_installs_no_signal_handlers(self):
+        """导入时不接管 SIGINT"""
+        result = run_python(
+            "import signal; before = signal.getsignal(signal.SIGINT); "
+            "import sckit_cli; print(signal.getsignal(signal.SIGINT) is before)"
+        )
+        assert result.stdout.strip() == "True"
+
+    def test_interrupt_handlers_restored(self):
+        """安装结束后恢复原来的信号处理器"""
+        import signal
+        from sckit_cli import interrupt_handlers, signal_handler
+
+        before = signal.getsignal(signal.SIGINT)
+        with interrupt_handlers():
+            assert signal.getsignal(signal.SIGINT) is signal_handler
+        assert signal.getsignal(signal.SIGINT) is before
+
+    def test_version_is_light(self):
+        """`sckit --version` 只输出版本，不加载重依赖"""
+        cli = "import sys; from sckit_cli import cli; sys.argv[0] = 'sckit'; cli()"
+        assert "sckit version" in run_python(cli, "--version").stdout
+
+        assert loaded_heavy_modules(cli, "--version") == ""
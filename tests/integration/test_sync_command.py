@@ -0,0 +1,162 @@
+"""
+集成测试：sckit sync
+
+测试登记项目、后台同步循环的条件请求与随机间隔，以及新版本发布后的增量更新
+"""
+
+import json
+from dataclasses import replace
+from unittest.mock import patch
+
+import httpx
+import pytest
+from typer.testing import CliRunner
+
+from sckit_cli import (
+    Editor, InstallConfig, app, config, install_template, next_poll_delay, watch_registered,
+)
+from sckit_cli.utils.http import HttpSession
+from sckit_cli.utils.projects import ProjectRegistry
+
+from conftest import template_zip
+
+
+class FakeGitHub:
+    """latest 接口按 ETag 返回 304；模板包按版本提供"""
+
+    def __init__(self):
+        self.version = None
+        self.zips = {}
+        self.requests = []
+
+    def publish(self, version, files):
+        self.version = version
+        self.zips[f"https://example.com/sckit-cursor-{version}.zip"] = template_zip(files)
+
+    def latest(self):
+        url = f"https://example.com/sckit-cursor-{self.version}.zip"
+        return {
+            "tag_name": f"v{self.version}",
+            "name": self.version,
+            "assets": [{
+                "name": f"sckit-cursor-{self.version}.zip",
+                "browser_download_url": url,
+                "size": len(self.zips[url]),
+            }],
+        }
+
+    def __call__(self, request):
+        self.requests.append(request)
+        url = str(request.url)
+        if url in self.zips:
+            return httpx.Response(200, content=self.zips[url])
+        etag = f'"{self.version}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        return httpx.Response(200, json=self.latest(), headers={"ETag": etag})
+
+    def release_checks(self):
+        return [r.headers.get("If-None-Match") for r in self.requests if "api.github" in str(r.url)]
+
+
+@pytest.fixture
+def github(tmp_path, monkeypatch):
+    monkeypatch.setenv("SCKIT_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("SCKIT_PROJECTS_FILE", str(tmp_path / "projects.json"))
+    server = FakeGitHub()
+    server.publish("0.1.0", {"sckit.a.md": "# A"})
+    session = HttpSession(sleep=lambda _: None, transport=httpx.MockTransport(server))
+    with patch("sckit_cli.get_http_session", return_value=session):
+        yield server
+
+
+@pytest.fixture
+def project(tmp_path, github):
+    path = tmp_path / "project"
+    path.mkdir()
+    install_template(InstallConfig(target_path=path, editor=Editor.CURSOR))
+    registry = ProjectRegistry.load()
+    registry.add(path)
+    registry.save()
+    return path
+
+
+def test_watch_updates_when_new_tag_appears(github, project):
+    """没有新版本时每次检查都是条件请求；发布后更新登记项目"""
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) == 2:
+            github.publish("0.2.0", {"sckit.a.md": "# A", "sckit.b.md": "# B"})
+
+    github.requests.clear()
+    watch_registered(600, sleep=sleep, max_polls=3)
+
+    commands = project / ".cursor" / "commands"
+    assert sorted(p.name for p in commands.iterdir()) == ["sckit.a.md", "sckit.b.md"]
+    # 每次检查都携带 ETag 重新验证，前两次得到 304
+    assert github.release_checks() == ['"0.1.0"'] * 3
+    assert all(600 * 0.8 <= s <= 600 * 1.2 for s in sleeps)
+    assert ProjectRegistry.load().last_tag == "v0.2.0"
+
+
+def test_next_poll_delay_is_jittered():
+    delays = {next_poll_delay(100, 0.2) for _ in range(20)}
+
+    assert len(delays) > 1
+    assert all(80 <= d <= 120 for d in delays)
+
+
+class TestSyncCommand:
+    """测试 sckit sync 命令"""
+
+    def test_add_and_list(self, github, project, tmp_path):
+        other = tmp_path / "other"
+        other.mkdir()
+
+        result = CliRunner().invoke(app, ["sync", "add", str(other)])
+        assert result.exit_code == 0
+        assert "尚未安装模板" in result.stdout
+
+        result = CliRunner().invoke(app, ["sync", "list"])
+        assert "cursor v0.1.0" in result.stdout
+        assert json.loads((tmp_path / "projects.json").read_text())["projects"] == [
+            str(project), str(other),
+        ]
+
+    def test_sync_once(self, github, project):
+        github.publish("0.2.0", {"sckit.a.md": "# A2"})
+
+        result = CliRunner().invoke(app, ["sync"])
+
+        assert result.exit_code == 0, result.stdout
+        assert (project / ".cursor" / "commands" / "sckit.a.md").read_text() == "# A2"
+
+        result = CliRunner().invoke(app, ["sync"])
+        assert "已是最新 (v0.2.0)" in result.stdout
+
+    def test_keeps_local_edits_in_background(self, github, project):
+        """后台同步不询问冲突"""
+        edited = project / ".cursor" / "commands" / "sckit.a.md"
+        edited.write_text("mine")
+        github.publish("0.2.0", {"sckit.a.md": "# A2"})
+
+        with patch("sckit_cli.sys.stdin.isatty", return_value=True):
+            watch_registered(600, sleep=lambda _: None, max_polls=1)
+
+        assert edited.read_text() == "mine"
+
+    def test_no_projects(self, github):
+        result = CliRunner().invoke(app, ["sync"])
+
+        assert result.exit_code == 1
+        assert "sckit sync add" in result.stdout
+
+
+def test_local_source_rejected(github, project):
+    """本地模板源没有可检查的新版本"""
+    with patch("sckit_cli.config", replace(config, TEMPLATE_SOURCE="/tmp/templates")):
+        result = CliRunner().invoke(app, ["sync"])
+
+    assert result.exit_code == 1
@@ -0,0 +1,268 @@
+"""
+单元测试：异步安装引擎
+
+使用 httpx.MockTransport 模拟 GitHub API 与模板包下载
+"""
+
+import asyncio
+import threading
+import time
+from collections import Counter
+from unittest.mock import patch
+
+import httpx
+
+from sckit_cli import Editor, InstallConfig, config, sync_project
+from sckit_cli.utils.async_engine import AsyncInstaller, install_templates_async
+from sckit_cli.utils.cache import ReleaseCache
+from sckit_cli.utils.manifest import InstallManifest
+
+from conftest import template_zip
+
+
+ZIPS = {editor: template_zip(config_dir=editor.config_dir) for editor in Editor}
+
+RELEASE_JSON = {
+    "tag_name": "v0.5.0",
+    "name": "Release 0.5.0",
+    "assets": [
+        {
+            "name": f"sckit-{editor.value}-0.5.0.zip",
+            "browser_download_url": f"https://example.com/sckit-{editor.value}-0.5.0.zip",
+            "size": len(data),
+        }
+        for editor, data in ZIPS.items()
+    ],
+}
+
+
+class FakeGitHub:
+    """记录请求次数的模拟服务器"""
+
+    def __init__(self, missing_assets=False):
+        self.requests = Counter()
+        self.missing_assets = missing_assets
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        self.requests[url] += 1
+        if url == config.release_api_url:
+            return httpx.Response(200, json=RELEASE_JSON)
+        for editor, data in ZIPS.items():
+            if url.endswith(f"sckit-{editor.value}-0.5.0.zip") and not self.missing_assets:
+                return httpx.Response(200, content=data)
+        return httpx.Response(404)
+
+    @property
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handler)
+
+
+def make_projects(tmp_path, count):
+    projects = []
+    for i in range(count):
+        project = tmp_path / f"pkg{i}"
+        project.mkdir()
+        projects.append(project)
+    return projects
+
+
+class TestAsyncInstaller:
+    """测试 AsyncInstaller"""
+
+    def test_many_projects_share_one_release_and_download(self, tmp_path):
+        """所有项目共用一次 Release 查询，每个编辑器的模板包只下载一次"""
+        server = FakeGitHub()
+        projects = make_projects(tmp_path, 10)
+        configs = [
+            InstallConfig(target_path=p, editor=editor)
+            for p in projects for editor in Editor
+        ]
+        progress, finished = [], []
+
+        batch = asyncio.run(install_templates_async(
+            configs,
+            transport=server.transport,
+            progress_callback=lambda editor, p: progress.append(editor),
+            result_callback=finished.append,
+        ))
+
+        assert batch.success
+        assert batch.files_copied == 40
+        assert len(finished) == 20
+        assert set(progress) == set(Editor)
+        assert server.requests[config.release_api_url] == 1
+        assert all(count == 1 for count in server.requests.values())
+        for project in projects:
+            assert (project / ".cursor" / "commands" / "sckit.a.md").read_text() == "# A"
+            assert (project / ".claude" / "commands" / "sckit.b.md").read_text() == "# B"
+
+    def test_concurrency_limit(self, tmp_path):
+        """同时进行的安装数不超过 max_concurrency"""
+        server = FakeGitHub()
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def slow_sync(*args, **kwargs):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            try:
+                return sync_project(*args, **kwargs)
+            finally:
+                with lock:
+                    state["active"] -= 1
+
+        configs = [
+            InstallConfig(target_path=p, editor=Editor.CURSOR)
+            for p in make_projects(tmp_path, 8)
+        ]
+        with patch("sckit_cli.utils.async_engine.sync_project", side_effect=slow_sync):
+            batch = asyncio.run(install_templates_async(
+                configs, transport=server.transport, max_concurrency=2, max_workers=8,
+            ))
+
+        assert batch.success
+        assert state["peak"] == 2
+
+    def test_async_conflict_callback(self, tmp_path):
+        """冲突回调可以是协程函数"""
+        server = FakeGitHub()
+        project = make_projects(tmp_path, 1)[0]
+        target = project / ".cursor" / "commands" / "sckit.a.md"
+        target.parent.mkdir(parents=True)
+        target.write_text("local edit")
+        asked = []
+
+        async def overwrite(paths):
+            asked.append(paths)
+            await asyncio.sleep(0)
+            return paths
+
+        async def run():
+            async with AsyncInstaller(transport=server.transport, conflict_callback=overwrite) as installer:
+                return await installer.install(InstallConfig(target_path=project, editor=Editor.CURSOR))
+
+        result = asyncio.run(run())
+
+        assert asked == [[target]]
+        assert result.files_overwritten == 1
+        assert target.read_text() == "# A"
+
+    def test_dry_run_writes_nothing(self, tmp_path):
+        """dry_run 只返回计划，不写入文件与安装清单"""
+        server = FakeGitHub()
+        project = make_projects(tmp_path, 1)[0]
+        config_obj = InstallConfig(target_path=project, editor=Editor.CURSOR, dry_run=True)
+
+        batch = asyncio.run(install_templates_async([config_obj], transport=server.transport))
+
+        result = batch.results[0]
+        assert result.success
+        assert [f.path for f in result.plan.files] == ["sckit.a.md", "sckit.b.md"]
+        assert result.files_copied == 0
+        assert list(project.iterdir()) == []
+
+    def test_failures_reported_per_project(self, tmp_path):
+        """下载失败时返回失败结果而不是抛出异常"""
+        server = FakeGitHub(missing_assets=True)
+        configs = [
+            InstallConfig(target_path=p, editor=Editor.CURSOR)
+            for p in make_projects(tmp_path, 3)
+        ]
+
+        batch = asyncio.run(install_templates_async(configs, transport=server.transport, retries=0))
+
+        assert not batch.success
+        assert len(batch.failed) == 3
+        assert all("下载失败" in r.error for r in batch.failed)
+
+    def test_failed_release_fetch_retried(self, tmp_path):
+        """一次失败的 Release 查询不会让之后的安装沿用同一个错误"""
+        server = FakeGitHub()
+        failures = [httpx.Response(500)]
+
+        def handler(request):
+            if failures and str(request.url) == config.release_api_url:
+                return failures.pop()
+            return server.handler(request)
+
+        project = make_projects(tmp_path, 1)[0]
+        config_obj = InstallConfig(target_path=project, editor=Editor.CURSOR, use_cache=False)
+
+        async def run():
+            async with AsyncInstaller(transport=httpx.MockTransport(handler), retries=0) as installer:
+                first = await installer.install_many([config_obj])
+                second = await installer.install_many([config_obj])
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert not first.success
+        assert second.success
+        assert (project / ".cursor" / "commands" / "sckit.a.md").read_text() == "# A"
+
+    def test_pinned_versions_staged_separately(self, tmp_path):
+        """同一编辑器固定不同版本时各自暂存对应版本的模板（版本经由异步客户端查找）"""
+        zips = {version: template_zip({"sckit.a.md": f"# {version}"}) for version in ("0.4.0", "0.5.0")}
+        index = [
+            {"tag_name": f"v{version}", "name": version, "assets": [{
+                "name": f"sckit-cursor-{version}.zip",
+                "browser_download_url": f"https://example.com/{version}.zip",
+                "size": len(data),
+            }]}
+            for version, data in zips.items()
+        ]
+
+        def handler(request):
+            if str(request.url).startswith(config.releases_api_url):
+                return httpx.Response(200, json=index)
+            return httpx.Response(200, content=zips[request.url.path.strip("/")[:-4]])
+
+        configs = [
+            InstallConfig(target_path=p, editor=Editor.CURSOR, version=v, use_cache=False)
+            for p, v in zip(make_projects(tmp_path, 2), ("0.4.0", "0.5.0"))
+        ]
+        with patch("sckit_cli.get_http_session", side_effect=AssertionError("blocking client")):
+            batch = asyncio.run(install_templates_async(
+                configs, transport=httpx.MockTransport(handler),
+            ))
+
+        assert batch.success
+        for config_obj in configs:
+            target = config_obj.commands_dir / "sckit.a.md"
+            assert target.read_text() == f"# {config_obj.version}"
+            assert InstallManifest.load(config_obj.manifest_path).source_version == config_obj.version
+
+    def test_resumes_cached_partial_download(self, tmp_path):
+        """缓存中未完成的下载用 Range / If-Range 续传，完成后移入缓存"""
+        data = ZIPS[Editor.CURSOR]
+        url = RELEASE_JSON["assets"][0]["browser_download_url"]
+        cache = ReleaseCache(tmp_path / "cache")
+        cache.lock_partial(url)
+        cache.partial_path(url).write_bytes(data[:100])
+        cache.set_partial_validator(url, '"v1"')
+        cache.unlock_partial(url)
+        ranges = []
+
+        def handler(request):
+            if str(request.url) == config.release_api_url:
+                return httpx.Response(200, json=RELEASE_JSON)
+            ranges.append((request.headers.get("Range"), request.headers.get("If-Range")))
+            return httpx.Response(206, content=data[100:], headers={
+                "Content-Range": f"bytes 100-{len(data) - 1}/{len(data)}", "ETag": '"v1"',
+            })
+
+        project = make_projects(tmp_path, 1)[0]
+        batch = asyncio.run(install_templates_async(
+            [InstallConfig(target_path=project, editor=Editor.CURSOR)],
+            transport=httpx.MockTransport(handler), cache=cache,
+        ))
+
+        assert batch.success
+        assert ranges == [("bytes=100-", '"v1"')]
+        assert (project / ".cursor" / "commands" / "sckit.a.md").read_text() == "# A"
+        assert cache.get_asset(url) is not None
+        assert not cache.partial_path(url).exists()
+        assert not cache.partial_lock_path(url).exists()
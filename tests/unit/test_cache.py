@@ -0,0 +1,229 @@
+"""
+单元测试：本地缓存
+
+测试 sckit_cli.utils.cache 模块以及 get_latest_release() 的缓存行为
+"""
+
+import threading
+import time
+from unittest.mock import patch, MagicMock
+
+import httpx
+import pytest
+
+from sckit_cli import get_latest_release, config, NetworkError, wait_for_refreshes
+from sckit_cli.utils.cache import ReleaseCache, file_sha256
+
+
+RELEASE_DATA = {
+    "tag_name": "v0.3.0",
+    "name": "Release 0.3.0",
+    "assets": [
+        {
+            "name": "sckit-cursor-0.3.0.zip",
+            "browser_download_url": "https://example.com/cursor.zip",
+            "size": 4,
+        }
+    ],
+}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """提供临时目录中的缓存实例"""
+    return ReleaseCache(root=tmp_path / "cache", ttl=60, max_size=1024)
+
+
+@pytest.fixture
+def mock_get():
+    """替换共享 HTTP 会话的 get()"""
+    with patch("sckit_cli.get_http_session") as mock_session:
+        yield mock_session.return_value.get
+
+
+def make_response(status_code, json_data=None, headers=None):
+    """构造模拟的 httpx 响应"""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = json_data
+    if status_code >= 400:
+        response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "error", request=MagicMock(), response=response
+        )
+    return response
+
+
+class TestReleaseCache:
+    """测试 ReleaseCache"""
+
+    def test_release_roundtrip(self, cache):
+        """保存后能读回数据与校验器"""
+        cache.put_release("https://api/x", RELEASE_DATA, etag='"abc"', last_modified="Mon")
+        cached = cache.get_release("https://api/x")
+
+        assert cached is not None
+        assert cached.data == RELEASE_DATA
+        assert cached.is_fresh(60)
+        assert cached.conditional_headers() == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Mon",
+        }
+
+    def test_missing_release(self, cache):
+        """未缓存时返回 None"""
+        assert cache.get_release("https://api/missing") is None
+
+    def test_asset_roundtrip(self, cache, tmp_path):
+        """模板包按内容摘要存储"""
+        source = tmp_path / "a.zip"
+        source.write_bytes(b"data")
+        digest = file_sha256(source)
+
+        stored = cache.put_asset("https://dl/a.zip", source)
+
+        assert stored.name == f"{digest}.zip"
+        assert cache.get_asset("https://dl/a.zip") == stored
+        assert cache.get_asset("https://dl/a.zip", expected_size=4) == stored
+        assert cache.get_asset("https://dl/a.zip", expected_size=5) is None
+
+    def test_asset_lookup_by_digest(self, cache, tmp_path):
+        """已知摘要时按摘要查找：其它地址同样命中，地址下内容变化时不命中"""
+        source = tmp_path / "a.zip"
+        source.write_bytes(b"data")
+        digest = file_sha256(source)
+        stored = cache.put_asset("https://dl/a.zip", source, digest)
+
+        assert cache.get_asset("https://mirror/a.zip", sha256=digest) == stored
+        assert cache.get_asset("https://dl/a.zip", sha256="0" * 64) is None
+
+    def test_prune_evicts_least_recently_used(self, cache, tmp_path):
+        """超出上限时淘汰最久未使用的模板包"""
+        cache.max_size = 10 * 1024
+        for name in ("old", "new"):
+            source = tmp_path / f"{name}.zip"
+            source.write_bytes(name.encode() * 200)
+            cache.put_asset(f"https://dl/{name}.zip", source)
+            time.sleep(0.01)
+
+        freed = cache.prune(max_size=700)
+
+        assert freed == 600
+        assert cache.get_asset("https://dl/old.zip") is None
+        assert cache.get_asset("https://dl/new.zip") is not None
+
+    def test_stats_hit_rate(self, cache):
+        """统计命中率"""
+        cache.record(hit=True)
+        cache.record(hit=True)
+        cache.record(hit=False)
+
+        stats = cache.stats()
+        assert stats.hits == 2
+        assert stats.misses == 1
+        assert round(stats.hit_rate) == 67
+
+    def test_stats_from_concurrent_processes_add_up(self, cache):
+        """多个进程的统计各自追加，不重写索引，也不互相覆盖"""
+        cache.root.mkdir(parents=True)
+        other = ReleaseCache(root=cache.root)
+        cache.record(hit=True)
+        other.record(hit=False)
+        other.record(hit=True)
+
+        assert not cache.index_path.exists()
+        cache.flush_stats()
+        other.flush_stats()
+
+        stats = ReleaseCache(root=cache.root).stats()
+        assert (stats.hits, stats.misses) == (2, 1)
+        assert cache.stats_path.read_text().splitlines() == ["1 0", "1 1"]
+
+    def test_clear(self, cache, tmp_path):
+        """清空缓存"""
+        source = tmp_path / "a.zip"
+        source.write_bytes(b"data")
+        cache.put_asset("https://dl/a.zip", source)
+        cache.put_release("https://api/x", RELEASE_DATA)
+
+        cache.clear()
+
+        stats = cache.stats()
+        assert stats.assets == 0
+        assert stats.releases == 0
+
+
+class TestGetLatestReleaseWithCache:
+    """测试 get_latest_release() 的缓存行为"""
+
+    def test_fresh_cache_skips_network(self, mock_get, cache):
+        """TTL 内不发请求"""
+        cache.put_release(config.release_api_url, RELEASE_DATA, etag='"abc"')
+
+        release = get_latest_release(cache=cache)
+
+        assert release.version == "0.3.0"
+        assert not mock_get.called
+
+    def test_stale_cache_revalidates(self, mock_get, cache):
+        """过期后发送条件请求，304 时复用缓存"""
+        cache.ttl = 0
+        cache.put_release(config.release_api_url, RELEASE_DATA, etag='"abc"')
+        mock_get.return_value = make_response(304)
+
+        release = get_latest_release(cache=cache)
+
+        assert release.version == "0.3.0"
+        headers = mock_get.call_args[1]["headers"]
+        assert headers["If-None-Match"] == '"abc"'
+
+    def test_stale_served_while_revalidating(self, mock_get, cache):
+        """过期不久时立即返回缓存，后台重新验证后更新缓存"""
+        cache.ttl = 0
+        cache.stale_ttl = 3600
+        cache.put_release(config.release_api_url, RELEASE_DATA, etag='"abc"')
+        released = threading.Event()
+
+        def respond(*args, **kwargs):
+            released.wait(5)
+            return make_response(200, {**RELEASE_DATA, "tag_name": "v0.4.0"}, {"ETag": '"new"'})
+
+        mock_get.side_effect = respond
+
+        release = get_latest_release(cache=cache)
+        assert release.version == "0.3.0"
+        released.set()
+        wait_for_refreshes()
+
+        assert mock_get.call_args[1]["headers"]["If-None-Match"] == '"abc"'
+        assert cache.get_release(config.release_api_url).etag == '"new"'
+        assert cache.stats().misses == 0  # 后台刷新不计入统计
+        assert get_latest_release(cache=cache).version == "0.4.0"
+        wait_for_refreshes()
+
+    def test_miss_stores_validators(self, mock_get, cache):
+        """未命中时保存响应及 ETag"""
+        mock_get.return_value = make_response(200, RELEASE_DATA, {"ETag": '"new"'})
+
+        get_latest_release(cache=cache)
+
+        cached = cache.get_release(config.release_api_url)
+        assert cached.etag == '"new"'
+        assert cache.stats().misses == 1
+
+    def test_network_error_serves_stale(self, mock_get, cache):
+        """网络失败时退回过期缓存"""
+        cache.ttl = 0
+        cache.put_release(config.release_api_url, RELEASE_DATA)
+        mock_get.side_effect = httpx.ConnectError("boom")
+
+        release = get_latest_release(cache=cache)
+
+        assert release.version == "0.3.0"
+
+    def test_network_error_without_cache_raises(self, mock_get, cache):
+        """没有缓存时仍然报错"""
+        mock_get.side_effect = httpx.ConnectError("boom")
+
+        with pytest.raises(NetworkError):
+            get_latest_release(cache=cache)
@@ -0,0 +1,291 @@
+"""
+单元测试：可续传下载
+
+测试 download_stream() / download_file() 的 Range 续传、跨进程的未完成下载，
+以及下载过程中的 SHA-256 校验
+"""
+
+import hashlib
+import zipfile
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from sckit_cli import (
+    download_file, stream_template_members, parse_checksums, DownloadError,
+    Editor, FileSystemError, IntegrityError, Release, ReleaseAsset,
+)
+from sckit_cli.utils.cache import ReleaseCache
+from sckit_cli.utils.http import HttpSession
+
+from conftest import template_zip
+
+
+URL = "https://example.com/sckit-cursor-0.3.0.zip"
+ETAG = '"v1"'
+
+
+PAYLOAD = template_zip(
+    {"sckit.a.md": "# A\n" * 5000, "sckit.b.md": "# B\n" * 5000}, compression=zipfile.ZIP_STORED,
+)
+PAYLOAD_SHA256 = hashlib.sha256(PAYLOAD).hexdigest()
+
+
+class BrokenStream(httpx.SyncByteStream):
+    """发送部分数据后断开"""
+
+    def __init__(self, data):
+        self.data = data
+
+    def __iter__(self):
+        yield self.data
+        raise httpx.ReadError("connection reset")
+
+
+class TrickleStream(httpx.SyncByteStream):
+    """按 1KB 小块逐次发送"""
+
+    def __init__(self, data):
+        self.data = data
+
+    def __iter__(self):
+        for i in range(0, len(self.data), 1024):
+            yield self.data[i:i + 1024]
+
+
+class FakeServer:
+    """支持 Range / If-Range 的模拟下载服务器"""
+
+    def __init__(self, data, fail_first_at=None, ranges=True):
+        self.data = data
+        self.fail_first_at = fail_first_at
+        self.ranges = ranges
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        headers = {"ETag": ETAG}
+        range_header = request.headers.get("Range")
+        if_range = request.headers.get("If-Range")
+
+        if range_header and self.ranges and if_range in (None, ETAG):
+            start = int(range_header.split("=")[1].rstrip("-"))
+            headers["Content-Range"] = f"bytes {start}-{len(self.data) - 1}/{len(self.data)}"
+            return httpx.Response(206, headers=headers, content=self.data[start:])
+
+        if self.fail_first_at is not None and len(self.requests) == 1:
+            headers["Content-Length"] = str(len(self.data))
+            return httpx.Response(
+                200, headers=headers, stream=BrokenStream(self.data[:self.fail_first_at])
+            )
+        return httpx.Response(200, headers=headers, content=self.data)
+
+
+@pytest.fixture
+def serve():
+    """用模拟服务器替换共享 HTTP 会话"""
+    def install(server):
+        session = HttpSession(sleep=lambda _: None, transport=httpx.MockTransport(server))
+        patcher = patch("sckit_cli.get_http_session", return_value=session)
+        patcher.start()
+        return server
+    yield install
+    patch.stopall()
+
+
+class TestDownloadResume:
+    """测试同一进程内的续传"""
+
+    def test_resumes_after_connection_reset(self, serve, tmp_path):
+        """连接中断后从已接收位置续传（偏移为下载块大小的整数倍）"""
+        server = serve(FakeServer(PAYLOAD, fail_first_at=16384))
+        dest = tmp_path / "a.zip"
+
+        download_file(URL, dest)
+
+        assert dest.read_bytes() == PAYLOAD
+        assert len(server.requests) == 2
+        assert server.requests[1].headers["Range"] == "bytes=16384-"
+        assert server.requests[1].headers["If-Range"] == ETAG
+
+    def test_restarts_when_range_unsupported(self, serve, tmp_path):
+        """服务器忽略 Range 时从头下载"""
+        serve(FakeServer(PAYLOAD, fail_first_at=16384, ranges=False))
+        dest = tmp_path / "a.zip"
+
+        download_file(URL, dest)
+
+        assert dest.read_bytes() == PAYLOAD
+
+    def test_gives_up_after_retries(self, serve, tmp_path):
+        """持续失败时报错"""
+        class AlwaysBroken(FakeServer):
+            def __call__(self, request):
+                self.requests.append(request)
+                return httpx.Response(200, stream=BrokenStream(b"x"))
+
+        serve(AlwaysBroken(PAYLOAD))
+
+        with pytest.raises(DownloadError):
+            download_file(URL, tmp_path / "a.zip")
+
+
+class TestPersistedPartial:
+    """测试跨进程的未完成下载"""
+
+    def test_resumes_from_cached_partial(self, serve, tmp_path):
+        """回放缓存中的已有数据，只请求剩余部分"""
+        server = serve(FakeServer(PAYLOAD))
+        cache = ReleaseCache(root=tmp_path / "cache")
+        cache.partial_dir.mkdir(parents=True)
+        cache.partial_path(URL).write_bytes(PAYLOAD[:1500])
+        cache.set_partial_validator(URL, ETAG)
+        staging = tmp_path / "staging"
+        asset = ReleaseAsset(name="sckit-cursor-0.3.0.zip", download_url=URL, size=len(PAYLOAD))
+
+        stream_template_members(asset, staging, Editor.CURSOR, cache)
+
+        assert server.requests[0].headers["Range"] == "bytes=1500-"
+        assert (staging / ".cursor" / "commands" / "sckit.b.md").read_text() == "# B\n" * 5000
+        assert cache.get_asset(URL).read_bytes() == PAYLOAD
+        assert not cache.partial_path(URL).exists()
+        assert not cache.partial_lock_path(URL).exists()
+
+    def test_interrupted_download_is_kept(self, serve, tmp_path):
+        """下载失败时保留未完成的数据和校验器"""
+        class DiesAfterFirst(FakeServer):
+            def __call__(self, request):
+                self.requests.append(request)
+                return httpx.Response(
+                    200, headers={"ETag": ETAG}, stream=BrokenStream(self.data[:16384])
+                )
+
+        serve(DiesAfterFirst(PAYLOAD))
+        cache = ReleaseCache(root=tmp_path / "cache")
+        asset = ReleaseAsset(name="sckit-cursor-0.3.0.zip", download_url=URL, size=len(PAYLOAD))
+
+        with pytest.raises(DownloadError):
+            stream_template_members(asset, tmp_path / "staging", Editor.CURSOR, cache)
+
+        partial = cache.get_partial(URL)
+        assert partial.offset > 0
+        assert partial.validator == ETAG
+        assert cache.lock_partial(URL)
+
+    def test_corrupt_zip_releases_lock(self, serve, tmp_path):
+        """ZIP 损坏时丢弃未完成的数据并释放下载锁"""
+        corrupt = b"NOTAZIP!" * 1024
+        serve(FakeServer(corrupt))
+        cache = ReleaseCache(root=tmp_path / "cache")
+        asset = ReleaseAsset(name="sckit-cursor-0.3.0.zip", download_url=URL, size=len(corrupt))
+
+        with pytest.raises(FileSystemError):
+            stream_template_members(asset, tmp_path / "staging", Editor.CURSOR, cache)
+
+        assert not cache.partial_path(URL).exists()
+        assert not cache.partial_lock_path(URL).exists()
+
+
+class TestDownloadLoop:
+    """测试分块、进度节流与预分配"""
+
+    def test_progress_is_throttled(self, serve, tmp_path):
+        """进度回调按间隔节流，结束时总会报告最终进度"""
+        serve(lambda request: httpx.Response(
+            200,
+            headers={"Content-Length": str(len(PAYLOAD))},
+            stream=TrickleStream(PAYLOAD),
+        ))
+        reports = []
+
+        with patch("sckit_cli.config") as mock_config:
+            mock_config.REQUEST_TIMEOUT = 10.0
+            mock_config.HTTP_RETRIES = 3
+            mock_config.DOWNLOAD_CHUNK_SIZE = 1024
+            mock_config.DOWNLOAD_MAX_CHUNK_SIZE = 1024
+            mock_config.PROGRESS_INTERVAL = 3600
+            mock_config.MAX_TEMPLATE_SIZE = 10 * 1024 * 1024
+            download_file(URL, tmp_path / "a.zip", reports.append)
+
+        assert len(reports) == 2  # 第一次回调 + 结束时的回调
+        assert reports[-1].downloaded == len(PAYLOAD)
+
+    def test_preallocated_file_has_exact_size(self, serve, tmp_path):
+        """按 content-length 预分配后，最终文件大小与内容一致"""
+        serve(FakeServer(PAYLOAD))
+        dest = tmp_path / "a.zip"
+
+        download_file(URL, dest)
+
+        assert dest.read_bytes() == PAYLOAD
+
+
+class TestIntegrity:
+    """测试下载过程中的 SHA-256 校验"""
+
+    def asset(self, sha256):
+        return ReleaseAsset(
+            name="sckit-cursor-0.3.0.zip", download_url=URL, size=len(PAYLOAD), sha256=sha256,
+        )
+
+    def test_download_file_returns_digest(self, serve, tmp_path):
+        serve(FakeServer(PAYLOAD))
+
+        assert download_file(URL, tmp_path / "a.zip", sha256=PAYLOAD_SHA256) == PAYLOAD_SHA256
+
+    def test_download_file_rejects_mismatch(self, serve, tmp_path):
+        """摘要不符时删除文件"""
+        serve(FakeServer(PAYLOAD))
+        dest = tmp_path / "a.zip"
+
+        with pytest.raises(IntegrityError):
+            download_file(URL, dest, sha256="0" * 64)
+
+        assert not dest.exists()
+
+    def test_resumed_download_hashes_replayed_data(self, serve, tmp_path):
+        """续传时已有数据计入摘要，模板包以发布的摘要为键进入缓存"""
+        serve(FakeServer(PAYLOAD))
+        cache = ReleaseCache(root=tmp_path / "cache")
+        cache.partial_dir.mkdir(parents=True)
+        cache.partial_path(URL).write_bytes(PAYLOAD[:1500])
+        cache.set_partial_validator(URL, ETAG)
+
+        stream_template_members(self.asset(PAYLOAD_SHA256), tmp_path / "staging", Editor.CURSOR, cache)
+
+        mirror = "https://mirror.example.com/sckit-cursor-0.3.0.zip"
+        assert cache.get_asset(mirror, sha256=PAYLOAD_SHA256).read_bytes() == PAYLOAD
+
+    def test_stream_rejects_mismatch(self, serve, tmp_path):
+        """摘要不符时不缓存模板包，也不保留未完成的数据"""
+        serve(FakeServer(PAYLOAD))
+        cache = ReleaseCache(root=tmp_path / "cache")
+
+        with pytest.raises(IntegrityError):
+            stream_template_members(self.asset("0" * 64), tmp_path / "staging", Editor.CURSOR, cache)
+
+        assert cache.get_asset(URL) is None
+        assert cache.get_partial(URL).offset == 0
+        assert cache.lock_partial(URL)
+
+
+def test_parse_checksums():
+    text = f"{PAYLOAD_SHA256}  sckit-cursor-0.3.0.zip\n{'A' * 64} *SHA256SUMS.sig\nbogus line\n"
+
+    assert parse_checksums(text) == {
+        "sckit-cursor-0.3.0.zip": PAYLOAD_SHA256,
+        "SHA256SUMS.sig": "a" * 64,
+    }
+
+
+def test_api_digest_is_used():
+    """GitHub API 资源的 digest 字段直接作为摘要"""
+    release = Release.from_api_response({"tag_name": "v0.3.0", "assets": [{
+        "name": "sckit-cursor-0.3.0.zip",
+        "browser_download_url": URL,
+        "size": 1,
+        "digest": f"sha256:{PAYLOAD_SHA256}",
+    }]})
+
+    assert release.get_template_asset(Editor.CURSOR).sha256 == PAYLOAD_SHA256
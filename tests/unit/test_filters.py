@@ -0,0 +1,136 @@
+"""
+单元测试：模板筛选
+
+测试 sckit_cli.utils.filters 模块，以及按筛选条件从 zip 中央目录解压、生成同步计划
+"""
+
+import zipfile
+
+import pytest
+
+from sckit_cli import Editor, ValidationError, extract_template_members
+from sckit_cli.utils.filters import TemplateFilter, parse_tags, split_patterns
+from sckit_cli.utils.manifest import InstallManifest, ManifestEntry
+from sckit_cli.utils.sync import plan_template_sync
+
+
+def frontmatter(tags_line, body="正文"):
+    return f"---\nname: x\n{tags_line}\n---\n\n{body}\n".encode("utf-8")
+
+
+@pytest.mark.parametrize("tags_line", [
+    "tags: [review, Git]",
+    "tags: review, git",
+    "tags:\n  - review\n  - 'git'",
+])
+def test_parse_tags(tags_line):
+    assert parse_tags(frontmatter(tags_line)) == {"review", "git"}
+
+
+def test_parse_tags_without_frontmatter():
+    assert parse_tags(b"# tags: review") == frozenset()
+
+
+def test_split_patterns():
+    assert split_patterns(["a, B", "b", " ", "tag:x"]) == ("a", "b", "tag:x")
+
+
+class TestTemplateFilter:
+    """测试 TemplateFilter.matches()"""
+
+    @pytest.mark.parametrize("pattern", [
+        "sckit.code-reviewer", "sckit.code-reviewer.md", "sckit.code-*", "*reviewer*",
+    ])
+    def test_only_globs(self, pattern):
+        template_filter = TemplateFilter.from_patterns(only=[pattern])
+
+        assert template_filter.matches("sckit.code-reviewer.md")
+        assert not template_filter.matches("sckit.git-committer.md")
+
+    def test_exclude_after_only(self):
+        template_filter = TemplateFilter.from_patterns(only=["sckit.*"], exclude=["*committer"])
+
+        assert template_filter.matches("sckit.code-reviewer.md")
+        assert not template_filter.matches("sckit.git-committer.md")
+
+    def test_star_means_everything(self):
+        assert not TemplateFilter.from_patterns(only=["*"])
+
+    def test_tags_read_only_when_needed(self):
+        """路径模式能决定结果时不读取 frontmatter"""
+        reads = []
+
+        def read_head():
+            reads.append(1)
+            return frontmatter("tags: [review]")
+
+        template_filter = TemplateFilter.from_patterns(only=["sckit.git-*", "tag:review"])
+
+        assert template_filter.matches("sckit.git-committer.md", read_head)
+        assert reads == []
+        assert template_filter.matches("sckit.code-reviewer.md", read_head)
+        assert not template_filter.matches("sckit.other.md", lambda: frontmatter("tags: [x]"))
+        assert reads == [1]
+
+
+@pytest.fixture
+def template_zip(tmp_path):
+    """unwanted.md 的数据被破坏：只要被完整解压就会因 CRC 不符而失败"""
+    path = tmp_path / "sckit-cursor-0.3.0.zip"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as zf:
+        zf.writestr(".cursor/commands/sckit.wanted.md", frontmatter("tags: [review]"))
+        zf.writestr(
+            ".cursor/commands/sckit.unwanted.md",
+            frontmatter("tags: [draft]", "x" * 10000 + "END"),
+        )
+    data = path.read_bytes()
+    path.write_bytes(data.replace(b"xEND", b"xBAD", 1))
+    return path
+
+
+class TestFilteredExtraction:
+    """测试按筛选条件解压"""
+
+    @pytest.mark.parametrize("template_filter", [
+        TemplateFilter.from_patterns(only=["sckit.wanted"]),
+        TemplateFilter.from_patterns(only=["tag:review"]),
+        TemplateFilter.from_patterns(exclude=["tag:draft"]),
+    ])
+    def test_unselected_members_not_decompressed(self, template_zip, tmp_path, template_filter):
+        staging = tmp_path / "staging"
+
+        extract_template_members(template_zip, staging, Editor.CURSOR, template_filter)
+
+        commands = staging / ".cursor" / "commands"
+        assert [p.name for p in commands.iterdir()] == ["sckit.wanted.md"]
+
+    def test_plan_filters_local_directory(self, tmp_path):
+        """本地目录模板源在生成计划时筛选；未选中的已安装文件随之清理"""
+        source, target = tmp_path / "source", tmp_path / "target"
+        for directory in (source, target):
+            directory.mkdir()
+            (directory / "sckit.a.md").write_bytes(frontmatter("tags: [review]"))
+            (directory / "sckit.b.md").write_bytes(frontmatter("tags: [draft]"))
+        previous = InstallManifest(source_version="0.1.0", editor="cursor", files={
+            p.name: ManifestEntry.from_file(p) for p in target.iterdir()
+        })
+
+        plan = plan_template_sync(
+            source, target, previous,
+            template_filter=TemplateFilter.from_patterns(exclude=["tag:draft"]),
+        )
+
+        assert {f.path: f.action.value for f in plan.files} == {
+            "sckit.a.md": "identical", "sckit.b.md": "removed",
+        }
+        assert plan.filtered == 1
+        assert "1 个未选择" in plan.format_counts()
+
+    def test_nothing_selected(self, tmp_path):
+        (tmp_path / "sckit.a.md").write_text("# A")
+
+        with pytest.raises(ValidationError):
+            plan_template_sync(
+                tmp_path, tmp_path / "target",
+                template_filter=TemplateFilter.from_patterns(only=["nope"]),
+            )
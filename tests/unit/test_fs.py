@@ -0,0 +1,50 @@
+"""
+单元测试：文件系统工具
+
+测试 sckit_cli.utils.fs 模块
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from sckit_cli.utils import fs
+from sckit_cli.utils.fs import atomic_path, atomic_write_json, user_dir
+
+
+def test_user_dir_follows_xdg(monkeypatch, tmp_path):
+    monkeypatch.setattr(fs.sys, "platform", "linux")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+
+    assert user_dir("cache") == tmp_path / "cache" / "sckit"
+    assert user_dir("data") == tmp_path / "data" / "sckit"
+
+
+def test_user_dir_macos(monkeypatch):
+    monkeypatch.setattr(fs.sys, "platform", "darwin")
+
+    assert user_dir("cache") == Path.home() / "Library" / "Caches" / "sckit"
+    assert user_dir("data") == Path.home() / "Library" / "Application Support" / "sckit"
+
+
+def test_atomic_write_json(tmp_path):
+    path = tmp_path / "nested" / "index.json"
+    atomic_write_json(path, {"名称": 1})
+
+    assert json.loads(path.read_text(encoding="utf-8")) == {"名称": 1}
+    assert list(path.parent.iterdir()) == [path]
+
+
+def test_failed_write_keeps_old_file(tmp_path):
+    path = tmp_path / "index.json"
+    path.write_text("old")
+
+    with pytest.raises(RuntimeError):
+        with atomic_path(path) as tmp:
+            tmp.write_text("new")
+            raise RuntimeError("boom")
+
+    assert path.read_text() == "old"
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,67 @@
+"""
+单元测试：模糊匹配
+
+测试 sckit_cli.utils.fuzzy 模块的匹配规则、排序与增量筛选
+"""
+
+import random
+
+import pytest
+
+from sckit_cli.utils.fuzzy import FuzzyIndex
+
+
+ENTRIES = [
+    ("git-committer", "生成规范的提交信息"),
+    ("code-reviewer", "代码审查专家"),
+    ("api-designer", "REST 与 GraphQL 接口设计"),
+    ("docs-architect", "从代码生成技术文档"),
+    ("java-pro", "Java 21 与 Spring Boot"),
+]
+
+
+def names(index, query):
+    return [ENTRIES[i][0] for i in index.filter(query)]
+
+
+class TestFuzzyIndex:
+    """测试 FuzzyIndex"""
+
+    @pytest.mark.parametrize("query, expected", [
+        ("gcm", ["git-committer"]),
+        ("rvw", ["code-reviewer"]),
+        ("GRAPHQL", ["api-designer"]),
+        ("审查", ["code-reviewer"]),
+        ("java spring", ["java-pro"]),
+        ("tim", []),
+    ])
+    def test_subsequence_of_name_or_description(self, query, expected):
+        assert names(FuzzyIndex(ENTRIES), query) == expected
+
+    def test_empty_query_keeps_order(self):
+        assert names(FuzzyIndex(ENTRIES), "  ") == [name for name, _ in ENTRIES]
+
+    def test_name_matches_ranked_first(self):
+        """名称中的子串 > 名称中按顺序出现 > 描述中的子串"""
+        index = FuzzyIndex([
+            ("docs-architect", "生成 code 文档"),
+            ("c-o-d-e", ""),
+            ("code-reviewer", ""),
+        ])
+
+        assert [i for i in index.filter("code")] == [2, 1, 0]
+
+    def test_incremental_results_match_fresh_index(self):
+        """逐字输入、删除后的结果与直接查询相同"""
+        random.seed(7)
+        alphabet = "abcdegirt -"
+
+        def word(length):
+            return "".join(random.choice(alphabet) for _ in range(length))
+
+        entries = [(word(12), word(20)) for _ in range(500)]
+        typed = FuzzyIndex(entries)
+        query = ""
+        for key in "git co\b\bre d\b":
+            query = query[:-1] if key == "\b" else query + key
+            assert typed.filter(query) == FuzzyIndex(entries).filter(query), query
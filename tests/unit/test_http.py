@@ -0,0 +1,159 @@
+"""
+单元测试：共享 HTTP 会话
+
+测试 sckit_cli.utils.http 模块的重试与退避行为
+"""
+
+import httpx
+import pytest
+
+from sckit_cli.utils.http import AdaptiveChunker, HttpSession
+
+
+def make_session(responses, retries=3):
+    """按顺序返回给定响应（或抛出异常）的会话"""
+    calls = []
+    sleeps = []
+
+    def handler(request):
+        calls.append(request)
+        item = responses[min(len(calls), len(responses)) - 1]
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    session = HttpSession(
+        retries=retries,
+        backoff_factor=0.1,
+        sleep=sleeps.append,
+        transport=httpx.MockTransport(handler),
+    )
+    return session, calls, sleeps
+
+
+class TestHttpSession:
+    """测试 HttpSession"""
+
+    def test_retries_transient_status(self):
+        """502 后重试并成功"""
+        session, calls, sleeps = make_session([
+            httpx.Response(502),
+            httpx.Response(200, json={"ok": True}),
+        ])
+
+        response = session.get("https://example.com/x")
+
+        assert response.status_code == 200
+        assert len(calls) == 2
+        assert session.stats.retries == 1
+        assert session.stats.requests == 2
+        assert len(sleeps) == 1
+
+    def test_retries_transport_error(self):
+        """连接错误后重试"""
+        session, calls, _ = make_session([
+            httpx.ConnectError("boom"),
+            httpx.Response(200),
+        ])
+
+        assert session.get("https://example.com/x").status_code == 200
+        assert len(calls) == 2
+
+    def test_gives_up_after_retries(self):
+        """重试次数耗尽后返回最后的响应"""
+        session, calls, _ = make_session([httpx.Response(503)], retries=2)
+
+        response = session.get("https://example.com/x")
+
+        assert response.status_code == 503
+        assert len(calls) == 3
+
+    def test_raises_after_retries(self):
+        """传输错误在重试耗尽后抛出"""
+        session, calls, _ = make_session([httpx.ReadTimeout("slow")], retries=1)
+
+        with pytest.raises(httpx.ReadTimeout):
+            session.get("https://example.com/x")
+        assert len(calls) == 2
+
+    def test_non_idempotent_not_retried(self):
+        """POST 不重试"""
+        session, calls, _ = make_session([httpx.Response(502), httpx.Response(200)])
+
+        response = session.request("POST", "https://example.com/x")
+
+        assert response.status_code == 502
+        assert len(calls) == 1
+
+    def test_forbidden_not_retried(self):
+        """403（GitHub 限流）不重试"""
+        session, calls, _ = make_session([httpx.Response(403), httpx.Response(200)])
+
+        assert session.get("https://example.com/x").status_code == 403
+        assert len(calls) == 1
+
+    def test_honours_retry_after(self):
+        """遵守 Retry-After 头"""
+        session, _, sleeps = make_session([
+            httpx.Response(429, headers={"Retry-After": "2"}),
+            httpx.Response(200),
+        ])
+
+        session.get("https://example.com/x")
+
+        assert sleeps == [2.0]
+
+    def test_stream_retries_before_body(self):
+        """流式请求在拿到响应前也会重试"""
+        session, calls, _ = make_session([
+            httpx.Response(502),
+            httpx.Response(200, content=b"payload"),
+        ])
+
+        with session.stream("GET", "https://example.com/x") as response:
+            assert response.read() == b"payload"
+        assert len(calls) == 2
+
+
+class TestAdaptiveChunker:
+    """测试 AdaptiveChunker"""
+
+    def make(self, times):
+        clock = iter(times)
+        return AdaptiveChunker(
+            min_size=4, max_size=64, target_interval=1.0, clock=lambda: next(clock),
+        )
+
+    def test_coalesces_small_reads(self):
+        """小块读到的数据合并到目标大小后再交出，flush 取回余下部分"""
+        chunker = self.make([0.0, 100.0])
+
+        out = [c for data in (b"ab", b"cd", b"e") for c in chunker.feed(data)]
+
+        assert out == [b"abcd"]
+        assert list(chunker.flush()) == [b"e"]
+
+    def test_large_read_passed_through_without_copy(self):
+        """一次读取已达到目标大小时原样交出"""
+        chunker = self.make([0.0, 100.0])
+        data = b"x" * 10
+
+        assert next(chunker.feed(data)) is data
+        assert list(chunker.flush()) == []
+
+    def test_grows_on_fast_link_and_clamps(self):
+        """吞吐量高时块变大，但不超过上限"""
+        chunker = self.make([0.0, 0.25, 0.26])
+
+        list(chunker.feed(b"x" * 4))      # 4 字节 / 0.25 秒 -> 16 字节
+        assert chunker.size == 16
+        list(chunker.feed(b"x" * 16))     # 16 字节 / 0.01 秒 -> 上限 64
+        assert chunker.size == 64
+
+    def test_shrinks_on_slow_link(self):
+        """吞吐量低时块回落到下限"""
+        chunker = self.make([0.0, 100.0])
+
+        list(chunker.feed(b"x" * 8))
+
+        assert chunker.size == 4
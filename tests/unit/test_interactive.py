@@ -1,14 +1,24 @@
 """
 单元测试：交互式选择界面
 
-测试 sckit_cli.utils.interactive 模块的选择功能
+测试 sckit_cli.utils.interactive 模块的选择功能，以及模板多选的筛选、
+滚动与按键延迟（预算默认 16 ms，可用 SCKIT_PICKER_BUDGET_MS 调整）
 """
 
+import io
+import os
+import random
+import time
 from unittest.mock import patch, MagicMock
 import pytest
+import readchar
 import typer
 from rich.console import Console
 
+from sckit_cli.utils.interactive import (
+    PickerItem, TemplatePicker, render_picker, select_templates,
+)
+
 
 # 导入待测试的模块（在实现之前会失败）
 try:
@@ -182,3 +192,117 @@ class TestSelectWithArrows:
                 console=console
             )
 
+
+
+# ============================================================================
+# 模板多选
+# ============================================================================
+
+PICKER_BUDGET_MS = float(os.getenv("SCKIT_PICKER_BUDGET_MS", "16"))
+
+
+def make_items(count):
+    random.seed(3)
+    words = ["git", "commit", "review", "code", "test", "docs", "deploy", "api", "sql", "lint"]
+    return [
+        PickerItem(
+            f"sckit.t{i}.md",
+            f"{random.choice(words)}-{random.choice(words)}-{i}",
+            " ".join(random.choice(words) for _ in range(8)),
+        )
+        for i in range(count)
+    ]
+
+
+class TestTemplatePicker:
+    """测试 TemplatePicker 的状态"""
+
+    def test_window_scrolls_with_cursor(self):
+        picker = TemplatePicker(make_items(100), height=10)
+
+        for _ in range(12):
+            picker.handle("down")
+
+        assert picker.cursor == 12
+        assert picker.visible() == list(range(3, 13))
+
+        picker.handle("pagedown")
+        picker.handle("end")
+        assert picker.visible()[-1] == 99
+        assert not picker.handle("down")  # 已在最后一行，无需重绘
+
+    def test_typing_filters_and_resets_cursor(self):
+        picker = TemplatePicker(make_items(100), height=10)
+        picker.handle("down")
+
+        for key in "-42":
+            picker.handle(key)
+
+        assert picker.items[picker.matches[0]].name.endswith("-42")
+        assert picker.cursor == 0
+
+        picker.handle("backspace")
+        assert picker.query == "-4"
+
+    def test_toggle_and_result(self):
+        items = make_items(20)
+        picker = TemplatePicker(items, selected={"sckit.t5.md"})
+
+        picker.handle("tab")
+        picker.handle("tab")
+
+        assert picker.result() == ["sckit.t0.md", "sckit.t1.md", "sckit.t5.md"]
+
+        picker.handle("select-all")
+        assert len(picker.result()) == 20
+        picker.handle("select-all")
+        assert picker.result() == [items[picker.matches[picker.cursor]].key]
+
+    def test_renders_only_visible_rows(self):
+        picker = TemplatePicker(make_items(10000), height=5)
+        console = Console(file=io.StringIO(), width=100)
+
+        console.print(render_picker(picker, "选择模板"))
+
+        assert console.file.getvalue().count("○") == 5
+
+    def test_keystroke_latency(self):
+        """一万个条目时，按键到完成渲染的耗时在预算内（取三次中最短）"""
+        items = make_items(10000)
+        keys = list("gitc") + ["down"] * 20 + ["tab", "pagedown"] + ["backspace"] * 4 + ["e"]
+        timings = []
+        for _ in range(3):
+            picker = TemplatePicker(items)
+            console = Console(file=io.StringIO(), width=100, height=30, force_terminal=True)
+            run = []
+            for key in keys:
+                start = time.perf_counter()
+                picker.handle(key)
+                console.print(render_picker(picker, "选择模板"))
+                run.append((time.perf_counter() - start) * 1000)
+            timings.append(run)
+
+        slowest = max(min(column) for column in zip(*timings))
+        assert slowest < PICKER_BUDGET_MS, f"按键耗时 {slowest:.1f} ms，超出预算"
+
+
+@patch('sckit_cli.utils.interactive.readchar.readkey')
+def test_select_templates(mock_readkey, console):
+    """输入筛选、Tab 选择、Esc 清空查询、Enter 确认"""
+    items = make_items(50)
+    mock_readkey.side_effect = [
+        *"-12", readchar.key.TAB, readchar.key.ESC, readchar.key.DOWN, readchar.key.TAB,
+        readchar.key.ENTER,
+    ]
+
+    result = select_templates(items, "选择模板", console)
+
+    assert result == ["sckit.t1.md", "sckit.t12.md"]
+
+
+@patch('sckit_cli.utils.interactive.readchar.readkey')
+def test_select_templates_esc_cancels(mock_readkey, console):
+    mock_readkey.side_effect = [readchar.key.ESC]
+
+    with pytest.raises(typer.Exit):
+        select_templates(make_items(5), "选择模板", console)
@@ -0,0 +1,154 @@
+"""
+单元测试：模板包限制
+
+测试 sckit_cli.utils.limits 模块，以及下载大小上限、zip 炸弹与路径穿越的拒绝
+"""
+
+from dataclasses import replace
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from sckit_cli import (
+    Editor, FileSystemError, ReleaseAsset, TemplateLimitError, config, download_file,
+    extract_template_members, extract_zip, stream_template_members,
+)
+from sckit_cli.utils.cache import ReleaseCache
+from sckit_cli.utils.http import HttpSession
+from sckit_cli.utils.limits import ArchiveLimitError, ExtractionBudget, ExtractionLimits
+
+from conftest import build_zip
+
+
+URL = "https://example.com/sckit-cursor-0.3.0.zip"
+LIMITS = ExtractionLimits(max_entries=2, max_total_size=4 * 1024 * 1024, max_ratio=100)
+
+
+# 20MB 的 0 压缩到约 20KB
+BOMB = build_zip({".cursor/commands/sckit.bomb.md": b"\0" * (20 * 1024 * 1024)})
+
+
+class TestExtractionBudget:
+    """测试 ExtractionBudget"""
+
+    def test_entry_count(self):
+        budget = ExtractionBudget(LIMITS)
+        budget.entry("a")
+        budget.entry("b")
+
+        with pytest.raises(ArchiveLimitError):
+            budget.entry("c")
+
+    def test_declared_size_rejected_before_extraction(self):
+        with pytest.raises(ArchiveLimitError):
+            ExtractionBudget(LIMITS).entry("a", compressed_size=1024, size=5 * 1024 * 1024)
+
+    def test_ratio_checked_while_producing(self):
+        """声明的大小不可信：按实际解压出的字节检查压缩比"""
+        budget = ExtractionBudget(LIMITS)
+        budget.entry("a", compressed_size=10 * 1024, size=100)
+
+        budget.produce(1024 * 1024)
+        with pytest.raises(ArchiveLimitError):
+            budget.produce(1024)
+
+    def test_small_files_not_ratio_checked(self):
+        budget = ExtractionBudget(LIMITS)
+        budget.entry("a", compressed_size=1, size=64 * 1024)
+        budget.produce(64 * 1024)
+
+        assert budget.total_size == 64 * 1024
+
+
+@pytest.fixture
+def serve():
+    def install(handler):
+        session = HttpSession(sleep=lambda _: None, transport=httpx.MockTransport(handler))
+        patcher = patch("sckit_cli.get_http_session", return_value=session)
+        patcher.start()
+        return session
+
+    yield install
+    patch.stopall()
+
+
+class EndlessStream(httpx.SyncByteStream):
+    """不声明长度、持续发送数据的响应"""
+
+    def __init__(self):
+        self.sent = 0
+
+    def __iter__(self):
+        while True:
+            self.sent += 64 * 1024
+            yield b"x" * (64 * 1024)
+
+
+class TestDownloadLimit:
+    """测试下载大小上限"""
+
+    def test_aborts_once_cap_is_passed(self, serve, tmp_path):
+        stream = EndlessStream()
+        serve(lambda request: httpx.Response(200, stream=stream))
+        dest = tmp_path / "a.zip"
+
+        with patch("sckit_cli.config", replace(config, MAX_TEMPLATE_SIZE=1024 * 1024)), \
+                pytest.raises(TemplateLimitError):
+            download_file(URL, dest)
+
+        assert stream.sent <= 1024 * 1024 + 5 * 64 * 1024
+        assert not dest.exists()
+
+    def test_declared_length_rejected_without_reading(self, serve, tmp_path):
+        stream = EndlessStream()
+        serve(lambda request: httpx.Response(
+            200, headers={"Content-Length": str(1 << 30)}, stream=stream,
+        ))
+
+        with pytest.raises(TemplateLimitError):
+            download_file(URL, tmp_path / "a.zip")
+
+        assert stream.sent == 0
+
+
+class TestZipBomb:
+    """测试解压限制"""
+
+    def test_streaming_extraction_aborts(self, serve, tmp_path):
+        """流式解压中止后不留下暂存文件与未完成的缓存"""
+        serve(lambda request: httpx.Response(200, content=BOMB))
+        cache = ReleaseCache(root=tmp_path / "cache")
+        staging = tmp_path / "staging"
+        asset = ReleaseAsset("sckit-cursor-0.3.0.zip", URL, len(BOMB))
+
+        with pytest.raises(TemplateLimitError):
+            stream_template_members(asset, staging, Editor.CURSOR, cache)
+
+        assert not any(p.is_file() for p in staging.rglob("*"))
+        assert not cache.partial_path(URL).exists()
+
+    def test_central_directory_extraction_aborts(self, tmp_path):
+        zip_path = tmp_path / "bomb.zip"
+        zip_path.write_bytes(BOMB)
+
+        with pytest.raises(TemplateLimitError):
+            extract_template_members(zip_path, tmp_path / "staging", Editor.CURSOR)
+
+    def test_entry_count(self, tmp_path):
+        zip_path = tmp_path / "many.zip"
+        zip_path.write_bytes(build_zip({f".cursor/commands/sckit.{i}.md": "# x" for i in range(5)}))
+
+        with patch("sckit_cli.config", replace(config, MAX_TEMPLATE_FILES=4)), \
+                pytest.raises(TemplateLimitError):
+            extract_template_members(zip_path, tmp_path / "staging", Editor.CURSOR)
+
+
+def test_extract_zip_rejects_traversal(tmp_path):
+    zip_path = tmp_path / "evil.zip"
+    zip_path.write_bytes(build_zip({"ok.md": "# ok", "../evil.md": "# evil"}))
+
+    with pytest.raises(FileSystemError):
+        extract_zip(zip_path, tmp_path / "out")
+
+    assert not (tmp_path / "evil.md").exists()
@@ -0,0 +1,36 @@
+"""
+单元测试：已登记项目
+
+测试 sckit_cli.utils.projects 模块
+"""
+
+from sckit_cli.utils.projects import ProjectRegistry
+
+
+def test_roundtrip(tmp_path):
+    path = tmp_path / "projects.json"
+    registry = ProjectRegistry.load(path)
+
+    assert registry.add(tmp_path / "a")
+    assert not registry.add(tmp_path / "a" / ".." / "a")
+    registry.last_tag = "v0.3.0"
+    registry.save()
+
+    loaded = ProjectRegistry.load(path)
+    assert loaded.projects == [str((tmp_path / "a").resolve())]
+    assert loaded.last_tag == "v0.3.0"
+
+
+def test_remove(tmp_path):
+    registry = ProjectRegistry(tmp_path / "projects.json", projects=[str(tmp_path)])
+
+    assert registry.remove(tmp_path)
+    assert not registry.remove(tmp_path)
+    assert registry.projects == []
+
+
+def test_corrupt_file_is_empty(tmp_path):
+    path = tmp_path / "projects.json"
+    path.write_text("{not json")
+
+    assert ProjectRegistry.load(path).projects == []
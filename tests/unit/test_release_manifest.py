@@ -0,0 +1,108 @@
+"""
+单元测试：Release 文件清单
+
+测试 sckit_cli.utils.release_manifest 模块：生成清单、合并读取区间、
+从字节区间中解出并校验成员
+"""
+
+import hashlib
+import json
+import zipfile
+
+import pytest
+
+from sckit_cli import Editor, Release, ReleaseAsset
+from sckit_cli.utils.release_manifest import (
+    ReleaseManifest, ReleaseManifestError, build_manifest, coalesce_ranges,
+    decode_members, main, manifest_name,
+)
+
+
+@pytest.fixture
+def template_zip(tmp_path):
+    path = tmp_path / "sckit-cursor-0.3.0.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr(".cursor/commands/a.md", "# A\n" * 200, zipfile.ZIP_DEFLATED)
+        zf.writestr(".cursor/commands/b.md", "# B", zipfile.ZIP_STORED)
+        zf.writestr(".cursor/commands/sub/", "")
+    return path
+
+
+def read_range(path, start, end):
+    with open(path, "rb") as f:
+        f.seek(start)
+        return f.read(end - start)
+
+
+class TestBuildManifest:
+    """测试 build_manifest()"""
+
+    def test_lists_files_with_hashes(self, template_zip):
+        manifest = build_manifest(template_zip)
+
+        assert manifest.asset == "sckit-cursor-0.3.0.zip"
+        assert manifest.asset_size == template_zip.stat().st_size
+        assert sorted(manifest.files) == [".cursor/commands/a.md", ".cursor/commands/b.md"]
+        b = manifest.files[".cursor/commands/b.md"]
+        assert b.sha256 == hashlib.sha256(b"# B").hexdigest()
+        assert read_range(template_zip, b.data_offset, b.data_end) == b"# B"
+
+    def test_round_trips_through_json(self, template_zip):
+        manifest = build_manifest(template_zip)
+
+        loaded = ReleaseManifest.from_dict(json.loads(json.dumps(manifest.to_dict())))
+
+        assert loaded == manifest
+
+    def test_rejects_unknown_format(self):
+        with pytest.raises(ReleaseManifestError):
+            ReleaseManifest.from_dict({"format": 99, "files": {}})
+
+    def test_main_writes_manifest_next_to_zip(self, template_zip):
+        assert main([str(template_zip)]) == 0
+
+        written = template_zip.with_name("sckit-cursor-0.3.0.manifest.json")
+        assert json.loads(written.read_text())["asset"] == template_zip.name
+        assert manifest_name(template_zip.name) == written.name
+
+
+class TestRanges:
+    """测试 coalesce_ranges() 与 decode_members()"""
+
+    def test_adjacent_members_share_one_range(self, template_zip):
+        manifest = build_manifest(template_zip)
+        files = list(manifest.files.values())
+
+        assert len(coalesce_ranges(files)) == 1
+        assert len(coalesce_ranges(files, max_gap=0)) == 2
+
+    def test_decodes_and_verifies(self, template_zip):
+        manifest = build_manifest(template_zip)
+        [(start, end, members)] = coalesce_ranges(list(manifest.files.values()))
+
+        decoded = dict(
+            (item.name, content)
+            for item, content in decode_members(read_range(template_zip, start, end), start, members)
+        )
+
+        assert decoded[".cursor/commands/a.md"] == b"# A\n" * 200
+        assert decoded[".cursor/commands/b.md"] == b"# B"
+
+    def test_rejects_mismatched_content(self, template_zip):
+        manifest = build_manifest(template_zip)
+        item = manifest.files[".cursor/commands/b.md"]
+
+        with pytest.raises(ReleaseManifestError):
+            list(decode_members(b"# X", item.data_offset, [item]))
+
+
+def test_manifest_asset_is_not_a_template():
+    """同名的 .manifest.json 不被当作模板包"""
+    release = Release(tag_name="v0.3.0", name="0.3.0", assets=[
+        ReleaseAsset("sckit-cursor-0.3.0.manifest.json", "https://example.com/m", 10),
+        ReleaseAsset("sckit-cursor-0.3.0.zip", "https://example.com/z", 100),
+    ])
+
+    assert release.get_template_asset(Editor.CURSOR).name == "sckit-cursor-0.3.0.zip"
+    assert release.get_manifest_asset(Editor.CURSOR).download_url == "https://example.com/m"
+    assert release.get_manifest_asset(Editor.CLAUDE) is None
@@ -0,0 +1,169 @@
+"""
+单元测试：Release 索引与版本固定
+
+测试 fetch_release_index() 的分页与增量刷新，以及 get_release() 的离线查找
+"""
+
+from dataclasses import replace
+from unittest.mock import patch
+
+import httpx
+import pytest
+from typer.testing import CliRunner
+
+from sckit_cli import (
+    Editor, ValidationError, app, config, fetch_release_index, get_release, list_releases,
+)
+from sckit_cli.utils.cache import ReleaseCache
+from sckit_cli.utils.http import HttpSession
+
+
+def release_data(version):
+    return {
+        "tag_name": f"v{version}",
+        "name": f"Release {version}",
+        "published_at": "2026-01-01T00:00:00Z",
+        "assets": [{
+            "name": f"sckit-cursor-{version}.zip",
+            "browser_download_url": f"https://example.com/sckit-cursor-{version}.zip",
+            "size": 4,
+        }],
+    }
+
+
+class FakeReleases:
+    """按 GitHub 方式分页（Link 头）返回 Release 列表，新版本在前"""
+
+    def __init__(self, count):
+        self.versions = [f"0.{i}.0" for i in range(count, 0, -1)]
+        self.requests = []
+
+    def publish(self, version):
+        self.versions.insert(0, version)
+
+    def __call__(self, request):
+        self.requests.append(request)
+        per_page = int(request.url.params.get("per_page", 30))
+        page = int(request.url.params.get("page", 1))
+        etag = f'"{self.versions[0]}"'
+        if request.headers.get("If-None-Match") == etag and page == 1:
+            return httpx.Response(304)
+
+        items = self.versions[(page - 1) * per_page:page * per_page]
+        headers = {"ETag": etag} if page == 1 else {}
+        if page * per_page < len(self.versions):
+            next_url = request.url.copy_merge_params({"page": page + 1})
+            headers["Link"] = f'<{next_url}>; rel="next"'
+        return httpx.Response(200, headers=headers, json=[release_data(v) for v in items])
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ReleaseCache(root=tmp_path / "cache", ttl=60)
+
+
+@pytest.fixture
+def server():
+    server = FakeReleases(5)
+    session = HttpSession(sleep=lambda _: None, transport=httpx.MockTransport(server))
+    with patch("sckit_cli.get_http_session", return_value=session), \
+            patch("sckit_cli.config", replace(config, RELEASES_PER_PAGE=2)):
+        yield server
+
+
+class TestReleaseIndex:
+    """测试 fetch_release_index()"""
+
+    def test_follows_pagination(self, server, cache):
+        """第一次获取时读取全部分页"""
+        releases = list_releases(cache=cache)
+
+        assert [r.version for r in releases] == ["0.5.0", "0.4.0", "0.3.0", "0.2.0", "0.1.0"]
+        assert len(server.requests) == 3
+
+    def test_fresh_cache_needs_no_request(self, server, cache):
+        """TTL 内直接使用缓存的索引"""
+        fetch_release_index(cache=cache)
+        server.requests.clear()
+
+        fetch_release_index(cache=cache)
+
+        assert server.requests == []
+
+    def test_incremental_refresh(self, server, cache):
+        """刷新时只获取比缓存更新的页面"""
+        fetch_release_index(cache=cache)
+        server.publish("0.6.0")
+        server.requests.clear()
+
+        releases = list_releases(cache=cache, refresh=True)
+
+        assert [r.version for r in releases][:3] == ["0.6.0", "0.5.0", "0.4.0"]
+        assert len(releases) == 6
+        assert len(server.requests) == 1
+
+    def test_unchanged_index_revalidated(self, server, cache):
+        """没有新版本时第一页返回 304"""
+        fetch_release_index(cache=cache)
+        server.requests.clear()
+
+        releases = fetch_release_index(cache=cache, refresh=True)
+
+        assert len(releases) == 5
+        assert len(server.requests) == 1
+        assert "If-None-Match" in server.requests[0].headers
+
+
+class TestGetRelease:
+    """测试 get_release()"""
+
+    def test_cached_version_needs_no_network(self, server, cache):
+        """已缓存的版本（即使索引已过期）不访问网络"""
+        fetch_release_index(cache=cache)
+        server.requests.clear()
+        expired = ReleaseCache(root=cache.root, ttl=0)
+
+        release = get_release("v0.2.0", cache=expired)
+
+        assert release.tag_name == "v0.2.0"
+        assert release.get_template_asset(Editor.CURSOR).name == "sckit-cursor-0.2.0.zip"
+        assert server.requests == []
+
+    def test_unknown_version_refreshes_index(self, server, cache):
+        """缓存中没有的版本先增量刷新索引"""
+        fetch_release_index(cache=cache)
+        server.publish("0.6.0")
+
+        assert get_release("0.6.0", cache=cache).version == "0.6.0"
+
+    def test_missing_version(self, server, cache):
+        with pytest.raises(ValidationError):
+            get_release("9.9.9", cache=cache)
+
+
+class TestReleaseCommands:
+    """测试 sckit releases 与 init --version"""
+
+    def test_releases_lists_newest_first(self, server, tmp_path, monkeypatch):
+        monkeypatch.setenv("SCKIT_CACHE_DIR", str(tmp_path / "cache"))
+
+        result = CliRunner().invoke(app, ["releases", "--limit", "2"])
+
+        assert result.exit_code == 0, result.stdout
+        assert result.stdout.index("v0.5.0") < result.stdout.index("v0.4.0")
+        assert "v0.3.0" not in result.stdout
+        assert "3 个更早的版本" in result.stdout
+
+    @patch("sckit_cli.install_template")
+    def test_init_version_option(self, mock_install, tmp_path):
+        result = CliRunner().invoke(app, ["init", str(tmp_path), "-e", "cursor", "--version", "0.2.0"])
+
+        assert result.exit_code == 0, result.stdout
+        assert mock_install.call_args[0][0].version == "0.2.0"
+
+    def test_version_with_source_rejected(self, tmp_path):
+        result = CliRunner().invoke(app, [
+            "init", str(tmp_path), "-e", "cursor", "--version", "0.2.0", "--source", str(tmp_path),
+        ])
+
+        assert result.exit_code == 1
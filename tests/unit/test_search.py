@@ -0,0 +1,138 @@
+"""
+单元测试：模板搜索
+
+测试 sckit_cli.utils.search 的分词、增量索引与排序，以及 sckit search 命令
+"""
+
+import json
+import zipfile
+
+import pytest
+from typer.testing import CliRunner
+
+from sckit_cli import app
+from sckit_cli.utils.search import SearchIndex, parse_template, tokenize
+
+
+def template(name, description, body=""):
+    return f"---\nname: {name}\ndescription: {description}\nauthor: x\n---\n\n{body}\n"
+
+
+TEMPLATES = {
+    "sckit.api-designer.md": template("api-designer", "接口设计大师", "REST 接口评审"),
+    "sckit.sql-pro.md": template("sql-pro", "SQL 性能优化", "数据库索引与查询调优"),
+    "sckit.git-committer.md": template("git-committer", "生成提交信息", "遵循 Conventional Commits"),
+}
+
+
+def files_of(templates, reads=None):
+    def reader(path, text):
+        def read():
+            if reads is not None:
+                reads.append(path)
+            return text
+        return read
+    return [(path, str(hash(text)), reader(path, text)) for path, text in templates.items()]
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = SearchIndex.load(tmp_path / "search")
+    index.update(files_of(TEMPLATES), source="v0.1.0")
+    index.save()
+    return SearchIndex.load(tmp_path / "search")
+
+
+def test_tokenize_mixed_text():
+    assert tokenize("SQL 性能优化") == ["sql", "性能", "能优", "优化"]
+
+
+def test_parse_template():
+    meta = parse_template(TEMPLATES["sckit.sql-pro.md"])
+
+    assert meta["name"] == "sql-pro"
+    assert meta["description"] == "SQL 性能优化"
+    assert "数据库索引" in meta["body"]
+    assert "author" not in meta["body"]
+
+
+class TestSearchIndex:
+    """测试 SearchIndex"""
+
+    def test_ranks_name_and_description_matches(self, index):
+        hits = index.search("接口设计")
+
+        assert hits[0].command == "/sckit.api-designer"
+        assert hits[0].description == "接口设计大师"
+
+    def test_body_matches(self, index):
+        assert [hit.path for hit in index.search("conventional")] == ["sckit.git-committer.md"]
+
+    def test_no_match(self, index):
+        assert index.search("kubernetes") == []
+
+    def test_incremental_update_parses_only_changes(self, index):
+        """fingerprint 未变的模板不读取；删除的模板移出索引"""
+        changed = dict(TEMPLATES)
+        changed["sckit.sql-pro.md"] = template("sql-pro", "数据仓库建模")
+        del changed["sckit.git-committer.md"]
+        reads = []
+
+        assert index.update(files_of(changed, reads), source="v0.2.0") == (1, 1)
+        index.save()
+
+        reloaded = SearchIndex.load(index.root)
+        assert reads == ["sckit.sql-pro.md"]
+        assert reloaded.search("性能") == []
+        assert reloaded.search("数据仓库")[0].path == "sckit.sql-pro.md"
+        assert reloaded.search("conventional") == []
+        assert reloaded.source == "v0.2.0"
+        assert len(reloaded) == 2
+
+    def test_missing_content_keeps_entry(self, index):
+        """无法读取内容（如保留了本地修改）时沿用旧条目"""
+        files = [(path, "new", lambda: None) for path in TEMPLATES]
+
+        index.update(files)
+
+        assert index.search("接口设计")[0].path == "sckit.api-designer.md"
+
+
+class TestSearchCommand:
+    """测试 sckit search"""
+
+    def test_indexes_local_source(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("SCKIT_CACHE_DIR", str(tmp_path / "cache"))
+        commands = tmp_path / "fork" / "commands"
+        commands.mkdir(parents=True)
+        for path, text in TEMPLATES.items():
+            (commands / path).write_text(text, encoding="utf-8")
+
+        result = CliRunner().invoke(app, [
+            "search", "sql", "--source", str(tmp_path / "fork"), "--json",
+        ])
+
+        assert result.exit_code == 0, result.stdout
+        document = json.loads(result.stdout)
+        assert document["templates"] == 3
+        assert document["results"][0]["command"] == "/sckit.sql-pro"
+
+    def test_indexes_template_zip(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("SCKIT_CACHE_DIR", str(tmp_path / "cache"))
+        zip_path = tmp_path / "sckit-cursor-0.1.0.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            for path, text in TEMPLATES.items():
+                zf.writestr(f".cursor/commands/{path}", text)
+
+        result = CliRunner().invoke(app, ["search", "提交", "--source", str(zip_path)])
+
+        assert result.exit_code == 0, result.stdout
+        assert "/sckit.git-committer" in result.stdout
+
+    def test_empty_index(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("SCKIT_CACHE_DIR", str(tmp_path / "cache"))
+
+        result = CliRunner().invoke(app, ["search", "sql"])
+
+        assert result.exit_code == 1
+        assert "sckit init" in result.stdout
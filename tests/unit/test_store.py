@@ -0,0 +1,212 @@
+"""
+单元测试：内容寻址的模板存储
+
+测试 sckit_cli.utils.store 模块以及 sync_template_files() 的链接安装方式
+"""
+
+import errno
+import os
+from unittest.mock import patch
+
+import pytest
+
+from sckit_cli import LinkMode
+from sckit_cli.utils.cache import file_sha256
+from sckit_cli.utils.store import Linker, TemplateStore
+from sckit_cli.utils.sync import sync_template_files
+
+
+@pytest.fixture
+def store(tmp_path):
+    return TemplateStore(tmp_path / "store")
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "source"
+    (path / "sub").mkdir(parents=True)
+    (path / "a.md").write_text("# A")
+    (path / "sub" / "b.md").write_text("# B")
+    return path
+
+
+def projects(tmp_path, count):
+    return [tmp_path / f"project{i}" / "commands" for i in range(count)]
+
+
+class TestTemplateStore:
+    """测试 TemplateStore"""
+
+    def test_add_is_content_addressed(self, store, tmp_path):
+        """同一内容只保存一份，对象只读"""
+        first = tmp_path / "x.md"
+        second = tmp_path / "y.md"
+        first.write_text("same")
+        second.write_text("same")
+        digest = file_sha256(first)
+
+        path = store.add(first, digest)
+
+        assert store.add(second, digest) == path
+        assert path.read_text() == "same"
+        assert not os.access(path, os.W_OK) or os.geteuid() == 0
+        assert store.stats() == (1, 4)
+
+    def test_add_move(self, store, tmp_path):
+        """move=True 时源文件被移入存储"""
+        staged = tmp_path / "x.md"
+        staged.write_text("data")
+
+        path = store.add(staged, file_sha256(staged), move=True)
+
+        assert not staged.exists()
+        assert path.read_text() == "data"
+
+    def test_add_move_across_devices(self, store, tmp_path):
+        """暂存文件与存储不在同一文件系统时改为复制"""
+        staged = tmp_path / "x.md"
+        staged.write_text("data")
+        real_replace = os.replace
+
+        def replace(src, dst):
+            if src == staged:
+                raise OSError(errno.EXDEV, "Invalid cross-device link")
+            return real_replace(src, dst)
+
+        with patch("sckit_cli.utils.store.os.replace", side_effect=replace):
+            path = store.add(staged, file_sha256(staged), move=True)
+
+        assert path.read_text() == "data"
+        assert not list(path.parent.glob(".tmp-*"))
+
+    def test_failed_move_restores_source(self, store, tmp_path):
+        """移入存储后提交失败时，暂存文件放回原处（权限不变）"""
+        staged = tmp_path / "x.md"
+        staged.write_text("data")
+        staged.chmod(0o640)
+        real_chmod = os.chmod
+        failures = [PermissionError(errno.EACCES, "Permission denied")]
+
+        def chmod(path, mode):
+            if failures:
+                raise failures.pop()
+            return real_chmod(path, mode)
+
+        with patch("sckit_cli.utils.store.os.chmod", side_effect=chmod), \
+                pytest.raises(PermissionError):
+            store.add(staged, file_sha256(staged), move=True)
+
+        assert staged.read_text() == "data"
+        assert oct(staged.stat().st_mode & 0o777) == oct(0o640)
+        assert not list(store.objects_dir.glob("*/.tmp-*"))
+
+
+class TestLinkedSync:
+    """测试 sync_template_files(linker=...)"""
+
+    def test_hardlinks_share_one_copy(self, store, source, tmp_path):
+        """多个项目的文件都是存储对象的硬链接"""
+        targets = projects(tmp_path, 3)
+
+        for target in targets:
+            result = sync_template_files(
+                source, target, linker=Linker(store, LinkMode.HARD)
+            )
+            assert result.files_copied == 2
+            assert result.files_linked == 2
+
+        obj = store.object_path(file_sha256(source / "a.md"))
+        assert obj.stat().st_nlink == 4
+        assert all((t / "a.md").samefile(obj) for t in targets)
+        assert store.stats()[0] == 2
+
+    def test_symlinks_point_into_store(self, store, source, tmp_path):
+        """symlink 方式生成指向存储对象的绝对符号链接"""
+        target = projects(tmp_path, 1)[0]
+
+        sync_template_files(source, target, linker=Linker(store, LinkMode.SYMLINK))
+
+        link = target / "sub" / "b.md"
+        assert link.is_symlink()
+        assert os.readlink(link) == str(store.object_path(file_sha256(source / "sub" / "b.md")).resolve())
+        assert link.read_text() == "# B"
+
+    def test_linked_files_are_unchanged_on_resync(self, store, source, tmp_path):
+        """已链接到存储的文件再次同步时不重写"""
+        target = projects(tmp_path, 1)[0]
+        sync_template_files(source, target, linker=Linker(store, LinkMode.HARD))
+
+        result = sync_template_files(source, target, linker=Linker(store, LinkMode.HARD))
+
+        assert result.files_unchanged == 2
+        assert result.files_written == 0
+        assert result.files_linked == 0
+
+    def test_identical_copies_converted_to_links(self, store, source, tmp_path):
+        """切换到链接方式后，内容相同的已有副本改为链接"""
+        target = projects(tmp_path, 1)[0]
+        sync_template_files(source, target)
+
+        result = sync_template_files(source, target, linker=Linker(store, LinkMode.HARD))
+
+        assert result.files_unchanged == 2
+        assert result.files_linked == 2
+        assert (target / "a.md").samefile(store.object_path(file_sha256(source / "a.md")))
+
+    def test_falls_back_to_copy(self, store, source, tmp_path):
+        """文件系统不支持链接时退回复制，同一文件系统只尝试一次"""
+        target = projects(tmp_path, 1)[0]
+        linker = Linker(store, LinkMode.HARD)
+
+        with patch("sckit_cli.utils.store.os.link", side_effect=OSError(18, "EXDEV")) as mock_link:
+            result = sync_template_files(source, target, linker=linker)
+
+        assert mock_link.call_count == 1
+        assert linker.fallbacks == 2
+        assert result.files_copied == 2
+        assert result.files_linked == 0
+        assert (target / "a.md").read_text() == "# A"
+        assert os.access(target / "a.md", os.W_OK)
+        assert not list(target.glob(".sckit-link-*"))
+
+    def test_store_failure_falls_back_to_copy(self, store, source, tmp_path):
+        """存储不可写时直接复制源文件"""
+        target = projects(tmp_path, 1)[0]
+        linker = Linker(store, LinkMode.HARD)
+
+        with patch.object(store, "add", side_effect=PermissionError(13, "EACCES")):
+            result = sync_template_files(source, target, linker=linker, move=True)
+
+        assert result.files_copied == 2
+        assert linker.fallbacks == 2
+        assert (target / "sub" / "b.md").read_text() == "# B"
+
+    def test_failed_store_commit_falls_back_to_copy(self, store, source, tmp_path):
+        """暂存文件移入存储后提交失败，仍能复制到项目"""
+        target = projects(tmp_path, 1)[0]
+        linker = Linker(store, LinkMode.HARD)
+        real_replace = os.replace
+
+        def replace(src, dst):
+            if str(dst).startswith(str(store.objects_dir)) and ".tmp-" not in str(dst):
+                raise OSError(errno.ENOSPC, "No space left on device")
+            return real_replace(src, dst)
+
+        with patch("sckit_cli.utils.store.os.replace", side_effect=replace):
+            result = sync_template_files(source, target, linker=linker, move=True)
+
+        assert result.files_copied == 2
+        assert linker.fallbacks == 2
+        assert (target / "a.md").read_text() == "# A"
+        assert (target / "sub" / "b.md").read_text() == "# B"
+
+    def test_reflink_unsupported_falls_back(self, store, source, tmp_path):
+        """不支持 reflink 的文件系统上得到普通副本"""
+        target = projects(tmp_path, 1)[0]
+        linker = Linker(store, LinkMode.REFLINK)
+
+        with patch("sckit_cli.utils.store.reflink", side_effect=OSError(95, "EOPNOTSUPP")):
+            result = sync_template_files(source, target, linker=linker)
+
+        assert result.files_copied == 2
+        assert (target / "sub" / "b.md").read_text() == "# B"
@@ -0,0 +1,92 @@
+"""
+单元测试：流式 ZIP 解压
+
+测试 sckit_cli.utils.stream_unzip 模块
+"""
+
+import zipfile
+
+import pytest
+
+from sckit_cli.utils.stream_unzip import (
+    StreamingZipExtractor,
+    StreamingUnsupportedError,
+    StreamingZipError,
+)
+
+from conftest import build_zip
+
+
+def feed_all(extractor, data, chunk_size):
+    for i in range(0, len(data), chunk_size):
+        extractor.feed(data[i:i + chunk_size])
+    extractor.close()
+
+
+FILES = {
+    "commands/a.md": "# A\n" * 100,
+    "commands/sub/b.md": "# B",
+    "README.md": "skip me",
+}
+
+
+def selector(root):
+    def select(name):
+        if name.startswith("commands/"):
+            return root / name
+        return None
+    return select
+
+
+class TestStreamingZipExtractor:
+    """测试 StreamingZipExtractor"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+    @pytest.mark.parametrize("compression", [zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED])
+    def test_extracts_selected_members(self, tmp_path, chunk_size, compression):
+        """任意分块大小下只写入选中的成员"""
+        data = build_zip(FILES, compression)
+        extractor = StreamingZipExtractor(selector(tmp_path))
+
+        feed_all(extractor, data, chunk_size)
+
+        assert (tmp_path / "commands" / "a.md").read_text() == FILES["commands/a.md"]
+        assert (tmp_path / "commands" / "sub" / "b.md").read_text() == "# B"
+        assert not (tmp_path / "README.md").exists()
+        assert len(extractor.files_written) == 2
+
+    def test_deflate_with_data_descriptor(self, tmp_path):
+        """deflate 成员使用数据描述符时依靠流结束标记定位边界"""
+        data = build_zip(FILES, zipfile.ZIP_DEFLATED, seekable=False)
+        extractor = StreamingZipExtractor(selector(tmp_path))
+
+        feed_all(extractor, data, 5)
+
+        assert (tmp_path / "commands" / "a.md").read_text() == FILES["commands/a.md"]
+
+    def test_stored_with_data_descriptor_unsupported(self, tmp_path):
+        """stored 成员使用数据描述符时无法流式解析"""
+        data = build_zip(FILES, zipfile.ZIP_STORED, seekable=False)
+        extractor = StreamingZipExtractor(selector(tmp_path))
+
+        with pytest.raises(StreamingUnsupportedError):
+            feed_all(extractor, data, 4096)
+
+    def test_truncated_stream(self, tmp_path):
+        """数据不完整时 close() 报错并删除半成品"""
+        data = build_zip(FILES, zipfile.ZIP_STORED)
+        extractor = StreamingZipExtractor(selector(tmp_path))
+
+        extractor.feed(data[:60])
+        with pytest.raises(StreamingZipError):
+            extractor.close()
+        assert not (tmp_path / "commands" / "a.md").exists()
+
+    def test_crc_mismatch(self, tmp_path):
+        """内容损坏时校验失败"""
+        data = bytearray(build_zip({"commands/a.md": "hello"}, zipfile.ZIP_STORED))
+        data[data.index(b"hello")] = ord("j")
+        extractor = StreamingZipExtractor(selector(tmp_path))
+
+        with pytest.raises(StreamingZipError):
+            feed_all(extractor, bytes(data), 4096)
@@ -0,0 +1,222 @@
+"""
+单元测试：增量同步与安装清单
+
+测试 sync_template_files()、同步计划与 sckit_cli.utils.manifest 模块
+"""
+
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from sckit_cli.utils.conflicts import parse_selection
+from sckit_cli.utils.manifest import InstallManifest, ManifestEntry
+from sckit_cli.utils.sync import (
+    FileAction, apply_template_sync, plan_template_sync, sync_template_files,
+)
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    source = tmp_path / "source"
+    target = tmp_path / "target"
+    source.mkdir()
+    target.mkdir()
+    return source, target
+
+
+def write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def manifest_for(directory, version="0.1.0"):
+    return InstallManifest(
+        source_version=version,
+        editor="cursor",
+        files={
+            p.relative_to(directory).as_posix(): ManifestEntry.from_file(p)
+            for p in directory.rglob("*") if p.is_file()
+        },
+    )
+
+
+class TestSyncTemplateFiles:
+    """测试 sync_template_files()"""
+
+    def test_identical_files_not_rewritten(self, dirs):
+        """内容相同的文件不写入，mtime 不变"""
+        source, target = dirs
+        write(source / "a.md", "same")
+        write(target / "a.md", "same")
+        os.utime(target / "a.md", (1000, 1000))
+
+        result = sync_template_files(source, target, force=True)
+
+        assert result.files_unchanged == 1
+        assert result.files_written == 0
+        assert (target / "a.md").stat().st_mtime == 1000
+        assert "a.md" in result.files
+
+    def test_owned_file_updated_without_prompt(self, dirs):
+        """上次安装的未修改文件直接更新，不询问"""
+        source, target = dirs
+        write(target / "a.md", "v1")
+        previous = manifest_for(target)
+        write(source / "a.md", "v2")
+        callback = MagicMock(return_value=[])
+
+        result = sync_template_files(source, target, conflict_callback=callback, previous=previous)
+
+        assert result.files_overwritten == 1
+        assert (target / "a.md").read_text() == "v2"
+        assert not callback.called
+
+    def test_local_edit_asks_and_skips(self, dirs):
+        """本地修改过的文件需要确认，拒绝后保留"""
+        source, target = dirs
+        write(target / "a.md", "v1")
+        previous = manifest_for(target)
+        write(target / "a.md", "edited")
+        write(source / "a.md", "v2")
+        callback = MagicMock(return_value=[])
+
+        result = sync_template_files(source, target, conflict_callback=callback, previous=previous)
+
+        callback.assert_called_once_with([target / "a.md"])
+        assert result.files_skipped == 1
+        assert (target / "a.md").read_text() == "edited"
+        assert "a.md" not in result.files
+
+    def test_prunes_dropped_files(self, dirs):
+        """新版本删除的文件被清理，本地修改过的保留"""
+        source, target = dirs
+        write(target / "old.md", "old")
+        write(target / "sub" / "gone.md", "gone")
+        write(target / "edited.md", "v1")
+        previous = manifest_for(target)
+        write(target / "edited.md", "mine")
+        write(source / "new.md", "new")
+
+        result = sync_template_files(source, target, previous=previous)
+
+        assert result.files_removed == 2
+        assert not (target / "old.md").exists()
+        assert not (target / "sub").exists()
+        assert (target / "edited.md").read_text() == "mine"
+        assert (target / "new.md").exists()
+
+
+class TestSyncPlan:
+    """测试 plan_template_sync() 与 apply_template_sync()"""
+
+    def make_plan(self, dirs):
+        source, target = dirs
+        write(target / "same.md", "same")
+        write(target / "updated.md", "v1")
+        write(target / "edited.md", "v1")
+        write(target / "dropped.md", "old")
+        previous = manifest_for(target)
+        write(target / "edited.md", "mine")
+        write(target / "unowned.md", "mine")
+        for name in ("same.md", "updated.md", "edited.md", "unowned.md", "new.md"):
+            write(source / name, "same" if name == "same.md" else "v2")
+        return plan_template_sync(source, target, previous, max_workers=4)
+
+    def test_classifies_every_file(self, dirs):
+        """新增、无变化、更新、本地已修改、删除各归其类，且不写入"""
+        target = dirs[1]
+
+        plan = self.make_plan(dirs)
+
+        actions = {f.path: f.action for f in plan.files}
+        assert actions == {
+            "new.md": FileAction.NEW,
+            "same.md": FileAction.IDENTICAL,
+            "updated.md": FileAction.MODIFIED,
+            "edited.md": FileAction.EDITED,
+            "unowned.md": FileAction.EDITED,
+            "dropped.md": FileAction.REMOVED,
+        }
+        assert [f.path for f in plan.conflicts] == ["edited.md", "unowned.md"]
+        assert {p.name: p.read_text() for p in target.iterdir()} == {
+            "same.md": "same", "updated.md": "v1", "edited.md": "mine",
+            "dropped.md": "old", "unowned.md": "mine",
+        }
+
+    def test_apply_overwrites_only_selected(self, dirs):
+        """应用阶段只覆盖选中的冲突文件"""
+        target = dirs[1]
+        plan = self.make_plan(dirs)
+
+        result = apply_template_sync(plan, overwrite={"unowned.md"})
+
+        assert result.files_copied == 1
+        assert result.files_overwritten == 2
+        assert result.files_skipped == 1
+        assert result.files_removed == 1
+        assert (target / "edited.md").read_text() == "mine"
+        assert (target / "unowned.md").read_text() == "v2"
+        assert "edited.md" not in result.files
+
+    def test_conflicts_decided_in_one_call(self, dirs):
+        """所有冲突文件一次交给回调，只覆盖回调返回的文件"""
+        source, target = dirs
+        for name in ("a.md", "b.md"):
+            write(target / name, "mine")
+            write(source / name, "v2")
+        callback = MagicMock(side_effect=lambda paths: [p for p in paths if p.name == "b.md"])
+
+        result = sync_template_files(source, target, conflict_callback=callback)
+
+        callback.assert_called_once_with([target / "a.md", target / "b.md"])
+        assert result.files_overwritten == 1
+        assert (target / "a.md").read_text() == "mine"
+        assert (target / "b.md").read_text() == "v2"
+
+    def test_conflicts_decided_before_any_write(self, dirs):
+        """冲突回调在任何写入之前被调用"""
+        source, target = dirs
+        write(target / "a.md", "mine")
+        write(source / "a.md", "v2")
+        write(source / "b.md", "new")
+
+        def callback(paths):
+            assert not (target / "b.md").exists()
+            return paths
+
+        result = sync_template_files(source, target, conflict_callback=callback)
+
+        assert result.files_overwritten == 1
+        assert (target / "b.md").exists()
+
+    @pytest.mark.parametrize("text, expected", [
+        ("1", {1}),
+        ("1, 3,5-7", {1, 3, 5, 6, 7}),
+        ("", set()),
+        ("0", None),
+        ("8", None),
+        ("3-2", None),
+        ("a", None),
+    ])
+    def test_parse_selection(self, text, expected):
+        assert parse_selection(text, 7) == expected
+
+
+class TestInstallManifest:
+    """测试 InstallManifest"""
+
+    def test_roundtrip_and_no_rewrite(self, tmp_path):
+        """保存后可读回；内容不变时不重写"""
+        write(tmp_path / "a.md", "hello")
+        manifest = manifest_for(tmp_path, "0.3.0")
+        path = tmp_path / ".sckit-manifest.json"
+
+        assert manifest.save(path) is True
+        loaded = InstallManifest.load(path)
+        assert loaded == manifest
+        assert manifest.save(path) is False
+
+    def test_load_missing(self, tmp_path):
+        """清单不存在时返回 None"""
+        assert InstallManifest.load(tmp_path / "missing.json") is None
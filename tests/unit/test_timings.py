@@ -0,0 +1,94 @@
+"""
+单元测试：阶段计时
+
+测试 sckit_cli.utils.timings 模块与 init --timings / --json
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from sckit_cli import app, Editor, InstallResult
+from sckit_cli.utils.timings import PhaseRecorder, PhaseTiming, optional_phase
+
+
+runner = CliRunner()
+
+
+class TestPhaseRecorder:
+    """测试 PhaseRecorder"""
+
+    def test_records_in_completion_order(self):
+        recorder = PhaseRecorder()
+        with recorder.phase("release") as timing:
+            timing.bytes = 10
+        with recorder.phase("sync", "cursor") as timing:
+            timing.files = 3
+
+        assert [t.label for t in recorder.phases] == ["release", "sync (cursor)"]
+        assert recorder.phases[0].bytes == 10
+        assert recorder.phases[1].files == 3
+        assert all(t.seconds >= 0 for t in recorder.phases)
+
+    def test_records_failed_phase(self):
+        """阶段抛出异常时同样记录"""
+        recorder = PhaseRecorder()
+        with pytest.raises(RuntimeError):
+            with recorder.phase("download"):
+                raise RuntimeError("boom")
+
+        assert [t.name for t in recorder.phases] == ["download"]
+
+    def test_optional_phase_without_recorder(self):
+        with optional_phase(None, "extract") as timing:
+            timing.files = 1
+        assert timing.files == 1
+
+
+def make_result() -> InstallResult:
+    return InstallResult(
+        success=True,
+        version="0.3.0",
+        files_copied=2,
+        target_path=Path("/tmp/project"),
+        editor=Editor.CURSOR,
+        timings=[
+            PhaseTiming(name="release", seconds=0.1, bytes=512),
+            PhaseTiming(name="download", detail="cursor", seconds=0.2, bytes=4096, files=2),
+            PhaseTiming(name="sync", seconds=0.05, files=2, peak_rss=50 * 1024 * 1024),
+        ],
+    )
+
+
+class TestInitTimingsOutput:
+    """测试 init --timings / --json"""
+
+    @pytest.fixture(autouse=True)
+    def restore_console(self, monkeypatch):
+        """--json 会把 Rich 输出切到 stderr，测试结束后恢复"""
+        import sckit_cli
+        monkeypatch.setattr(sckit_cli, "_console", sckit_cli._console)
+
+    @patch("sckit_cli.install_template", return_value=make_result())
+    def test_json(self, mock_install, tmp_path):
+        """--json 在 stdout 输出可解析的结果文档"""
+        result = runner.invoke(app, ["init", str(tmp_path), "-e", "cursor", "--json"])
+
+        assert result.exit_code == 0, result.output
+        document = json.loads(result.stdout[result.stdout.index("{"):])
+        assert document["success"] is True
+        timings = document["results"][0]["timings"]
+        assert [t["name"] for t in timings] == ["release", "download", "sync"]
+        assert timings[1]["bytes"] == 4096
+
+    @patch("sckit_cli.install_template", return_value=make_result())
+    def test_timings_table(self, mock_install, tmp_path):
+        """--timings 显示阶段表格"""
+        result = runner.invoke(app, ["init", str(tmp_path), "-e", "cursor", "--timings"])
+
+        assert result.exit_code == 0, result.output
+        assert "download (cursor)" in result.output
+        assert "4.0 KB" in result.output